@@ -10,9 +10,12 @@ import pandas as pd
 import tempfile
 import yaml
 import asyncio
+from unittest.mock import patch
 from pathlib import Path
 
 from validation_framework.core.async_engine import AsyncValidationEngine
+from validation_framework.core.async_scheduler import AsyncScheduler, CapacityLimiter
+from validation_framework.core.async_streams import ChunkBroadcast
 from validation_framework.core.config import ValidationConfig
 from validation_framework.core.results import Status
 from validation_framework.loaders.async_csv_loader import AsyncCSVLoader
@@ -103,6 +106,22 @@ class TestAsyncJSONLoader:
         df = pd.concat(chunks, ignore_index=True)
         assert len(df) > 0
 
+    async def test_async_json_loader_streams_array(self, tmp_path):
+        """Test that JSON arrays are parsed in chunks rather than read whole."""
+        import json
+
+        path = tmp_path / "orders.json"
+        path.write_text(json.dumps([{"id": i} for i in range(25)]))
+        loader = AsyncJSONLoader(file_path=str(path), chunk_size=10)
+
+        with patch("pandas.read_json", side_effect=AssertionError("read whole file")):
+            chunks = [chunk async for chunk in loader.load()]
+            metadata = await loader.get_metadata()
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert metadata["row_count"] == 25
+        assert metadata["columns"] == ["id"]
+
     async def test_async_json_loader_metadata(self, temp_json_file):
         """Test async JSON loader metadata."""
         loader = AsyncJSONLoader(file_path=temp_json_file)
@@ -158,6 +177,186 @@ class TestAsyncLoaderFactory:
             Path(temp_file).unlink(missing_ok=True)
 
 
+# ============================================================================
+# ASYNC CHUNK BROADCAST TESTS
+# ============================================================================
+
+async def _numbered_chunks(count, produced):
+    """Async chunk iterator that records how many chunks it has produced."""
+    for i in range(count):
+        produced.append(i)
+        yield pd.DataFrame({"value": [i]})
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestChunkBroadcast:
+    """Tests for the bounded streams between async loaders and validations."""
+
+    async def test_stream_yields_every_chunk_in_order(self):
+        """Test that a consumer thread sees every chunk in order."""
+        loop = asyncio.get_running_loop()
+        stream = ChunkBroadcast(_numbered_chunks(10, []), loop, queue_depth=2).streams[0]
+
+        try:
+            chunks = await loop.run_in_executor(None, list, stream)
+        finally:
+            await stream.aclose()
+
+        assert [chunk["value"].iloc[0] for chunk in chunks] == list(range(10))
+
+    async def test_stream_buffers_at_most_queue_depth(self):
+        """Test that the producer waits for the consumer once the queue is full."""
+        loop = asyncio.get_running_loop()
+        produced = []
+        stream = ChunkBroadcast(_numbered_chunks(100, produced), loop, queue_depth=3).streams[0]
+
+        try:
+            first = await loop.run_in_executor(None, next, stream)
+            await asyncio.sleep(0.05)
+
+            assert first["value"].iloc[0] == 0
+            # One chunk consumed, three queued, one waiting to be queued
+            assert len(produced) <= 5
+        finally:
+            await stream.aclose()
+
+    async def test_stream_not_read_until_iterated(self):
+        """Test that a consumer that never iterates never reads the loader."""
+        loop = asyncio.get_running_loop()
+        produced = []
+        stream = ChunkBroadcast(_numbered_chunks(5, produced), loop).streams[0]
+
+        await stream.aclose()
+
+        assert produced == []
+
+    async def test_broadcast_reads_once_for_all_streams(self):
+        """Test that every stream sees every chunk from a single read."""
+        loop = asyncio.get_running_loop()
+        produced = []
+        broadcast = ChunkBroadcast(_numbered_chunks(20, produced), loop, consumers=3, queue_depth=2)
+
+        try:
+            seen = await asyncio.gather(*[
+                loop.run_in_executor(None, lambda s=stream: [c["value"].iloc[0] for c in s])
+                for stream in broadcast.streams
+            ])
+        finally:
+            await broadcast.aclose()
+
+        assert seen == [list(range(20))] * 3
+        assert produced == list(range(20))
+
+    async def test_broadcast_continues_after_a_stream_closes(self):
+        """Test that a consumer that stops early does not stall the others."""
+        loop = asyncio.get_running_loop()
+        broadcast = ChunkBroadcast(_numbered_chunks(20, []), loop, consumers=2, queue_depth=1)
+        early, full = broadcast.streams
+
+        try:
+            await loop.run_in_executor(None, next, early)
+            await early.aclose()
+            chunks = await loop.run_in_executor(None, list, full)
+        finally:
+            await broadcast.aclose()
+
+        assert len(chunks) == 20
+
+    async def test_broadcast_stops_reading_once_all_streams_close(self):
+        """Test that the loader is not read past the point every consumer stopped."""
+        loop = asyncio.get_running_loop()
+        produced = []
+        broadcast = ChunkBroadcast(_numbered_chunks(100, produced), loop, consumers=2, queue_depth=1)
+
+        for stream in broadcast.streams:
+            await loop.run_in_executor(None, next, stream)
+        await broadcast.aclose()
+
+        assert len(produced) < 10
+
+    async def test_stream_raises_loader_errors_in_consumer(self):
+        """Test that a loader error is raised by the step that reaches it."""
+        async def _failing_chunks():
+            yield pd.DataFrame({"value": [1]})
+            raise ValueError("bad chunk")
+
+        loop = asyncio.get_running_loop()
+        stream = ChunkBroadcast(_failing_chunks(), loop).streams[0]
+
+        try:
+            with pytest.raises(ValueError, match="bad chunk"):
+                await loop.run_in_executor(None, list, stream)
+        finally:
+            await stream.aclose()
+
+
+# ============================================================================
+# ASYNC SCHEDULER TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestAsyncScheduler:
+    """Tests for admission control in the async engine."""
+
+    async def test_limiter_waits_for_capacity(self):
+        """Test that a request waits until enough units are released."""
+        limiter = CapacityLimiter(3)
+        await limiter.acquire(2)
+
+        waiter = asyncio.ensure_future(limiter.acquire(2))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        limiter.release(2)
+        assert await waiter == 2
+        assert limiter.in_use == 2
+
+    async def test_limiter_grants_in_request_order(self):
+        """Test that a small request does not overtake a waiting large one."""
+        limiter = CapacityLimiter(4)
+        await limiter.acquire(3)
+        granted = []
+
+        async def _take(name, amount):
+            await limiter.acquire(amount)
+            granted.append(name)
+
+        large = asyncio.ensure_future(_take("large", 4))
+        await asyncio.sleep(0)
+        small = asyncio.ensure_future(_take("small", 1))
+        await asyncio.sleep(0)
+        assert granted == []
+
+        limiter.release(3)
+        await asyncio.sleep(0)
+        assert granted == ["large"]
+
+        limiter.release(4)
+        await asyncio.gather(large, small)
+        assert granted == ["large", "small"]
+
+    async def test_limiter_clamps_oversized_requests(self):
+        """Test that a request larger than the capacity runs alone instead of never."""
+        limiter = CapacityLimiter(10)
+
+        async with limiter.hold(25):
+            assert limiter.in_use == 10
+        assert limiter.in_use == 0
+
+    async def test_admission_order_is_largest_first(self):
+        """Test that files are admitted in decreasing size."""
+        scheduler = AsyncScheduler(max_files=2)
+
+        assert scheduler.admission_order([10, 300, 0, 50]) == [1, 3, 0, 2]
+
+    async def test_rule_batches_respect_max_rules(self):
+        """Test that validations are split into batches of at most max_rules."""
+        assert AsyncScheduler(max_rules=2).rule_batches(5) == [range(0, 2), range(2, 4), range(4, 5)]
+        assert AsyncScheduler().rule_batches(5) == [range(0, 5)]
+
+
 # ============================================================================
 # ASYNC ENGINE TESTS
 # ============================================================================
@@ -207,6 +406,131 @@ class TestAsyncValidationEngine:
         assert len(report.file_reports) == 1
         assert report.file_reports[0].total_validations == 1
 
+    async def test_async_engine_streams_chunks(self, temp_large_csv_file):
+        """Test that data validations see every row when the file spans many chunks."""
+        config_dict = {
+            "validation_job": {
+                "name": "Async Streaming Test",
+                "files": [
+                    {
+                        "path": temp_large_csv_file,
+                        "validations": [
+                            {
+                                "type": "MandatoryFieldCheck",
+                                "severity": "ERROR",
+                                "params": {"fields": ["id"]}
+                            }
+                        ]
+                    }
+                ],
+                "processing": {"chunk_size": 1000, "async_queue_depth": 2}
+            }
+        }
+
+        config = ValidationConfig(config_dict)
+        engine = AsyncValidationEngine(config)
+
+        report = await engine.run()
+
+        result = report.file_reports[0].validation_results[0]
+        assert result.passed
+        assert result.total_count == len(pd.read_csv(temp_large_csv_file))
+
+    async def test_async_engine_runs_validations_on_one_read(self, temp_large_csv_file):
+        """Test that several data validations share one read and keep config order."""
+        config_dict = {
+            "validation_job": {
+                "name": "Async Broadcast Test",
+                "files": [
+                    {
+                        "path": temp_large_csv_file,
+                        "validations": [
+                            {"type": "EmptyFileCheck", "severity": "ERROR"},
+                            {
+                                "type": "MandatoryFieldCheck",
+                                "severity": "ERROR",
+                                "params": {"fields": ["id"]}
+                            },
+                            {"type": "UnknownCheck", "severity": "WARNING"},
+                            {
+                                "type": "RangeCheck",
+                                "severity": "WARNING",
+                                "params": {"field": "id", "min_value": 0}
+                            }
+                        ]
+                    }
+                ],
+                "processing": {"chunk_size": 1000}
+            }
+        }
+
+        config = ValidationConfig(config_dict)
+        engine = AsyncValidationEngine(config)
+
+        with patch.object(AsyncCSVLoader, "load", autospec=True, side_effect=AsyncCSVLoader.load) as load:
+            report = await engine.run()
+
+        results = report.file_reports[0].validation_results
+        assert [r.rule_name for r in results] == [
+            "EmptyFileCheck", "MandatoryFieldCheck", "UnknownCheck", "RangeCheck"
+        ]
+        assert results[1].passed and results[3].passed
+        assert not results[2].passed
+        assert load.call_count == 1
+
+    async def test_async_engine_limits_concurrent_files(self, tmp_path, sample_dataframe):
+        """Test that files are validated one at a time, largest first, when limited."""
+        paths = []
+        for name, rows in [("small", 5), ("large", 50), ("medium", 20)]:
+            path = tmp_path / f"{name}.csv"
+            pd.concat([sample_dataframe] * rows).to_csv(path, index=False)
+            paths.append(str(path))
+
+        config_dict = {
+            "validation_job": {
+                "name": "Async Scheduling Test",
+                "files": [
+                    {
+                        "path": path,
+                        "validations": [
+                            {"type": "EmptyFileCheck", "severity": "ERROR"},
+                            {
+                                "type": "MandatoryFieldCheck",
+                                "severity": "ERROR",
+                                "params": {"fields": ["id"]}
+                            }
+                        ]
+                    }
+                    for path in paths
+                ],
+                "processing": {"max_concurrent_files": 1, "max_concurrent_rules": 1}
+            }
+        }
+
+        config = ValidationConfig(config_dict)
+        engine = AsyncValidationEngine(config)
+
+        running = []
+        started = []
+        validate_file = engine._validate_file
+
+        async def _tracked(file_config, scheduler):
+            running.append(file_config["path"])
+            started.append((file_config["path"], len(running)))
+            try:
+                return await validate_file(file_config, scheduler)
+            finally:
+                running.remove(file_config["path"])
+
+        with patch.object(engine, "_validate_file", side_effect=_tracked):
+            report = await engine.run()
+
+        assert [path for path, _ in started] == [paths[1], paths[2], paths[0]]
+        assert all(concurrent == 1 for _, concurrent in started)
+        # Reports keep configuration order
+        assert [r.file_path for r in report.file_reports] == paths
+        assert all(r.total_validations == 2 for r in report.file_reports)
+
     async def test_async_engine_multiple_files_parallel(self, temp_csv_file, sample_dataframe):
         """Test async validation of multiple files in parallel."""
         # Create second file
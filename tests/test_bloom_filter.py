@@ -0,0 +1,48 @@
+"""
+Tests for the blocked Bloom filter.
+"""
+
+import numpy as np
+import pytest
+
+from validation_framework.core.bloom_filter import BlockedBloomFilter, false_positive_rate_for
+
+
+@pytest.mark.unit
+class TestBlockedBloomFilter:
+    """Tests for BlockedBloomFilter."""
+
+    def test_no_false_negatives(self):
+        """Test that every added hash is reported as possibly present."""
+        rng = np.random.default_rng(3)
+        hashes = rng.integers(0, 2**63, 20000, dtype=np.int64).astype(np.uint64)
+
+        bloom = BlockedBloomFilter(expected_keys=20000)
+        bloom.add_many(hashes[:10000])
+        bloom.add_many(hashes[10000:])
+
+        assert bloom.contains_many(hashes).all()
+        assert bloom.key_count == 20000
+
+    def test_false_positive_rate_near_target(self):
+        """Test that unseen hashes are mostly ruled out at the expected load."""
+        bloom = BlockedBloomFilter(expected_keys=50000, false_positive_rate=0.01)
+        bloom.add_many(np.arange(50000, dtype=np.uint64))
+
+        rate = bloom.contains_many(np.arange(50000, 250000, dtype=np.uint64)).mean()
+
+        assert rate < 0.02
+
+    def test_empty_filter(self):
+        """Test that an empty filter rules everything out."""
+        bloom = BlockedBloomFilter(expected_keys=1)
+
+        assert not bloom.contains_many(np.array([0, 1, 2**63], dtype=np.uint64)).any()
+
+    def test_false_positive_rate_for_budget(self):
+        """Test that a filter built at the budget rate stays within the budget."""
+        rate = false_positive_rate_for(expected_keys=1_000_000, max_bytes=256 * 1024)
+        bloom = BlockedBloomFilter(expected_keys=1_000_000, false_positive_rate=rate)
+
+        assert rate > 0.01
+        assert bloom.nbytes <= 256 * 1024
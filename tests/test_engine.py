@@ -10,6 +10,7 @@ Author: Daniel Edge
 
 import pytest
 import tempfile
+import itertools
 import pandas as pd
 import yaml
 from pathlib import Path
@@ -117,6 +118,33 @@ def multi_file_config(tmp_path):
     return str(config_file)
 
 
+@pytest.fixture
+def write_config(tmp_path):
+    """
+    Return a function that writes a validation job configuration.
+
+    The function takes the data file and validations of a single file, or a
+    complete files list, plus optional processing options, and returns the
+    path of the YAML configuration it wrote.
+    """
+    config_numbers = itertools.count()
+
+    def write(data_file=None, validations=None, files=None, processing=None, name="Test Job"):
+        if files is None:
+            files = [{"name": Path(data_file).stem, "path": str(data_file), "validations": validations or []}]
+
+        job = {"name": name, "files": files}
+        if processing:
+            job["processing"] = processing
+
+        config_file = tmp_path / f"job_config_{next(config_numbers)}.yaml"
+        with open(config_file, 'w') as f:
+            yaml.dump({"validation_job": job}, f)
+        return str(config_file)
+
+    return write
+
+
 # ============================================================================
 # ENGINE INITIALIZATION TESTS
 # ============================================================================
@@ -455,5 +483,695 @@ class TestEngineIntegration:
         assert report.status == Status.PASSED
 
 
+
+class TestFusedExecution:
+    """Test single-pass execution of chunk-protocol validations."""
+
+    VALIDATIONS = [
+        {"type": "EmptyFileCheck", "severity": "ERROR"},
+        {
+            "type": "RegexCheck",
+            "severity": "ERROR",
+            "params": {"field": "email", "pattern": r"^[^@]+@[^@]+$"}
+        },
+        {
+            "type": "ValidValuesCheck",
+            "severity": "WARNING",
+            "params": {"field": "status", "valid_values": ["active"]}
+        },
+        {
+            "type": "UniqueKeyCheck",
+            "severity": "ERROR",
+            "params": {"fields": ["id"]}
+        },
+        {
+            "type": "MandatoryFieldCheck",
+            "severity": "ERROR",
+            "params": {"fields": ["missing_column"]}
+        },
+    ]
+
+    @pytest.fixture
+    def data_file(self, tmp_path):
+        data_file = tmp_path / "fused_data.csv"
+        pd.DataFrame({
+            "id": list(range(50)) + [3],
+            "email": ["user%d@example.com" % i for i in range(50)] + ["bad"],
+            "status": ["active"] * 50 + ["unknown"],
+        }).to_csv(data_file, index=False)
+        return data_file
+
+    def _config(self, write_config, data_file, fused_execution=True):
+        return write_config(
+            data_file, self.VALIDATIONS, processing={"chunk_size": 10, "fused_execution": fused_execution}
+        )
+
+    def test_fused_results_match_per_rule_execution(self, data_file, write_config):
+        """Test that fused and per-rule execution produce identical results."""
+        fused = ValidationEngine.from_config(self._config(write_config, data_file, True)).run(verbose=False)
+        separate = ValidationEngine.from_config(self._config(write_config, data_file, False)).run(verbose=False)
+
+        fused_results = fused.file_reports[0].validation_results
+        separate_results = separate.file_reports[0].validation_results
+
+        assert [r.rule_name for r in fused_results] == [r.rule_name for r in separate_results]
+        for a, b in zip(fused_results, separate_results):
+            assert a.passed == b.passed
+            assert a.failed_count == b.failed_count
+            assert a.total_count == b.total_count
+            assert a.message == b.message
+            assert a.sample_failures == b.sample_failures
+
+    def test_fused_execution_reads_file_once(self, data_file, write_config):
+        """Test that chunk-protocol validations share a single scan of the file."""
+        from validation_framework.loaders.csv_loader import CSVLoader
+
+        engine = ValidationEngine.from_config(self._config(write_config, data_file))
+        original_load = CSVLoader.load
+
+        with patch.object(CSVLoader, "load", autospec=True, side_effect=original_load) as mock_load:
+            report = engine.run(verbose=False)
+
+        # EmptyFileCheck is a file-level rule and reads the file itself
+        assert mock_load.call_count == 2
+        assert len(report.file_reports[0].validation_results) == 5
+
+    def test_fused_execution_reports_in_config_order(self, data_file, write_config):
+        """Test that results keep configuration order and failures are reported."""
+        report = ValidationEngine.from_config(self._config(write_config, data_file)).run(verbose=False)
+        results = report.file_reports[0].validation_results
+
+        assert [r.rule_name for r in results] == [
+            "EmptyFileCheck", "RegexCheck", "ValidValuesCheck", "UniqueKeyCheck", "MandatoryFieldCheck"
+        ]
+        assert results[1].failed_count == 1
+        assert results[3].failed_count == 1
+        assert "missing_column" in results[4].message
+
+
+class TestColumnProjection:
+    """Test loading only the columns referenced by the configured validations."""
+
+    @pytest.fixture
+    def data_file(self, tmp_path):
+        data_file = tmp_path / "wide_data.csv"
+        pd.DataFrame({
+            "id": [1, 2, 3],
+            "email": ["a@example.com", "bad", "c@example.com"],
+            "status": ["active", "active", "closed"],
+            "notes": ["x", "y", "z"],
+        }).to_csv(data_file, index=False)
+        return data_file
+
+    @staticmethod
+    def _loaded_columns(config):
+        from validation_framework.loaders.csv_loader import CSVLoader
+
+        engine = ValidationEngine.from_config(config)
+        original_load = CSVLoader.load
+        loaded = []
+
+        def tracking_load(loader):
+            loaded.append(loader.columns)
+            return original_load(loader)
+
+        with patch.object(CSVLoader, "load", autospec=True, side_effect=tracking_load):
+            report = engine.run(verbose=False)
+        return loaded, report
+
+    def test_loads_referenced_columns_only(self, data_file, write_config):
+        """Test that fields and condition columns are loaded and others skipped."""
+        loaded, report = self._loaded_columns(write_config(data_file, [
+            {"type": "EmptyFileCheck", "severity": "ERROR"},
+            {
+                "type": "RegexCheck",
+                "severity": "ERROR",
+                "params": {"field": "email", "pattern": r"^[^@]+@[^@]+$"},
+                "condition": "status == 'active'",
+            },
+        ]))
+
+        assert loaded[-1] == ["email", "status"]
+        results = report.file_reports[0].validation_results
+        assert results[1].failed_count == 1
+
+    def test_rule_needing_all_columns_disables_projection(self, data_file, write_config):
+        """Test that a rule without declared columns loads every column."""
+        loaded, _ = self._loaded_columns(write_config(data_file, [
+            {"type": "MandatoryFieldCheck", "severity": "ERROR", "params": {"fields": ["id"]}},
+            {"type": "DuplicateRowCheck", "severity": "ERROR", "params": {"consider_all_fields": True}},
+        ]))
+
+        assert loaded[-1] is None
+
+    def test_projection_can_be_disabled(self, data_file, write_config):
+        """Test that column_projection: false loads every column."""
+        loaded, _ = self._loaded_columns(write_config(
+            data_file,
+            [{"type": "MandatoryFieldCheck", "severity": "ERROR", "params": {"fields": ["id"]}}],
+            processing={"column_projection": False},
+        ))
+
+        assert loaded[-1] is None
+
+
+class TestParallelFiles:
+    """Test process-pool validation of multiple files."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        files = []
+        for i in range(4):
+            data_file = tmp_path / f"feed_{i}.csv"
+            pd.DataFrame({
+                "id": range(20),
+                "amount": [j * (i + 1) for j in range(20)],
+            }).to_csv(data_file, index=False)
+            files.append({
+                "name": f"feed_{i}",
+                "path": str(data_file),
+                "validations": [
+                    {"type": "EmptyFileCheck", "severity": "ERROR"},
+                    {
+                        "type": "RangeCheck",
+                        "severity": "ERROR" if i % 2 else "WARNING",
+                        "params": {"field": "amount", "min_value": 0, "max_value": 40}
+                    },
+                ]
+            })
+        return files
+
+    def test_worker_count_honours_config(self, files, write_config):
+        """Test that worker count is capped by max_workers and file count."""
+        def worker_count(**processing):
+            engine = ValidationEngine.from_config(write_config(files=files, processing=processing))
+            return engine._parallel_worker_count()
+
+        assert worker_count(parallel_files=False) == 1
+        assert worker_count(parallel_files=True, max_workers=2) == 2
+        assert worker_count(parallel_files=True, max_workers=64) == 4
+
+    def test_parallel_results_match_sequential(self, files, write_config):
+        """Test that parallel reports match sequential ones in config order."""
+        sequential = ValidationEngine.from_config(
+            write_config(files=files, processing={"parallel_files": False})
+        ).run(verbose=False)
+        parallel = ValidationEngine.from_config(
+            write_config(files=files, processing={"parallel_files": True, "max_workers": 2})
+        ).run(verbose=False)
+
+        assert [r.file_name for r in parallel.file_reports] == ["feed_0", "feed_1", "feed_2", "feed_3"]
+        assert parallel.overall_status == sequential.overall_status
+        assert parallel.total_errors == sequential.total_errors
+        assert parallel.total_warnings == sequential.total_warnings
+        for a, b in zip(parallel.file_reports, sequential.file_reports):
+            assert a.status == b.status
+            assert [r.failed_count for r in a.validation_results] == [r.failed_count for r in b.validation_results]
+
+    def test_parallel_missing_file_reported(self, files, write_config):
+        """Test that a missing file in one worker does not affect the others."""
+        engine = ValidationEngine.from_config(
+            write_config(files=files, processing={"parallel_files": True, "max_workers": 2})
+        )
+        engine.config.files[1]["path"] = str(Path(files[1]["path"]).with_name("does_not_exist.csv"))
+
+        report = engine.run(verbose=False)
+
+        assert report.file_reports[1].status == Status.FAILED
+        assert report.file_reports[1].validation_results[0].rule_name == "FileExistence"
+        assert report.file_reports[0].status == Status.PASSED
+
+
+class TestParallelChunks:
+    """Test chunk-parallel evaluation within a single file."""
+
+    VALIDATIONS = [
+        {
+            "type": "RegexCheck",
+            "severity": "ERROR",
+            "params": {"field": "email", "pattern": r"^[^@]+@[^@]+$"}
+        },
+        {
+            "type": "DateFormatCheck",
+            "severity": "ERROR",
+            "params": {"field": "signup", "format": "%Y-%m-%d"}
+        },
+        {
+            "type": "InlineBusinessRuleCheck",
+            "severity": "WARNING",
+            "params": {"rule": "age >= 18", "error_message": "Too young"}
+        },
+        {
+            "type": "ValidValuesCheck",
+            "severity": "ERROR",
+            "params": {"field": "status", "valid_values": ["active"]}
+        },
+        {
+            "type": "CompletenessCheck",
+            "severity": "WARNING",
+            "params": {"field": "notes", "min_completeness": 0.9}
+        },
+        {
+            "type": "UniqueKeyCheck",
+            "severity": "ERROR",
+            "params": {"fields": ["id"]}
+        },
+    ]
+
+    @pytest.fixture
+    def data_file(self, tmp_path):
+        data_file = tmp_path / "chunked.csv"
+        rows = 500
+        pd.DataFrame({
+            "id": range(rows),
+            "email": ["bad" if i % 37 == 0 else f"user{i}@example.com" for i in range(rows)],
+            "signup": ["2024-13-01" if i % 41 == 0 else "2024-01-15" for i in range(rows)],
+            "age": [10 if i % 53 == 0 else 30 for i in range(rows)],
+            "status": ["gone" if i % 61 == 0 else "active" for i in range(rows)],
+            "notes": [None if i % 3 == 0 else "x" for i in range(rows)],
+        }).to_csv(data_file, index=False)
+        return data_file
+
+    def _engine(self, write_config, data_file, parallel_chunks):
+        processing = {
+            "chunk_size": 40,
+            "max_sample_failures": 5,
+            "parallel_chunks": parallel_chunks,
+            "max_workers": 2,
+        }
+        return ValidationEngine.from_config(write_config(data_file, self.VALIDATIONS, processing=processing))
+
+    def test_chunk_worker_count(self, data_file, write_config):
+        """Test that chunk workers are only used when parallel_chunks is enabled."""
+        assert self._engine(write_config, data_file, False)._chunk_worker_count() == 1
+        assert self._engine(write_config, data_file, True)._chunk_worker_count() == 2
+
+    def test_parallel_chunks_match_sequential(self, data_file, write_config):
+        """Test that merged partial states give the same results as a sequential scan."""
+        sequential = self._engine(write_config, data_file, False).run(verbose=False)
+        parallel = self._engine(write_config, data_file, True).run(verbose=False)
+
+        sequential_results = sequential.file_reports[0].validation_results
+        parallel_results = parallel.file_reports[0].validation_results
+
+        assert not any(r.message.startswith("Error") for r in parallel_results)
+        for a, b in zip(parallel_results, sequential_results):
+            assert a.rule_name == b.rule_name
+            assert a.passed == b.passed
+            assert a.message == b.message
+            assert a.failed_count == b.failed_count
+            assert a.total_count == b.total_count
+            assert a.sample_failures == b.sample_failures
+
+
+class TestRowGroupSkipping:
+    """Test skipping Parquet row groups that their statistics settle."""
+
+    VALIDATIONS = [
+        {
+            "type": "RangeCheck",
+            "severity": "ERROR",
+            "params": {"field": "age", "min_value": 0, "max_value": 120}
+        },
+        {
+            "type": "MandatoryFieldCheck",
+            "severity": "ERROR",
+            "params": {"fields": ["id"]}
+        },
+        {
+            "type": "CompletenessCheck",
+            "severity": "WARNING",
+            "params": {"field": "email", "min_completeness": 0.99}
+        },
+    ]
+
+    @pytest.fixture
+    def data_file(self, tmp_path):
+        data_file = tmp_path / "row_groups.parquet"
+        rows = 1000
+        pd.DataFrame({
+            "id": range(rows),
+            "age": [150 if i == 712 else 20 + i % 50 for i in range(rows)],
+            "email": [None if i in (130, 140) else f"user{i}@example.com" for i in range(rows)],
+        }).to_parquet(data_file, index=False, row_group_size=100)
+        return data_file
+
+    def _run(self, write_config, data_file, row_group_skipping, parallel_chunks=False):
+        from validation_framework.loaders.parquet_loader import ParquetLoader
+
+        processing = {
+            "chunk_size": 150,
+            "row_group_skipping": row_group_skipping,
+            "parallel_chunks": parallel_chunks,
+            "max_workers": 2,
+        }
+        engine = ValidationEngine.from_config(write_config(data_file, self.VALIDATIONS, processing=processing))
+        original_read = ParquetLoader._read_row_groups
+        decoded = []
+
+        def tracking_read(loader, indices):
+            decoded.extend(indices)
+            return original_read(loader, indices)
+
+        with patch.object(ParquetLoader, "_read_row_groups", autospec=True, side_effect=tracking_read):
+            report = engine.run(verbose=False)
+        return decoded, report.file_reports[0].validation_results
+
+    def test_only_unsettled_row_groups_decoded(self, data_file, write_config):
+        """Test that row groups settled by statistics are not decoded."""
+        decoded, results = self._run(write_config, data_file, True)
+
+        # Row group 7 holds an out-of-range age; all others are settled
+        assert decoded == [7]
+        assert results[0].failed_count == 1
+        assert results[0].sample_failures[0]["row"] == 712
+        assert results[1].passed
+        assert results[2].total_count == 1000
+        assert results[2].message == "Completeness 99.80% meets minimum 99%"
+
+    @pytest.mark.parametrize("parallel_chunks", [False, True])
+    def test_results_match_full_scan(self, data_file, write_config, parallel_chunks):
+        """Test that skipping row groups gives the same results as decoding them all."""
+        _, skipped = self._run(write_config, data_file, True, parallel_chunks)
+        decoded, full = self._run(write_config, data_file, False)
+
+        assert decoded == list(range(10))
+        for a, b in zip(skipped, full):
+            assert a.rule_name == b.rule_name
+            assert a.passed == b.passed
+            assert a.message == b.message
+            assert a.failed_count == b.failed_count
+            assert a.total_count == b.total_count
+            assert a.sample_failures == b.sample_failures
+
+
+class TestMetadataPlanner:
+    """Test answering validations from Parquet footer statistics."""
+
+    @pytest.fixture
+    def data_file(self, tmp_path):
+        data_file = tmp_path / "footer.parquet"
+        pd.DataFrame({
+            "id": range(500),
+            "age": [20 + i % 50 for i in range(500)],
+            "score": [float(i) for i in range(500)],
+        }).to_parquet(data_file, index=False, row_group_size=100)
+        return data_file
+
+    @staticmethod
+    def _run(config):
+        from validation_framework.loaders.parquet_loader import ParquetLoader
+
+        engine = ValidationEngine.from_config(config)
+        with patch.object(ParquetLoader, "_read_row_groups", autospec=True) as mock_read:
+            report = engine.run(verbose=False)
+        return mock_read, report.file_reports[0].validation_results
+
+    def test_settled_rules_read_no_data(self, data_file, write_config):
+        """Test that rules settled by the footer are answered without decoding any row group."""
+        mock_read, results = self._run(write_config(data_file, [
+            {"type": "EmptyFileCheck", "severity": "ERROR", "params": {"check_data_rows": True}},
+            {"type": "RowCountRangeCheck", "severity": "ERROR", "params": {"min_rows": 500, "max_rows": 500}},
+            {"type": "ColumnPresenceCheck", "severity": "ERROR", "params": {"required_columns": ["id", "age"]}},
+            {"type": "RangeCheck", "severity": "ERROR", "params": {"field": "age", "min_value": 18, "max_value": 70}},
+            {"type": "MandatoryFieldCheck", "severity": "ERROR", "params": {"fields": ["id", "age"]}},
+            {"type": "CompletenessCheck", "severity": "WARNING", "params": {"field": "id", "min_completeness": 1.0}},
+        ]))
+
+        mock_read.assert_not_called()
+        assert all(result.passed for result in results)
+        assert all(result.from_metadata for result in results)
+        assert results[3].total_count == 500
+        assert results[3].to_dict()["from_metadata"] is True
+
+    def test_unsettled_rules_scan_data(self, data_file, write_config):
+        """Test that rules the statistics cannot settle still read the data."""
+        engine = ValidationEngine.from_config(write_config(data_file, [
+            {"type": "RangeCheck", "severity": "ERROR", "params": {"field": "age", "min_value": 18, "max_value": 60}},
+            {"type": "MandatoryFieldCheck", "severity": "ERROR", "params": {"fields": ["score"]}},
+            {"type": "RowCountRangeCheck", "severity": "ERROR", "params": {"min_rows": 1}},
+        ]))
+        report = engine.run(verbose=False)
+        results = report.file_reports[0].validation_results
+
+        assert not results[0].passed
+        assert not results[0].from_metadata
+        # Floating-point null counts do not cover NaN values
+        assert results[1].passed and not results[1].from_metadata
+        assert results[2].from_metadata
+
+
+class TestExactRowCount:
+    """Test that row-count rules see exact counts for estimated files."""
+
+    def test_row_count_rule_uses_exact_count(self, tmp_path, write_config, monkeypatch):
+        """Test that RowCountRangeCheck gets an exact count, not the sampled estimate."""
+        from validation_framework.loaders import csv_loader
+
+        monkeypatch.setattr(csv_loader, "ESTIMATE_SAMPLE_BYTES", 64)
+        data_file = tmp_path / "counted.csv"
+        pd.DataFrame({
+            "id": range(1000),
+            "note": ["short" if i < 10 else "a much longer note, quoted\nacross lines" for i in range(1000)],
+        }).to_csv(data_file, index=False)
+
+        config = write_config(data_file, [{
+            "type": "RowCountRangeCheck",
+            "severity": "ERROR",
+            "params": {"min_rows": 1000, "max_rows": 1000},
+        }])
+
+        report = ValidationEngine.from_config(config).run(verbose=False)
+        file_report = report.file_reports[0]
+
+        assert file_report.validation_results[0].passed
+        assert file_report.metadata["total_rows"] == 1000
+
+    def test_row_count_rule_counts_json_arrays(self, tmp_path, write_config, monkeypatch):
+        """Test that JSON arrays larger than the estimate sample are counted exactly."""
+        import json
+        from validation_framework.loaders import json_loader
+
+        monkeypatch.setattr(json_loader, "ESTIMATE_SAMPLE_RECORDS", 100)
+        data_file = tmp_path / "counted.json"
+        data_file.write_text(json.dumps([
+            {"id": i, "note": "short" if i < 100 else "a much longer note"} for i in range(1000)
+        ]))
+
+        config = write_config(data_file, [{
+            "type": "RowCountRangeCheck",
+            "severity": "ERROR",
+            "params": {"min_rows": 1000, "max_rows": 1000},
+        }])
+
+        report = ValidationEngine.from_config(config).run(verbose=False)
+        file_report = report.file_reports[0]
+
+        assert file_report.validation_results[0].passed
+        assert file_report.metadata["total_rows"] == 1000
+
+
+class TestRulePlanner:
+    """Test cost-based rule ordering and fail-fast skipping."""
+
+    VALIDATIONS = [
+        {
+            "type": "StatisticalOutlierCheck",
+            "severity": "WARNING",
+            "params": {"field": "amount"},
+        },
+        {
+            "type": "MandatoryFieldCheck",
+            "severity": "ERROR",
+            "params": {"fields": ["id"]},
+        },
+        {"type": "RowCountRangeCheck", "severity": "WARNING", "params": {"min_rows": 1}},
+        {
+            "type": "ColumnPresenceCheck",
+            "severity": "ERROR",
+            "params": {"required_columns": ["id", "customer_name"]},
+        },
+    ]
+
+    @pytest.fixture
+    def data_file(self, tmp_path):
+        data_file = tmp_path / "planned.csv"
+        pd.DataFrame({"id": range(20), "amount": range(20)}).to_csv(data_file, index=False)
+        return data_file
+
+    def test_execution_order_puts_gates_and_cheap_rules_first(self):
+        """Test that gates run first and the rest run by increasing cost."""
+        from validation_framework.core.planner import execution_order
+
+        registry = get_registry()
+        names = [
+            "StatisticalOutlierCheck", "RegexCheck", None, "RowCountRangeCheck",
+            "ConditionalValidation", "EmptyFileCheck",
+        ]
+        rules = [
+            registry.get(name)(name=name, severity="ERROR", params={}) if name else None
+            for name in names
+        ]
+
+        assert execution_order(rules) == [5, 3, 1, 4, 0]
+
+    @pytest.mark.parametrize("name, cost", [
+        ("RowCountRangeCheck", "FILE"),
+        ("MandatoryFieldCheck", "VECTORIZED"),
+        ("RangeCheck", "VECTORIZED"),
+        ("BlankRecordCheck", "PYTHON_LOOP"),
+        ("StringLengthCheck", "PYTHON_LOOP"),
+        ("InlineLookupCheck", "PYTHON_LOOP"),
+        ("StatisticalOutlierCheck", "MATERIALIZE"),
+    ])
+    def test_estimated_costs(self, name, cost):
+        """Test that rules with per-row Python work are not estimated as vectorized."""
+        from validation_framework.validations.base import RuleCost
+
+        rule = get_registry().get(name)(name=name, severity="ERROR", params={})
+
+        assert rule.estimate_cost() == RuleCost[cost]
+
+    def test_fail_fast_skips_scans_after_failed_gate(self, data_file, write_config):
+        """Test that a failed ERROR gate skips data scans but not file-level rules."""
+        engine = ValidationEngine.from_config(
+            write_config(data_file, self.VALIDATIONS, processing={"fail_fast": True})
+        )
+
+        with patch("validation_framework.validations.builtin.advanced_checks.StatisticalOutlierCheck.validate") as outlier:
+            report = engine.run(verbose=False)
+
+        file_report = report.file_reports[0]
+        results = file_report.validation_results
+        assert [r.rule_name for r in results] == [
+            "StatisticalOutlierCheck", "MandatoryFieldCheck", "RowCountRangeCheck", "ColumnPresenceCheck"
+        ]
+        assert results[0].skipped and results[1].skipped
+        assert "ColumnPresenceCheck" in results[0].message
+        assert results[2].passed and not results[2].skipped
+        assert not results[3].passed
+        outlier.assert_not_called()
+        # Only the failed gate counts as an error
+        assert file_report.error_count == 1
+        assert file_report.status == Status.FAILED
+
+    def test_without_fail_fast_every_rule_runs(self, data_file, write_config):
+        """Test that a failed gate skips nothing unless fail_fast is set."""
+        config = write_config(data_file, self.VALIDATIONS, processing={"fail_fast": False})
+        report = ValidationEngine.from_config(config).run(verbose=False)
+        results = report.file_reports[0].validation_results
+
+        assert not any(r.skipped for r in results)
+        assert results[1].passed
+
+
+class TestStopAfterFailures:
+    """Test rules stopping once they reach stop_after_failures."""
+
+    @pytest.fixture
+    def data_file(self, tmp_path):
+        data_file = tmp_path / "failing.csv"
+        pd.DataFrame({
+            "id": range(100),
+            "email": ["bad"] * 100,
+            "status": ["active"] * 100,
+            "notes": [""] * 100,
+        }).to_csv(data_file, index=False)
+        return data_file
+
+    @staticmethod
+    def _regex_check(**params):
+        return {
+            "type": "RegexCheck",
+            "severity": "ERROR",
+            "params": {"field": "email", "pattern": r"^[^@]+@[^@]+$", **params},
+        }
+
+    def test_scan_stops_once_every_rule_has_failed(self, data_file, write_config):
+        """Test that the loader stops once every rule has reached the limit."""
+        from validation_framework.loaders.csv_loader import CSVLoader
+
+        config = write_config(
+            data_file, [self._regex_check()], processing={"chunk_size": 10, "stop_after_failures": 5}
+        )
+        engine = ValidationEngine.from_config(config)
+        original_load = CSVLoader.load
+        chunks_read = []
+
+        def counting_load(loader):
+            for chunk in original_load(loader):
+                chunks_read.append(len(chunk))
+                yield chunk
+
+        with patch.object(CSVLoader, "load", autospec=True, side_effect=counting_load):
+            report = engine.run(verbose=False)
+
+        result = report.file_reports[0].validation_results[0]
+        assert not result.passed
+        assert result.stopped_early
+        assert result.failed_count == 10
+        assert result.total_count == 10
+        assert "counts are lower bounds" in result.message
+        assert result.to_dict()["stopped_early"] is True
+        assert chunks_read == [10]
+
+    def test_rules_without_stops_early_read_whole_file(self, data_file, write_config):
+        """Test that the per-rule param applies and other rules still see every row."""
+        validations = [
+            self._regex_check(stop_after_failures=1),
+            {
+                "type": "CompletenessCheck",
+                "severity": "WARNING",
+                "params": {"field": "status", "min_completeness": 0.5, "stop_after_failures": 1},
+            },
+        ]
+        config = write_config(data_file, validations, processing={"chunk_size": 10})
+        report = ValidationEngine.from_config(config).run(verbose=False)
+        regex, completeness = report.file_reports[0].validation_results
+
+        assert regex.stopped_early and regex.total_count == 10
+        assert not completeness.stopped_early
+        assert completeness.total_count == 100
+
+    def test_without_limit_counts_are_exact(self, data_file, write_config):
+        """Test that rules read the whole file unless a limit is set."""
+        config = write_config(data_file, [self._regex_check()], processing={"chunk_size": 10})
+        result = ValidationEngine.from_config(config).run(verbose=False).file_reports[0].validation_results[0]
+
+        assert not result.stopped_early
+        assert result.failed_count == 100
+
+    def test_parallel_chunks_stop_early(self, data_file, write_config):
+        """Test that merged worker states are checked against the limit."""
+        processing = {"chunk_size": 10, "stop_after_failures": 5, "parallel_chunks": True, "max_workers": 2}
+        config = write_config(data_file, [self._regex_check()], processing=processing)
+        result = ValidationEngine.from_config(config).run(verbose=False).file_reports[0].validation_results[0]
+
+        assert result.stopped_early
+        assert 10 <= result.failed_count < 100
+
+    @pytest.mark.parametrize("rule_type, params", [
+        ("MandatoryFieldCheck", {"fields": ["notes"]}),
+        ("RangeCheck", {"field": "id", "max_value": -1}),
+        ("StringLengthCheck", {"field": "email", "min_length": 5}),
+        ("NumericPrecisionCheck", {"field": "id", "exact_decimal_places": 2}),
+        ("CrossFieldComparisonCheck", {"field_a": "id", "operator": ">", "field_b": "id"}),
+        ("InlineRegexCheck", {"field": "email", "pattern": "@"}),
+        ("InlineBusinessRuleCheck", {"rule": "id < 0"}),
+        ("InlineLookupCheck", {"field": "status", "reference_values": ["inactive"]}),
+        ("BlankRecordCheck", {"exclude_fields": ["id", "email", "status"]}),
+    ])
+    def test_limit_above_sample_cap(self, data_file, write_config, rule_type, params):
+        """Test that failures beyond the sample cap still count towards the limit."""
+        validations = [{"type": rule_type, "severity": "ERROR", "params": params}]
+        processing = {"chunk_size": 10, "stop_after_failures": 20, "max_sample_failures": 5}
+        config = write_config(data_file, validations, processing=processing)
+        result = ValidationEngine.from_config(config).run(verbose=False).file_reports[0].validation_results[0]
+
+        assert result.stopped_early
+        assert result.failed_count == 20
+        assert len(result.sample_failures) == 5
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
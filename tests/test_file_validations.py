@@ -17,6 +17,7 @@ from validation_framework.validations.builtin.file_checks import (
     RowCountRangeCheck,
     FileSizeCheck
 )
+from validation_framework.core.results import Severity
 from tests.conftest import create_data_iterator
 
 
@@ -70,6 +71,33 @@ class TestEmptyFileCheck:
         
         assert result.passed is True
 
+    @pytest.mark.parametrize("content,passed", [
+        ('[{"id": 1}, {"id": 2', True),
+        ("[ \n ]", False),
+        ('{"id": {"0": 1}}', True),
+    ])
+    def test_json_data_rows_read_only_first_record(self, tmp_path, content, passed):
+        """Test that JSON arrays are checked from their first record only."""
+        path = tmp_path / "data.json"
+        path.write_text(content)
+
+        validation = EmptyFileCheck(name="empty", severity=Severity.ERROR, params={"check_data_rows": True})
+        result = validation.validate_file({"file_path": str(path), "file_format": "json"})
+
+        assert result.passed is passed
+
+    @pytest.mark.parametrize("rows,passed", [(0, False), (3, True)])
+    def test_excel_data_rows_streamed(self, tmp_path, monkeypatch, rows, passed):
+        """Test that Excel sheets are checked without pd.read_excel."""
+        path = tmp_path / "data.xlsx"
+        pd.DataFrame({"id": range(rows)}).to_excel(path, index=False)
+        monkeypatch.setattr(pd, "read_excel", None)
+
+        validation = EmptyFileCheck(name="empty", severity=Severity.ERROR, params={"check_data_rows": True})
+        result = validation.validate_file({"file_path": str(path), "file_format": "excel"})
+
+        assert result.passed is passed
+
 
 # ============================================================================
 # ROW COUNT RANGE CHECK TESTS
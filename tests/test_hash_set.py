@@ -0,0 +1,83 @@
+"""
+Tests for the NumPy open-addressing hash set.
+"""
+
+import numpy as np
+import pytest
+
+from validation_framework.core.hash_set import UInt64PairSet
+
+
+def _u64(values):
+    return np.array(values, dtype=np.uint64)
+
+
+@pytest.mark.unit
+class TestUInt64PairSet:
+    """Tests for UInt64PairSet."""
+
+    def test_insert_and_contains(self):
+        """Test basic membership after a batch insert."""
+        table = UInt64PairSet()
+
+        inserted = table.insert_many(_u64([1, 2, 3]), _u64([10, 20, 30]))
+
+        assert inserted.tolist() == [True, True, True]
+        assert table.contains_many(_u64([1, 2, 4]), _u64([10, 20, 40])).tolist() == [True, True, False]
+        assert len(table) == 3
+
+    def test_pairs_with_same_key_are_distinct(self):
+        """Test that pairs sharing a lookup hash but not a check hash are both kept."""
+        table = UInt64PairSet()
+
+        assert table.insert_many(_u64([5, 5]), _u64([1, 2])).tolist() == [True, True]
+        assert table.contains_many(_u64([5, 5, 5]), _u64([1, 2, 3])).tolist() == [True, True, False]
+
+    def test_repeats_within_batch(self):
+        """Test that only the first occurrence of a repeated pair is new."""
+        table = UInt64PairSet()
+
+        inserted = table.insert_many(_u64([7, 8, 7, 7]), _u64([1, 1, 1, 2]))
+
+        assert inserted.tolist() == [True, True, False, True]
+        assert len(table) == 3
+
+    def test_zero_pair(self):
+        """Test that the empty-slot marker can be stored as a real pair."""
+        table = UInt64PairSet()
+
+        assert table.contains_many(_u64([0]), _u64([0])).tolist() == [False]
+        assert table.insert_many(_u64([0, 0]), _u64([0, 0])).tolist() == [True, False]
+        assert table.contains_many(_u64([0]), _u64([0])).tolist() == [True]
+        assert len(table) == 1
+
+    def test_growth_matches_python_set(self):
+        """Test that resizing keeps every pair against a reference set."""
+        rng = np.random.default_rng(42)
+        table = UInt64PairSet(initial_capacity=8)
+        reference = set()
+
+        for _ in range(20):
+            keys = rng.integers(0, 2000, 500).astype(np.uint64)
+            checks = keys % np.uint64(3)
+            expected = []
+            for pair in zip(keys.tolist(), checks.tolist()):
+                expected.append(pair not in reference)
+                reference.add(pair)
+
+            assert table.insert_many(keys, checks).tolist() == expected
+
+        keys, checks = table.pairs()
+        assert set(zip(keys.tolist(), checks.tolist())) == reference
+        assert len(table) == len(reference)
+        assert len(table) <= table.capacity * table.max_load
+
+    def test_clear(self):
+        """Test that clear removes every pair."""
+        table = UInt64PairSet()
+        table.insert_many(_u64([1, 0]), _u64([1, 0]))
+
+        table.clear()
+
+        assert len(table) == 0
+        assert table.contains_many(_u64([1, 0]), _u64([1, 0])).tolist() == [False, False]
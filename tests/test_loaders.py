@@ -12,7 +12,9 @@ from pathlib import Path
 from validation_framework.loaders.factory import LoaderFactory
 from validation_framework.loaders.csv_loader import CSVLoader
 from validation_framework.loaders.json_loader import JSONLoader
-from validation_framework.loaders.base import DataLoader
+from validation_framework.loaders.excel_loader import ExcelLoader
+from validation_framework.loaders.parquet_loader import ParquetLoader
+from validation_framework.loaders.base import DataLoader, RowGroupStatistics
 
 
 @pytest.fixture
@@ -230,6 +232,594 @@ class TestCSVLoader:
             Path(temp_path).unlink()
 
 
+@pytest.mark.unit
+class TestCSVLoaderPyArrowEngine:
+    """Tests for the multithreaded pyarrow CSV engine."""
+
+    def test_matches_pandas_engine(self, temp_csv_file):
+        """Test that both engines return the same data."""
+        pandas_df = pd.concat(CSVLoader(temp_csv_file).load(), ignore_index=True)
+        arrow_df = pd.concat(CSVLoader(temp_csv_file, engine="pyarrow").load(), ignore_index=True)
+
+        pd.testing.assert_frame_equal(arrow_df, pandas_df, check_dtype=False)
+
+    def test_chunks_follow_chunk_size(self, large_csv_file):
+        """Test that record batches are regrouped into chunk_size rows."""
+        loader = CSVLoader(large_csv_file, chunk_size=300, engine="pyarrow", block_size=1024)
+
+        chunks = list(loader.load())
+
+        assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+        assert chunks[-1]["id"].tolist() == list(range(900, 1000))
+
+    def test_dates_stay_strings(self, tmp_path):
+        """Test that date columns are not converted, as with the pandas engine."""
+        path = tmp_path / "dates.csv"
+        path.write_text("id,day\n1,2024-01-31\n2,\n")
+
+        chunk = next(CSVLoader(str(path), engine="pyarrow").load())
+
+        assert chunk["day"].iloc[0] == "2024-01-31"
+        assert pd.isna(chunk["day"].iloc[1])
+
+    def test_infer_types_disabled(self, temp_csv_file):
+        """Test that infer_types=False reads every column as strings."""
+        chunk = next(CSVLoader(temp_csv_file, engine="pyarrow", infer_types=False).load())
+
+        assert chunk["id"].tolist() == ["1", "2", "3", "4", "5"]
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty file yields one empty DataFrame."""
+        path = tmp_path / "empty.csv"
+        path.write_text("")
+
+        chunks = list(CSVLoader(str(path), engine="pyarrow").load())
+
+        assert len(chunks) == 1 and chunks[0].empty
+
+    def test_unknown_engine_rejected(self, temp_csv_file):
+        """Test that an unknown engine is rejected by the factory."""
+        with pytest.raises(RuntimeError, match="Unknown CSV engine"):
+            LoaderFactory.create_loader(temp_csv_file, engine="polars")
+
+
+@pytest.mark.unit
+class TestCSVRowCount:
+    """Tests for exact CSV row counts."""
+
+    def test_count_rows_excludes_header(self, large_csv_file):
+        """Test that count_rows() counts data rows only."""
+        assert CSVLoader(large_csv_file).count_rows() == 1000
+        assert CSVLoader(large_csv_file, header=None).count_rows() == 1001
+
+    def test_count_rows_skips_whitespace_lines(self, tmp_path):
+        """Test that whitespace-only lines are skipped by the count as they are by load()."""
+        path = tmp_path / "blank_lines.csv"
+        path.write_text("a,b\n1,2\n   \n3,4\n\t\n5,6\n")
+        loader = CSVLoader(str(path))
+
+        assert loader.count_rows() == sum(len(chunk) for chunk in loader.load()) == 3
+
+    def test_small_file_metadata_is_exact(self, temp_csv_file):
+        """Test that files smaller than the sample get an exact total_rows."""
+        metadata = CSVLoader(temp_csv_file).get_metadata()
+
+        assert metadata["total_rows"] == 5
+        assert metadata["estimated_rows"] == 5
+
+    def test_large_file_metadata_is_estimated(self, large_csv_file, monkeypatch):
+        """Test that larger files are estimated from a raw sample without a full count."""
+        from validation_framework.loaders import csv_loader
+
+        monkeypatch.setattr(csv_loader, "ESTIMATE_SAMPLE_BYTES", 4096)
+        metadata = CSVLoader(large_csv_file).get_metadata()
+
+        assert "total_rows" not in metadata
+        assert 900 <= metadata["estimated_rows"] <= 1200
+
+
+@pytest.mark.unit
+class TestMemoryMappedLoading:
+    """Tests for parsing byte ranges of memory-mapped files."""
+
+    def test_ranges_end_on_record_boundaries(self):
+        """Test that ranges never split a quoted field across a newline."""
+        from validation_framework.loaders.byte_ranges import record_ranges
+
+        data = b'a,"x\ny\nz"\nb,c\n'
+        ranges = list(record_ranges(data, 0, range_size=3, quotechar='"'))
+
+        assert [data[start:end] for start, end in ranges] == [b'a,"x\ny\nz"\n', b'b,c\n']
+
+    @pytest.mark.parametrize("parse_threads", [1, 3])
+    def test_csv_matches_sequential_load(self, tmp_path, parse_threads):
+        """Test that many small ranges give the same chunks as a normal load."""
+        path = tmp_path / "quoted.csv"
+        rows = [f'{i},"line {i}\nnext ""{i}""",{i % 3}' for i in range(100)]
+        path.write_text("id,note,group\n" + "\n\n".join(rows) + "\n")
+
+        expected = list(CSVLoader(str(path), chunk_size=30).load())
+        chunks = list(CSVLoader(
+            str(path), chunk_size=30, memory_map=True, range_size=50, parse_threads=parse_threads
+        ).load())
+
+        assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+        assert all(chunk.index[0] == 0 for chunk in chunks)
+        pd.testing.assert_frame_equal(
+            pd.concat(chunks, ignore_index=True), pd.concat(expected, ignore_index=True)
+        )
+
+    def test_csv_projection_and_header_only(self, tmp_path):
+        """Test column projection and a file holding only a header."""
+        path = tmp_path / "header.csv"
+        path.write_text("id,name\n")
+
+        df = next(CSVLoader(str(path), memory_map=True, columns=["name"]).load())
+
+        assert list(df.columns) == ["name"]
+        assert df.empty
+
+    def test_jsonl_matches_sequential_load(self, tmp_path):
+        """Test that JSON Lines ranges give the same records as a normal load."""
+        path = tmp_path / "records.jsonl"
+        lines = [f'{{"id": {i}, "customer": {{"name": "c{i}"}}}}' for i in range(25)]
+        path.write_text("\n".join(lines[:10]) + "\n\n{bad\n" + "\n".join(lines[10:]))
+
+        expected = list(JSONLoader(str(path), chunk_size=10).load())
+        chunks = list(JSONLoader(
+            str(path), chunk_size=10, memory_map=True, range_size=64, parse_threads=2
+        ).load())
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        for chunk, expected_chunk in zip(chunks, expected):
+            pd.testing.assert_frame_equal(chunk, expected_chunk)
+
+
+@pytest.mark.unit
+class TestJSONArrayStreaming:
+    """Tests for incremental parsing of top-level JSON arrays."""
+
+    def test_reader_handles_values_split_across_buffers(self):
+        """Test that elements cut by the buffer boundary are decoded whole."""
+        import io
+        import json
+        from validation_framework.loaders.json_stream import JSONArrayReader
+
+        values = [{"id": 1, "note": "a, ] b"}, 12345.678, -1e-05, [1, [2]], None, True, "x"]
+        text = " \n" + json.dumps(values, indent=2) + "\n"
+
+        for buffer_size in (1, 3, 7, 64):
+            assert list(JSONArrayReader(io.StringIO(text), buffer_size=buffer_size)) == values
+
+    @pytest.mark.parametrize("text", ["[1, 2", "[1 2]", "[1,]", "[1] []", "{}"])
+    def test_reader_rejects_malformed_arrays(self, text):
+        """Test that malformed or non-array documents raise JSONDecodeError."""
+        import io
+        import json
+        from validation_framework.loaders.json_stream import JSONArrayReader
+
+        with pytest.raises(json.JSONDecodeError):
+            list(JSONArrayReader(io.StringIO(text), buffer_size=2))
+
+    def test_loader_yields_chunks_while_reading(self, tmp_path, monkeypatch):
+        """Test that chunks are built from the stream rather than a whole-file parse."""
+        import json
+        from validation_framework.loaders import json_loader, json_stream
+
+        path = tmp_path / "orders.json"
+        path.write_text(json.dumps([{"id": i, "customer": {"name": f"c{i}"}} for i in range(25)]))
+        monkeypatch.setattr(json_stream, "BUFFER_SIZE", 16)
+        monkeypatch.setattr(json_loader.json, "load", None)
+
+        chunks = list(JSONLoader(str(path), chunk_size=10).load())
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert list(chunks[0].columns) == ["id", "customer_name"]
+        assert chunks[2]["id"].tolist() == [20, 21, 22, 23, 24]
+
+    def test_loader_reports_invalid_array(self, tmp_path):
+        """Test that a truncated array fails with the loader's error."""
+        path = tmp_path / "truncated.json"
+        path.write_text('[{"id": 1}, {"id": 2')
+
+        with pytest.raises(RuntimeError, match="Invalid JSON"):
+            list(JSONLoader(str(path), lines=False).load())
+
+    def test_metadata_estimates_large_arrays(self, tmp_path, monkeypatch):
+        """Test that row counts come from a sample of the array."""
+        import json
+        from validation_framework.loaders import json_loader
+
+        path = tmp_path / "orders.json"
+        path.write_text(json.dumps([{"id": i, "code": "abcdef"} for i in range(1000)]))
+
+        assert JSONLoader(str(path)).get_metadata()["estimated_rows"] == 1000
+
+        monkeypatch.setattr(json_loader, "ESTIMATE_SAMPLE_RECORDS", 100)
+        assert 900 <= JSONLoader(str(path)).get_metadata()["estimated_rows"] <= 1100
+
+    def test_count_rows_is_exact(self, tmp_path, monkeypatch):
+        """Test that count_rows() counts every array element, past the estimate sample."""
+        import json
+        from validation_framework.loaders import json_loader
+
+        path = tmp_path / "orders.json"
+        path.write_text(json.dumps([{"id": i, "code": "x" * (i % 50)} for i in range(1000)]))
+        monkeypatch.setattr(json_loader, "ESTIMATE_SAMPLE_RECORDS", 100)
+        monkeypatch.setattr(JSONLoader, "_records_to_dataframe", None)
+
+        assert JSONLoader(str(path)).count_rows() == 1000
+
+    def test_count_rows_of_invalid_array(self, tmp_path):
+        """Test that a truncated array is not counted."""
+        path = tmp_path / "truncated.json"
+        path.write_text('[{"id": 1}, {"id": 2')
+
+        assert JSONLoader(str(path), lines=False).count_rows() is None
+
+
+@pytest.fixture
+def jsonl_with_bad_lines(tmp_path):
+    """JSON Lines file with nested objects, blank lines and invalid lines."""
+    import json
+
+    lines = []
+    for i in range(30):
+        lines.append(json.dumps({"id": i, "customer": {"name": f"c{i}", "tier": i % 3}}))
+        if i % 10 == 4:
+            lines.append("{not json")
+        if i == 12:
+            lines.extend(["", "[1, 2]"])
+    path = tmp_path / "events.jsonl"
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.mark.unit
+class TestJSONLinesEngines:
+    """Tests for the python and pyarrow JSON Lines engines."""
+
+    @pytest.mark.parametrize("engine", ["python", "pyarrow"])
+    def test_engines_agree(self, jsonl_with_bad_lines, engine):
+        """Test that both engines yield the same flattened chunks."""
+        pytest.importorskip("pyarrow")
+
+        chunks = list(JSONLoader(str(jsonl_with_bad_lines), chunk_size=8, lines=True, engine=engine).load())
+        df = pd.concat(chunks, ignore_index=True)
+
+        assert [len(chunk) for chunk in chunks] == [8, 8, 8, 6]
+        assert list(df.columns) == ["id", "customer_name", "customer_tier"]
+        assert df["id"].tolist() == list(range(30))
+        assert df["customer_name"].iloc[29] == "c29"
+
+    @pytest.mark.parametrize("engine", ["python", "pyarrow"])
+    def test_invalid_lines_reported_once(self, jsonl_with_bad_lines, engine, caplog):
+        """Test that invalid lines are counted and reported in a single warning."""
+        pytest.importorskip("pyarrow")
+
+        loader = JSONLoader(str(jsonl_with_bad_lines), lines=True, engine=engine)
+        with caplog.at_level("WARNING", logger="validation_framework.loaders.json_loader"):
+            list(loader.load())
+
+        assert loader.invalid_lines == 4
+        assert len(loader.invalid_line_samples) == 4
+        assert "{not json" in loader.invalid_line_samples[0]
+        assert len([r for r in caplog.records if "invalid JSON line" in r.message]) == 1
+
+    def test_pyarrow_engine_projects_columns(self, jsonl_with_bad_lines):
+        """Test that the pyarrow engine returns only the requested columns."""
+        pytest.importorskip("pyarrow")
+
+        loader = JSONLoader(str(jsonl_with_bad_lines), lines=True, engine="pyarrow")
+        loader.columns = ["customer_tier"]
+
+        df = pd.concat(loader.load(), ignore_index=True)
+
+        assert list(df.columns) == ["customer_tier"]
+        assert df["customer_tier"].tolist() == [i % 3 for i in range(30)]
+
+    def test_count_rows_skips_blank_lines(self, tmp_path):
+        """Test that count_rows() counts the non-blank lines of a JSON Lines file."""
+        path = tmp_path / "events.jsonl"
+        path.write_text('{"id": 1}\n\n{"id": 2}\n  \n{"id": 3}\n')
+
+        assert JSONLoader(str(path)).count_rows() == 3
+
+    def test_unknown_engine_rejected(self, jsonl_with_bad_lines):
+        """Test that an unknown engine name raises an error."""
+        with pytest.raises(RuntimeError, match="Unknown JSON engine"):
+            LoaderFactory.create_loader(str(jsonl_with_bad_lines), file_format="json", engine="fast")
+
+
+@pytest.mark.unit
+class TestColumnProjection:
+    """Tests for loading a subset of columns."""
+
+    @pytest.mark.parametrize("engine", ["pandas", "pyarrow"])
+    def test_csv_loads_requested_columns(self, temp_csv_file, engine):
+        """Test that only the requested columns are loaded, in file order."""
+        loader = CSVLoader(temp_csv_file, engine=engine, columns=["id", "age"])
+
+        df = pd.concat(loader.load(), ignore_index=True)
+
+        assert list(df.columns) == ["id", "age"]
+        assert df["age"].tolist() == [25, 30, 35, 40, 45]
+
+    def test_csv_without_header(self, tmp_path):
+        """Test that positional columns are projected when there is no header row."""
+        path = tmp_path / "no_header.csv"
+        path.write_text("1,a,x\n2,b,y\n")
+
+        pandas_df = next(CSVLoader(str(path), header=None, columns=[0, 2]).load())
+        arrow_df = next(CSVLoader(str(path), header=None, columns=[0, 2], engine="pyarrow").load())
+
+        assert list(pandas_df.columns) == [0, 2]
+        pd.testing.assert_frame_equal(arrow_df, pandas_df, check_dtype=False)
+
+    def test_json_keeps_parents_of_flattened_columns(self, tmp_path):
+        """Test that nested fields needed for a flattened column are kept."""
+        path = tmp_path / "nested.json"
+        path.write_text(
+            '[{"id": 1, "note": "a", "customer": {"name": "Ann"}},'
+            ' {"id": 2, "note": "b", "customer": {"name": "Bob"}}]'
+        )
+
+        df = pd.concat(JSONLoader(str(path), columns=["customer_name"]).load(), ignore_index=True)
+
+        assert list(df.columns) == ["customer_name"]
+        assert len(df) == 2
+
+
+@pytest.mark.unit
+class TestExcelLoader:
+    """Tests for streaming Excel sheets with openpyxl."""
+
+    def test_chunks_match_read_excel(self, temp_excel_file, sample_dataframe):
+        """Test that streamed chunks hold the same data as pd.read_excel."""
+        chunks = list(ExcelLoader(temp_excel_file, chunk_size=2).load())
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        df = pd.concat(chunks, ignore_index=True)
+        pd.testing.assert_frame_equal(df, pd.read_excel(temp_excel_file), check_dtype=False)
+
+    def test_sheet_layout_follows_read_excel(self, tmp_path):
+        """Test blank rows, unnamed and repeated headers, and sheet selection."""
+        import openpyxl
+
+        workbook = openpyxl.Workbook()
+        workbook.active.append(["other"])
+        sheet = workbook.create_sheet("Data")
+        for row in [["id", None, "id"], [1, "NA", 2], [], [3, "x", 4, "extra"], [], []]:
+            sheet.append(row)
+        path = tmp_path / "report.xlsx"
+        workbook.save(path)
+
+        df = next(ExcelLoader(str(path), sheet_name="Data").load())
+        expected = pd.read_excel(path, sheet_name="Data")
+
+        assert list(df.columns) == ["id", "Unnamed: 1", "id.1", "Unnamed: 3"]
+        pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+
+    def test_loads_without_reading_whole_sheet(self, temp_excel_file, monkeypatch):
+        """Test that pd.read_excel is not used for .xlsx files."""
+        monkeypatch.setattr(pd, "read_excel", None)
+
+        loader = ExcelLoader(temp_excel_file, chunk_size=2)
+        loader.columns = ["id", "status"]
+
+        df = pd.concat(loader.load(), ignore_index=True)
+        metadata = loader.get_metadata()
+
+        assert list(df.columns) == ["id", "status"]
+        assert metadata["columns"] == ["id", "name", "email", "age", "balance", "status"]
+        assert metadata["total_rows"] == 5
+        assert metadata["dimensions"] == "A1:F6"
+        assert loader.count_rows() == 5
+
+    def test_header_only_sheet(self, tmp_path):
+        """Test that a sheet with only a header yields one empty chunk with its columns."""
+        path = tmp_path / "empty.xlsx"
+        pd.DataFrame(columns=["id", "name"]).to_excel(path, index=False)
+
+        chunks = list(ExcelLoader(str(path)).load())
+
+        assert len(chunks) == 1
+        assert list(chunks[0].columns) == ["id", "name"]
+        assert len(chunks[0]) == 0
+
+
+@pytest.fixture
+def row_group_parquet_file(tmp_path):
+    """Create a Parquet file with ten row groups of 100 rows."""
+    df = pd.DataFrame({
+        "id": range(1000),
+        "amount": [float(i) for i in range(1000)],
+        "name": ["row%d" % i for i in range(1000)],
+    })
+    df.loc[555, "amount"] = None
+
+    path = tmp_path / "row_groups.parquet"
+    df.to_parquet(path, index=False, row_group_size=100)
+    return str(path), df
+
+
+@pytest.mark.unit
+class TestParquetLoaderRowGroups:
+    """Tests for parallel row-group decoding and row-group statistics."""
+
+    @pytest.mark.parametrize("read_threads", [1, 4])
+    def test_chunks_keep_file_order(self, row_group_parquet_file, read_threads):
+        """Test that row groups decoded in parallel are regrouped in order."""
+        path, df = row_group_parquet_file
+        loader = ParquetLoader(path, chunk_size=250, read_threads=read_threads)
+
+        chunks = list(loader.load())
+
+        assert [len(chunk) for chunk in chunks] == [250, 250, 250, 250]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+    def test_row_group_statistics(self, row_group_parquet_file):
+        """Test that min/max/null-count statistics are read for each row group."""
+        path, _ = row_group_parquet_file
+
+        statistics = ParquetLoader(path).row_group_statistics()
+
+        assert len(statistics) == 10
+        assert statistics[5].num_rows == 100
+        assert statistics[5].columns["id"].kind == "integer"
+        assert statistics[5].columns["id"].min_value == 500
+        assert statistics[5].columns["id"].max_value == 599
+        assert statistics[5].columns["amount"].null_count == 1
+        assert statistics[5].columns["name"].kind == "string"
+
+    def test_skipped_row_groups_replaced_by_statistics(self, row_group_parquet_file):
+        """Test that skipped row groups are not decoded and chunks do not span them."""
+        path, df = row_group_parquet_file
+        loader = ParquetLoader(path, chunk_size=250)
+
+        items = list(loader.load_skipping(lambda statistics: statistics.index in (1, 2, 7)))
+
+        shapes = [item.index if isinstance(item, RowGroupStatistics) else len(item) for item in items]
+        assert shapes == [100, 1, 2, 250, 150, 7, 200]
+        assert items[3]["id"].iloc[0] == 300
+
+
+def _compress(data, compression):
+    """Compress bytes as a whole file in the given format."""
+    import bz2
+    import gzip
+    import lzma
+    import pyarrow as pa
+
+    if compression == "zstd":
+        sink = pa.BufferOutputStream()
+        with pa.CompressedOutputStream(sink, "zstd") as stream:
+            stream.write(data)
+        return sink.getvalue().to_pybytes()
+    return {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}[compression](data)
+
+
+def _bgzf(data, block_size=1000):
+    """Compress bytes as BGZF blocks, as bgzip does."""
+    import struct
+    import zlib
+
+    blocks = []
+    for start in range(0, len(data) + 1, block_size):
+        piece = data[start:start + block_size]
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        body = compressor.compress(piece) + compressor.flush()
+        blocks.append(
+            b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC\x02\x00"
+            + struct.pack("<H", len(body) + 25) + body
+            + struct.pack("<II", zlib.crc32(piece), len(piece))
+        )
+    return b"".join(blocks)
+
+
+@pytest.fixture
+def csv_bytes():
+    """CSV content with a quoted newline."""
+    rows = ['%d,"name %d%s"' % (i, i, "\nsecond line" if i % 50 == 0 else "") for i in range(500)]
+    return ("id,name\n" + "\n".join(rows) + "\n").encode()
+
+
+@pytest.mark.unit
+class TestCompressedInput:
+    """Tests for reading compressed CSV and JSON files."""
+
+    @pytest.mark.parametrize("compression,suffix", [
+        ("gzip", ".gz"), ("bz2", ".bz2"), ("xz", ".xz"), ("zstd", ".zst"),
+    ])
+    @pytest.mark.parametrize("engine", ["pandas", "pyarrow"])
+    def test_csv_matches_uncompressed(self, tmp_path, csv_bytes, compression, suffix, engine):
+        """Test that compressed CSV files load like the uncompressed file."""
+        plain = tmp_path / "data.csv"
+        plain.write_bytes(csv_bytes)
+        packed = tmp_path / f"data.csv{suffix}"
+        packed.write_bytes(_compress(csv_bytes, compression))
+
+        loader = LoaderFactory.create_loader(str(packed), chunk_size=100, engine=engine)
+        expected = pd.concat(LoaderFactory.create_loader(str(plain), engine=engine).load(), ignore_index=True)
+
+        assert isinstance(loader, CSVLoader)
+        pd.testing.assert_frame_equal(pd.concat(loader.load(), ignore_index=True), expected)
+        assert loader.count_rows() == 500
+        assert loader.get_metadata()["columns"] == ["id", "name"]
+
+    @pytest.mark.parametrize("layout", ["bgzf", "zstd_frames"])
+    def test_split_files_decompressed_in_parallel(self, tmp_path, csv_bytes, monkeypatch, layout):
+        """Test that BGZF blocks and zstd frames are decompressed in batches on several threads."""
+        from validation_framework.loaders import compression
+
+        if layout == "bgzf":
+            path = tmp_path / "data.csv.gz"
+            path.write_bytes(_bgzf(csv_bytes))
+        else:
+            path = tmp_path / "data.csv.zst"
+            path.write_bytes(b"".join(
+                _compress(csv_bytes[start:start + 1000], "zstd") for start in range(0, len(csv_bytes), 1000)
+            ))
+
+        batches = []
+        ordered_map = compression.ordered_map
+
+        def recording_map(function, items, threads):
+            return ordered_map(function, (batches.append(item) or item for item in items), threads)
+
+        monkeypatch.setattr(compression, "BATCH_SIZE", 500)
+        monkeypatch.setattr(compression, "ordered_map", recording_map)
+
+        with compression.open_file(path, threads=3) as f:
+            assert f.read() == csv_bytes
+            assert compression.estimate_decompressed_size(f, path.stat().st_size) == len(csv_bytes)
+
+        assert len(batches) > 3
+
+    def test_json_lines_and_arrays(self, tmp_path):
+        """Test that compressed JSON Lines and JSON arrays load with every engine."""
+        import gzip
+        import json
+
+        records = [{"id": i, "customer": {"name": f"c{i}"}} for i in range(300)]
+        lines = tmp_path / "events.jsonl.gz"
+        lines.write_bytes(gzip.compress("\n".join(json.dumps(r) for r in records).encode()))
+        array = tmp_path / "events.json.gz"
+        array.write_bytes(gzip.compress(json.dumps(records).encode()))
+
+        for path, options in [(lines, {"engine": "python"}), (lines, {"engine": "pyarrow"}), (array, {})]:
+            loader = LoaderFactory.create_loader(str(path), chunk_size=128, memory_map=True, **options)
+            chunks = list(loader.load())
+
+            assert [len(chunk) for chunk in chunks] == [128, 128, 44]
+            assert chunks[2]["customer_name"].iloc[-1] == "c299"
+            assert loader.get_metadata()["estimated_rows"] == 300
+
+    def test_unsupported_format_rejected(self, tmp_path):
+        """Test that formats read with random access cannot be compressed."""
+        path = tmp_path / "data.parquet.gz"
+        path.write_bytes(b"")
+
+        with pytest.raises(ValueError, match="not supported for format 'parquet'"):
+            LoaderFactory.create_loader(str(path))
+
+    def test_corrupt_file_raises_and_close_stops_thread(self, tmp_path, csv_bytes):
+        """Test that decompression errors reach the reader and closing stops the thread."""
+        import gzip
+        import threading
+        from validation_framework.loaders.compression import open_file
+
+        path = tmp_path / "data.csv.gz"
+        path.write_bytes(gzip.compress(csv_bytes)[:-20] + b"x" * 20)
+        with pytest.raises(RuntimeError, match="Error loading CSV file"):
+            list(CSVLoader(str(path)).load())
+
+        path.write_bytes(gzip.compress(csv_bytes * 50))
+        with open_file(path) as f:
+            f.read(10)
+        assert not any(thread.name == "decompress" for thread in threading.enumerate())
+
+
 @pytest.mark.unit
 class TestCustomLoaderRegistration:
     """Tests for registering custom loaders."""
@@ -0,0 +1,189 @@
+"""
+Tests for MemoryBoundedTracker in-memory stores and disk spillover.
+"""
+
+import numpy as np
+import pytest
+
+from validation_framework.core.memory_bounded_tracker import MemoryBoundedTracker
+
+
+@pytest.mark.unit
+class TestHashArrayStore:
+    """Tests for the NumPy-backed hash_array store."""
+
+    def test_generic_keys(self):
+        """Test has_seen/add with ordinary Python keys."""
+        with MemoryBoundedTracker(memory_store="hash_array") as tracker:
+            assert tracker.add(("customer", 1)) is True
+            assert tracker.add(("customer", 1)) is False
+            assert tracker.has_seen(("customer", 1)) is True
+            assert tracker.has_seen(("customer", 2)) is False
+            assert tracker.get_statistics()["memory_store"] == "hash_array"
+
+    def test_batch_matches_set_store(self):
+        """Test that both stores report the same keys as seen."""
+        rng = np.random.default_rng(7)
+        batches = [rng.integers(1, 500, 300).astype(np.uint64) for _ in range(5)]
+
+        results = {}
+        for store in ("set", "hash_array"):
+            with MemoryBoundedTracker(memory_store=store) as tracker:
+                results[store] = [
+                    tracker.add_and_check_many(batch, batch * np.uint64(3)).tolist() for batch in batches
+                ]
+                assert tracker.get_statistics()["total_keys"] == len(np.unique(np.concatenate(batches)))
+
+        assert results["set"] == results["hash_array"]
+
+    def test_spill_keeps_keys(self):
+        """Test that keys remain visible after spilling to disk."""
+        keys = np.arange(1, 301, dtype=np.uint64)
+
+        with MemoryBoundedTracker(max_memory_keys=100, memory_store="hash_array") as tracker:
+            seen = tracker.add_and_check_many(keys[:150], keys[:150])
+            assert not seen.any()
+            assert tracker.get_statistics()["is_spilled"] is True
+
+            seen = tracker.add_and_check_many(keys[100:], keys[100:])
+            assert seen[:50].all()
+            assert not seen[50:].any()
+            assert tracker.get_statistics()["total_keys"] == 300
+
+    def test_unknown_store_rejected(self):
+        """Test that an unknown store name raises ValueError."""
+        with pytest.raises(ValueError, match="memory_store"):
+            MemoryBoundedTracker(memory_store="dict")
+
+
+@pytest.mark.unit
+class TestPartitionedSpill:
+    """Tests for the hash-partitioned spill backend."""
+
+    def test_matches_sqlite_backend(self):
+        """Test that both spill backends report the same keys as seen."""
+        rng = np.random.default_rng(11)
+        batches = [rng.integers(0, 2000, 400).astype(np.uint64) for _ in range(10)]
+
+        results = {}
+        for backend in ("sqlite", "partitioned"):
+            with MemoryBoundedTracker(
+                max_memory_keys=150, memory_store="hash_array", spill_backend=backend, spill_partitions=8
+            ) as tracker:
+                results[backend] = [
+                    tracker.add_and_check_many(batch, batch ^ np.uint64(5)).tolist() for batch in batches
+                ]
+                stats = tracker.get_statistics()
+                assert stats["is_spilled"] is True
+                assert stats["total_keys"] == len(np.unique(np.concatenate(batches)))
+
+        assert results["sqlite"] == results["partitioned"]
+
+    def test_generic_keys_after_spill(self):
+        """Test has_seen/add on keys held in memory and in partitions."""
+        with MemoryBoundedTracker(
+            max_memory_keys=10, memory_store="hash_array", spill_backend="partitioned", spill_partitions=4
+        ) as tracker:
+            for i in range(25):
+                assert tracker.add(f"key-{i}") is True
+
+            assert tracker.get_statistics()["disk_keys"] == 20
+            assert all(tracker.has_seen(f"key-{i}") for i in range(25))
+            assert tracker.add("key-3") is False
+            assert tracker.has_seen("key-99") is False
+
+    def test_runs_are_merged(self):
+        """Test that lookups stay correct once partition runs are merged."""
+        with MemoryBoundedTracker(
+            max_memory_keys=20, memory_store="hash_array", spill_backend="partitioned", spill_partitions=2
+        ) as tracker:
+            keys = np.arange(1, 1001, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+            for start in range(0, 1000, 20):
+                tracker.add_and_check_many(keys[start:start + 20], keys[start:start + 20])
+
+            assert all(len(runs) <= tracker.spill_store.max_runs for runs in tracker.spill_store._runs)
+            assert tracker.add_and_check_many(keys, keys).all()
+
+    def test_files_removed_on_close(self, tmp_path):
+        """Test that partition files are deleted on close."""
+        spill_dir = tmp_path / "spill"
+        tracker = MemoryBoundedTracker(
+            max_memory_keys=10, db_path=str(spill_dir), memory_store="hash_array", spill_backend="partitioned"
+        )
+        keys = np.arange(1, 51, dtype=np.uint64)
+        tracker.add_and_check_many(keys, keys)
+        assert any(spill_dir.iterdir())
+
+        tracker.close()
+        assert not spill_dir.exists()
+
+    def test_requires_hash_array_store(self):
+        """Test that the partitioned backend rejects the set store."""
+        with pytest.raises(ValueError, match="hash_array"):
+            MemoryBoundedTracker(spill_backend="partitioned")
+
+
+@pytest.mark.unit
+class TestBloomFilter:
+    """Tests for the Bloom filter in front of the disk store."""
+
+    @pytest.mark.parametrize("backend", ["sqlite", "partitioned"])
+    def test_results_unchanged(self, backend):
+        """Test that the filter does not change which keys are reported as seen."""
+        rng = np.random.default_rng(5)
+        batches = [rng.integers(1, 3000, 500).astype(np.uint64) for _ in range(6)]
+
+        results = {}
+        for use_bloom in (False, True):
+            with MemoryBoundedTracker(
+                max_memory_keys=200, memory_store="hash_array", spill_backend=backend, bloom_filter=use_bloom
+            ) as tracker:
+                results[use_bloom] = [tracker.add_and_check_many(batch, batch).tolist() for batch in batches]
+
+        assert results[False] == results[True]
+
+    def test_new_keys_skip_disk(self):
+        """Test that lookups of new keys are answered by the filter."""
+        with MemoryBoundedTracker(max_memory_keys=50, bloom_filter=True, expected_keys=1000) as tracker:
+            for i in range(100):
+                tracker.add(f"old-{i}")
+
+            assert all(tracker.has_seen(f"old-{i}") for i in range(100))
+            before = tracker.get_statistics()
+            assert not any(tracker.has_seen(f"new-{i}") for i in range(500))
+
+            stats = tracker.get_statistics()
+            skipped = stats["bloom_skipped_lookups"] - before["bloom_skipped_lookups"]
+            false_positives = stats["bloom_false_positives"] - before["bloom_false_positives"]
+            assert stats["bloom_filter"] is True
+            assert skipped + false_positives == 500
+            assert skipped > 450
+            assert stats["bloom_false_positive_rate"] < 10
+
+    def test_memory_cap_raises_false_positive_rate(self, caplog):
+        """Test that bloom_max_bytes bounds the filter and logs the higher rate."""
+        with caplog.at_level("INFO", logger="validation_framework.core.memory_bounded_tracker"):
+            with MemoryBoundedTracker(
+                max_memory_keys=50, bloom_filter=True, expected_keys=1_000_000, bloom_max_bytes=4096
+            ) as tracker:
+                for i in range(100):
+                    tracker.add(f"key-{i}")
+
+                assert tracker.bloom.nbytes <= 4096
+                assert tracker.bloom.false_positive_rate > 0.01
+                assert all(tracker.has_seen(f"key-{i}") for i in range(100))
+
+        assert "Bloom filter for 1,000,000 keys capped at 0.0 MB" in caplog.text
+
+    def test_memory_cap_unused_when_target_fits(self, caplog):
+        """Test that a filter within bloom_max_bytes keeps the target rate."""
+        with caplog.at_level("INFO", logger="validation_framework.core.memory_bounded_tracker"):
+            with MemoryBoundedTracker(
+                max_memory_keys=50, bloom_filter=True, expected_keys=1000, bloom_max_bytes=1024 * 1024
+            ) as tracker:
+                for i in range(100):
+                    tracker.add(f"key-{i}")
+
+                assert tracker.bloom.false_positive_rate == 0.01
+
+        assert "capped" not in caplog.text
@@ -0,0 +1,72 @@
+"""
+Tests for exact record counting of delimited text files.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from validation_framework.loaders import row_counter
+from validation_framework.loaders.row_counter import count_records
+
+
+@pytest.fixture(autouse=True)
+def small_buffers(monkeypatch):
+    """Use tiny buffers so records and quotes straddle buffer boundaries."""
+    monkeypatch.setattr(row_counter, "BUFFER_SIZE", 5)
+    row_counter.clear_cache()
+    yield
+    row_counter.clear_cache()
+
+
+@pytest.mark.unit
+class TestCountRecords:
+    """Tests for count_records()."""
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"])
+    def test_matches_pandas(self, tmp_path, newline):
+        """Test that quoted newlines, escaped quotes and blank lines are handled like pandas."""
+        lines = ['id,note', '1,plain', '2,"two\nlines"', '', '3,"say ""hi"""', '4,"a,b"', '', '5,end']
+        path = tmp_path / "quoted.csv"
+        path.write_bytes(newline.join(lines).encode())
+
+        assert count_records(path) == len(pd.read_csv(path)) + 1 == 6
+
+    @pytest.mark.parametrize("delimiter", [",", ";", "\t"])
+    def test_whitespace_lines_match_pandas(self, tmp_path, delimiter):
+        """Test that lines of spaces, tabs and carriage returns are blank unless they hold the delimiter."""
+        lines = ["a{0}b", "1{0}2", "   ", "3{0}4", "\t", " \t\r", "5{0}6", "  "]
+        path = tmp_path / "blank.csv"
+        path.write_bytes("\n".join(line.format(delimiter) for line in lines).encode())
+
+        assert count_records(path, delimiter=delimiter) == len(pd.read_csv(path, sep=delimiter)) + 1
+
+    def test_trailing_newline_and_empty_file(self, tmp_path):
+        """Test that a final newline does not add a record and an empty file has none."""
+        path = tmp_path / "rows.csv"
+        path.write_text("a\n1\n2\n\n")
+        empty = tmp_path / "empty.csv"
+        empty.write_text("")
+
+        assert count_records(path) == 3
+        assert count_records(empty) == 0
+
+    def test_cache_invalidated_by_change(self, tmp_path):
+        """Test that the cached count is refreshed when the file changes."""
+        path = tmp_path / "growing.csv"
+        path.write_text("a\n1\n")
+        assert count_records(path) == 2
+
+        path.write_text("a\n1\n2\n3\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert count_records(path) == 4
+
+    def test_wide_encodings_not_counted(self, tmp_path):
+        """Test that UTF-16 files are not scanned byte-wise."""
+        path = tmp_path / "wide.csv"
+        path.write_text("a\n1\n", encoding="utf-16")
+
+        assert count_records(path, encoding="utf-16") is None
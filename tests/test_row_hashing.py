@@ -0,0 +1,73 @@
+"""
+Tests for vectorized row-key hashing used by duplicate detection.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validation_framework.core.memory_bounded_tracker import MemoryBoundedTracker
+from validation_framework.core.row_hashing import hash_rows, mark_duplicates
+
+
+@pytest.mark.unit
+class TestHashRows:
+    """Tests for hash_rows()."""
+
+    def test_equal_keys_hash_equal_across_dtypes(self):
+        """Test that int, float and nullable int columns hash consistently."""
+        as_int = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+        as_float = pd.DataFrame({"id": [1.0, 2.0], "name": ["a", "b"]})
+        as_nullable = pd.DataFrame({"id": pd.array([1, 2], dtype="Int64"), "name": ["a", "b"]})
+
+        for other in (as_float, as_nullable):
+            assert np.array_equal(hash_rows(as_int)[0], hash_rows(other)[0])
+            assert np.array_equal(hash_rows(as_int)[1], hash_rows(other)[1])
+
+    def test_nulls_hash_equal(self):
+        """Test that None, NaN and NA hash to the same value."""
+        primary = [
+            hash_rows(pd.DataFrame({"v": values}))[0][1]
+            for values in ([1.5, np.nan], ["x", None], pd.array([1, None], dtype="Int64"))
+        ]
+        assert len(set(primary)) == 1
+
+    def test_column_order_matters(self):
+        """Test that swapping values between key columns changes the hash."""
+        df = pd.DataFrame({"a": ["x", "y"], "b": ["y", "x"]})
+        primary, check = hash_rows(df)
+        assert primary[0] != primary[1]
+        assert check[0] != check[1]
+
+
+@pytest.mark.unit
+class TestMarkDuplicates:
+    """Tests for mark_duplicates()."""
+
+    def test_repeats_within_and_across_chunks(self):
+        """Test that only later occurrences of a key are flagged."""
+        with MemoryBoundedTracker() as tracker:
+            first = mark_duplicates(tracker, *hash_rows(pd.DataFrame({"k": ["a", "b", "a"]})))
+            second = mark_duplicates(tracker, *hash_rows(pd.DataFrame({"k": ["c", "b", "c"]})))
+
+            assert first.tolist() == [False, False, True]
+            assert second.tolist() == [False, True, True]
+            assert tracker.get_statistics()["total_keys"] == 3
+
+    def test_empty_chunk(self):
+        """Test that empty chunks produce an empty mask."""
+        with MemoryBoundedTracker() as tracker:
+            mask = mark_duplicates(tracker, *hash_rows(pd.DataFrame({"k": pd.Series([], dtype=object)})))
+            assert len(mask) == 0
+
+    def test_primary_hash_collision_is_not_a_duplicate(self):
+        """Test that rows sharing only the primary hash are treated as distinct keys."""
+        hashes = np.array([5, 5, 9, 5], dtype=np.uint64)
+        check_hashes = np.array([1, 2, 3, 1], dtype=np.uint64)
+
+        with MemoryBoundedTracker(memory_store="hash_array") as tracker:
+            first = mark_duplicates(tracker, hashes, check_hashes)
+            second = mark_duplicates(tracker, hashes[:2], np.array([2, 4], dtype=np.uint64))
+
+        assert first.tolist() == [False, False, False, True]
+        assert second.tolist() == [True, False]
@@ -11,8 +11,12 @@ from pathlib import Path
 
 from validation_framework.core.results import Severity, ValidationResult
 from validation_framework.validations.builtin.file_checks import EmptyFileCheck, RowCountRangeCheck
-from validation_framework.validations.builtin.field_checks import MandatoryFieldCheck, RangeCheck, RegexCheck
-from validation_framework.validations.builtin.record_checks import DuplicateRowCheck
+from validation_framework.validations.builtin.field_checks import (
+    MandatoryFieldCheck, RangeCheck, RegexCheck, ValidValuesCheck, DateFormatCheck
+)
+from validation_framework.validations.builtin.record_checks import (
+    BLOOM_FILTER_MAX_BYTES, HASHED_KEY_MEMORY_LIMIT, DuplicateRowCheck, UniqueKeyCheck, _create_key_tracker
+)
 
 
 @pytest.fixture
@@ -321,6 +325,199 @@ class TestRegexCheck:
         assert result.passed is False
         assert result.failed_count >= 1  # "invalid" doesn't match pattern
 
+    def test_regex_check_counts_every_failure(self):
+        """Test that failed_count is exact even when samples are capped."""
+        df = pd.DataFrame({"code": ["AB12"] * 50 + ["bad"] * 30 + [None] * 5})
+
+        validation = RegexCheck(
+            name="RegexCheck",
+            severity=Severity.ERROR,
+            params={"field": "code", "pattern": r"[A-Z]{2}\d{2}$"}
+        )
+
+        result = validation.validate(iter([df.iloc[:40], df.iloc[40:]]), {"max_sample_failures": 10})
+
+        assert result.failed_count == 30
+        assert len(result.sample_failures) == 10
+        assert result.sample_failures[0]["value"] == "bad"
+        assert "Found 30 values" in result.message
+
+    def test_regex_check_invert(self):
+        """Test that invert flags values that match the pattern."""
+        df = pd.DataFrame({"comment": ["ok", "DROP TABLE x", "fine", "drop table y"]})
+
+        validation = RegexCheck(
+            name="RegexCheck",
+            severity=Severity.ERROR,
+            params={"field": "comment", "pattern": r"(?i)drop\s+table", "invert": True}
+        )
+
+        result = validation.validate(iter([df]), {})
+
+        assert result.failed_count == 2
+        assert [f["row"] for f in result.sample_failures] == [1, 3]
+
+    def test_regex_check_engines_agree(self):
+        """Test that the pyarrow and re matching paths give identical results."""
+        df = pd.DataFrame({
+            "value": ["abc123", "ABC123", "abc", "x1", "\u00e9t\u00e9123", "line\n123", "123abc"]
+        })
+
+        results = []
+        for engine in ("auto", "python"):
+            validation = RegexCheck(
+                name="RegexCheck",
+                severity=Severity.ERROR,
+                params={"field": "value", "pattern": r"[a-z]+\d+$", "engine": engine}
+            )
+            results.append(validation.validate(iter([df]), {}))
+
+        auto, python = results
+        assert auto.failed_count == python.failed_count
+        assert auto.sample_failures == python.sample_failures
+
+    def test_regex_check_pattern_unsupported_by_pyarrow(self):
+        """Test that patterns RE2 cannot compile fall back to Python's re."""
+        df = pd.DataFrame({"word": ["aa", "ab", "bb"]})
+
+        validation = RegexCheck(
+            name="RegexCheck",
+            severity=Severity.ERROR,
+            params={"field": "word", "pattern": r"(\w)\1"}
+        )
+
+        assert validation.arrow_pattern is None
+
+        result = validation.validate(iter([df]), {})
+
+        assert result.failed_count == 1
+        assert result.sample_failures[0]["value"] == "ab"
+
+    @pytest.mark.parametrize("pattern, values, failing", [
+        # re reads {,3} as {0,3}; RE2 reads it literally
+        (r"^a{,3}$", ["aa", "a{,3}", "aaaa"], ["a{,3}", "aaaa"]),
+        # re reads [[:alpha:]] as a set of characters; RE2 as a POSIX class
+        (r"[[:alpha:]]+$", ["abc", ":]", "p]]"], ["abc"]),
+    ])
+    def test_regex_check_divergent_syntax_uses_python_re(self, pattern, values, failing):
+        """Test that patterns RE2 would read differently are matched with Python's re."""
+        validation = RegexCheck(
+            name="RegexCheck",
+            severity=Severity.ERROR,
+            params={"field": "value", "pattern": pattern}
+        )
+
+        assert validation.arrow_pattern is None
+
+        result = validation.validate(iter([pd.DataFrame({"value": values})]), {})
+
+        assert [f["value"] for f in result.sample_failures] == failing
+
+
+@pytest.mark.unit
+class TestValidValuesCheck:
+    """Tests for ValidValuesCheck validation."""
+
+    def test_valid_values_counts_every_invalid_row(self):
+        """Test that invalid rows are counted exactly across chunks."""
+        df = pd.DataFrame({"status": ["ACTIVE", "CLOSED", None, "PENDING", "CLOSED", "UNKNOWN"] * 20})
+
+        validation = ValidValuesCheck(
+            name="ValidValuesCheck",
+            severity=Severity.ERROR,
+            params={"field": "status", "valid_values": ["ACTIVE", "PENDING"]}
+        )
+
+        result = validation.validate(iter([df.iloc[:50], df.iloc[50:]]), {"max_sample_failures": 5})
+
+        assert result.passed is False
+        assert result.failed_count == 60
+        assert len(result.sample_failures) == 5
+        assert [f["row"] for f in result.sample_failures] == [1, 4, 5, 7, 10]
+        assert "CLOSED, UNKNOWN" in result.message
+
+    def test_valid_values_case_insensitive(self):
+        """Test case-insensitive comparison of distinct values."""
+        df = pd.DataFrame({"status": ["active", "Active", "ACTIVE", "closed"]})
+
+        validation = ValidValuesCheck(
+            name="ValidValuesCheck",
+            severity=Severity.ERROR,
+            params={"field": "status", "valid_values": ["ACTIVE"], "case_sensitive": False}
+        )
+
+        result = validation.validate(iter([df]), {})
+
+        assert result.failed_count == 1
+        assert result.sample_failures[0]["value"] == "closed"
+
+    def test_valid_values_categorical_column(self):
+        """Test that already-encoded categorical columns are handled."""
+        df = pd.DataFrame({"region": pd.Categorical(["EU", "US", "APAC", "EU", "MARS"])})
+
+        validation = ValidValuesCheck(
+            name="ValidValuesCheck",
+            severity=Severity.WARNING,
+            params={"field": "region", "valid_values": ["EU", "US", "APAC"]}
+        )
+
+        result = validation.validate(iter([df]), {})
+
+        assert result.failed_count == 1
+        assert result.sample_failures[0]["row"] == 4
+
+
+@pytest.mark.unit
+class TestDateFormatCheck:
+    """Tests for DateFormatCheck validation."""
+
+    def test_date_format_counts_repeated_invalid_dates(self):
+        """Test that repeated values are all counted and sampled in row order."""
+        df = pd.DataFrame({"date": ["2024-01-01", "01/02/2024", "2024-01-01", None, "2024-02-30"] * 40})
+
+        validation = DateFormatCheck(
+            name="DateFormatCheck",
+            severity=Severity.ERROR,
+            params={"field": "date", "format": "%Y-%m-%d", "allow_null": False}
+        )
+
+        result = validation.validate(iter([df]), {"max_sample_failures": 4})
+
+        assert result.failed_count == 120
+        assert [f["row"] for f in result.sample_failures] == [1, 3, 4, 6]
+        assert result.sample_failures[1]["message"] == "Null value not allowed"
+        assert "Expected: %Y-%m-%d" in result.sample_failures[2]["message"]
+
+    def test_date_format_allows_nulls_by_default(self):
+        """Test that nulls are skipped unless allow_null is false."""
+        df = pd.DataFrame({"date": ["15/03/2024", None, "31/12/2023"]})
+
+        validation = DateFormatCheck(
+            name="DateFormatCheck",
+            severity=Severity.ERROR,
+            params={"field": "date", "format": "%d/%m/%Y"}
+        )
+
+        result = validation.validate(iter([df]), {})
+
+        assert result.passed is True
+        assert result.total_count == 3
+
+    def test_date_format_accepts_dates_outside_timestamp_range(self):
+        """Test that valid dates pandas cannot represent are not reported."""
+        df = pd.DataFrame({"date": ["9999-12-31", "0001-01-01", "2024-13-01"]})
+
+        validation = DateFormatCheck(
+            name="DateFormatCheck",
+            severity=Severity.ERROR,
+            params={"field": "date", "format": "%Y-%m-%d"}
+        )
+
+        result = validation.validate(iter([df]), {})
+
+        assert result.failed_count == 1
+        assert result.sample_failures[0]["value"] == "2024-13-01"
+
 
 @pytest.mark.unit
 class TestDuplicateRowCheck:
@@ -378,6 +575,87 @@ class TestDuplicateRowCheck:
         assert result.passed is False
         assert "not found" in result.message.lower()
 
+    def test_duplicate_check_across_chunks_with_dtype_drift(self):
+        """Test that keys repeat across chunks even when column dtypes differ."""
+        first = pd.DataFrame({"id": [1, 2, 3], "code": ["a", "b", "c"]})
+        second = pd.DataFrame({"id": [3.0, None, 4.0], "code": ["c", "d", "e"]})
+        third = pd.DataFrame({"id": [1, 5, 5], "code": ["a", "f", "f"]})
+
+        validation = DuplicateRowCheck(
+            name="DuplicateRowCheck",
+            severity=Severity.ERROR,
+            params={"key_fields": ["id", "code"]}
+        )
+
+        result = validation.validate(iter([first, second, third]), {})
+
+        assert result.failed_count == 3
+        assert [f["row"] for f in result.sample_failures] == [3, 6, 8]
+        assert result.sample_failures[0]["key_values"] == {"id": 3.0, "code": "c"}
+
+    def test_duplicate_check_all_fields(self):
+        """Test duplicate detection across all columns."""
+        df = pd.DataFrame({"a": [1, 1, 1], "b": ["x", "x", "y"]})
+
+        validation = DuplicateRowCheck(
+            name="DuplicateRowCheck",
+            severity=Severity.ERROR,
+            params={"consider_all_fields": True}
+        )
+
+        result = validation.validate(iter([df]), {})
+
+        assert result.failed_count == 1
+        assert result.sample_failures[0]["row"] == 1
+
+    def test_key_tracker_bloom_filter_sized_for_spilled_keys(self):
+        """Test that the Bloom filter covers the spilled keys within its memory cap."""
+        row_count = 1_000_000_000
+
+        with _create_key_tracker({"total_rows": row_count}) as tracker:
+            assert tracker.expected_keys == row_count - HASHED_KEY_MEMORY_LIMIT
+
+            tracker._init_bloom_filter()
+            assert tracker.bloom.nbytes <= BLOOM_FILTER_MAX_BYTES
+            assert tracker.bloom.false_positive_rate > tracker.bloom_false_positive_rate
+
+
+@pytest.mark.unit
+class TestUniqueKeyCheck:
+    """Tests for UniqueKeyCheck validation."""
+
+    def test_unique_key_composite_duplicates(self):
+        """Test composite keys and first occurrence reporting across chunks."""
+        first = pd.DataFrame({"account": ["A", "A", "B"], "seq": [1, 2, 1]})
+        second = pd.DataFrame({"account": ["B", "A", "C"], "seq": [1, 2, 1]})
+
+        validation = UniqueKeyCheck(
+            name="UniqueKeyCheck",
+            severity=Severity.ERROR,
+            params={"fields": ["account", "seq"]}
+        )
+
+        result = validation.validate(iter([first, second]), {})
+
+        assert result.failed_count == 2
+        assert [f["first_seen_row"] for f in result.sample_failures] == [2, 1]
+        assert [f["row"] for f in result.sample_failures] == [3, 4]
+
+    def test_unique_key_skips_null_keys(self):
+        """Test that rows with a null key field are not treated as duplicates."""
+        df = pd.DataFrame({"id": [1.0, None, None, 2.0, 1.0]})
+
+        validation = UniqueKeyCheck(
+            name="UniqueKeyCheck",
+            severity=Severity.ERROR,
+            params={"fields": ["id"]}
+        )
+
+        result = validation.validate(iter([df]), {})
+
+        assert result.failed_count == 1
+        assert result.sample_failures[0]["row"] == 4
+
 
 @pytest.mark.unit
 class TestValidationResultCreation:
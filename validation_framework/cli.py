@@ -261,8 +261,12 @@ validation_job:
   # Processing options
   processing:
     chunk_size: 50000  # Rows per chunk (for large files)
-    parallel_files: false
+    parallel_files: false  # Validate files in separate worker processes
+    parallel_chunks: false  # Evaluate chunks of a single file in worker processes
+    # max_workers: 8  # Worker processes for parallel_files/parallel_chunks (default: CPU count)
     max_sample_failures: 100
+    fail_fast: false  # Skip data scans on a file once an ERROR-level schema/empty-file check fails
+    # stop_after_failures: 100  # Stop a failing rule once it has found this many failures
 '''
 
     try:
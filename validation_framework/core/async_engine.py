@@ -6,15 +6,21 @@ significantly improving throughput for I/O-bound validation workloads.
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import logging
 import time
 from datetime import datetime
 
+from validation_framework.core.async_scheduler import AsyncScheduler
+from validation_framework.core.async_streams import ChunkBroadcast, ChunkStream
 from validation_framework.core.config import ValidationConfig
 from validation_framework.core.registry import get_registry
-from validation_framework.core.results import ValidationReport, FileValidationReport, Severity, Status
+from validation_framework.core.results import (
+    ValidationReport, FileValidationReport, ValidationResult, Severity, Status
+)
+from validation_framework.loaders.async_base import AsyncFileLoader
 from validation_framework.loaders.async_factory import AsyncLoaderFactory
 from validation_framework.reporters.html_reporter import HTMLReporter
 from validation_framework.reporters.json_reporter import JSONReporter
@@ -61,8 +67,10 @@ class AsyncValidationEngine:
         """
         Run validation job asynchronously.
 
-        Validates all configured files concurrently, collecting results
-        and generating reports.
+        Validates the configured files concurrently, collecting results
+        and generating reports. Files are admitted largest first, within the
+        processing.max_concurrent_files, max_concurrent_rules and
+        memory_budget_mb limits.
 
         Returns:
             ValidationReport with overall results
@@ -74,15 +82,33 @@ class AsyncValidationEngine:
             ...     print(f"Validation failed: {report.total_errors} errors")
         """
         logger.info(f"Starting async validation job: {self.config.job_name}")
-        logger.info(f"Validating {len(self.config.files)} files concurrently")
 
         start_time = time.time()
 
-        # Validate all files concurrently
-        file_reports = await asyncio.gather(
-            *[self._validate_file(file_config) for file_config in self.config.files],
+        files = self.config.files
+        scheduler = AsyncScheduler(
+            max_files=self.config.max_concurrent_files,
+            max_rules=self.config.max_concurrent_rules,
+            memory_budget=self.config.memory_budget_bytes,
+        )
+        logger.info(f"Validating {len(files)} files, up to {scheduler.max_files} at a time")
+
+        # Size every file first so the largest files are admitted first
+        file_sizes = await asyncio.gather(*[self._file_size(file_config) for file_config in files])
+        order = scheduler.admission_order(file_sizes)
+
+        async def _admit(idx: int) -> FileValidationReport:
+            async with scheduler.file(file_sizes[idx]):
+                return await self._validate_file(files[idx], scheduler)
+
+        # Tasks start in admission order and queue for the scheduler in that order
+        admitted = await asyncio.gather(
+            *[_admit(idx) for idx in order],
             return_exceptions=True
         )
+        file_reports = [None] * len(files)
+        for idx, report in zip(order, admitted):
+            file_reports[idx] = report
 
         # Handle any exceptions from file validations
         processed_reports = []
@@ -127,12 +153,60 @@ class AsyncValidationEngine:
 
         return overall_report
 
-    async def _validate_file(self, file_config: Dict[str, Any]) -> FileValidationReport:
+    async def _file_size(self, file_config: Dict[str, Any]) -> int:
+        """
+        Get the size of a file on disk, for scheduling.
+
+        Args:
+            file_config: File configuration dictionary
+
+        Returns:
+            File size in bytes, or 0 if it cannot be read (the error is
+            reported when the file is validated)
+        """
+        try:
+            loader = await self._create_loader(file_config)
+            if not isinstance(loader, AsyncFileLoader):
+                return 0
+            metadata = await loader.get_base_metadata()
+            return metadata["file_size"]
+        except Exception:
+            return 0
+
+    async def _create_loader(self, file_config: Dict[str, Any]):
+        """
+        Create the async loader for a file.
+
+        Args:
+            file_config: File configuration dictionary
+
+        Returns:
+            AsyncDataLoader for the file
+        """
+        loader_kwargs = {
+            "delimiter": file_config.get("delimiter", ","),
+            "encoding": file_config.get("encoding", "utf-8"),
+            "header": file_config.get("header", 0),
+        }
+
+        return await AsyncLoaderFactory.create_loader(
+            file_path=file_config["path"],
+            file_format=file_config.get("format", "csv"),
+            chunk_size=self.config.chunk_size,
+            **loader_kwargs
+        )
+
+    async def _validate_file(
+        self,
+        file_config: Dict[str, Any],
+        scheduler: AsyncScheduler
+    ) -> FileValidationReport:
         """
         Validate a single file asynchronously.
 
         Args:
             file_config: File configuration dictionary
+            scheduler: Scheduler limiting the validations that run at once
 
         Returns:
             FileValidationReport with validation results
@@ -153,18 +227,7 @@ class AsyncValidationEngine:
 
         try:
             # Create async loader
-            loader_kwargs = {
-                "delimiter": file_config.get("delimiter", ","),
-                "encoding": file_config.get("encoding", "utf-8"),
-                "header": file_config.get("header", 0),
-            }
-
-            loader = await AsyncLoaderFactory.create_loader(
-                file_path=file_path,
-                file_format=file_format,
-                chunk_size=self.config.chunk_size,
-                **loader_kwargs
-            )
+            loader = await self._create_loader(file_config)
 
             # Get file metadata
             metadata = await loader.get_metadata()
@@ -174,12 +237,12 @@ class AsyncValidationEngine:
             validations = file_config.get("validations", [])
             logger.info(f"Running {len(validations)} validations on {file_name}")
 
-            # Execute validations concurrently where possible
-            # Note: Some validations may need to be sequential (e.g., cross-file)
+            # Execute validations concurrently over a single read of the file
             validation_results = await self._execute_validations(
                 validations,
                 loader,
-                file_config
+                file_config,
+                scheduler
             )
 
             # Add results to report
@@ -201,107 +264,135 @@ class AsyncValidationEngine:
         self,
         validations: List[Dict[str, Any]],
         loader,
-        file_config: Dict[str, Any]
+        file_config: Dict[str, Any],
+        scheduler: Optional[AsyncScheduler] = None
     ) -> List:
         """
-        Execute all validations for a file.
+        Execute all validations for a file concurrently.
 
-        Note: Currently runs validations sequentially to maintain data consistency.
-        Future enhancement: Run independent validations concurrently.
+        The file is read once per batch of validations: each chunk from the
+        async loader is broadcast to every validation in the batch through its
+        own bounded stream, and the validations run side by side on a thread
+        pool sized to the batch, so a rule waiting for its next chunk never
+        holds up another. All validations form one batch unless the scheduler
+        limits how many may run at once, in which case the file is read again
+        for each batch.
 
         Args:
             validations: List of validation configurations
             loader: Async data loader
             file_config: File configuration
+            scheduler: Scheduler limiting the validations that run at once
 
         Returns:
-            List of ValidationResult objects
+            List of ValidationResult objects, in configuration order
         """
-        results = []
+        scheduler = scheduler or AsyncScheduler()
+        enabled = [v for v in validations if v.get("enabled", True)]
+        results: List[Optional[ValidationResult]] = [None] * len(enabled)
+        rules = []
 
-        for val_config in validations:
-            if not val_config.get("enabled", True):
-                continue
+        for slot, val_config in enumerate(enabled):
+            try:
+                rules.append((slot, self._create_validation(val_config)))
+            except Exception as e:
+                results[slot] = self._validation_error_result(val_config, e)
 
-            validation_type = val_config["type"]
-            severity = val_config["severity"]
-            params = val_config.get("params", {})
-            condition = val_config.get("condition")
+        context = {
+            "file_name": file_config["name"],
+            "file_path": file_config["path"],
+            "max_sample_failures": self.config.max_sample_failures,
+            "stop_after_failures": self.config.stop_after_failures,
+        }
 
-            try:
-                # Get validation class from registry
-                validation_class = self.registry.get(validation_type)
-
-                # Instantiate validation
-                validation = validation_class(
-                    name=validation_type,
-                    severity=severity,
-                    params=params,
-                    condition=condition
-                )
+        for batch in scheduler.rule_batches(len(rules)):
+            async with scheduler.rules(len(batch)):
+                await self._execute_batch([rules[i] for i in batch], enabled, loader, context, results)
 
-                # Execute validation
-                # Convert async loader to sync iterator for compatibility with existing validators
-                # TODO: Create async validators for full async support
-                data_iterator = await self._async_loader_to_sync(loader)
-
-                context = {
-                    "file_name": file_config["name"],
-                    "file_path": file_config["path"],
-                    "max_sample_failures": self.config.max_sample_failures,
-                }
-
-                # Run validation in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None,
-                    validation.validate,
-                    data_iterator,
-                    context
-                )
+        return results
 
-                results.append(result)
+    async def _execute_batch(
+        self,
+        rules: List[Tuple[int, Any]],
+        enabled: List[Dict[str, Any]],
+        loader,
+        context: Dict[str, Any],
+        results: List[Optional[ValidationResult]]
+    ) -> None:
+        """
+        Run a batch of validations concurrently over one read of the file.
 
-                logger.debug(f"Validation {validation_type}: {'PASSED' if result.passed else 'FAILED'}")
+        Args:
+            rules: (slot, validation) pairs to run
+            enabled: Configuration of every enabled validation, by slot
+            loader: Async data loader
+            context: Validation context
+            results: Results by slot, filled in place
+        """
+        loop = asyncio.get_running_loop()
+        broadcast = ChunkBroadcast(
+            loader.load(), loop, consumers=len(rules), queue_depth=self.config.async_queue_depth
+        )
+        executor = ThreadPoolExecutor(max_workers=len(rules), thread_name_prefix="async-validation")
 
-            except Exception as e:
-                logger.error(f"Error in validation {validation_type}: {str(e)}", exc_info=True)
-                # Create error result directly without validation object
-                from validation_framework.core.results import ValidationResult
-                error_result = ValidationResult(
-                    rule_name=validation_type,
-                    severity=Severity[severity] if isinstance(severity, str) else severity,
-                    passed=False,
-                    message=f"Validation error: {str(e)}",
-                    failed_count=1,
-                    total_count=1
+        async def _run(slot: int, validation, stream: ChunkStream) -> None:
+            try:
+                results[slot] = await loop.run_in_executor(
+                    executor, validation.validate, stream, context
                 )
-                results.append(error_result)
-
-        return results
+                logger.debug(
+                    f"Validation {validation.name}: {'PASSED' if results[slot].passed else 'FAILED'}"
+                )
+            except Exception as e:
+                results[slot] = self._validation_error_result(enabled[slot], e)
+            finally:
+                await stream.aclose()
 
-    async def _async_loader_to_sync(self, async_loader):
+        try:
+            await asyncio.gather(*[
+                _run(slot, validation, stream)
+                for (slot, validation), stream in zip(rules, broadcast.streams)
+            ])
+        finally:
+            await broadcast.aclose()
+            executor.shutdown(wait=False)
+
+    def _create_validation(self, val_config: Dict[str, Any]):
         """
-        Convert async loader to synchronous iterator.
-
-        This is a compatibility layer until we implement fully async validators.
-        Loads all chunks into memory then returns sync iterator.
+        Instantiate a validation rule from its configuration.
 
         Args:
-            async_loader: Async data loader
+            val_config: Validation configuration dictionary
 
         Returns:
-            Iterator of DataFrames
+            Validation rule instance
 
-        Note:
-            This temporarily defeats the memory efficiency of chunking.
-            Future enhancement: Implement async validators that work with async iterators.
+        Raises:
+            KeyError: If the validation type is not registered
         """
-        chunks = []
-        async for chunk in async_loader.load():
-            chunks.append(chunk)
+        validation_class = self.registry.get(val_config["type"])
 
-        return iter(chunks)
+        return validation_class(
+            name=val_config["type"],
+            severity=val_config["severity"],
+            params=val_config.get("params", {}),
+            condition=val_config.get("condition")
+        )
+
+    def _validation_error_result(self, val_config: Dict[str, Any], error: Exception) -> ValidationResult:
+        """Create the result reported when a validation could not be executed."""
+        validation_type = val_config["type"]
+        severity = val_config["severity"]
+        logger.error(f"Error in validation {validation_type}: {str(error)}", exc_info=True)
+
+        return ValidationResult(
+            rule_name=validation_type,
+            severity=Severity[severity] if isinstance(severity, str) else severity,
+            passed=False,
+            message=f"Validation error: {str(error)}",
+            failed_count=1,
+            total_count=1
+        )
 
     async def _generate_reports(self, report: ValidationReport) -> None:
         """
@@ -0,0 +1,194 @@
+"""
+Admission control for AsyncValidationEngine.
+
+Starting every file of a large job at once opens every file together and
+thrashes memory. The scheduler admits files and validations against three
+limits: the number of files validated at once, the number of validations
+running at once across all files, and a memory budget that each admitted file
+draws on in proportion to its size on disk. Files are admitted largest first,
+so the longest-running files start early and do not stretch the tail of the
+job.
+"""
+
+import asyncio
+import os
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, List, Optional, Sequence, Tuple
+
+from validation_framework.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class CapacityLimiter:
+    """
+    Hand out units of a fixed capacity to coroutines, first come first served.
+
+    A request larger than the whole capacity is reduced to the capacity, so it
+    waits until nothing else is held and then runs alone rather than never.
+    Requests are granted strictly in the order they were made: a small request
+    does not overtake a large one that is waiting.
+
+    Example:
+        >>> limiter = CapacityLimiter(4)
+        >>> async with limiter.hold(2):
+        ...     await do_work()
+    """
+
+    def __init__(self, capacity: Optional[float] = None) -> None:
+        """
+        Create a limiter.
+
+        Args:
+            capacity: Units available, or None for no limit
+        """
+        self.capacity = capacity
+        self.in_use = 0.0
+        self._waiters: Deque[Tuple[float, "asyncio.Future[None]"]] = deque()
+
+    async def acquire(self, amount: float = 1) -> float:
+        """
+        Wait until amount units are free and take them.
+
+        Args:
+            amount: Units to take
+
+        Returns:
+            Units taken, to be passed to release()
+        """
+        amount = max(0.0, amount)
+        if self.capacity is not None:
+            amount = min(amount, self.capacity)
+
+        if not self._waiters and self._fits(amount):
+            self.in_use += amount
+            return amount
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((amount, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just before the cancellation arrived
+                self.release(amount)
+            else:
+                self._wake()
+            raise
+        return amount
+
+    def release(self, amount: float) -> None:
+        """
+        Return units taken by acquire().
+
+        Args:
+            amount: Units returned by acquire()
+        """
+        self.in_use -= amount
+        self._wake()
+
+    @asynccontextmanager
+    async def hold(self, amount: float = 1) -> AsyncIterator[None]:
+        """Hold amount units for the duration of the block."""
+        granted = await self.acquire(amount)
+        try:
+            yield
+        finally:
+            self.release(granted)
+
+    def _fits(self, amount: float) -> bool:
+        """Check whether amount units are free."""
+        return self.capacity is None or self.in_use + amount <= self.capacity
+
+    def _wake(self) -> None:
+        """Grant waiting requests, in order, while they fit."""
+        while self._waiters:
+            amount, waiter = self._waiters[0]
+            if waiter.done():
+                # Cancelled while waiting
+                self._waiters.popleft()
+                continue
+            if not self._fits(amount):
+                break
+            self._waiters.popleft()
+            self.in_use += amount
+            waiter.set_result(None)
+
+
+class AsyncScheduler:
+    """
+    Limits on concurrent files, concurrent validations and memory for a job.
+
+    Example:
+        >>> scheduler = AsyncScheduler(max_files=4, max_rules=16, memory_budget=2 * 1024**3)
+        >>> for i in scheduler.admission_order(file_sizes):
+        ...     ...
+        >>> async with scheduler.file(file_sizes[i]):
+        ...     async with scheduler.rules(len(batch)):
+        ...         ...
+    """
+
+    def __init__(
+        self,
+        max_files: Optional[int] = None,
+        max_rules: Optional[int] = None,
+        memory_budget: Optional[int] = None,
+    ) -> None:
+        """
+        Create a scheduler.
+
+        Args:
+            max_files: Files validated at once (default: number of CPU cores)
+            max_rules: Validations running at once across all files (default: no limit)
+            memory_budget: Bytes of input admitted at once (default: no limit)
+        """
+        self.max_files = max(1, max_files or os.cpu_count() or 1)
+        self.max_rules = max(1, max_rules) if max_rules else None
+        self.memory_budget = memory_budget if memory_budget and memory_budget > 0 else None
+
+        self._files = CapacityLimiter(self.max_files)
+        self._rules = CapacityLimiter(self.max_rules)
+        self._memory = CapacityLimiter(self.memory_budget)
+
+    def admission_order(self, file_sizes: Sequence[int]) -> List[int]:
+        """
+        Order files for admission, largest first.
+
+        Args:
+            file_sizes: Size in bytes of each file, in configuration order
+
+        Returns:
+            Positions of the files in the order they should be admitted
+        """
+        return sorted(range(len(file_sizes)), key=lambda i: file_sizes[i], reverse=True)
+
+    def rule_batches(self, count: int) -> List[range]:
+        """
+        Split a file's validations into batches that may run together.
+
+        Args:
+            count: Number of validations for the file
+
+        Returns:
+            Ranges of validation positions, in order
+        """
+        size = self.max_rules or max(count, 1)
+        return [range(start, min(start + size, count)) for start in range(0, count, size)]
+
+    @asynccontextmanager
+    async def file(self, file_size: int) -> AsyncIterator[None]:
+        """Hold a file slot and the file's share of the memory budget."""
+        async with self._files.hold(1):
+            async with self._memory.hold(file_size):
+                logger.debug(
+                    f"Admitted file of {file_size} bytes "
+                    f"({int(self._files.in_use)}/{self.max_files} files running)"
+                )
+                yield
+
+    @asynccontextmanager
+    async def rules(self, count: int) -> AsyncIterator[None]:
+        """Hold slots for count validations that run together."""
+        async with self._rules.hold(count):
+            yield
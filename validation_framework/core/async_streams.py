@@ -0,0 +1,221 @@
+"""
+Bounded chunk streams between async loaders and synchronous validations.
+
+Validations iterate plain DataFrame iterators on executor threads, while async
+loaders produce chunks on the event loop. A ChunkBroadcast connects the two: a
+producer task reads the loader once and hands every chunk to each of its
+ChunkStreams, and each validation's thread takes chunks off its own stream as
+it iterates. A stream buffers at most queue_depth chunks and the producer waits
+while any open stream is full, so memory stays bounded however large the file
+is.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Deque, List, Optional
+
+import pandas as pd
+
+# Chunks buffered ahead of each consumer
+DEFAULT_QUEUE_DEPTH = 4
+
+# Queued after the last chunk
+_END = object()
+
+
+class _Failure:
+    """An exception to raise in the consumer in place of the next chunk."""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+class ChunkStream:
+    """
+    Synchronous iterator over the chunks of a ChunkBroadcast.
+
+    The stream is iterated on a thread other than the event loop's, such as an
+    executor thread; each step waits for the next chunk on the loop. An
+    exception raised while reading is raised by the step that reaches it.
+
+    Streams are created by ChunkBroadcast. The event loop must call aclose()
+    once the consumer is done, whether or not it read every chunk. This stops
+    the broadcast waiting for the stream and wakes a consumer still waiting for
+    a chunk.
+    """
+
+    def __init__(
+        self,
+        broadcast: "ChunkBroadcast",
+        loop: asyncio.AbstractEventLoop,
+        queue_depth: int = DEFAULT_QUEUE_DEPTH,
+    ) -> None:
+        """
+        Create a stream fed by a broadcast.
+
+        Args:
+            broadcast: Broadcast the stream receives chunks from
+            loop: Event loop the chunks are produced on
+            queue_depth: Chunks buffered ahead of the consumer (default: 4)
+        """
+        self._broadcast = broadcast
+        self._loop = loop
+        self._queue_depth = max(1, queue_depth)
+        self._buffer: Deque[Any] = deque()
+        self._changed = asyncio.Condition()
+        self._closed = False
+        self._finished = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the consumer is done with the stream."""
+        return self._closed
+
+    def __iter__(self) -> "ChunkStream":
+        return self
+
+    def __next__(self) -> pd.DataFrame:
+        """Wait for the next chunk; called on the consumer's thread."""
+        if self._finished:
+            raise StopIteration
+
+        item = asyncio.run_coroutine_threadsafe(self._get(), self._loop).result()
+
+        if item is _END:
+            self._finished = True
+            raise StopIteration
+        if isinstance(item, _Failure):
+            self._finished = True
+            raise item.error
+        return item
+
+    async def _get(self) -> Any:
+        """Take the next item off the buffer, starting the broadcast if needed."""
+        await self._broadcast._start()
+
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._closed or self._buffer)
+            if self._closed:
+                return _Failure(RuntimeError("Chunk stream is closed"))
+            item = self._buffer.popleft()
+            self._changed.notify_all()
+            return item
+
+    async def _put(self, item: Any) -> None:
+        """Add an item to the buffer, waiting while it is full."""
+        async with self._changed:
+            await self._changed.wait_for(
+                lambda: self._closed or len(self._buffer) < self._queue_depth
+            )
+            if not self._closed:
+                self._buffer.append(item)
+                self._changed.notify_all()
+
+    async def aclose(self) -> None:
+        """
+        Stop receiving chunks; called on the event loop once the consumer is done.
+
+        Buffered chunks are dropped. A consumer still waiting for a chunk, for
+        example one whose result is no longer wanted after a cancellation,
+        receives a RuntimeError instead.
+        """
+        if self._closed:
+            return
+
+        async with self._changed:
+            self._closed = True
+            self._buffer.clear()
+            self._changed.notify_all()
+
+        await self._broadcast._detach()
+
+
+class ChunkBroadcast:
+    """
+    Read an async chunk iterator once and hand every chunk to several streams.
+
+    Reading starts when the first stream is iterated, so a broadcast whose
+    consumers never iterate never reads the file. Each chunk is put on every
+    open stream in turn; the producer waits while a stream is full, so the
+    slowest consumer sets the pace. Once every stream is closed the producer
+    stops and the chunk iterator is closed, even if chunks remain.
+
+    Example:
+        >>> broadcast = ChunkBroadcast(loader.load(), loop, consumers=len(rules))
+        >>> async def run(rule, stream):
+        ...     try:
+        ...         return await loop.run_in_executor(pool, rule.validate, stream, context)
+        ...     finally:
+        ...         await stream.aclose()
+        >>> results = await asyncio.gather(*map(run, rules, broadcast.streams))
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterator[pd.DataFrame],
+        loop: asyncio.AbstractEventLoop,
+        consumers: int = 1,
+        queue_depth: int = DEFAULT_QUEUE_DEPTH,
+    ) -> None:
+        """
+        Create a broadcast over an async chunk iterator.
+
+        Args:
+            chunks: Async iterator of DataFrames, such as AsyncDataLoader.load()
+            loop: Event loop the chunks are produced on
+            consumers: Number of streams to create
+            queue_depth: Chunks buffered ahead of each consumer (default: 4)
+        """
+        self._chunks = chunks
+        self._producer: Optional["asyncio.Future[None]"] = None
+        self._stopped = False
+        self.streams: List[ChunkStream] = [
+            ChunkStream(self, loop, queue_depth) for _ in range(consumers)
+        ]
+
+    async def _start(self) -> None:
+        """Start the producer task on the event loop."""
+        if self._producer is None and not self._stopped:
+            self._producer = asyncio.ensure_future(self._produce())
+
+    async def _produce(self) -> None:
+        """Put each chunk on every open stream, waiting while one is full."""
+        try:
+            async for chunk in self._chunks:
+                open_streams = [stream for stream in self.streams if not stream.closed]
+                if not open_streams:
+                    break
+                for stream in open_streams:
+                    await stream._put(chunk)
+            for stream in self.streams:
+                await stream._put(_END)
+        except Exception as e:
+            for stream in self.streams:
+                await stream._put(_Failure(e))
+        finally:
+            await self._close_chunks()
+
+    async def _detach(self) -> None:
+        """Stop reading once every stream has been closed."""
+        if self._stopped or not all(stream.closed for stream in self.streams):
+            return
+        self._stopped = True
+
+        if self._producer is not None:
+            self._producer.cancel()
+            await asyncio.gather(self._producer, return_exceptions=True)
+        else:
+            await self._close_chunks()
+
+    async def _close_chunks(self) -> None:
+        """Close the chunk iterator, if it supports closing."""
+        close = getattr(self._chunks, "aclose", None)
+        if close is not None:
+            await close()
+
+    async def aclose(self) -> None:
+        """Close every stream and stop reading; called on the event loop."""
+        for stream in self.streams:
+            await stream.aclose()
+        # Covers a broadcast created with no streams
+        await self._detach()
@@ -0,0 +1,119 @@
+"""
+Blocked Bloom filter over 64-bit key hashes.
+
+BlockedBloomFilter answers "definitely not present" for most keys that were
+never added, so a caller can skip a disk lookup for them. Each key sets k bits
+inside a single 512-bit block (eight uint64 words) chosen from its hash, which
+keeps every probe within one cache line. Inserts and lookups take whole uint64
+arrays and are vectorized with NumPy.
+"""
+
+import math
+
+import numpy as np
+
+# Multipliers used to derive independent bit positions from a key hash
+_BLOCK_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+_BIT_MULTIPLIER = np.uint64(0xC2B2AE3D27D4EB4F)
+
+_WORDS_PER_BLOCK = 8
+_BITS_PER_BLOCK = _WORDS_PER_BLOCK * 64
+_BITS_PER_PROBE = 9  # log2(_BITS_PER_BLOCK)
+_MAX_PROBES = 64 // _BITS_PER_PROBE
+
+
+def false_positive_rate_for(expected_keys: int, max_bytes: int) -> float:
+    """
+    Lowest false positive rate a filter of at most max_bytes reaches at expected_keys.
+
+    Args:
+        expected_keys: Number of keys the filter is sized for
+        max_bytes: Memory budget for the bit array, in bytes
+
+    Returns:
+        False positive rate to pass to BlockedBloomFilter to stay within max_bytes
+    """
+    bits = max(1, max_bytes // (_BITS_PER_BLOCK // 8)) * _BITS_PER_BLOCK
+    return math.exp(-bits * math.log(2) ** 2 / max(int(expected_keys), 1))
+
+
+class BlockedBloomFilter:
+    """
+    Bloom filter of uint64 hashes stored in a NumPy bit array.
+
+    The filter is sized for an expected number of keys and a target false
+    positive rate. It never reports an added key as absent; adding more keys
+    than expected only raises the false positive rate.
+
+    Example:
+        >>> bloom = BlockedBloomFilter(expected_keys=1_000_000)
+        >>> bloom.add_many(np.array([1, 2], dtype=np.uint64))
+        >>> bloom.contains_many(np.array([2, 3], dtype=np.uint64))
+        array([ True, False])
+    """
+
+    def __init__(self, expected_keys: int, false_positive_rate: float = 0.01) -> None:
+        """
+        Initialize an empty filter.
+
+        Args:
+            expected_keys: Number of keys the filter is sized for
+            false_positive_rate: Target false positive rate at expected_keys
+        """
+        expected_keys = max(int(expected_keys), 1)
+        bits = -expected_keys * math.log(false_positive_rate) / (math.log(2) ** 2)
+
+        num_blocks = max(1, math.ceil(bits / _BITS_PER_BLOCK))
+
+        self.expected_keys = expected_keys
+        self.false_positive_rate = false_positive_rate
+        self.num_probes = min(_MAX_PROBES, max(1, round(bits / expected_keys * math.log(2))))
+        self.key_count = 0
+
+        self._num_blocks = np.uint64(num_blocks)
+        self._words = np.zeros(num_blocks * _WORDS_PER_BLOCK, dtype=np.uint64)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the bit array, in bytes."""
+        return self._words.nbytes
+
+    def add_many(self, hashes: np.ndarray) -> None:
+        """
+        Add a batch of key hashes.
+
+        Args:
+            hashes: uint64 array of key hashes
+        """
+        words, masks = self._positions(hashes)
+        np.bitwise_or.at(self._words, words.ravel(), masks.ravel())
+        self.key_count += len(hashes)
+
+    def contains_many(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Test a batch of key hashes.
+
+        Args:
+            hashes: uint64 array of key hashes
+
+        Returns:
+            Boolean array, False where the key was certainly never added
+        """
+        words, masks = self._positions(hashes)
+        return ((self._words[words] & masks) != 0).all(axis=1)
+
+    def _positions(self, hashes: np.ndarray):
+        """Map hashes to (word index, bit mask) arrays of shape (n, num_probes)."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+
+        # Map the top 32 bits of the mixed hash onto [0, num_blocks) by multiplication
+        blocks = (((hashes * _BLOCK_MULTIPLIER) >> np.uint64(32)) * self._num_blocks) >> np.uint64(32)
+        bit_source = hashes * _BIT_MULTIPLIER
+
+        # Take the probes from the high bits, which are mixed best by the multiply
+        shifts = np.uint64(64) - (np.arange(1, self.num_probes + 1, dtype=np.uint64) * np.uint64(_BITS_PER_PROBE))
+        bits = (bit_source[:, None] >> shifts) & np.uint64(_BITS_PER_BLOCK - 1)
+
+        words = (blocks[:, None] * np.uint64(_WORDS_PER_BLOCK) + (bits >> np.uint64(6))).astype(np.intp)
+        masks = np.uint64(1) << (bits & np.uint64(63))
+        return words, masks
@@ -5,6 +5,7 @@ import os
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from validation_framework.core.results import Severity
+from validation_framework.loaders.compression import strip_compression_suffix
 
 
 class ConfigError(Exception):
@@ -185,7 +186,21 @@ class ValidationConfig:
         processing = job_config.get("processing", {})
         self.chunk_size = processing.get("chunk_size", 50000)
         self.parallel_files = processing.get("parallel_files", False)
+        self.parallel_chunks = processing.get("parallel_chunks", False)
+        self.max_workers: Optional[int] = processing.get("max_workers", None)
         self.max_sample_failures = processing.get("max_sample_failures", 100)
+        self.fused_execution = processing.get("fused_execution", True)
+        self.column_projection = processing.get("column_projection", True)
+        self.row_group_skipping = processing.get("row_group_skipping", True)
+        self.fail_fast = processing.get("fail_fast", False)
+        self.stop_after_failures: Optional[int] = processing.get("stop_after_failures", None)
+        self.async_queue_depth = processing.get("async_queue_depth", 4)
+        self.max_concurrent_files: Optional[int] = processing.get("max_concurrent_files", None)
+        self.max_concurrent_rules: Optional[int] = processing.get("max_concurrent_rules", None)
+        memory_budget_mb = processing.get("memory_budget_mb", None)
+        self.memory_budget_bytes: Optional[int] = (
+            int(memory_budget_mb * 1024 * 1024) if memory_budget_mb else None
+        )
 
     def _parse_files(self, files_config: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Parse files configuration."""
@@ -202,6 +217,14 @@ class ValidationConfig:
                 "delimiter": file_config.get("delimiter", ","),
                 "encoding": file_config.get("encoding", "utf-8"),
                 "header": file_config.get("header", 0),
+                "sheet_name": file_config.get("sheet_name", 0),
+                "engine": file_config.get("engine"),
+                "block_size": file_config.get("block_size"),
+                "infer_types": file_config.get("infer_types", True),
+                "read_threads": file_config.get("read_threads"),
+                "memory_map": file_config.get("memory_map", False),
+                "range_size": file_config.get("range_size"),
+                "parse_threads": file_config.get("parse_threads"),
                 "validations": self._parse_validations(file_config.get("validations", [])),
                 "metadata": file_config.get("metadata", {}),
             }
@@ -238,8 +261,8 @@ class ValidationConfig:
         return parsed_validations
 
     def _infer_format(self, file_path: str) -> str:
-        """Infer file format from extension."""
-        suffix = Path(file_path).suffix.lower()
+        """Infer file format from extension, ignoring a compression suffix."""
+        suffix = strip_compression_suffix(file_path).suffix.lower()
         format_map = {
             ".csv": "csv",
             ".tsv": "csv",
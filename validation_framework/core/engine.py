@@ -4,25 +4,33 @@ Validation engine - orchestrates the entire validation process.
 The engine:
 1. Loads configuration
 2. Creates data loaders for each file
-3. Executes validations in order
+3. Executes validations, cheapest first
 4. Collects and aggregates results
 5. Generates reports
 """
 
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
 from validation_framework.core.config import ValidationConfig
 from validation_framework.core.registry import get_registry, ValidationRegistry
+from validation_framework.core.parallel import ChunkParallelExecutor
+from validation_framework.core.planner import execution_order, is_failed_gate, needs_scan, skipped_result
 from validation_framework.core.results import (
     ValidationReport,
     FileValidationReport,
+    ValidationResult,
+    Severity,
     Status,
 )
+from validation_framework.loaders.base import DataLoader, RowGroupStatistics
 from validation_framework.loaders.factory import LoaderFactory
+from validation_framework.validations.base import ValidationRule, DataValidationRule, FileValidationRule
 from validation_framework.core.logging_config import get_logger
 
 # Import to trigger registration of built-in validations
@@ -126,30 +134,15 @@ class ValidationEngine:
         logger.debug("Validation report initialized")
 
         # Process each file
-        for file_idx, file_config in enumerate(self.config.files, 1):
-            logger.info(f"Processing file {file_idx}/{len(self.config.files)}: {file_config['name']}")
-            logger.debug(f"File path: {file_config['path']}, Format: {file_config['format']}")
+        if self._parallel_worker_count() > 1:
+            self._run_parallel(report, verbose)
+        else:
+            for file_idx, file_config in enumerate(self.config.files, 1):
+                self._print_file_header(file_idx, file_config, verbose)
 
-            if verbose:
-                print(f"\n{Fore.YELLOW}[{file_idx}/{len(self.config.files)}] Processing: {file_config['name']}{Style.RESET_ALL}")
-                print(f"  Path: {file_config['path']}")
-                print(f"  Format: {file_config['format']}")
-                print(f"  Validations: {len(file_config['validations'])}")
-
-            # Validate the file
-            file_report = self._validate_file(file_config, verbose)
-            logger.info(f"File validation completed: {file_config['name']} - Status: {file_report.status.value}")
-
-            # Add to overall report
-            report.add_file_report(file_report)
-
-            # Print summary for this file
-            if verbose:
-                status_color = Fore.GREEN if file_report.status == Status.PASSED else Fore.RED
-                print(f"\n  {status_color}Status: {file_report.status.value}{Style.RESET_ALL}")
-                print(f"  Errors: {file_report.error_count}")
-                print(f"  Warnings: {file_report.warning_count}")
-                print(f"  Duration: {file_report.execution_time:.2f}s")
+                # Validate the file
+                file_report = self._validate_file(file_config, verbose)
+                self._record_file_report(report, file_config, file_report, verbose)
 
         # Update overall status and duration
         report.update_overall_status()
@@ -164,6 +157,124 @@ class ValidationEngine:
 
         return report
 
+    def _parallel_worker_count(self) -> int:
+        """
+        Determine how many worker processes to use for file validation.
+
+        Returns:
+            Number of workers (1 means files are validated sequentially)
+        """
+        if not self.config.parallel_files or len(self.config.files) < 2:
+            return 1
+
+        max_workers = self.config.max_workers or os.cpu_count() or 1
+        return max(1, min(max_workers, len(self.config.files)))
+
+    def _chunk_worker_count(self) -> int:
+        """
+        Determine how many worker processes evaluate chunks within a file.
+
+        Chunk parallelism is not used when files are already validated in
+        parallel, since the file workers occupy the available cores.
+
+        Returns:
+            Number of workers (1 means chunks are evaluated in-process)
+        """
+        if not self.config.parallel_chunks or self._parallel_worker_count() > 1:
+            return 1
+
+        return max(1, self.config.max_workers or os.cpu_count() or 1)
+
+    def _run_parallel(self, report: ValidationReport, verbose: bool) -> None:
+        """
+        Validate files in a pool of worker processes.
+
+        Each file is validated in its own process and the resulting
+        FileValidationReport is returned to the parent. Reports are added
+        to the overall report in configuration order, regardless of the
+        order in which the workers finish.
+
+        Args:
+            report: Overall report to add file reports to
+            verbose: Whether to print progress
+        """
+        files = self.config.files
+        workers = self._parallel_worker_count()
+        logger.info(f"Validating {len(files)} files in parallel with {workers} worker processes")
+
+        if verbose:
+            print(f"Validating files in parallel ({workers} worker processes)")
+
+        file_reports: List[Optional[FileValidationReport]] = [None] * len(files)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_validate_file_in_worker, self.config, file_config): idx
+                for idx, file_config in enumerate(files)
+            }
+
+            for future in as_completed(futures):
+                idx = futures[future]
+                try:
+                    file_reports[idx] = future.result()
+                except Exception as e:
+                    logger.error(f"Worker failed for file {files[idx]['name']}: {str(e)}")
+                    file_reports[idx] = self._worker_failure_report(files[idx], e)
+
+        for file_idx, (file_config, file_report) in enumerate(zip(files, file_reports), 1):
+            self._print_file_header(file_idx, file_config, verbose)
+            self._record_file_report(report, file_config, file_report, verbose)
+
+    def _worker_failure_report(self, file_config: Dict[str, Any], error: Exception) -> FileValidationReport:
+        """Create the report for a file whose worker process failed."""
+        file_report = FileValidationReport(
+            file_name=file_config["name"],
+            file_path=file_config["path"],
+            file_format=file_config["format"],
+            status=Status.FAILED,
+        )
+        file_report.add_result(ValidationResult(
+            rule_name="FileProcessing",
+            severity=Severity.ERROR,
+            passed=False,
+            message=f"Error processing file: {str(error)}",
+            failed_count=1,
+        ))
+        file_report.update_status()
+        return file_report
+
+    def _print_file_header(self, file_idx: int, file_config: Dict[str, Any], verbose: bool) -> None:
+        """Log and print the header shown before a file's results."""
+        logger.info(f"Processing file {file_idx}/{len(self.config.files)}: {file_config['name']}")
+        logger.debug(f"File path: {file_config['path']}, Format: {file_config['format']}")
+
+        if verbose:
+            print(f"\n{Fore.YELLOW}[{file_idx}/{len(self.config.files)}] Processing: {file_config['name']}{Style.RESET_ALL}")
+            print(f"  Path: {file_config['path']}")
+            print(f"  Format: {file_config['format']}")
+            print(f"  Validations: {len(file_config['validations'])}")
+
+    def _record_file_report(
+        self,
+        report: ValidationReport,
+        file_config: Dict[str, Any],
+        file_report: FileValidationReport,
+        verbose: bool,
+    ) -> None:
+        """Add a file report to the overall report and print its summary."""
+        logger.info(f"File validation completed: {file_config['name']} - Status: {file_report.status.value}")
+
+        # Add to overall report
+        report.add_file_report(file_report)
+
+        # Print summary for this file
+        if verbose:
+            status_color = Fore.GREEN if file_report.status == Status.PASSED else Fore.RED
+            print(f"\n  {status_color}Status: {file_report.status.value}{Style.RESET_ALL}")
+            print(f"  Errors: {file_report.error_count}")
+            print(f"  Warnings: {file_report.warning_count}")
+            print(f"  Duration: {file_report.execution_time:.2f}s")
+
     def _validate_file(self, file_config: Dict[str, Any], verbose: bool) -> FileValidationReport:
         """
         Validate a single file.
@@ -195,6 +306,13 @@ class ValidationEngine:
                 encoding=file_config.get("encoding"),
                 header=file_config.get("header"),
                 sheet_name=file_config.get("sheet_name"),
+                engine=file_config.get("engine"),
+                block_size=file_config.get("block_size"),
+                infer_types=file_config.get("infer_types", True),
+                read_threads=file_config.get("read_threads"),
+                memory_map=file_config.get("memory_map", False),
+                range_size=file_config.get("range_size"),
+                parse_threads=file_config.get("parse_threads"),
             )
 
             # Get file metadata
@@ -207,81 +325,129 @@ class ValidationEngine:
                 "file_name": file_config["name"],
                 "file_format": file_config["format"],
                 "max_sample_failures": self.config.max_sample_failures,
+                "stop_after_failures": self.config.stop_after_failures,
                 **metadata,
             }
 
             # Execute each validation
-            validations = file_config.get("validations", [])
+            validations = [v for v in file_config.get("validations", []) if v.get("enabled", True)]
 
             if verbose and validations:
                 print(f"\n  Executing validations:")
 
-            for validation_config in validations:
-                if not validation_config.get("enabled", True):
-                    continue
+            # Results are collected per slot so they are reported in config order,
+            # even though fused rules only finish once the shared scan completes
+            outcomes: List[Optional[Tuple[ValidationResult, str]]] = [None] * len(validations)
+            rules: List[Optional[ValidationRule]] = [None] * len(validations)
+            fused: List[Tuple[int, DataValidationRule]] = []
 
+            for slot, validation_config in enumerate(validations):
                 validation_type = validation_config["type"]
 
-                if verbose:
-                    print(f"    - {validation_type}...", end=" ", flush=True)
-
                 try:
-                    # Get validation class from registry
-                    validation_class = self.registry.get(validation_type)
-
-                    # Instantiate validation
-                    validation = validation_class(
-                        name=validation_type,
-                        severity=validation_config["severity"],
-                        params=validation_config.get("params", {}),
-                        condition=validation_config.get("condition"),
-                    )
-
-                    # Execute validation
-                    exec_start = time.time()
-
-                    # Create fresh data iterator for this validation
-                    data_iterator = loader.load()
-
-                    result = validation.validate(data_iterator, context)
-                    result.execution_time = time.time() - exec_start
-
-                    # Add result to report
-                    file_report.add_result(result)
-
-                    if verbose:
-                        if result.passed:
-                            print(f"{Fore.GREEN}✓ PASS{Style.RESET_ALL}")
-                        else:
-                            print(f"{Fore.RED}✗ FAIL{Style.RESET_ALL}")
-
+                    rules[slot] = self._create_validation(validation_config)
                 except KeyError:
-                    if verbose:
-                        print(f"{Fore.RED}✗ NOT FOUND{Style.RESET_ALL}")
                     # Create error result for unknown validation
-                    from validation_framework.core.results import ValidationResult, Severity
-                    error_result = ValidationResult(
+                    outcomes[slot] = (ValidationResult(
                         rule_name=validation_type,
                         severity=validation_config["severity"],
                         passed=False,
                         message=f"Validation type '{validation_type}' not found in registry",
                         failed_count=1,
-                    )
-                    file_report.add_result(error_result)
-
+                    ), "NOT FOUND")
                 except Exception as e:
-                    if verbose:
-                        print(f"{Fore.RED}✗ ERROR{Style.RESET_ALL}")
-                    # Create error result
-                    from validation_framework.core.results import ValidationResult
-                    error_result = ValidationResult(
-                        rule_name=validation_type,
-                        severity=validation_config["severity"],
-                        passed=False,
-                        message=f"Error executing validation: {str(e)}",
-                        failed_count=1,
-                    )
-                    file_report.add_result(error_result)
+                    outcomes[slot] = (self._validation_error_result(validation_config, e), "ERROR")
+
+            # Row-count rules get an exact count rather than a sampled estimate
+            if "total_rows" not in context and any(
+                isinstance(rule, FileValidationRule) and rule.needs_row_count for rule in rules
+            ):
+                row_count = loader.count_rows()
+                if row_count is not None:
+                    context["total_rows"] = metadata["total_rows"] = row_count
+
+            statistics = self._footer_statistics(loader)
+
+            # File-level rules only read metadata, so they run first, gates
+            # (empty file, schema) ahead of the rest
+            failed_gate: Optional[ValidationResult] = None
+            for slot in execution_order(rules):
+                validation = rules[slot]
+                if not isinstance(validation, FileValidationRule):
+                    continue
+                outcomes[slot] = self._execute_own_pass(validations[slot], validation, loader, context, statistics)
+                rules[slot] = None
+                if failed_gate is None and is_failed_gate(validation, outcomes[slot][0]):
+                    failed_gate = outcomes[slot][0]
+
+            # Rules that the footer statistics of a columnar file settle are
+            # answered here and never scan the data
+            if statistics is not None:
+                for slot, validation in enumerate(rules):
+                    if not isinstance(validation, DataValidationRule):
+                        continue
+                    result = self._resolve_from_statistics(validation, statistics, context)
+                    if result is not None:
+                        outcomes[slot] = (result, "PASS" if result.passed else "FAIL")
+                        rules[slot] = None
+
+            # A failed ERROR-level gate means the file is broken, so the rules
+            # that would scan its data are not run
+            if failed_gate is not None and self.config.fail_fast:
+                skipped = 0
+                for slot, validation in enumerate(rules):
+                    if validation is not None and needs_scan(validation):
+                        outcomes[slot] = (skipped_result(validation, failed_gate), "SKIPPED")
+                        rules[slot] = None
+                        skipped += 1
+                if skipped:
+                    logger.info(f"Skipping {skipped} validations on {file_config['name']}: {failed_gate.rule_name} failed")
+
+            # Load only the columns the rules read
+            if self.config.column_projection:
+                loader.columns = self._projected_columns(
+                    [rule for rule in rules if rule is not None], metadata
+                )
+                if loader.columns is not None:
+                    logger.debug(f"Loading {len(loader.columns)} of {len(metadata['columns'])} columns")
+
+            # Cheapest first: the shared scan, then rules reading the file on their own
+            own_pass = []
+            for slot in execution_order(rules):
+                validation = rules[slot]
+                if (
+                    self.config.fused_execution
+                    and isinstance(validation, DataValidationRule)
+                    and validation.supports_chunk_protocol()
+                ):
+                    fused.append((slot, validation))
+                else:
+                    own_pass.append(slot)
+
+            if fused:
+                logger.debug(f"Running {len(fused)} validations in a single pass over {file_config['name']}")
+                fused_results = self._execute_fused(
+                    [validation for _, validation in fused], loader, context
+                )
+                for (slot, _), result in zip(fused, fused_results):
+                    outcomes[slot] = (result, "PASS" if result.passed else "FAIL")
+
+            for slot in own_pass:
+                outcomes[slot] = self._execute_own_pass(validations[slot], rules[slot], loader, context, statistics)
+
+            for validation_config, (result, outcome) in zip(validations, outcomes):
+                # Add result to report
+                file_report.add_result(result)
+
+                if verbose:
+                    print(f"    - {validation_config['type']}...", end=" ", flush=True)
+                    source = " (metadata)" if result.from_metadata else ""
+                    if outcome == "PASS":
+                        print(f"{Fore.GREEN}✓ PASS{Style.RESET_ALL}{source}")
+                    elif outcome == "SKIPPED":
+                        print(f"{Fore.YELLOW}- SKIPPED{Style.RESET_ALL}")
+                    else:
+                        print(f"{Fore.RED}✗ {outcome}{Style.RESET_ALL}{source}")
 
         except FileNotFoundError:
             if verbose:
@@ -317,6 +483,328 @@ class ValidationEngine:
 
         return file_report
 
+    def _create_validation(self, validation_config: Dict[str, Any]) -> ValidationRule:
+        """
+        Instantiate a validation rule from its configuration.
+
+        Args:
+            validation_config: Validation configuration dictionary
+
+        Returns:
+            Validation rule instance
+
+        Raises:
+            KeyError: If the validation type is not registered
+        """
+        validation_class = self.registry.get(validation_config["type"])
+
+        return validation_class(
+            name=validation_config["type"],
+            severity=validation_config["severity"],
+            params=validation_config.get("params", {}),
+            condition=validation_config.get("condition"),
+        )
+
+    def _execute_own_pass(
+        self,
+        validation_config: Dict[str, Any],
+        validation: ValidationRule,
+        loader: DataLoader,
+        context: Dict[str, Any],
+        statistics: Optional[List[RowGroupStatistics]],
+    ) -> Tuple[ValidationResult, str]:
+        """
+        Execute a validation that reads the file through its own iterator.
+
+        Args:
+            validation_config: Validation configuration dictionary
+            validation: Validation rule instance
+            loader: Data loader for the file
+            context: Validation context
+            statistics: Footer statistics of the file, if it has them
+
+        Returns:
+            Tuple of (result, outcome label)
+        """
+        try:
+            exec_start = time.time()
+
+            # Create fresh data iterator for this validation
+            data_iterator = loader.load()
+
+            result = validation.validate(data_iterator, context)
+            result.execution_time = time.time() - exec_start
+            # File-level rules only read metadata, which is exact for columnar files
+            result.from_metadata = statistics is not None and isinstance(validation, FileValidationRule)
+            return result, "PASS" if result.passed else "FAIL"
+
+        except Exception as e:
+            return self._validation_error_result(validation_config, e), "ERROR"
+
+    def _projected_columns(
+        self,
+        validations: List[ValidationRule],
+        metadata: Dict[str, Any],
+    ) -> Optional[List[str]]:
+        """
+        Work out which columns of a file need to be loaded.
+
+        Args:
+            validations: Validations that will run on the file
+            metadata: File metadata from the loader
+
+        Returns:
+            Columns to load, in file order, or None to load every column
+        """
+        file_columns = metadata.get("columns")
+        if not file_columns:
+            return None
+
+        required = set()
+        for validation in validations:
+            columns = validation.required_columns()
+            if columns is None:
+                return None
+            required.update(columns)
+
+        # Names that are not columns (missing fields, keywords in conditions)
+        # are left for the rules to report
+        projected = [column for column in file_columns if column in required]
+        if not projected or len(projected) == len(file_columns):
+            return None
+
+        return projected
+
+    def _footer_statistics(self, loader: DataLoader) -> Optional[List[RowGroupStatistics]]:
+        """
+        Get the row-group statistics of a file, if the planner may use them.
+
+        Args:
+            loader: Data loader for the file
+
+        Returns:
+            Statistics of every row group, or None if the file has none
+        """
+        if not self.config.row_group_skipping:
+            return None
+
+        try:
+            return loader.row_group_statistics()
+        except Exception as e:
+            logger.debug(f"Row group statistics unavailable: {str(e)}")
+            return None
+
+    def _resolve_from_statistics(
+        self,
+        validation: DataValidationRule,
+        statistics: List[RowGroupStatistics],
+        context: Dict[str, Any],
+    ) -> Optional[ValidationResult]:
+        """
+        Answer a validation from row-group statistics alone, if they settle it.
+
+        A validation is answered when it covers every row group of the file;
+        its result is then the same as a full scan would give.
+
+        Args:
+            validation: Validation implementing the chunk protocol
+            statistics: Statistics of every row group of the file
+            context: Validation context
+
+        Returns:
+            ValidationResult marked from_metadata, or None if the data must be read
+        """
+        if not statistics or not validation.supports_chunk_protocol():
+            return None
+
+        start = time.time()
+        if not all(validation.covers_row_group(row_group) for row_group in statistics):
+            return None
+
+        state = None
+        try:
+            state = validation.init_state(context)
+            row_offset = 0
+            for row_group in statistics:
+                if state.get("result") is not None:
+                    break
+                validation.accumulate_statistics(state, row_group, row_offset, context)
+                row_offset += row_group.num_rows
+            result = validation.finalize(state, context)
+
+        except Exception as e:
+            result = validation._error_result(e)
+
+        finally:
+            if state is not None:
+                validation.release_state(state)
+
+        result.from_metadata = True
+        result.execution_time = time.time() - start
+        return result
+
+    def _validation_error_result(self, validation_config: Dict[str, Any], error: Exception) -> ValidationResult:
+        """Create the result reported when a validation could not be executed."""
+        return ValidationResult(
+            rule_name=validation_config["type"],
+            severity=validation_config["severity"],
+            passed=False,
+            message=f"Error executing validation: {str(error)}",
+            failed_count=1,
+        )
+
+    def _execute_fused(
+        self,
+        validations: List[DataValidationRule],
+        loader: DataLoader,
+        context: Dict[str, Any],
+    ) -> List[ValidationResult]:
+        """
+        Execute chunk-protocol validations in a single pass over the file.
+
+        The file is read once and every chunk is handed to each validation that
+        is still active. A validation drops out of the scan once it has stored a
+        final result in its state (e.g. a missing field), and the scan stops
+        early when no validation needs more data. When processing.parallel_chunks
+        is enabled, validations with parallel_chunks = True evaluate chunks in
+        worker processes and their partial states are merged in chunk order.
+        Row groups of columnar files whose statistics settle every validation in
+        the scan (processing.row_group_skipping) are not decoded; each rule folds
+        in the statistics instead.
+
+        Args:
+            validations: Validations implementing the chunk protocol
+            loader: Data loader for the file
+            context: Validation context
+
+        Returns:
+            List of ValidationResult, in the same order as validations
+        """
+        states: List[Optional[Dict[str, Any]]] = [None] * len(validations)
+        errors: List[Optional[ValidationResult]] = [None] * len(validations)
+        timings = [0.0] * len(validations)
+
+        for i, validation in enumerate(validations):
+            start = time.time()
+            try:
+                states[i] = validation.init_state(context)
+            except Exception as e:
+                errors[i] = validation._error_result(e)
+            timings[i] += time.time() - start
+
+        # Rules that can evaluate chunks independently are handed to a worker pool
+        executor = None
+        workers = self._chunk_worker_count()
+        if workers > 1:
+            pooled = [
+                i for i, validation in enumerate(validations)
+                if validation.parallel_chunks and errors[i] is None and states[i].get("result") is None
+            ]
+            if pooled:
+                logger.debug(f"Evaluating {len(pooled)} validations on chunks with {workers} worker processes")
+                executor = ChunkParallelExecutor(
+                    [validations[i] for i in pooled], [states[i] for i in pooled], context, workers
+                )
+        else:
+            pooled = []
+        in_process = [i for i in range(len(validations)) if i not in pooled]
+
+        # Row groups whose statistics settle every rule in the scan are not decoded
+        scanning = [i for i in range(len(validations)) if errors[i] is None and states[i].get("result") is None]
+        if self.config.row_group_skipping and scanning:
+            data_iterator = loader.load_skipping(
+                lambda statistics: all(validations[i].covers_row_group(statistics) for i in scanning)
+            )
+        else:
+            data_iterator = loader.load()
+
+        try:
+            row_offset = 0
+            skipped_row_groups = 0
+            for chunk in data_iterator:
+                active = [
+                    i for i in in_process
+                    if errors[i] is None and states[i].get("result") is None
+                ]
+                if not active and not (executor and executor.active_indices()):
+                    break
+
+                if isinstance(chunk, RowGroupStatistics):
+                    for i in active:
+                        start = time.time()
+                        try:
+                            validations[i].accumulate_statistics(states[i], chunk, row_offset, context)
+                        except Exception as e:
+                            errors[i] = validations[i]._error_result(e)
+                        timings[i] += time.time() - start
+
+                    if executor:
+                        executor.submit_statistics(chunk, row_offset, context)
+
+                    row_offset += chunk.num_rows
+                    skipped_row_groups += 1
+                    continue
+
+                for i in active:
+                    start = time.time()
+                    try:
+                        validations[i].accumulate(states[i], chunk, row_offset, context)
+                        validations[i].check_failure_limit(states[i], context)
+                    except Exception as e:
+                        errors[i] = validations[i]._error_result(e)
+                    timings[i] += time.time() - start
+
+                if executor:
+                    executor.submit(chunk, row_offset)
+
+                row_offset += len(chunk)
+
+                # Stop reading as soon as every rule has its result
+                if not any(errors[i] is None and states[i].get("result") is None for i in active) and not (
+                    executor and executor.active_indices()
+                ):
+                    break
+
+            if executor:
+                executor.finish()
+
+            if skipped_row_groups:
+                logger.debug(f"Skipped {skipped_row_groups} row groups settled by their statistics")
+
+        except Exception as e:
+            # Loader failure: every validation still scanning sees the same error
+            if executor:
+                executor.finish()
+            for i, validation in enumerate(validations):
+                if errors[i] is None and states[i].get("result") is None:
+                    errors[i] = validation._error_result(e)
+
+        finally:
+            if hasattr(data_iterator, "close"):
+                data_iterator.close()
+            if executor:
+                executor.close()
+                for i, elapsed in zip(pooled, executor.timings):
+                    timings[i] += elapsed
+
+        results = []
+        for i, validation in enumerate(validations):
+            start = time.time()
+            try:
+                result = errors[i]
+                if result is None:
+                    result = validation.finalize(states[i], context)
+            except Exception as e:
+                result = validation._error_result(e)
+            finally:
+                if states[i] is not None:
+                    validation.release_state(states[i])
+
+            result.execution_time = timings[i] + (time.time() - start)
+            results.append(result)
+
+        return results
+
     def _print_summary(self, report: ValidationReport) -> None:
         """
         Print a summary of the validation results.
@@ -378,3 +866,20 @@ class ValidationEngine:
             List of validation type names
         """
         return self.registry.list_available()
+
+
+def _validate_file_in_worker(config: ValidationConfig, file_config: Dict[str, Any]) -> FileValidationReport:
+    """
+    Validate a single file inside a worker process.
+
+    Defined at module level so it can be pickled by ProcessPoolExecutor.
+
+    Args:
+        config: Validation configuration for the job
+        file_config: File configuration dictionary
+
+    Returns:
+        FileValidationReport for the file
+    """
+    engine = ValidationEngine(config)
+    return engine._validate_file(file_config, verbose=False)
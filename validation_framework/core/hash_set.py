@@ -0,0 +1,201 @@
+"""
+Compact NumPy hash set for 64-bit key hashes.
+
+UInt64PairSet stores keys as pairs of uint64 values (a lookup hash and a check
+hash, see validation_framework.core.row_hashing) in two flat NumPy arrays using
+open addressing with linear probing. Each slot costs 16 bytes, compared with
+well over 100 bytes per entry for a Python set of tuples, and lookups and
+inserts are done for whole batches with vectorized probe rounds.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+# Fibonacci hashing multiplier used to spread keys over slots
+_SLOT_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+class UInt64PairSet:
+    """
+    Open-addressing hash set of (uint64, uint64) pairs backed by NumPy arrays.
+
+    The pair (0, 0) marks an empty slot; if it is inserted as a real key it is
+    tracked with a separate flag. The table doubles in size whenever the load
+    factor would exceed max_load.
+
+    Example:
+        >>> table = UInt64PairSet()
+        >>> table.insert_many(np.array([1, 2], dtype=np.uint64), np.array([7, 8], dtype=np.uint64))
+        array([ True,  True])
+        >>> table.contains_many(np.array([2, 3], dtype=np.uint64), np.array([8, 9], dtype=np.uint64))
+        array([ True, False])
+    """
+
+    def __init__(self, initial_capacity: int = 1024, max_load: float = 0.75) -> None:
+        """
+        Initialize the table.
+
+        Args:
+            initial_capacity: Initial number of slots (rounded up to a power of two)
+            max_load: Maximum fraction of occupied slots before the table grows
+        """
+        self.max_load = max_load
+        self._count = 0
+        self._has_zero_pair = False
+        self._allocate(max(int(initial_capacity), 8))
+
+    def __len__(self) -> int:
+        """Number of pairs in the set."""
+        return self._count + int(self._has_zero_pair)
+
+    @property
+    def capacity(self) -> int:
+        """Number of slots in the table."""
+        return len(self._keys)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the slot arrays, in bytes."""
+        return self._keys.nbytes + self._checks.nbytes
+
+    def contains_many(self, keys: np.ndarray, checks: np.ndarray) -> np.ndarray:
+        """
+        Test a batch of pairs for membership.
+
+        Args:
+            keys: uint64 array of lookup hashes
+            checks: uint64 array of check hashes
+
+        Returns:
+            Boolean array, True where the pair is in the set
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        checks = np.asarray(checks, dtype=np.uint64)
+
+        found = np.zeros(len(keys), dtype=bool)
+        zero = (keys == 0) & (checks == 0)
+        found[zero] = self._has_zero_pair
+
+        active = np.flatnonzero(~zero)
+        slots = self._slots(keys[active])
+
+        while active.size:
+            slot_keys = self._keys[slots]
+            slot_checks = self._checks[slots]
+            match = (slot_keys == keys[active]) & (slot_checks == checks[active])
+            empty = (slot_keys == 0) & (slot_checks == 0)
+
+            found[active[match]] = True
+
+            # Keep probing past occupied slots holding other pairs
+            keep = ~(match | empty)
+            active = active[keep]
+            slots = (slots[keep] + 1) & self._mask
+
+        return found
+
+    def insert_many(self, keys: np.ndarray, checks: np.ndarray) -> np.ndarray:
+        """
+        Insert a batch of pairs.
+
+        Pairs are handled in order, so when a pair occurs more than once in
+        the batch only its first occurrence is reported as new.
+
+        Args:
+            keys: uint64 array of lookup hashes
+            checks: uint64 array of check hashes
+
+        Returns:
+            Boolean array, True where the pair was not in the set before
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        checks = np.asarray(checks, dtype=np.uint64)
+        self._reserve(self._count + len(keys))
+
+        inserted = np.zeros(len(keys), dtype=bool)
+
+        zero = np.flatnonzero((keys == 0) & (checks == 0))
+        if zero.size and not self._has_zero_pair:
+            self._has_zero_pair = True
+            inserted[zero[0]] = True
+
+        active = np.flatnonzero((keys != 0) | (checks != 0))
+        slots = self._slots(keys[active])
+
+        while active.size:
+            slot_keys = self._keys[slots]
+            slot_checks = self._checks[slots]
+            match = (slot_keys == keys[active]) & (slot_checks == checks[active])
+            empty = (slot_keys == 0) & (slot_checks == 0)
+
+            # Several pairs may race for the same empty slot; the earliest wins
+            # and the others look at the slot again in the next round
+            claim = np.flatnonzero(empty)
+            won = np.zeros(len(active), dtype=bool)
+            if claim.size:
+                _, first = np.unique(slots[claim], return_index=True)
+                winners = claim[first]
+                self._keys[slots[winners]] = keys[active[winners]]
+                self._checks[slots[winners]] = checks[active[winners]]
+                inserted[active[winners]] = True
+                self._count += len(winners)
+                won[winners] = True
+
+            advance = ~(match | empty)
+            slots[advance] = (slots[advance] + 1) & self._mask
+
+            keep = ~(match | won)
+            active = active[keep]
+            slots = slots[keep]
+
+        return inserted
+
+    def pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get every pair in the set.
+
+        Returns:
+            Tuple of (keys, checks) uint64 arrays
+        """
+        occupied = (self._keys != 0) | (self._checks != 0)
+        keys = self._keys[occupied]
+        checks = self._checks[occupied]
+        if self._has_zero_pair:
+            keys = np.append(keys, np.uint64(0))
+            checks = np.append(checks, np.uint64(0))
+        return keys, checks
+
+    def clear(self) -> None:
+        """Remove all pairs and release the slot arrays."""
+        self._count = 0
+        self._has_zero_pair = False
+        self._allocate(8)
+
+    def _allocate(self, capacity: int) -> None:
+        """Allocate empty slot arrays with at least the given capacity."""
+        capacity = 1 << (capacity - 1).bit_length()
+        self._keys = np.zeros(capacity, dtype=np.uint64)
+        self._checks = np.zeros(capacity, dtype=np.uint64)
+        self._mask = np.uint64(capacity - 1)
+        self._shift = np.uint64(64 - (capacity.bit_length() - 1))
+
+    def _slots(self, keys: np.ndarray) -> np.ndarray:
+        """Map lookup hashes to their home slots."""
+        return (keys * _SLOT_MULTIPLIER) >> self._shift
+
+    def _reserve(self, count: int) -> None:
+        """Grow the table so that count pairs fit within max_load."""
+        if count <= self.capacity * self.max_load:
+            return
+
+        keys, checks = self._keys, self._checks
+        occupied = (keys != 0) | (checks != 0)
+
+        capacity = self.capacity
+        while count > capacity * self.max_load:
+            capacity *= 2
+
+        self._allocate(capacity)
+        self._count = 0
+        self.insert_many(keys[occupied], checks[occupied])
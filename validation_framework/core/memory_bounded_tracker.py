@@ -3,7 +3,8 @@ Memory-bounded data structure for tracking seen keys with disk spillover.
 
 This module provides a memory-efficient way to track millions/billions of keys
 without running out of memory. When the in-memory limit is reached, keys are
-spilled to a SQLite database on disk.
+spilled to disk: either to a SQLite database, or (for hashed keys) to
+hash-partitioned files that are searched a batch at a time.
 
 This enables validation of 200GB+ files while keeping memory usage under control.
 """
@@ -16,6 +17,12 @@ import hashlib
 from typing import Any, Optional, Tuple, Dict
 from pathlib import Path
 
+import numpy as np
+
+from validation_framework.core.bloom_filter import BlockedBloomFilter, false_positive_rate_for
+from validation_framework.core.hash_set import UInt64PairSet
+from validation_framework.core.spill_store import PartitionedSpillStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,9 +35,14 @@ class MemoryBoundedTracker:
 
     Features:
     - Configurable memory limit (default: 1 million keys)
+    - Optional compact NumPy store ("hash_array") holding 64-bit key hashes
+      instead of Python objects, for many more keys in the same memory
     - Automatic spillover to disk when limit reached
     - Fast in-memory lookups until spillover
-    - Efficient SQLite-based lookups after spillover
+    - Efficient SQLite-based lookups after spillover, or batched lookups in
+      hash-partitioned files ("partitioned" spill backend)
+    - Optional Bloom filter in front of the disk store, so lookups of new
+      keys skip the disk after spillover
     - Automatic cleanup of temporary database files
     - Thread-safe operations
 
@@ -48,7 +60,14 @@ class MemoryBoundedTracker:
         self,
         max_memory_keys: int = 1_000_000,
         db_path: Optional[str] = None,
-        auto_cleanup: bool = True
+        auto_cleanup: bool = True,
+        memory_store: str = "set",
+        spill_backend: str = "sqlite",
+        spill_partitions: int = 64,
+        bloom_filter: bool = False,
+        expected_keys: Optional[int] = None,
+        bloom_false_positive_rate: float = 0.01,
+        bloom_max_bytes: Optional[int] = None,
     ):
         """
         Initialize the memory-bounded tracker.
@@ -58,16 +77,54 @@ class MemoryBoundedTracker:
                            Default: 1,000,000 keys (~40-80 MB depending on key size)
             db_path: Path to SQLite database file. If None, creates a temporary file.
             auto_cleanup: Whether to automatically delete the database file on close.
+            memory_store: In-memory key store. "set" keeps keys in a Python set.
+                        "hash_array" keeps a pair of 64-bit hashes per key in a NumPy
+                        open-addressing table (~16-32 bytes per key); keys passed to
+                        has_seen()/add() are reduced to such a pair with SHA-256.
+            spill_backend: Disk store used once the memory limit is reached. "sqlite" moves
+                         all keys to a SQLite table and queries it key by key. "partitioned"
+                         (requires memory_store="hash_array") keeps the in-memory table as a
+                         write buffer and flushes it, whenever it fills up, to files
+                         partitioned by key hash; db_path is then used as the directory.
+            spill_partitions: Number of partitions for the "partitioned" spill backend.
+            bloom_filter: Whether to keep a Bloom filter of the spilled keys. Lookups the
+                        filter rules out skip the disk store entirely.
+            expected_keys: Number of unique keys the Bloom filter is sized for.
+                         Default: 10 x max_memory_keys
+            bloom_false_positive_rate: Target false positive rate of the Bloom filter
+                                     at expected_keys.
+            bloom_max_bytes: Memory budget for the Bloom filter, in bytes. When the
+                           target rate needs more, the filter is built at this size
+                           and a higher false positive rate. Default: no limit
         """
+        if memory_store not in ("set", "hash_array"):
+            raise ValueError(f"Unknown memory_store '{memory_store}'. Expected 'set' or 'hash_array'")
+        if spill_backend not in ("sqlite", "partitioned"):
+            raise ValueError(f"Unknown spill_backend '{spill_backend}'. Expected 'sqlite' or 'partitioned'")
+        if spill_backend == "partitioned" and memory_store != "hash_array":
+            raise ValueError("The 'partitioned' spill_backend requires memory_store='hash_array'")
+
         self.max_memory_keys = max_memory_keys
         self.auto_cleanup = auto_cleanup
+        self.memory_store = memory_store
+        self.spill_backend = spill_backend
+        self.spill_partitions = spill_partitions
+        self.use_bloom_filter = bloom_filter
+        self.expected_keys = expected_keys or max_memory_keys * 10
+        self.bloom_false_positive_rate = bloom_false_positive_rate
+        self.bloom_max_bytes = bloom_max_bytes
 
         # In-memory storage for fast lookups
         self.memory_keys: set = set()
+        self.hash_table: Optional[UInt64PairSet] = (
+            UInt64PairSet() if memory_store == "hash_array" else None
+        )
 
         # Disk storage for spillover
         self.db_path = db_path
         self.db_conn: Optional[sqlite3.Connection] = None
+        self.spill_store: Optional[PartitionedSpillStore] = None
+        self.bloom: Optional[BlockedBloomFilter] = None
         self.is_spilled = False
 
         # Statistics
@@ -75,6 +132,8 @@ class MemoryBoundedTracker:
         self.total_lookups = 0
         self.memory_hits = 0
         self.disk_hits = 0
+        self.bloom_negatives = 0
+        self.bloom_false_positives = 0
 
         logger.debug(
             f"Initialized MemoryBoundedTracker with max_memory_keys={max_memory_keys}"
@@ -159,13 +218,18 @@ class MemoryBoundedTracker:
 
         This is called automatically when the memory limit is reached.
         All keys currently in memory are written to the database, and
-        the in-memory set is cleared.
+        the in-memory set is cleared. With the "partitioned" backend this
+        happens every time the in-memory table fills up.
         """
+        if self.spill_backend == "partitioned":
+            self._flush_to_partitions()
+            return
+
         if self.is_spilled:
             return  # Already in spillover mode
 
         logger.info(
-            f"Memory limit reached ({len(self.memory_keys):,} keys). "
+            f"Memory limit reached ({self._memory_key_count():,} keys). "
             f"Spilling to disk..."
         )
 
@@ -173,11 +237,13 @@ class MemoryBoundedTracker:
         self._init_database()
 
         # Write all memory keys to database
+        self._init_bloom_filter()
         batch = []
-        for key in self.memory_keys:
+        for key in self._iter_memory_keys():
             key_hash = self._hash_key(key)
             key_value = self._serialize_key(key)
             batch.append((key_hash, key_value))
+            self._bloom_add_hex(key_hash)
 
             # Batch insert for performance
             if len(batch) >= 10000:
@@ -197,12 +263,101 @@ class MemoryBoundedTracker:
         self.db_conn.commit()
 
         # Clear memory to reclaim space
-        spilled_count = len(self.memory_keys)
+        spilled_count = self._memory_key_count()
         self.memory_keys.clear()
+        if self.hash_table is not None:
+            self.hash_table.clear()
         self.is_spilled = True
 
         logger.info(f"Spilled {spilled_count:,} keys to disk successfully")
 
+    def _flush_to_partitions(self) -> None:
+        """
+        Move the keys in the in-memory table to the partitioned spill store.
+
+        The keys are new to the store (lookups check it before inserting), so
+        they are written as one sorted run per partition without deduplication.
+        """
+        if self.spill_store is None:
+            self.spill_store = PartitionedSpillStore(
+                directory=self.db_path,
+                num_partitions=self.spill_partitions,
+                auto_cleanup=self.auto_cleanup,
+            )
+            self._init_bloom_filter()
+            logger.info(
+                f"Memory limit reached ({self._memory_key_count():,} keys). "
+                f"Spilling to {self.spill_store.num_partitions} hash partitions..."
+            )
+
+        keys, checks = self.hash_table.pairs()
+        self.spill_store.add_run(keys, checks)
+        if self.bloom is not None:
+            self.bloom.add_many(keys)
+        self.hash_table.clear()
+        self.is_spilled = True
+
+        logger.debug(f"Flushed {len(keys):,} keys to disk ({self.spill_store.key_count:,} on disk)")
+
+    def _init_bloom_filter(self) -> None:
+        """Create the Bloom filter for spilled keys, if enabled."""
+        if not self.use_bloom_filter or self.bloom is not None:
+            return
+
+        false_positive_rate = self.bloom_false_positive_rate
+        if self.bloom_max_bytes is not None:
+            capped_rate = false_positive_rate_for(self.expected_keys, self.bloom_max_bytes)
+            if capped_rate > false_positive_rate:
+                logger.info(
+                    f"Bloom filter for {self.expected_keys:,} keys capped at "
+                    f"{self.bloom_max_bytes / (1024 * 1024):.1f} MB; false positive rate "
+                    f"raised from {false_positive_rate:.2%} to {capped_rate:.2%}"
+                )
+                false_positive_rate = capped_rate
+
+        self.bloom = BlockedBloomFilter(self.expected_keys, false_positive_rate)
+        logger.debug(
+            f"Created Bloom filter for {self.expected_keys:,} keys "
+            f"({self.bloom.nbytes / (1024 * 1024):.1f} MB, {self.bloom.num_probes} probes)"
+        )
+
+    @staticmethod
+    def _hex_to_hashes(key_hash: str) -> np.ndarray:
+        """Take a 64-bit Bloom filter hash from a SHA-256 hex digest."""
+        return np.array([int(key_hash[:16], 16)], dtype=np.uint64)
+
+    def _bloom_add_hex(self, key_hash: str) -> None:
+        """Record a key stored in the SQLite backend in the Bloom filter."""
+        if self.bloom is not None:
+            self.bloom.add_many(self._hex_to_hashes(key_hash))
+
+    def _bloom_filter_many(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Find the keys that may be on disk according to the Bloom filter.
+
+        Args:
+            hashes: uint64 array of key hashes
+
+        Returns:
+            Boolean array, False where the disk lookup can be skipped
+        """
+        if self.bloom is None:
+            return np.ones(len(hashes), dtype=bool)
+
+        maybe = self.bloom.contains_many(hashes)
+        self.bloom_negatives += int(len(maybe) - maybe.sum())
+        return maybe
+
+    def _spill_contains_many(self, hashes: np.ndarray, check_hashes: np.ndarray) -> np.ndarray:
+        """Look a batch of hashed keys up in the partitioned spill store."""
+        found = np.zeros(len(hashes), dtype=bool)
+        maybe = np.flatnonzero(self._bloom_filter_many(hashes))
+        if maybe.size:
+            found[maybe] = self.spill_store.contains_many(hashes[maybe], check_hashes[maybe])
+            if self.bloom is not None:
+                self.bloom_false_positives += int(maybe.size - found[maybe].sum())
+        return found
+
     def has_seen(self, key: Any) -> bool:
         """
         Check if a key has been seen before.
@@ -221,11 +376,18 @@ class MemoryBoundedTracker:
             >>> tracker.has_seen("customer_456")
             False
         """
+        return self._has_seen(self._store_key(key))
+
+    def _has_seen(self, key: Any) -> bool:
+        """Check a key that has already been converted with _store_key()."""
         self.total_lookups += 1
 
-        if self.is_spilled:
-            # Check database
+        if self.is_spilled and self.spill_store is None:
+            # Check database, unless the Bloom filter rules the key out
             key_hash = self._hash_key(key)
+            if not self._bloom_filter_many(self._hex_to_hashes(key_hash))[0]:
+                return False
+
             cursor = self.db_conn.execute(
                 "SELECT 1 FROM seen_keys WHERE key_hash = ? LIMIT 1",
                 (key_hash,)
@@ -235,14 +397,23 @@ class MemoryBoundedTracker:
 
             if found:
                 self.disk_hits += 1
+            elif self.bloom is not None:
+                self.bloom_false_positives += 1
 
             return found
         else:
-            # Check in-memory set
-            found = key in self.memory_keys
+            # Check in-memory store
+            if self.hash_table is not None:
+                found = bool(self.hash_table.contains_many(*self._pair_arrays([key]))[0])
+            else:
+                found = key in self.memory_keys
 
             if found:
                 self.memory_hits += 1
+            elif self.spill_store is not None:
+                found = bool(self._spill_contains_many(*self._pair_arrays([key]))[0])
+                if found:
+                    self.disk_hits += 1
 
             return found
 
@@ -263,13 +434,17 @@ class MemoryBoundedTracker:
             >>> tracker.add("customer_123")  # Returns False (duplicate)
             False
         """
+        return self._add(self._store_key(key))
+
+    def _add(self, key: Any) -> bool:
+        """Add a key that has already been converted with _store_key()."""
         # Check if already seen
-        if self.has_seen(key):
+        if self._has_seen(key):
             return False
 
         self.total_keys_added += 1
 
-        if self.is_spilled:
+        if self.is_spilled and self.spill_store is None:
             # Add to database
             key_hash = self._hash_key(key)
             key_value = self._serialize_key(key)
@@ -279,6 +454,7 @@ class MemoryBoundedTracker:
                     "INSERT INTO seen_keys (key_hash, key_value) VALUES (?, ?)",
                     (key_hash, key_value)
                 )
+                self._bloom_add_hex(key_hash)
                 # Commit periodically for performance
                 if self.total_keys_added % 10000 == 0:
                     self.db_conn.commit()
@@ -288,10 +464,13 @@ class MemoryBoundedTracker:
                 return False
         else:
             # Add to memory
-            self.memory_keys.add(key)
+            if self.hash_table is not None:
+                self.hash_table.insert_many(*self._pair_arrays([key]))
+            else:
+                self.memory_keys.add(key)
 
             # Check if we need to spill to disk
-            if len(self.memory_keys) >= self.max_memory_keys:
+            if self._memory_key_count() >= self.max_memory_keys:
                 self._spill_to_disk()
 
             return True
@@ -321,6 +500,78 @@ class MemoryBoundedTracker:
         was_added = False if was_seen else self.add(key)
         return was_seen, was_added
 
+    def add_and_check_many(self, hashes: np.ndarray, check_hashes: np.ndarray) -> np.ndarray:
+        """
+        Check and add a batch of hashed keys.
+
+        Each key is the pair (hashes[i], check_hashes[i]), as produced by
+        validation_framework.core.row_hashing.hash_rows(). Keys are processed
+        in order, so a key repeated within the batch is reported as seen.
+
+        Args:
+            hashes: uint64 array of primary key hashes
+            check_hashes: uint64 array of check hashes
+
+        Returns:
+            Boolean array, True where the key had been seen before
+        """
+        if self.hash_table is not None and (not self.is_spilled or self.spill_store is not None):
+            # Vectorized path: one probe pass over the NumPy table, after one
+            # batched search of the spilled partitions
+            seen = np.zeros(len(hashes), dtype=bool)
+            if self.spill_store is not None:
+                seen = self._spill_contains_many(hashes, check_hashes)
+                self.disk_hits += int(seen.sum())
+
+            new = np.flatnonzero(~seen)
+            inserted = self.hash_table.insert_many(hashes[new], check_hashes[new])
+            seen[new[~inserted]] = True
+
+            self.total_lookups += len(seen)
+            self.memory_hits += int((~inserted).sum())
+            self.total_keys_added += int(inserted.sum())
+
+            if self._memory_key_count() >= self.max_memory_keys:
+                self._spill_to_disk()
+            return seen
+
+        seen = np.empty(len(hashes), dtype=bool)
+        for i, key in enumerate(zip(hashes.tolist(), check_hashes.tolist())):
+            seen[i] = not self._add(key)
+        return seen
+
+    def _store_key(self, key: Any) -> Any:
+        """
+        Convert a caller's key into the form held by the in-memory store.
+
+        The hash_array store only holds pairs of 64-bit integers, so keys are
+        reduced to the first 16 bytes of their SHA-256 digest.
+        """
+        if self.hash_table is None:
+            return key
+
+        digest = hashlib.sha256(str(key).encode('utf-8')).digest()
+        return (int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:16], "little"))
+
+    @staticmethod
+    def _pair_arrays(keys: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Split a list of (int, int) pairs into two uint64 arrays."""
+        pairs = np.array(keys, dtype=np.uint64).reshape(-1, 2)
+        return pairs[:, 0], pairs[:, 1]
+
+    def _memory_key_count(self) -> int:
+        """Number of keys currently held in memory."""
+        if self.hash_table is not None:
+            return len(self.hash_table)
+        return len(self.memory_keys)
+
+    def _iter_memory_keys(self):
+        """Iterate over the keys held in memory, in their stored form."""
+        if self.hash_table is not None:
+            keys, checks = self.hash_table.pairs()
+            return zip(keys.tolist(), checks.tolist())
+        return iter(self.memory_keys)
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about tracker usage.
@@ -334,8 +585,16 @@ class MemoryBoundedTracker:
             - total_lookups: Total number of lookups
             - memory_hit_rate: Percentage of lookups served from memory
             - total_keys_added: Total add() calls
+            - bloom_skipped_lookups: Disk lookups skipped by the Bloom filter
+            - bloom_false_positives: Disk lookups the Bloom filter let through
+              for keys that were not on disk
+            - bloom_false_positive_rate: Observed false positive rate, in percent
         """
-        if self.is_spilled:
+        if self.spill_store is not None:
+            disk_count = self.spill_store.key_count
+            memory_keys = self._memory_key_count()
+            total_keys = disk_count + memory_keys
+        elif self.is_spilled:
             # Count keys in database
             cursor = self.db_conn.execute("SELECT COUNT(*) FROM seen_keys")
             disk_count = cursor.fetchone()[0]
@@ -343,7 +602,7 @@ class MemoryBoundedTracker:
             memory_keys = 0
         else:
             disk_count = 0
-            memory_keys = len(self.memory_keys)
+            memory_keys = self._memory_key_count()
             total_keys = memory_keys
 
         memory_hit_rate = (
@@ -352,6 +611,14 @@ class MemoryBoundedTracker:
             else 0
         )
 
+        # Observed rate among lookups of keys that were not on disk
+        bloom_misses = self.bloom_negatives + self.bloom_false_positives
+        bloom_false_positive_rate = (
+            (self.bloom_false_positives / bloom_misses * 100)
+            if bloom_misses > 0
+            else 0
+        )
+
         return {
             "total_keys": total_keys,
             "memory_keys": memory_keys,
@@ -362,6 +629,12 @@ class MemoryBoundedTracker:
             "disk_hits": self.disk_hits,
             "memory_hit_rate": round(memory_hit_rate, 2),
             "total_keys_added": self.total_keys_added,
+            "memory_store": self.memory_store,
+            "spill_backend": self.spill_backend,
+            "bloom_filter": self.use_bloom_filter,
+            "bloom_skipped_lookups": self.bloom_negatives,
+            "bloom_false_positives": self.bloom_false_positives,
+            "bloom_false_positive_rate": round(bloom_false_positive_rate, 2),
         }
 
     def close(self) -> None:
@@ -372,6 +645,17 @@ class MemoryBoundedTracker:
         Always call this method when done using the tracker to prevent
         resource leaks.
         """
+        # Collect statistics while the spillover database is still open
+        stats = (
+            self.get_statistics()
+            if self.db_conn or self.spill_store or not self.is_spilled
+            else None
+        )
+
+        if self.spill_store is not None:
+            self.spill_store.close()
+            self.spill_store = None
+
         if self.db_conn:
             self.db_conn.commit()
             self.db_conn.close()
@@ -393,15 +677,18 @@ class MemoryBoundedTracker:
                     logger.warning(f"Failed to delete temporary database: {e}")
 
         # Clear memory
+        self.bloom = None
         self.memory_keys.clear()
+        if self.hash_table is not None:
+            self.hash_table.clear()
 
         # Log final statistics
-        stats = self.get_statistics()
-        logger.info(
-            f"Tracker closed. Statistics: {stats['total_keys']:,} total keys, "
-            f"{stats['total_lookups']:,} lookups, "
-            f"{stats['memory_hit_rate']:.1f}% memory hit rate"
-        )
+        if stats is not None:
+            logger.info(
+                f"Tracker closed. Statistics: {stats['total_keys']:,} total keys, "
+                f"{stats['total_lookups']:,} lookups, "
+                f"{stats['memory_hit_rate']:.1f}% memory hit rate"
+            )
 
     def __enter__(self):
         """Context manager entry."""
@@ -414,5 +701,5 @@ class MemoryBoundedTracker:
 
     def __del__(self):
         """Destructor - ensures cleanup even if close() not called."""
-        if hasattr(self, 'db_conn') and self.db_conn:
+        if getattr(self, 'db_conn', None) or getattr(self, 'spill_store', None):
             self.close()
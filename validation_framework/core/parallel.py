@@ -0,0 +1,203 @@
+"""
+Chunk-parallel evaluation of data validations.
+
+Rules that declare ``parallel_chunks = True`` only look at the chunk they are
+given, so each chunk can be accumulated into a fresh state in a worker process.
+The partial states are merged back into the running state in chunk order, which
+keeps sample failures and early results identical to a sequential run.
+
+Rules are sent to each worker once, when the pool starts; tasks only carry the
+chunk and the indices of the rules that still need data.
+"""
+
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from validation_framework.core.logging_config import get_logger
+from validation_framework.loaders.base import RowGroupStatistics
+from validation_framework.validations.base import DataValidationRule
+
+logger = get_logger(__name__)
+
+# Rules and context for the current worker process, set by _init_worker
+_worker_validations: List[DataValidationRule] = []
+_worker_context: Dict[str, Any] = {}
+
+
+def _init_worker(validations: List[DataValidationRule], context: Dict[str, Any]) -> None:
+    """Store the rules and context in the worker process."""
+    global _worker_validations, _worker_context
+    _worker_validations = validations
+    _worker_context = context
+
+
+def _accumulate_chunk(
+    indices: List[int],
+    chunk: pd.DataFrame,
+    row_offset: int,
+) -> List[Tuple[Dict[str, Any], float]]:
+    """
+    Accumulate one chunk into a fresh state for each selected rule.
+
+    Args:
+        indices: Positions of the rules to evaluate
+        chunk: DataFrame chunk
+        row_offset: Number of rows preceding this chunk
+
+    Returns:
+        List of (partial state, seconds spent) in the same order as indices
+    """
+    partials = []
+    for i in indices:
+        validation = _worker_validations[i]
+        start = time.time()
+        state = validation.init_state(_worker_context)
+        try:
+            validation.accumulate(state, chunk, row_offset, _worker_context)
+        except Exception as e:
+            state["result"] = validation._error_result(e)
+        finally:
+            validation.release_state(state)
+        partials.append((state, time.time() - start))
+    return partials
+
+
+class ChunkParallelExecutor:
+    """
+    Evaluate chunk-protocol rules on chunks in a pool of worker processes.
+
+    Chunks are submitted in file order. At most max_pending chunks are in
+    flight at once; when the limit is reached the oldest chunk is merged
+    before a new one is submitted, which bounds memory use and keeps the
+    merge order deterministic.
+
+    Example usage:
+        executor = ChunkParallelExecutor(validations, states, context, max_workers=8)
+        try:
+            for chunk in loader.load():
+                executor.submit(chunk, row_offset)
+                row_offset += len(chunk)
+            executor.finish()
+        finally:
+            executor.close()
+    """
+
+    def __init__(
+        self,
+        validations: List[DataValidationRule],
+        states: List[Dict[str, Any]],
+        context: Dict[str, Any],
+        max_workers: int,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the executor.
+
+        Args:
+            validations: Rules with parallel_chunks = True
+            states: Running state for each rule (merged into in place)
+            context: Validation context
+            max_workers: Number of worker processes
+            max_pending: Maximum chunks in flight (default: 2 per worker)
+        """
+        self.validations = validations
+        self.states = states
+        self.context = context
+        self.timings = [0.0] * len(validations)
+        self.max_pending = max_pending or max_workers * 2
+        self._pending: Deque[Tuple[List[int], Future]] = deque()
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(validations, context),
+        )
+
+    def active_indices(self) -> List[int]:
+        """Get positions of rules that still need data."""
+        return [i for i, state in enumerate(self.states) if state.get("result") is None]
+
+    def submit(self, chunk: pd.DataFrame, row_offset: int) -> None:
+        """
+        Submit a chunk for evaluation by every rule that is still active.
+
+        Args:
+            chunk: DataFrame chunk
+            row_offset: Number of rows preceding this chunk
+        """
+        while len(self._pending) >= self.max_pending:
+            self._merge_next()
+
+        indices = self.active_indices()
+        if not indices:
+            return
+
+        future = self._executor.submit(_accumulate_chunk, indices, chunk, row_offset)
+        self._pending.append((indices, future))
+
+    def submit_statistics(self, statistics: RowGroupStatistics, row_offset: int, context: Dict[str, Any]) -> None:
+        """
+        Fold a skipped row group into every active rule, in order with the chunks.
+
+        Statistics are cheap to fold, so the partial states are built in this
+        process and queued behind the chunks already in flight.
+
+        Args:
+            statistics: Statistics of the skipped row group
+            row_offset: Number of rows preceding the row group
+            context: Validation context
+        """
+        indices = self.active_indices()
+        if not indices:
+            return
+
+        partials = []
+        for i in indices:
+            validation = self.validations[i]
+            start = time.time()
+            state = validation.init_state(context)
+            try:
+                validation.accumulate_statistics(state, statistics, row_offset, context)
+            except Exception as e:
+                state["result"] = validation._error_result(e)
+            finally:
+                validation.release_state(state)
+            partials.append((state, time.time() - start))
+
+        future: Future = Future()
+        future.set_result(partials)
+        self._pending.append((indices, future))
+
+    def finish(self) -> None:
+        """Merge all outstanding chunks."""
+        while self._pending:
+            self._merge_next()
+
+    def close(self) -> None:
+        """Shut down the worker pool, discarding chunks that were not merged."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._pending.clear()
+
+    def _merge_next(self) -> None:
+        """Wait for the oldest chunk and merge its partial states."""
+        indices, future = self._pending.popleft()
+
+        try:
+            partials = future.result()
+        except Exception as e:
+            logger.error(f"Chunk evaluation failed in worker process: {str(e)}")
+            for i in indices:
+                if self.states[i].get("result") is None:
+                    self.states[i]["result"] = self.validations[i]._error_result(e)
+            return
+
+        for i, (partial, elapsed) in zip(indices, partials):
+            self.validations[i].merge_state(self.states[i], partial)
+            try:
+                self.validations[i].check_failure_limit(self.states[i], self.context)
+            except Exception as e:
+                self.states[i]["result"] = self.validations[i]._error_result(e)
+            self.timings[i] += elapsed
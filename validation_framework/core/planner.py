@@ -0,0 +1,78 @@
+"""
+Cost-based ordering of the validations on a file.
+
+Each rule estimates its own cost (ValidationRule.estimate_cost()): file-level
+rules read metadata only, chunk-protocol rules scan in the shared pass (most of
+them vectorized, some with per-row Python work), and rules that only override
+validate() read the file again or hold whole columns in memory. The engine runs
+gating rules (empty file and schema checks) first and the rest from cheapest to
+most expensive. Results are still reported in configuration order. Rules that
+the footer statistics of a columnar file settle are answered by the engine
+before the scan, whatever their cost.
+
+With processing.fail_fast, a failed ERROR-level gate means the file is broken,
+so the rules that would scan its data are skipped rather than run.
+"""
+
+from typing import List, Optional, Sequence
+
+from validation_framework.core.results import Severity, ValidationResult
+from validation_framework.validations.base import RuleCost, ValidationRule
+
+
+def execution_order(rules: Sequence[Optional[ValidationRule]]) -> List[int]:
+    """
+    Order the rules of a file for execution.
+
+    Gates come first, then rules by increasing estimated cost; ties keep
+    configuration order.
+
+    Args:
+        rules: Rules by configuration slot (None for slots already resolved)
+
+    Returns:
+        Slots of the rules, in the order to run them
+    """
+    return sorted(
+        (slot for slot, rule in enumerate(rules) if rule is not None),
+        key=lambda slot: (not rules[slot].gate, rules[slot].estimate_cost(), slot),
+    )
+
+
+def is_failed_gate(rule: ValidationRule, result: ValidationResult) -> bool:
+    """
+    Check whether a result is a failed ERROR-level gate.
+
+    Args:
+        rule: Rule that produced the result
+        result: Result of the rule
+
+    Returns:
+        True if the rule is a gate that failed at ERROR severity
+    """
+    return rule.gate and not result.passed and result.severity == Severity.ERROR
+
+
+def needs_scan(rule: ValidationRule) -> bool:
+    """Check whether a rule reads the data, so fail_fast may skip it."""
+    return rule.estimate_cost() >= RuleCost.VECTORIZED
+
+
+def skipped_result(rule: ValidationRule, gate: ValidationResult) -> ValidationResult:
+    """
+    Create the result reported for a rule skipped after a failed gate.
+
+    Args:
+        rule: Rule that was not run
+        gate: Result of the gate that failed
+
+    Returns:
+        ValidationResult marked skipped
+    """
+    return ValidationResult(
+        rule_name=rule.name,
+        severity=rule.severity,
+        passed=False,
+        message=f"Skipped: {gate.rule_name} failed ({gate.message})",
+        skipped=True,
+    )
@@ -32,6 +32,9 @@ class ValidationResult:
     details: List[Dict[str, Any]] = field(default_factory=list)
     sample_failures: List[Dict[str, Any]] = field(default_factory=list)
     execution_time: float = 0.0
+    from_metadata: bool = False  # Answered from file metadata without reading data
+    skipped: bool = False  # Not run because a gating check failed (processing.fail_fast)
+    stopped_early: bool = False  # Stopped at stop_after_failures; counts are lower bounds
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -45,6 +48,9 @@ class ValidationResult:
             "success_rate": self._calculate_success_rate(),
             "sample_failures": self.sample_failures[:10],  # Limit to 10 samples
             "execution_time": round(self.execution_time, 3),
+            "from_metadata": self.from_metadata,
+            "skipped": self.skipped,
+            "stopped_early": self.stopped_early,
         }
 
     def _calculate_success_rate(self) -> float:
@@ -74,7 +80,8 @@ class FileValidationReport:
         self.validation_results.append(result)
         self.total_validations += 1
 
-        if not result.passed:
+        # Skipped rules are listed but not counted; the gate that failed already is
+        if not result.passed and not result.skipped:
             if result.severity == Severity.ERROR:
                 self.error_count += 1
             else:
@@ -0,0 +1,143 @@
+"""
+Vectorized hashing of composite row keys for duplicate detection.
+
+Each row's key columns are reduced to two independent 64-bit hashes computed
+with pandas' hashing routines. The first hash is the lookup key; the second is
+used to tell genuine repeats apart from rows that merely collide on the first,
+so a key is only reported as a duplicate when both hashes match.
+
+Hashes are normalised so that the same key hashes identically in every chunk,
+even when type inference differs between chunks: integral floats hash like the
+equivalent integers (a column read as int64 in one chunk and float64 in the
+next) and all null markers (None, NaN, NA) hash to the same value.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_float_dtype
+
+from validation_framework.core.memory_bounded_tracker import MemoryBoundedTracker
+
+# 16-character keys for pd.util.hash_array; the primary key is pandas' default
+_PRIMARY_HASH_KEY = "0123456789123456"
+_CHECK_HASH_KEY = "f1c3e8a2d7b45960"
+
+_NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+_COMBINE_MULTIPLIER = np.uint64(1000003)
+
+# Largest float magnitude that converts to int64 without overflow
+_INT64_LIMIT = 2.0 ** 63
+
+
+def _hash_column(values: pd.Series, hash_key: str) -> np.ndarray:
+    """
+    Hash one key column.
+
+    Args:
+        values: Column values
+        hash_key: Hash key selecting the hash function
+
+    Returns:
+        uint64 array with one hash per value
+    """
+    null_mask = values.isna().to_numpy()
+
+    if is_float_dtype(values.dtype):
+        array = values.to_numpy(dtype="float64", na_value=np.nan)
+        hashes = pd.util.hash_array(array, hash_key=hash_key)
+
+        # Integral values hash like the integers they represent
+        with np.errstate(invalid="ignore"):
+            integral = ~null_mask & (np.floor(array) == array) & (np.abs(array) < _INT64_LIMIT)
+        if integral.any():
+            hashes[integral] = pd.util.hash_array(array[integral].astype(np.int64), hash_key=hash_key)
+    else:
+        # Copy: under copy-on-write pandas hands out read-only views
+        hashes = pd.util.hash_pandas_object(values, index=False, hash_key=hash_key).to_numpy(
+            dtype=np.uint64, copy=True
+        )
+
+    hashes[null_mask] = _NULL_HASH
+    return hashes
+
+
+def hash_rows(frame: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hash every row of a frame of key columns.
+
+    Args:
+        frame: DataFrame holding only the key columns
+
+    Returns:
+        Tuple of (primary hashes, check hashes), both uint64 arrays
+    """
+    primary = np.zeros(len(frame), dtype=np.uint64)
+    check = np.zeros(len(frame), dtype=np.uint64)
+
+    for _, values in frame.items():
+        primary = (primary * _COMBINE_MULTIPLIER) ^ _hash_column(values, _PRIMARY_HASH_KEY)
+        check = (check * _COMBINE_MULTIPLIER) ^ _hash_column(values, _CHECK_HASH_KEY)
+
+    return primary, check
+
+
+def mark_duplicates(
+    tracker: MemoryBoundedTracker,
+    hashes: np.ndarray,
+    check_hashes: np.ndarray,
+) -> np.ndarray:
+    """
+    Flag rows whose key was already seen, earlier in the chunk or in the tracker.
+
+    Repeats within the chunk are resolved with NumPy; only the distinct keys
+    of the chunk are looked up in and added to the tracker, in one batch.
+
+    Args:
+        tracker: Tracker holding the keys of previous chunks
+        hashes: Primary row hashes from hash_rows()
+        check_hashes: Check row hashes from hash_rows()
+
+    Returns:
+        Boolean array, True for rows that repeat an earlier key
+    """
+    if len(hashes) == 0:
+        return np.zeros(0, dtype=bool)
+
+    first_index, inverse = _first_occurrences(hashes, check_hashes)
+
+    # Feed the tracker in row order
+    seen_before = tracker.add_and_check_many(hashes[first_index], check_hashes[first_index])
+
+    repeated_in_chunk = first_index[inverse] != np.arange(len(hashes))
+    return repeated_in_chunk | seen_before[inverse]
+
+
+def _first_occurrences(hashes: np.ndarray, check_hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Group rows by key within a chunk.
+
+    Args:
+        hashes: Primary row hashes
+        check_hashes: Check row hashes
+
+    Returns:
+        Tuple of (row index of each distinct key's first occurrence, in row
+        order; distinct key number of every row)
+    """
+    # pd.factorize numbers keys in order of first appearance, in linear time
+    codes, _ = pd.factorize(hashes)
+    previous_max = np.maximum.accumulate(np.concatenate(([-1], codes[:-1])))
+    first_index = np.flatnonzero(codes > previous_max)
+
+    if np.array_equal(check_hashes, check_hashes[first_index][codes]):
+        return first_index, codes
+
+    # Rows that share a primary hash but not a check hash: group on both hashes
+    pairs = np.column_stack((hashes, check_hashes))
+    _, first_index, inverse = np.unique(pairs, axis=0, return_index=True, return_inverse=True)
+    order = np.argsort(first_index, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return first_index[order], rank[inverse.reshape(-1)]
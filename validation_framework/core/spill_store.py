@@ -0,0 +1,183 @@
+"""
+Hash-partitioned on-disk store for spilled key hashes.
+
+PartitionedSpillStore holds (hash, check hash) pairs that no longer fit in
+memory. Pairs are split into partitions by the top bits of their hash, Grace
+hash join style, and each partition is kept as a small number of sorted runs
+in .npy files. Lookups and inserts work on whole batches: a batch is split by
+partition and each partition is searched with np.searchsorted over
+memory-mapped runs, so no per-key queries or transactions are involved.
+
+When a partition collects more than max_runs runs they are merged into one,
+which only needs that single partition in memory.
+"""
+
+import os
+import shutil
+import tempfile
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from validation_framework.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class PartitionedSpillStore:
+    """
+    Disk store of uint64 pairs, partitioned by hash and searched in batches.
+
+    Example:
+        >>> store = PartitionedSpillStore(num_partitions=16)
+        >>> store.add_run(keys, checks)          # keys known to be new
+        >>> store.contains_many(keys, checks)    # boolean array
+        >>> store.close()
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        num_partitions: int = 64,
+        max_runs: int = 8,
+        auto_cleanup: bool = True,
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory for partition files. If None, a temporary directory is created.
+            num_partitions: Number of partitions (rounded up to a power of two)
+            max_runs: Sorted runs per partition before they are merged
+            auto_cleanup: Whether to delete the partition files on close
+        """
+        self.num_partitions = 1 << max(int(num_partitions) - 1, 0).bit_length()
+        self.max_runs = max_runs
+        self.auto_cleanup = auto_cleanup
+
+        if directory is None:
+            self.directory = tempfile.mkdtemp(prefix="tracker_spill_")
+            logger.info(f"Created temporary directory for spillover: {self.directory}")
+        else:
+            self.directory = directory
+            os.makedirs(directory, exist_ok=True)
+
+        self._bits = np.uint64(self.num_partitions.bit_length() - 1)
+        self._runs: List[List[Tuple[str, str, int]]] = [[] for _ in range(self.num_partitions)]
+        self._run_counter = 0
+        self.key_count = 0
+
+    def contains_many(self, keys: np.ndarray, checks: np.ndarray) -> np.ndarray:
+        """
+        Test a batch of pairs for membership.
+
+        Args:
+            keys: uint64 array of lookup hashes
+            checks: uint64 array of check hashes
+
+        Returns:
+            Boolean array, True where the pair is stored
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        checks = np.asarray(checks, dtype=np.uint64)
+        found = np.zeros(len(keys), dtype=bool)
+
+        for partition, positions in self._split(keys):
+            for keys_path, checks_path, _ in self._runs[partition]:
+                remaining = positions[~found[positions]]
+                if remaining.size == 0:
+                    break
+                run_keys = np.load(keys_path, mmap_mode="r")
+                run_checks = np.load(checks_path, mmap_mode="r")
+                found[remaining] = self._search(run_keys, run_checks, keys[remaining], checks[remaining])
+
+        return found
+
+    def add_run(self, keys: np.ndarray, checks: np.ndarray) -> None:
+        """
+        Store a batch of pairs that are not yet in the store.
+
+        Args:
+            keys: uint64 array of lookup hashes
+            checks: uint64 array of check hashes
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        checks = np.asarray(checks, dtype=np.uint64)
+
+        for partition, positions in self._split(keys):
+            self._write_run(partition, keys[positions], checks[positions])
+            if len(self._runs[partition]) > self.max_runs:
+                self._merge_runs(partition)
+
+        self.key_count += len(keys)
+
+    def close(self) -> None:
+        """Delete the partition files if auto_cleanup is enabled."""
+        self._runs = [[] for _ in range(self.num_partitions)]
+        if self.auto_cleanup and os.path.isdir(self.directory):
+            shutil.rmtree(self.directory, ignore_errors=True)
+            logger.debug(f"Cleaned up spillover directory: {self.directory}")
+
+    def _split(self, keys: np.ndarray):
+        """Yield (partition, positions) for every partition present in keys."""
+        if self.num_partitions == 1:
+            if len(keys):
+                yield 0, np.arange(len(keys))
+            return
+
+        partitions = (keys >> (np.uint64(64) - self._bits)).astype(np.intp)
+        order = np.argsort(partitions, kind="stable")
+        bounds = np.searchsorted(partitions[order], np.arange(self.num_partitions + 1))
+        for partition in range(self.num_partitions):
+            start, end = bounds[partition], bounds[partition + 1]
+            if start < end:
+                yield partition, order[start:end]
+
+    @staticmethod
+    def _search(
+        run_keys: np.ndarray,
+        run_checks: np.ndarray,
+        keys: np.ndarray,
+        checks: np.ndarray,
+    ) -> np.ndarray:
+        """Look pairs up in one run sorted by (key, check)."""
+        left = np.searchsorted(run_keys, keys, side="left")
+        right = np.searchsorted(run_keys, keys, side="right")
+        found = np.zeros(len(keys), dtype=bool)
+
+        # Usually a key occurs at most once per run; compare its check hash directly
+        single = right - left == 1
+        found[single] = run_checks[left[single]] == checks[single]
+
+        # Several pairs share the key: search the check hashes in that range
+        for i in np.flatnonzero(right - left > 1):
+            span = run_checks[left[i]:right[i]]
+            position = np.searchsorted(span, checks[i])
+            found[i] = position < len(span) and span[position] == checks[i]
+
+        return found
+
+    def _write_run(self, partition: int, keys: np.ndarray, checks: np.ndarray) -> None:
+        """Sort a batch of pairs and write it as a new run of a partition."""
+        order = np.lexsort((checks, keys))
+        self._run_counter += 1
+        base = os.path.join(self.directory, f"p{partition:04d}_r{self._run_counter:06d}")
+        keys_path, checks_path = f"{base}_keys.npy", f"{base}_checks.npy"
+        np.save(keys_path, keys[order])
+        np.save(checks_path, checks[order])
+        self._runs[partition].append((keys_path, checks_path, len(keys)))
+
+    def _merge_runs(self, partition: int) -> None:
+        """Merge all runs of a partition into a single sorted run."""
+        runs = self._runs[partition]
+        keys = np.concatenate([np.load(keys_path) for keys_path, _, _ in runs])
+        checks = np.concatenate([np.load(checks_path) for _, checks_path, _ in runs])
+
+        self._runs[partition] = []
+        self._write_run(partition, keys, checks)
+
+        for keys_path, checks_path, _ in runs:
+            os.remove(keys_path)
+            os.remove(checks_path)
+
+        logger.debug(f"Merged {len(runs)} runs of spill partition {partition} ({len(keys):,} keys)")
@@ -93,14 +93,19 @@ class AsyncCSVLoader(AsyncFileLoader):
         # Get the chunk iterator
         chunk_iterator = await loop.run_in_executor(None, _read_csv_chunks)
 
-        # Yield chunks asynchronously
+        # Parse each chunk in the thread pool as well, so the event loop keeps
+        # serving other files and consumers while a chunk is read
         chunk_count = 0
-        for chunk in chunk_iterator:
-            # Yield control to event loop between chunks
-            await asyncio.sleep(0)
-            chunk_count += 1
-            logger.debug(f"Loaded chunk {chunk_count}: {len(chunk)} rows")
-            yield chunk
+        try:
+            while True:
+                chunk = await loop.run_in_executor(None, next, chunk_iterator, None)
+                if chunk is None:
+                    break
+                chunk_count += 1
+                logger.debug(f"Loaded chunk {chunk_count}: {len(chunk)} rows")
+                yield chunk
+        finally:
+            chunk_iterator.close()
 
         logger.info(f"Completed loading {chunk_count} chunks from {self.file_path}")
 
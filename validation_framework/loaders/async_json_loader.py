@@ -6,10 +6,12 @@ arrays and JSON Lines (JSONL) format.
 """
 
 from typing import AsyncIterator, Dict, Any
+from itertools import islice
 import pandas as pd
 import asyncio
 import json
 from validation_framework.loaders.async_base import AsyncFileLoader
+from validation_framework.loaders.json_stream import JSONArrayReader, is_json_array
 import logging
 
 # Optional dependency for async file I/O
@@ -113,7 +115,7 @@ class AsyncJSONLoader(AsyncFileLoader):
             async for chunk in self._load_jsonl_chunks():
                 yield chunk
         else:
-            # Standard JSON array - load entire array then chunk
+            # Standard JSON array - parse incrementally in chunks
             async for chunk in self._load_json_array_chunks():
                 yield chunk
 
@@ -176,8 +178,51 @@ class AsyncJSONLoader(AsyncFileLoader):
         """
         Load standard JSON array file in chunks.
 
-        Since pandas read_json doesn't support chunking for arrays,
-        we load the entire array and then chunk it.
+        Top-level arrays are parsed incrementally in the thread pool, one chunk
+        of records at a time. Other JSON documents are read whole with pandas
+        read_json and then chunked.
+
+        Yields:
+            DataFrame chunks
+        """
+        loop = asyncio.get_event_loop()
+
+        if not await loop.run_in_executor(None, is_json_array, self.file_path):
+            async for chunk in self._load_json_document_chunks():
+                yield chunk
+            return
+
+        chunk_count = 0
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            records = iter(JSONArrayReader(f))
+
+            while True:
+                chunk_data = await loop.run_in_executor(
+                    None, lambda: list(islice(records, self.chunk_size))
+                )
+                if not chunk_data:
+                    break
+
+                df = pd.DataFrame(chunk_data)
+                if self.flatten and len(df) > 0:
+                    df = self._flatten_dataframe(df)
+
+                chunk_count += 1
+                logger.debug(f"Loaded JSON chunk {chunk_count}: {len(df)} rows")
+
+                yield df
+
+                # Yield control to event loop
+                await asyncio.sleep(0)
+
+        logger.info(f"Completed loading {chunk_count} chunks from {self.file_path}")
+
+    async def _load_json_document_chunks(self) -> AsyncIterator[pd.DataFrame]:
+        """
+        Load a JSON document that is not a top-level array in chunks.
+
+        Since pandas read_json doesn't support chunking, we load the entire
+        document and then chunk it.
 
         Yields:
             DataFrame chunks
@@ -257,8 +302,17 @@ class AsyncJSONLoader(AsyncFileLoader):
                         columns = list(first_record.keys())
                     else:
                         columns = []
+            elif is_json_array(self.file_path):
+                # Count the array's records without holding them
+                row_count = 0
+                columns = []
+                with open(self.file_path, 'r', encoding='utf-8') as f:
+                    for record in JSONArrayReader(f):
+                        if row_count == 0 and isinstance(record, dict):
+                            columns = list(record.keys())
+                        row_count += 1
             else:
-                # Load JSON array
+                # Load JSON document
                 df = pd.read_json(self.file_path)
                 row_count = len(df)
                 columns = list(df.columns)
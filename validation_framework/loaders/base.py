@@ -1,14 +1,51 @@
 """Base data loader interface."""
 
 from abc import ABC, abstractmethod
-from typing import Iterator, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import Iterator, Dict, Any, List, Optional, Callable, Union, BinaryIO
 from pathlib import Path
 import pandas as pd
+from validation_framework.loaders.compression import compression_of, open_file
+
+
+@dataclass
+class ColumnStatistics:
+    """
+    Statistics stored for one column of a row group.
+
+    kind is one of "integer", "floating", "string", "boolean", "temporal" or
+    "other". min_value and max_value are None when the file holds no min/max
+    for the column; null_count is None when it holds no null count. NaN values
+    in floating-point columns are not counted as nulls.
+    """
+
+    kind: str
+    min_value: Any = None
+    max_value: Any = None
+    null_count: Optional[int] = None
+
+    @property
+    def has_min_max(self) -> bool:
+        """Whether min_value and max_value are known."""
+        return self.min_value is not None and self.max_value is not None
+
+
+@dataclass
+class RowGroupStatistics:
+    """Statistics for one row group of a columnar file."""
+
+    index: int
+    num_rows: int
+    columns: Dict[str, ColumnStatistics] = field(default_factory=dict)
 
 
 class DataLoader(ABC):
     """Base class for data loaders."""
 
+    # True when the loader reads compressed files (.gz, .bz2, .xz, .zst)
+    # through open_file()
+    supports_compression: bool = False
+
     def __init__(self, file_path: str, chunk_size: int = 50000, **kwargs: Any) -> None:
         """
         Initialize data loader.
@@ -16,11 +53,15 @@ class DataLoader(ABC):
         Args:
             file_path: Path to the data file
             chunk_size: Number of rows per chunk for memory-efficient processing
-            **kwargs: Additional loader-specific parameters
+            **kwargs: Additional loader-specific parameters. All loaders accept
+                      columns: a list of columns to load (default: all columns).
+                      Loaders that cannot read a subset of columns load them all.
         """
         self.file_path: Path = Path(file_path)
         self.chunk_size: int = chunk_size
         self.kwargs: Dict[str, Any] = kwargs
+        self.columns: Optional[List[str]] = kwargs.get("columns")
+        self.compression: Optional[str] = compression_of(self.file_path)
 
         if not self.file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
@@ -45,6 +86,56 @@ class DataLoader(ABC):
         """
         pass
 
+    def load_skipping(
+        self,
+        skip: Callable[[RowGroupStatistics], bool],
+    ) -> Iterator[Union[pd.DataFrame, RowGroupStatistics]]:
+        """
+        Load data in chunks, leaving out row groups proven by their statistics.
+
+        Row groups for which skip() returns True are not decoded; their
+        RowGroupStatistics are yielded in their place, in file order. Loaders
+        without row-group statistics load every row.
+
+        Args:
+            skip: Called with the statistics of each row group
+
+        Yields:
+            DataFrames containing chunks of data, and statistics of skipped row groups
+        """
+        return self.load()
+
+    def count_rows(self) -> Optional[int]:
+        """
+        Get the exact number of data rows without loading the data.
+
+        Returns:
+            Number of rows, or None if the loader cannot count rows cheaply
+        """
+        return None
+
+    def row_group_statistics(self) -> Optional[List[RowGroupStatistics]]:
+        """
+        Get the statistics stored for each row group of the file.
+
+        Returns:
+            List of RowGroupStatistics in file order, or None if the format
+            stores no statistics
+        """
+        return None
+
+    def open_file(self) -> BinaryIO:
+        """
+        Open the file for reading bytes.
+
+        Compressed files are decompressed on a background thread as they are
+        read (see compression).
+
+        Returns:
+            Binary file object
+        """
+        return open_file(self.file_path)
+
     def get_file_size(self) -> int:
         """Get file size in bytes."""
         return self.file_path.stat().st_size
@@ -0,0 +1,299 @@
+"""
+Byte-range splitting of memory-mapped text files.
+
+A mapped file is split into ranges of roughly range_size bytes that start and
+end on record boundaries, so each range can be parsed on its own and ranges can
+be parsed in parallel. Boundaries are found by searching the mapping for the
+next newline; for quoted formats a newline only ends a record when an even
+number of quote characters precede it within the range. Ranges are (start, end)
+offsets into the mapping, so splitting copies no data.
+
+ordered_map() parses ranges (or any other work items) on a thread pool and
+yields results in input order; rechunk() regroups the resulting DataFrames into
+chunks of a fixed number of rows.
+"""
+
+import codecs
+import io
+import mmap
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Deque, Iterable, Iterator, Optional, Tuple, TypeVar, Union
+
+import numpy as np
+import pandas as pd
+
+# Default number of bytes in one range
+DEFAULT_RANGE_SIZE = 8 * 1024 * 1024
+
+# Default number of ranges parsed at once
+DEFAULT_PARSE_THREADS = min(4, os.cpu_count() or 1)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ascii_compatible(encoding: str) -> bool:
+    """
+    Check whether newline and quote characters are single ASCII bytes in an encoding.
+
+    Args:
+        encoding: Encoding name
+
+    Returns:
+        False for UTF-16 and UTF-32, True otherwise
+    """
+    return not codecs.lookup(encoding).name.startswith(("utf-16", "utf-32"))
+
+
+@contextmanager
+def map_file(file_path: Union[str, Path]) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Memory-map a file read-only.
+
+    Empty files cannot be mapped and are returned as b"". The mapping is left
+    to the garbage collector if views of it are still alive on exit.
+
+    Args:
+        file_path: Path to the file
+
+    Yields:
+        mmap object, or b"" for an empty file
+    """
+    with open(file_path, "rb") as f:
+        if not Path(file_path).stat().st_size:
+            yield b""
+            return
+
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield data
+        finally:
+            try:
+                data.close()
+            except BufferError:
+                pass
+
+
+def record_ranges(
+    data: Union[mmap.mmap, bytes],
+    start: int = 0,
+    range_size: int = DEFAULT_RANGE_SIZE,
+    quotechar: Optional[str] = None,
+) -> Iterator[Tuple[int, int]]:
+    """
+    Split data into ranges that end on record boundaries.
+
+    Ranges are computed lazily, so parsing can start before the whole mapping
+    has been split.
+
+    Args:
+        data: Mapped file
+        start: Offset of the first record
+        range_size: Target number of bytes per range
+        quotechar: Quote character whose quoted newlines do not end a record
+
+    Yields:
+        (start, end) byte offsets; the last range ends at len(data)
+    """
+    quote = quotechar.encode("ascii") if quotechar else None
+    range_size = max(1, int(range_size))
+
+    while start < len(data):
+        end = record_end(data, start, start + range_size, quote)
+        yield start, end
+        start = end
+
+
+def line_blocks(file: BinaryIO, block_size: int) -> Iterator[bytes]:
+    """
+    Read a stream that cannot be mapped, such as a decompressed file, in blocks
+    of whole lines.
+
+    Blocks end after a newline, whether or not it is quoted, so this suits
+    formats without newlines inside values, such as JSON Lines.
+
+    Args:
+        file: Binary file object
+        block_size: Bytes read at a time
+
+    Yields:
+        Blocks of about block_size bytes; only the last may lack a trailing newline
+    """
+    rest = b""
+    while True:
+        data = file.read(block_size)
+        if not data:
+            if rest:
+                yield rest
+            return
+
+        data = rest + data
+        end = data.rfind(b"\n") + 1
+        rest = data[end:]
+        if end:
+            yield data[:end]
+
+
+def record_end(data: Union[mmap.mmap, bytes], start: int, target: int, quote: Optional[bytes] = None) -> int:
+    """
+    Find the end of the first record that ends at or after target.
+
+    Args:
+        data: Mapped file
+        start: Offset of a record boundary before target
+        target: Offset to search from
+        quote: Quote character as a single byte, or None
+
+    Returns:
+        Offset just past the record-ending newline, or len(data)
+    """
+    if target >= len(data):
+        return len(data)
+
+    in_quotes = quote is not None and _quote_count(data, start, target, quote) % 2 == 1
+    position = target
+    while True:
+        newline = data.find(b"\n", position)
+        if newline == -1:
+            return len(data)
+        if quote is not None and _quote_count(data, position, newline, quote) % 2 == 1:
+            in_quotes = not in_quotes
+        if not in_quotes:
+            return newline + 1
+        position = newline + 1
+
+
+def skip_records(data: Union[mmap.mmap, bytes], count: int, quotechar: Optional[str] = None) -> int:
+    """
+    Get the offset just past the first count non-blank records.
+
+    Blank lines are passed over without being counted, as pandas does when
+    locating the header.
+
+    Args:
+        data: Mapped file
+        count: Number of records to skip
+        quotechar: Quote character whose quoted newlines do not end a record
+
+    Returns:
+        Byte offset of the next record
+    """
+    quote = quotechar.encode("ascii") if quotechar else None
+    offset = 0
+    while count > 0 and offset < len(data):
+        end = record_end(data, offset, offset, quote)
+        if data[offset:end].strip(b"\r\n"):
+            count -= 1
+        offset = end
+    return offset
+
+
+class RangeReader(io.RawIOBase):
+    """Binary file object over data[start:end] that reads straight from the mapping."""
+
+    def __init__(self, data: Union[mmap.mmap, bytes], start: int, end: int) -> None:
+        super().__init__()
+        self._view = memoryview(data)[start:end]
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        size = min(len(buffer), len(self._view) - self._position)
+        buffer[:size] = self._view[self._position:self._position + size]
+        self._position += size
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+def _quote_count(data: Union[mmap.mmap, bytes], start: int, end: int, quote: bytes) -> int:
+    """Count quote bytes in data[start:end] without copying."""
+    if end <= start or data.find(quote, start, end) == -1:
+        return 0
+    window = np.frombuffer(data, dtype=np.uint8, count=end - start, offset=start)
+    count = int(np.count_nonzero(window == quote[0]))
+    del window
+    return count
+
+
+def ordered_map(function: Callable[[T], R], items: Iterable[T], threads: int) -> Iterator[R]:
+    """
+    Apply function to items on a thread pool, yielding results in input order.
+
+    At most threads items are in flight ahead of the result being consumed.
+    Closing the iterator cancels work that has not started and waits for work
+    that has.
+
+    Args:
+        function: Function to apply
+        items: Work items; consumed lazily
+        threads: Number of worker threads; 1 runs in the calling thread
+
+    Yields:
+        function(item) for each item, in order
+    """
+    if threads <= 1:
+        for item in items:
+            yield function(item)
+        return
+
+    remaining = iter(items)
+    pending: Deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        try:
+            pending.extend(pool.submit(function, item) for item in islice(remaining, threads))
+            while pending:
+                result = pending.popleft().result()
+                pending.extend(pool.submit(function, item) for item in islice(remaining, 1))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def rechunk(frames: Iterable[pd.DataFrame], chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Regroup DataFrames into chunks of chunk_size rows with a fresh index.
+
+    Only the rows left over at the end of a frame are copied, together with
+    the start of the next frame.
+
+    Args:
+        frames: DataFrames in order
+        chunk_size: Rows per chunk
+
+    Yields:
+        DataFrames of chunk_size rows; the last one may be shorter
+    """
+    carry: Optional[pd.DataFrame] = None
+
+    for frame in frames:
+        position = 0
+
+        if carry is not None:
+            needed = chunk_size - len(carry)
+            if len(frame) < needed:
+                carry = pd.concat([carry, frame], ignore_index=True)
+                continue
+            yield pd.concat([carry, frame.iloc[:needed]], ignore_index=True)
+            position, carry = needed, None
+
+        while len(frame) - position >= chunk_size:
+            yield frame.iloc[position:position + chunk_size].reset_index(drop=True)
+            position += chunk_size
+
+        if position < len(frame) or (carry is None and position == 0):
+            carry = frame.iloc[position:]
+
+    if carry is not None and (len(carry) or len(carry.columns)):
+        yield carry.reset_index(drop=True)
@@ -0,0 +1,386 @@
+"""
+Transparent decompression of compressed input files.
+
+open_file() opens .gz, .bz2, .xz and .zst files as binary streams of their
+decompressed bytes. A background thread decompresses blocks ahead of the reader
+and hands them over through a bounded queue, so decompression overlaps with
+parsing; zlib, bz2, lzma and Arrow's zstd codec release the GIL while they work.
+
+Files made of independent pieces are also decompressed in parallel: gzip files
+written as BGZF blocks (bgzip), whose headers give each block's size, and zstd
+files holding several frames (pzstd, or zstd files concatenated together), whose
+frame boundaries are found by walking the block headers. Other files, including
+ordinary single-member gzip files, are decompressed on the background thread
+alone.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import queue
+import struct
+import threading
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator, List, Optional, Tuple, Union
+
+from validation_framework.loaders.byte_ranges import DEFAULT_PARSE_THREADS, ordered_map
+
+# Compression formats by file suffix
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+}
+
+# Decompressed bytes handed to the reader at a time
+BLOCK_SIZE = 1024 * 1024
+
+# Blocks decompressed ahead of the reader
+READ_AHEAD_BLOCKS = 8
+
+# Compressed bytes of BGZF blocks or zstd frames decompressed per parallel task
+BATCH_SIZE = 1024 * 1024
+
+# zstd files whose first frame is larger than this are decompressed as a stream
+MAX_PARALLEL_FRAME_SIZE = 64 * 1024 * 1024
+
+# Default number of batches decompressed at once
+DEFAULT_DECOMPRESS_THREADS = DEFAULT_PARSE_THREADS
+
+_BGZF_HEADER = struct.Struct("<4s6xH2sHH")
+_ZSTD_MAGIC = 0xFD2FB528
+_ZSTD_SKIPPABLE_MAGIC = range(0x184D2A50, 0x184D2A60)
+
+# A block of decompressed bytes, and the number of compressed bytes consumed to
+# produce it and everything before it
+Block = Tuple[Union[bytes, memoryview], int]
+
+
+def compression_of(file_path: Union[str, Path]) -> Optional[str]:
+    """
+    Get the compression format of a file from its suffix.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        "gzip", "bz2", "xz" or "zstd", or None for uncompressed files
+    """
+    return COMPRESSION_SUFFIXES.get(Path(file_path).suffix.lower())
+
+
+def strip_compression_suffix(file_path: Union[str, Path]) -> Path:
+    """Remove a compression suffix, so data.csv.gz becomes data.csv."""
+    path = Path(file_path)
+    return path.with_suffix("") if compression_of(path) else path
+
+
+def open_file(file_path: Union[str, Path], threads: Optional[int] = None) -> BinaryIO:
+    """
+    Open a file for reading bytes, decompressing it if it is compressed.
+
+    Args:
+        file_path: Path to the file
+        threads: Batches decompressed at once for files that can be split
+                 (default: DEFAULT_DECOMPRESS_THREADS)
+
+    Returns:
+        Binary file object. Compressed files are not seekable.
+    """
+    compression = compression_of(file_path)
+    if compression is None:
+        return open(file_path, "rb")
+
+    blocks = _decompressed_blocks(Path(file_path), compression, threads or DEFAULT_DECOMPRESS_THREADS)
+    return io.BufferedReader(DecompressedStream(blocks), buffer_size=BLOCK_SIZE)
+
+
+def estimate_decompressed_size(file: BinaryIO, file_size: int) -> int:
+    """
+    Estimate the decompressed size of a file opened with open_file().
+
+    The estimate applies the compression ratio of the data read so far to the
+    whole file; uncompressed files are their own size.
+
+    Args:
+        file: File object returned by open_file()
+        file_size: Size of the file on disk
+
+    Returns:
+        Estimated number of bytes the file decompresses to
+    """
+    raw = getattr(file, "raw", file)
+    if not isinstance(raw, DecompressedStream) or not raw.compressed_position:
+        return file_size
+    return int(file_size * raw.decompressed_position / raw.compressed_position)
+
+
+class DecompressedStream(io.RawIOBase):
+    """
+    Read-only stream of blocks produced on a background thread.
+
+    The thread runs the blocks iterator and puts its blocks on a bounded queue;
+    reading takes them off. An exception raised by the iterator is raised by the
+    read that reaches it. Closing the stream stops the thread and closes the
+    iterator.
+    """
+
+    def __init__(self, blocks: Iterator[Block]) -> None:
+        super().__init__()
+        # Bytes of the file on disk, and decompressed bytes, up to the end of
+        # the current block
+        self.compressed_position = 0
+        self.decompressed_position = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=READ_AHEAD_BLOCKS)
+        self._stop = threading.Event()
+        self._block: Union[bytes, memoryview] = b""
+        self._offset = 0
+        self._finished = False
+        self._thread = threading.Thread(
+            target=self._produce, args=(blocks,), name="decompress", daemon=True
+        )
+        self._thread.start()
+
+    def _produce(self, blocks: Iterator[Block]) -> None:
+        """Move blocks onto the queue until they run out or the stream closes."""
+        try:
+            for block in blocks:
+                if not self._put(block):
+                    return
+            self._put(None)
+        except BaseException as e:
+            self._put(e)
+        finally:
+            close = getattr(blocks, "close", None)
+            if close is not None:
+                close()
+
+    def _put(self, item: Any) -> bool:
+        """Queue an item, giving up if the stream is closed meanwhile."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Copy decompressed bytes into buffer, waiting for the next block if needed."""
+        while self._offset >= len(self._block):
+            if self._finished:
+                return 0
+            item = self._queue.get()
+            if item is None or isinstance(item, BaseException):
+                self._finished = True
+                if item is None:
+                    return 0
+                raise item
+            self._block, self.compressed_position = item
+            self.decompressed_position += len(self._block)
+            self._offset = 0
+
+        size = min(len(buffer), len(self._block) - self._offset)
+        buffer[:size] = self._block[self._offset:self._offset + size]
+        self._offset += size
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._block = b""
+        super().close()
+
+
+def _decompressed_blocks(path: Path, compression: str, threads: int) -> Iterator[Block]:
+    """
+    Decompress a file into blocks, in parallel where the format allows.
+
+    Args:
+        path: Path to the compressed file
+        compression: Compression format
+        threads: Batches decompressed at once
+
+    Yields:
+        Blocks of decompressed bytes with their compressed positions
+    """
+    with open(path, "rb") as raw:
+        size = os.fstat(raw.fileno()).st_size
+
+        batches: Optional[Iterator[Block]] = None
+        decompress: Optional[Callable[[bytes], bytes]] = None
+        if compression == "gzip" and _bgzf_block_size(raw.read(_BGZF_HEADER.size)) is not None:
+            batches, decompress = _bgzf_batches(raw), gzip.decompress
+        elif compression == "zstd":
+            first_end = _zstd_frame_end(raw, 0, MAX_PARALLEL_FRAME_SIZE)
+            if first_end is not None and first_end < size:
+                batches, decompress = _zstd_batches(raw, size), _zstd_decompress
+        raw.seek(0)
+
+        if batches is not None:
+            def work(batch: Block) -> Block:
+                return decompress(batch[0]), batch[1]
+
+            results = ordered_map(work, batches, threads)
+            try:
+                previous = 0
+                for data, position in results:
+                    # Spread the batch's compressed bytes over its blocks
+                    view = memoryview(data)
+                    for start in range(0, len(view), BLOCK_SIZE):
+                        end = min(start + BLOCK_SIZE, len(view))
+                        yield view[start:end], previous + (position - previous) * end // len(view)
+                    previous = position
+            finally:
+                results.close()
+            return
+
+        with _open_stream(raw, compression) as stream:
+            while True:
+                block = stream.read(BLOCK_SIZE)
+                if not block:
+                    return
+                yield block, raw.tell()
+
+
+def _open_stream(raw: BinaryIO, compression: str) -> Any:
+    """Open a sequential decompressor over a compressed file object."""
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="rb")
+    if compression == "bz2":
+        return bz2.BZ2File(raw, mode="rb")
+    if compression == "xz":
+        return lzma.LZMAFile(raw, mode="rb")
+    import pyarrow as pa
+
+    return pa.CompressedInputStream(raw, "zstd")
+
+
+def _bgzf_block_size(header: bytes) -> Optional[int]:
+    """Get the size of a BGZF block from its header, or None if it is not one."""
+    if len(header) < _BGZF_HEADER.size:
+        return None
+    magic, extra_length, subfield, subfield_length, block_size = _BGZF_HEADER.unpack(header)
+    if magic != b"\x1f\x8b\x08\x04" or extra_length != 6 or subfield != b"BC" or subfield_length != 2:
+        return None
+    return block_size + 1
+
+
+def _bgzf_batches(raw: BinaryIO) -> Iterator[Block]:
+    """
+    Group the BGZF blocks of a gzip file into batches of about BATCH_SIZE bytes.
+
+    Raises:
+        ValueError: If a gzip member is not a BGZF block
+    """
+    raw.seek(0)
+    batch: List[bytes] = []
+    batch_size = 0
+    while True:
+        header = raw.read(_BGZF_HEADER.size)
+        if not header:
+            break
+        block_size = _bgzf_block_size(header)
+        if block_size is None:
+            raise ValueError(f"Invalid BGZF block at byte {raw.tell() - len(header)}")
+
+        batch.append(header + raw.read(block_size - len(header)))
+        batch_size += block_size
+        if batch_size >= BATCH_SIZE:
+            yield b"".join(batch), raw.tell()
+            batch, batch_size = [], 0
+
+    if batch:
+        yield b"".join(batch), raw.tell()
+
+
+def _zstd_frame_end(raw: BinaryIO, start: int, limit: Optional[int] = None) -> Optional[int]:
+    """
+    Find where a zstd frame ends by walking its block headers.
+
+    Args:
+        raw: Compressed file
+        start: Offset of the frame
+        limit: Largest frame size to walk (default: no limit)
+
+    Returns:
+        Offset just past the frame, or None if it is not a zstd frame or is
+        larger than limit
+    """
+    raw.seek(start)
+    magic = raw.read(4)
+    if len(magic) < 4:
+        return None
+    (magic_number,) = struct.unpack("<I", magic)
+
+    if magic_number in _ZSTD_SKIPPABLE_MAGIC:
+        (length,) = struct.unpack("<I", raw.read(4))
+        return start + 8 + length
+    if magic_number != _ZSTD_MAGIC:
+        return None
+
+    descriptor = raw.read(1)[0]
+    single_segment = (descriptor >> 5) & 1
+    header_size = (
+        1
+        + (0 if single_segment else 1)
+        + (0, 1, 2, 4)[descriptor & 3]
+        + ((1 if single_segment else 0), 2, 4, 8)[descriptor >> 6]
+    )
+    position = start + 4 + header_size
+
+    while True:
+        raw.seek(position)
+        block_header = raw.read(3)
+        if len(block_header) < 3:
+            return None
+        value = int.from_bytes(block_header, "little")
+        block_type = (value >> 1) & 3
+        if block_type == 3:
+            return None
+        # RLE blocks hold one byte repeated block-size times
+        position += 3 + (1 if block_type == 1 else value >> 3)
+        if limit is not None and position - start > limit:
+            return None
+        if value & 1:
+            break
+
+    # Content checksum
+    if descriptor & 4:
+        position += 4
+    return position
+
+
+def _zstd_batches(raw: BinaryIO, size: int) -> Iterator[Block]:
+    """
+    Group whole zstd frames into batches of about BATCH_SIZE bytes.
+
+    Raises:
+        ValueError: If the data after a frame is not a zstd frame
+    """
+    start = 0
+    while start < size:
+        end = start
+        while end < size and end - start < BATCH_SIZE:
+            frame_end = _zstd_frame_end(raw, end)
+            if frame_end is None or frame_end > size:
+                raise ValueError(f"Invalid zstd frame at byte {end}")
+            end = frame_end
+
+        raw.seek(start)
+        yield raw.read(end - start), end
+        start = end
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    """Decompress one or more whole zstd frames."""
+    import pyarrow as pa
+
+    return pa.CompressedInputStream(pa.BufferReader(data), "zstd").read()
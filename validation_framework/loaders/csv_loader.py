@@ -1,12 +1,103 @@
 """CSV data loader with chunked reading for large files."""
 
-from typing import Iterator, Dict, Any
+from contextlib import ExitStack, contextmanager
+from typing import Iterator, Dict, Any, List, Optional
+import logging
 import pandas as pd
 from validation_framework.loaders.base import DataLoader
+from validation_framework.loaders.byte_ranges import (
+    DEFAULT_PARSE_THREADS,
+    DEFAULT_RANGE_SIZE,
+    RangeReader,
+    ascii_compatible,
+    map_file,
+    ordered_map,
+    rechunk,
+    record_ranges,
+    skip_records,
+)
+from validation_framework.loaders.compression import estimate_decompressed_size
+from validation_framework.loaders.row_counter import count_records
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+    pa = None
+    pa_csv = None
+
+logger = logging.getLogger(__name__)
+
+# Supported parsing engines for CSVLoader
+CSV_ENGINES = ("pandas", "pyarrow")
+
+# Default number of bytes the pyarrow engine parses per block
+DEFAULT_BLOCK_SIZE = 16 * 1024 * 1024
+
+# Bytes sampled from the start of the file to estimate its row count
+ESTIMATE_SAMPLE_BYTES = 1024 * 1024
 
 
 class CSVLoader(DataLoader):
-    """Loader for CSV and delimited text files."""
+    """
+    Loader for CSV and delimited text files.
+
+    Two parsing engines are available:
+        - "pandas" (default): pd.read_csv with chunksize, single-threaded
+        - "pyarrow": streams record batches from pyarrow.csv.open_csv, which
+          parses blocks of the file on multiple threads. Batches are regrouped
+          into chunks of chunk_size rows.
+
+    With memory_map enabled the file is memory-mapped instead of read through
+    a file handle. The pandas engine then splits the mapping into byte ranges
+    that end on record boundaries (see byte_ranges) and parses the ranges
+    independently on parse_threads threads; the pyarrow engine reads its
+    blocks straight from the mapping.
+
+    Files compressed with gzip, bzip2, xz or zstd are decompressed on a
+    background thread while they are parsed (see compression); memory_map does
+    not apply to them.
+
+    Loader options (passed as keyword arguments):
+        engine: "pandas" or "pyarrow"
+        block_size: Bytes per block parsed by the pyarrow engine (default: 16 MB)
+        use_threads: Whether the pyarrow engine parses on multiple threads (default: True)
+        infer_types: Whether the pyarrow engine infers column types. If False, every
+                     column is read as strings (default: True)
+        memory_map: Whether to memory-map the file (default: False)
+        range_size: Bytes per range parsed by the memory-mapped pandas engine
+                    (default: 8 MB)
+        parse_threads: Ranges parsed at once by the memory-mapped pandas engine
+                       (default: min(4, CPU count))
+    """
+
+    supports_compression = True
+
+    def __init__(self, file_path: str, chunk_size: int = 50000, **kwargs: Any) -> None:
+        """
+        Initialize CSV loader.
+
+        Args:
+            file_path: Path to the CSV file
+            chunk_size: Number of rows per chunk
+            **kwargs: Loader options (delimiter, encoding, header, engine, ...)
+
+        Raises:
+            ValueError: If the engine is unknown
+        """
+        super().__init__(file_path, chunk_size, **kwargs)
+
+        self.engine: str = (kwargs.get("engine") or "pandas").lower()
+        if self.engine not in CSV_ENGINES:
+            raise ValueError(
+                f"Unknown CSV engine '{self.engine}'. Expected one of: {', '.join(CSV_ENGINES)}"
+            )
+
+        self.memory_map: bool = bool(kwargs.get("memory_map", False))
+        self.range_size: int = kwargs.get("range_size") or DEFAULT_RANGE_SIZE
+        self.parse_threads: int = kwargs.get("parse_threads") or DEFAULT_PARSE_THREADS
 
     def load(self) -> Iterator[pd.DataFrame]:
         """
@@ -15,22 +106,32 @@ class CSVLoader(DataLoader):
         Yields:
             DataFrames containing chunks of data
         """
+        if self.engine == "pyarrow":
+            yield from self._load_pyarrow()
+            return
+
+        if self.memory_map and not self.compression and ascii_compatible(self.kwargs.get("encoding") or "utf-8"):
+            yield from self._load_mapped()
+            return
+
         delimiter = self.kwargs.get("delimiter", ",")
         encoding = self.kwargs.get("encoding", "utf-8")
         header = self.kwargs.get("header", 0)
 
         try:
             # Use chunksize for memory-efficient reading
-            for chunk in pd.read_csv(
-                self.file_path,
-                delimiter=delimiter,
-                encoding=encoding,
-                header=header,
-                chunksize=self.chunk_size,
-                low_memory=False,
-                on_bad_lines='warn',  # Warn but don't fail on bad lines
-            ):
-                yield chunk
+            with self._open_source() as source:
+                for chunk in pd.read_csv(
+                    source,
+                    delimiter=delimiter,
+                    encoding=encoding,
+                    header=header,
+                    usecols=self.columns,
+                    chunksize=self.chunk_size,
+                    low_memory=False,
+                    on_bad_lines='warn',  # Warn but don't fail on bad lines
+                ):
+                    yield chunk
 
         except pd.errors.EmptyDataError:
             # Return empty DataFrame with no columns
@@ -39,6 +140,255 @@ class CSVLoader(DataLoader):
         except Exception as e:
             raise RuntimeError(f"Error loading CSV file {self.file_path}: {str(e)}")
 
+    @contextmanager
+    def _open_source(self) -> Iterator[Any]:
+        """
+        Open what the parsers read from.
+
+        Yields:
+            The file path, or a decompressing file object for compressed files
+        """
+        if self.compression is None:
+            yield self.file_path
+            return
+
+        with self.open_file() as f:
+            yield f
+
+    def _load_mapped(self) -> Iterator[pd.DataFrame]:
+        """
+        Load CSV data by parsing byte ranges of the memory-mapped file.
+
+        Column names are read from the header once; each range is then parsed
+        with those names. Ranges are parsed in parallel and regrouped, in file
+        order, into chunks of chunk_size rows.
+
+        Yields:
+            DataFrames containing chunks of chunk_size rows
+        """
+        delimiter = self.kwargs.get("delimiter", ",")
+        encoding = self.kwargs.get("encoding", "utf-8")
+        header = self.kwargs.get("header", 0)
+
+        if self.is_empty():
+            yield pd.DataFrame()
+            return
+
+        try:
+            names = None
+            if header is not None:
+                names = list(pd.read_csv(
+                    self.file_path, delimiter=delimiter, encoding=encoding, header=header, nrows=0
+                ).columns)
+
+            def parse(byte_range):
+                reader = RangeReader(data, *byte_range)
+                try:
+                    return pd.read_csv(
+                        reader,
+                        delimiter=delimiter,
+                        encoding=encoding,
+                        header=None,
+                        names=names,
+                        usecols=self.columns,
+                        low_memory=False,
+                        on_bad_lines='warn',
+                    )
+                except pd.errors.EmptyDataError:
+                    return None
+                finally:
+                    reader.close()
+
+            with map_file(self.file_path) as data:
+                start = skip_records(data, self._header_rows(), quotechar='"')
+                ranges = record_ranges(data, start, self.range_size, quotechar='"')
+                frames = ordered_map(parse, ranges, self.parse_threads)
+                yielded = False
+                try:
+                    for chunk in rechunk((frame for frame in frames if frame is not None), self.chunk_size):
+                        yielded = True
+                        yield chunk
+                finally:
+                    frames.close()
+
+            if not yielded:
+                columns = names if self.columns is None else [name for name in names or [] if name in self.columns]
+                yield pd.DataFrame(columns=columns)
+
+        except pd.errors.EmptyDataError:
+            yield pd.DataFrame()
+
+        except Exception as e:
+            raise RuntimeError(f"Error loading CSV file {self.file_path}: {str(e)}")
+
+    def _load_pyarrow(self) -> Iterator[pd.DataFrame]:
+        """
+        Load CSV data with the multithreaded pyarrow reader.
+
+        Types are inferred from the first block. Date and time columns are kept
+        as strings, as the pandas engine does, so rules see the same values.
+
+        Yields:
+            DataFrames containing chunks of chunk_size rows
+        """
+        if not HAS_PYARROW:
+            raise RuntimeError(
+                "PyArrow is required for the pyarrow CSV engine but is not installed. "
+                "Install it with: pip install pyarrow"
+            )
+
+        if self.is_empty():
+            yield pd.DataFrame()
+            return
+
+        header = self.kwargs.get("header", 0)
+
+        try:
+            with ExitStack() as sources:
+                reader = self._open_arrow_reader(sources)
+                if reader is None:
+                    yield pd.DataFrame()
+                    return
+
+                pending: List["pa.RecordBatch"] = []
+                pending_rows = 0
+                yielded = False
+
+                for batch in reader:
+                    pending.append(batch)
+                    pending_rows += batch.num_rows
+
+                    while pending_rows >= self.chunk_size:
+                        table = pa.Table.from_batches(pending, schema=reader.schema)
+                        yield self._to_frame(table.slice(0, self.chunk_size), header)
+                        yielded = True
+
+                        rest = table.slice(self.chunk_size)
+                        pending = rest.to_batches()
+                        pending_rows = rest.num_rows
+
+                if pending_rows or not yielded:
+                    table = pa.Table.from_batches(pending, schema=reader.schema)
+                    yield self._to_frame(table, header)
+
+        except Exception as e:
+            message = str(e)
+            if "In CSV column" in message:
+                message += (
+                    ". The column type was inferred from the first block; "
+                    "set infer_types: false or a larger block_size"
+                )
+            raise RuntimeError(f"Error loading CSV file {self.file_path}: {message}")
+
+    def _open_arrow_reader(self, sources: ExitStack) -> Optional["pa_csv.CSVStreamingReader"]:
+        """
+        Open a streaming pyarrow CSV reader for the file.
+
+        Args:
+            sources: Exit stack that closes the files the reader reads from
+
+        Returns:
+            CSVStreamingReader, or None if the file holds no data
+        """
+        delimiter = self.kwargs.get("delimiter") or ","
+        encoding = self.kwargs.get("encoding") or "utf-8"
+        header = self.kwargs.get("header", 0)
+        infer_types = self.kwargs.get("infer_types", True)
+
+        read_options = pa_csv.ReadOptions(
+            use_threads=self.kwargs.get("use_threads", True),
+            block_size=self.kwargs.get("block_size") or DEFAULT_BLOCK_SIZE,
+            encoding=encoding,
+            skip_rows=header or 0,
+            autogenerate_column_names=header is None,
+        )
+        parse_options = pa_csv.ParseOptions(
+            delimiter=delimiter,
+            invalid_row_handler=self._skip_invalid_row,
+        )
+        convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+        if self.columns is not None:
+            # Without a header row pyarrow names the columns f0, f1, ...
+            convert_options.include_columns = [
+                f"f{column}" if header is None else column for column in self.columns
+            ]
+
+        def open_reader(options):
+            if self.compression is not None:
+                source = sources.enter_context(self.open_file())
+            elif self.memory_map:
+                source = sources.enter_context(pa.memory_map(str(self.file_path)))
+            else:
+                source = self.file_path
+            return pa_csv.open_csv(
+                source,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=options,
+            )
+
+        try:
+            reader = open_reader(convert_options)
+        except pa.ArrowInvalid as e:
+            if "Empty CSV file" in str(e):
+                return None
+            raise
+
+        # Reopen with string columns where pandas would not have converted values
+        string_columns = [
+            field.name for field in reader.schema
+            if not infer_types or pa.types.is_temporal(field.type)
+        ]
+        if string_columns:
+            reader.close()
+            convert_options.column_types = {name: pa.string() for name in string_columns}
+            reader = open_reader(convert_options)
+
+        return reader
+
+    @staticmethod
+    def _skip_invalid_row(row: Any) -> str:
+        """Skip a malformed row with a warning, like on_bad_lines='warn'."""
+        logger.warning(
+            f"Skipping line {row.number}: expected {row.expected_columns} fields, saw {row.actual_columns}"
+        )
+        return "skip"
+
+    def _to_frame(self, table: "pa.Table", header: Optional[int]) -> pd.DataFrame:
+        """Convert an Arrow table to a DataFrame with pandas-style column names."""
+        df = table.to_pandas()
+        if header is None:
+            # pandas numbers unnamed columns 0..n-1
+            df.columns = list(self.columns) if self.columns is not None else range(len(df.columns))
+        return df
+
+    def count_rows(self) -> Optional[int]:
+        """
+        Count the data rows of the file exactly, without parsing it.
+
+        The file is scanned for record-ending newlines (see row_counter); the
+        count is cached until the file's size or modification time changes.
+
+        Returns:
+            Number of data rows, or None if the encoding cannot be scanned
+        """
+        if self.is_empty():
+            return 0
+
+        records = count_records(
+            self.file_path,
+            encoding=self.kwargs.get("encoding") or "utf-8",
+            delimiter=self.kwargs.get("delimiter", ","),
+        )
+        if records is None:
+            return None
+        return max(0, records - self._header_rows())
+
+    def _header_rows(self) -> int:
+        """Number of leading records pandas consumes for the header."""
+        header = self.kwargs.get("header", 0)
+        return 0 if header is None else header + 1
+
     def get_metadata(self) -> Dict[str, Any]:
         """
         Get CSV file metadata.
@@ -61,24 +411,36 @@ class CSVLoader(DataLoader):
                 header = self.kwargs.get("header", 0)
 
                 # Read just first chunk to get schema
-                first_chunk = pd.read_csv(
-                    self.file_path,
-                    delimiter=delimiter,
-                    encoding=encoding,
-                    header=header,
-                    nrows=1000,
-                    low_memory=False,
-                )
+                with self._open_source() as source:
+                    first_chunk = pd.read_csv(
+                        source,
+                        delimiter=delimiter,
+                        encoding=encoding,
+                        header=header,
+                        nrows=1000,
+                        low_memory=False,
+                    )
 
                 metadata["columns"] = list(first_chunk.columns)
                 metadata["column_count"] = len(first_chunk.columns)
                 metadata["dtypes"] = {col: str(dtype) for col, dtype in first_chunk.dtypes.items()}
 
-                # Estimate total rows (rough estimate based on file size and sample)
-                # This is just an estimate, actual count requires reading the full file
-                sample_size_bytes = len(first_chunk.to_csv(index=False).encode(encoding))
-                estimated_rows = int((self.get_file_size() / sample_size_bytes) * len(first_chunk))
-                metadata["estimated_rows"] = estimated_rows
+                # Small files are counted exactly; larger ones are estimated from
+                # the line density of the first block. count_rows() is exact.
+                with self.open_file() as f:
+                    sample = f.read(ESTIMATE_SAMPLE_BYTES)
+                    data_size = estimate_decompressed_size(f, self.get_file_size())
+
+                if len(sample) < ESTIMATE_SAMPLE_BYTES:
+                    row_count = self.count_rows()
+                    if row_count is not None:
+                        metadata["total_rows"] = row_count
+                        metadata["estimated_rows"] = row_count
+                if "estimated_rows" not in metadata:
+                    lines_per_byte = max(sample.count(b"\n"), 1) / len(sample)
+                    metadata["estimated_rows"] = max(
+                        0, int(data_size * lines_per_byte) - self._header_rows()
+                    )
 
             except Exception as e:
                 metadata["error"] = f"Could not read metadata: {str(e)}"
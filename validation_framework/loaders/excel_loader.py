@@ -1,50 +1,250 @@
 """Excel data loader."""
 
-from typing import Iterator, Dict, Any
+from contextlib import contextmanager
+from typing import Iterator, Dict, Any, List, Optional, Tuple
 import pandas as pd
+from pandas.io.parsers import TextParser
 from validation_framework.loaders.base import DataLoader
 
+# Workbook formats streamed row by row with openpyxl; others (.xls, .ods, ...)
+# are read whole by pandas
+STREAMING_SUFFIXES = (".xlsx", ".xlsm")
+
+# Rows read by get_metadata() to infer column types
+METADATA_SAMPLE_ROWS = 1000
+
+
+def _convert_cell(value: Any) -> Any:
+    """Convert a cell value the way pandas read_excel does before parsing."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _row_values(row: Tuple[Any, ...]) -> List[Any]:
+    """Convert a worksheet row, dropping empty trailing cells."""
+    values = [_convert_cell(value) for value in row]
+    while values and values[-1] == "":
+        values.pop()
+    return values
+
+
+def _column_names(values: List[Any]) -> List[Any]:
+    """Name header cells as pandas does: 'Unnamed: n' for blanks, 'name.1' for repeats."""
+    names: List[Any] = []
+    seen: Dict[Any, int] = {}
+    for index, value in enumerate(values):
+        name = f"Unnamed: {index}" if value == "" else value
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
 
 class ExcelLoader(DataLoader):
-    """Loader for Excel files (.xls, .xlsx)."""
+    """
+    Loader for Excel files (.xls, .xlsx).
+
+    .xlsx and .xlsm sheets are streamed with openpyxl in read-only mode, so only
+    one chunk of rows is held in memory at a time. Cell values are converted with
+    the same rules as pandas read_excel (blank cells and "NA"-like text become
+    NaN, header blanks become "Unnamed: n"), but column types are inferred per
+    chunk. Other workbook formats are read whole with pandas.
+
+    Options:
+        sheet_name (str or int): Sheet name or 0-based index (default: 0)
+        header (int or None): Row number of the header, or None when the sheet
+            has no header row (default: 0)
+    """
 
     def load(self) -> Iterator[pd.DataFrame]:
         """
         Load Excel data in chunks.
 
-        Note: Excel files are typically smaller than CSVs. We load the full sheet
-        but can still yield in chunks for consistency.
-
         Yields:
             DataFrames containing chunks of data
         """
-        sheet_name = self.kwargs.get("sheet_name", 0)
-        header = self.kwargs.get("header", 0)
-
         try:
-            # Read the full Excel sheet (Excel files are typically smaller)
-            df = pd.read_excel(
-                self.file_path,
-                sheet_name=sheet_name,
-                header=header,
-                engine='openpyxl',  # Use openpyxl for .xlsx files
-            )
-
-            # Yield in chunks for consistency with other loaders
-            if len(df) == 0:
-                yield df
-            else:
-                for start in range(0, len(df), self.chunk_size):
-                    end = min(start + self.chunk_size, len(df))
-                    yield df.iloc[start:end].copy()
+            if self.file_path.suffix.lower() not in STREAMING_SUFFIXES:
+                yield from self._load_whole()
+                return
+
+            with self._open_workbook() as workbook:
+                worksheet = self._worksheet(workbook)
+                for names, rows in self._read_rows(worksheet, self.chunk_size):
+                    yield self._to_dataframe(names, rows, self.columns)
 
         except Exception as e:
             raise RuntimeError(f"Error loading Excel file {self.file_path}: {str(e)}")
 
+    def _load_whole(self) -> Iterator[pd.DataFrame]:
+        """
+        Read a workbook openpyxl cannot stream with pandas, then chunk it.
+
+        Yields:
+            DataFrames containing chunks of data
+        """
+        df = pd.read_excel(
+            self.file_path,
+            sheet_name=self._sheet_name(),
+            header=self._header_row(),
+            usecols=self.columns,
+        )
+
+        if len(df) == 0:
+            yield df
+        else:
+            for start in range(0, len(df), self.chunk_size):
+                end = min(start + self.chunk_size, len(df))
+                yield df.iloc[start:end].copy()
+
+    def _sheet_name(self) -> Any:
+        """Sheet to read; None (as passed by the engine) means the first sheet."""
+        sheet_name = self.kwargs.get("sheet_name")
+        return 0 if sheet_name is None else sheet_name
+
+    def _header_row(self) -> Optional[int]:
+        """Row number of the header row, or None for sheets without one."""
+        return self.kwargs.get("header", 0)
+
+    @contextmanager
+    def _open_workbook(self) -> Iterator[Any]:
+        """
+        Open the workbook in openpyxl's read-only mode.
+
+        Read-only workbooks keep the file open until they are closed, so the
+        workbook is closed when the block exits.
+
+        Yields:
+            openpyxl Workbook
+        """
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(
+            self.file_path, read_only=True, data_only=True, keep_links=False
+        )
+        try:
+            yield workbook
+        finally:
+            workbook.close()
+
+    def _worksheet(self, workbook: Any) -> Any:
+        """Select the configured sheet of an open workbook."""
+        sheet_name = self._sheet_name()
+        if isinstance(sheet_name, int):
+            return workbook.worksheets[sheet_name]
+        return workbook[sheet_name]
+
+    def _read_rows(
+        self, worksheet: Any, chunk_size: int
+    ) -> Iterator[Tuple[List[Any], List[List[Any]]]]:
+        """
+        Stream the data rows of a worksheet in chunks.
+
+        Reading starts at the first row of the sheet, whatever its stored
+        dimensions say. Blank rows between data rows are kept as empty rows; blank rows after
+        the last data row are dropped, as read_excel drops them. Rows wider than
+        the header add "Unnamed: n" columns, which appear from that chunk on.
+        A sheet without data rows yields one empty chunk with the header names.
+
+        Args:
+            worksheet: Read-only openpyxl worksheet
+            chunk_size: Number of rows per chunk
+
+        Yields:
+            Tuples of (column names, rows of converted cell values)
+        """
+        # Stored dimensions may not start at A1 or may be stale; read every row
+        worksheet.reset_dimensions()
+        rows = worksheet.iter_rows(values_only=True)
+        header = self._header_row()
+
+        names: List[Any] = []
+        if header is not None:
+            for _ in range(header):
+                next(rows, None)
+            names = _column_names(_row_values(next(rows, ())))
+
+        chunk: List[List[Any]] = []
+        blank_rows = 0
+        yielded = False
+        for row in rows:
+            values = _row_values(row)
+            if not values:
+                blank_rows += 1
+                continue
+
+            if len(values) > len(names):
+                names = names + [
+                    index if header is None else f"Unnamed: {index}"
+                    for index in range(len(names), len(values))
+                ]
+
+            for item in [[]] * blank_rows + [values]:
+                chunk.append(item)
+                if len(chunk) >= chunk_size:
+                    yield names, chunk
+                    chunk = []
+                    yielded = True
+            blank_rows = 0
+
+        if chunk or not yielded:
+            yield names, chunk
+
+    @staticmethod
+    def _to_dataframe(
+        names: List[Any], rows: List[List[Any]], columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Parse converted rows into a DataFrame with pandas' Excel parsing rules.
+
+        Args:
+            names: Column names
+            rows: Rows of converted cell values, at most len(names) wide
+            columns: Columns to keep (default: all columns)
+
+        Returns:
+            DataFrame with one row per input row
+        """
+        if not rows:
+            return pd.DataFrame(columns=[name for name in names if columns is None or name in columns])
+
+        width = len(names)
+        rows = [row + [""] * (width - len(row)) for row in rows]
+        return TextParser(
+            rows, header=None, names=names, usecols=columns, skip_blank_lines=False
+        ).read()
+
+    def count_rows(self) -> Optional[int]:
+        """
+        Count the data rows of the sheet exactly by streaming it.
+
+        Returns:
+            Number of data rows
+        """
+        if self.is_empty():
+            return 0
+
+        if self.file_path.suffix.lower() not in STREAMING_SUFFIXES:
+            return sum(len(chunk) for chunk in self.load())
+
+        with self._open_workbook() as workbook:
+            worksheet = self._worksheet(workbook)
+            return sum(len(rows) for _, rows in self._read_rows(worksheet, self.chunk_size))
+
     def get_metadata(self) -> Dict[str, Any]:
         """
         Get Excel file metadata.
 
+        Columns and types come from the header and the first rows of the sheet,
+        and the row count from the sheet's stored dimensions; the sheet is not
+        read in full. Sheets with few rows are counted exactly.
+
         Returns:
             Dictionary with file metadata
         """
@@ -57,25 +257,39 @@ class ExcelLoader(DataLoader):
 
         if not self.is_empty():
             try:
-                sheet_name = self.kwargs.get("sheet_name", 0)
-                header = self.kwargs.get("header", 0)
+                if self.file_path.suffix.lower() not in STREAMING_SUFFIXES:
+                    df = pd.concat(list(self.load()), ignore_index=True)
+                    metadata["columns"] = list(df.columns)
+                    metadata["column_count"] = len(df.columns)
+                    metadata["dtypes"] = {col: str(dtype) for col, dtype in df.dtypes.items()}
+                    metadata["total_rows"] = len(df)
+                    metadata["sheet_names"] = pd.ExcelFile(self.file_path).sheet_names
+                    return metadata
+
+                with self._open_workbook() as workbook:
+                    worksheet = self._worksheet(workbook)
+                    metadata["sheet_names"] = list(workbook.sheetnames)
+                    metadata["sheet_name"] = worksheet.title
+                    if worksheet.max_row and worksheet.max_column:
+                        metadata["dimensions"] = worksheet.calculate_dimension()
+
+                    max_row = worksheet.max_row
 
-                # Read to get schema (we need to load Excel files fully anyway)
-                df = pd.read_excel(
-                    self.file_path,
-                    sheet_name=sheet_name,
-                    header=header,
-                    engine='openpyxl',
-                )
+                    # Read one row past the sample to learn whether it is the whole sheet
+                    names, rows = next(self._read_rows(worksheet, METADATA_SAMPLE_ROWS + 1))
 
+                df = self._to_dataframe(names, rows[:METADATA_SAMPLE_ROWS])
                 metadata["columns"] = list(df.columns)
                 metadata["column_count"] = len(df.columns)
                 metadata["dtypes"] = {col: str(dtype) for col, dtype in df.dtypes.items()}
-                metadata["total_rows"] = len(df)
 
-                # Get sheet names
-                xl_file = pd.ExcelFile(self.file_path, engine='openpyxl')
-                metadata["sheet_names"] = xl_file.sheet_names
+                if len(rows) <= METADATA_SAMPLE_ROWS:
+                    metadata["total_rows"] = len(rows)
+                    metadata["estimated_rows"] = len(rows)
+                elif max_row:
+                    header = self._header_row()
+                    header_rows = 0 if header is None else header + 1
+                    metadata["estimated_rows"] = max(0, max_row - header_rows)
 
             except Exception as e:
                 metadata["error"] = f"Could not read metadata: {str(e)}"
@@ -13,6 +13,7 @@ from validation_framework.loaders.excel_loader import ExcelLoader
 from validation_framework.loaders.parquet_loader import ParquetLoader
 from validation_framework.loaders.json_loader import JSONLoader
 from validation_framework.loaders.database_loader import DatabaseLoader
+from validation_framework.loaders.compression import compression_of, strip_compression_suffix
 
 
 class LoaderFactory:
@@ -28,6 +29,9 @@ class LoaderFactory:
         - Parquet files (parquet)
         - JSON files (json, jsonl)
 
+    CSV and JSON files may be compressed with gzip, bzip2, xz or zstd
+    (data.csv.gz, data.jsonl.zst, ...); they are decompressed while they are read.
+
     Supported data sources:
         - Database connections (PostgreSQL, MySQL, SQL Server, Oracle, SQLite)
           Use create_database_loader() for database sources
@@ -63,6 +67,18 @@ class LoaderFactory:
                 - delimiter: Column delimiter for CSV files (default: ',')
                 - encoding: File encoding for CSV files (default: 'utf-8')
                 - header: Row number to use as column names (default: 0)
+                - engine: CSV parsing engine, 'pandas' or 'pyarrow' (default: 'pandas').
+                          'pyarrow' parses blocks of the file on multiple threads.
+                          JSON Lines decoding engine, 'python' or 'pyarrow'
+                          (default: 'python').
+                - block_size: Bytes per block for the pyarrow CSV and JSON engines (default: 16 MB)
+                - infer_types: For the pyarrow CSV engine, False reads every column as
+                               strings (default: True)
+                - read_threads: Row groups of a Parquet file decoded at once (default: up to 4)
+                - memory_map: For CSV and JSON Lines files, memory-map the file and parse
+                              byte ranges of whole records in parallel (default: False)
+                - range_size: Bytes per range when memory-mapped (default: 8 MB)
+                - parse_threads: Ranges parsed at once when memory-mapped (default: up to 4)
                 - sheet_name: Sheet name or index for Excel files (default: 0)
                 - lines: For JSON files, True for JSON Lines format (default: auto-detect)
                 - flatten: For JSON files, flatten nested structures (default: True)
@@ -83,6 +99,13 @@ class LoaderFactory:
             ...     chunk_size=100000
             ... )
 
+            >>> # Create CSV loader with multithreaded pyarrow parsing
+            >>> loader = LoaderFactory.create_loader(
+            ...     'wide.csv',
+            ...     engine='pyarrow',
+            ...     block_size=64 * 1024 * 1024
+            ... )
+
             >>> # Create Parquet loader (format auto-detected)
             >>> loader = LoaderFactory.create_loader('large_data.parquet')
 
@@ -115,6 +138,13 @@ class LoaderFactory:
                 f"Supported formats are: {supported_formats}"
             )
 
+        compression = compression_of(file_path)
+        if compression is not None and not loader_class.supports_compression:
+            raise ValueError(
+                f"Compressed input ({compression}) is not supported for format '{file_format}'. "
+                f"Decompress the file first"
+            )
+
         # Instantiate and return the loader
         try:
             return loader_class(file_path, chunk_size=chunk_size, **kwargs)
@@ -137,7 +167,8 @@ class LoaderFactory:
         Raises:
             ValueError: If format cannot be inferred from extension
         """
-        suffix = Path(file_path).suffix.lower()
+        # data.csv.gz is inferred from .csv
+        suffix = strip_compression_suffix(file_path).suffix.lower()
 
         # Map file extensions to format names
         extension_map = {
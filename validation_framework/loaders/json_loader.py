@@ -10,11 +10,85 @@ Supports:
 Author: daniel edge
 """
 
-from typing import Iterator, Dict, Any, List
+from contextlib import contextmanager
+from typing import Iterator, Dict, Any, List, Optional, Tuple, TextIO
+from itertools import islice
+import io
+import logging
 import pandas as pd
 import json
 from pathlib import Path
 from validation_framework.loaders.base import DataLoader
+from validation_framework.loaders.json_stream import JSONArrayReader, is_json_array
+from validation_framework.loaders.byte_ranges import (
+    DEFAULT_PARSE_THREADS,
+    DEFAULT_RANGE_SIZE,
+    line_blocks,
+    map_file,
+    ordered_map,
+    rechunk,
+    record_ranges,
+)
+from validation_framework.loaders.compression import estimate_decompressed_size
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.json as pa_json
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+    pa = None
+    pc = None
+    pa_json = None
+
+# orjson decodes JSON Lines faster when installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Supported JSON Lines decoding engines
+JSON_ENGINES = ("python", "pyarrow")
+
+# Default number of bytes the pyarrow engine parses per block
+DEFAULT_BLOCK_SIZE = 16 * 1024 * 1024
+
+# Records of a JSON array read to estimate its row count
+ESTIMATE_SAMPLE_RECORDS = 10000
+
+# Invalid JSON Lines kept as samples for the warning logged after a load
+MAX_INVALID_LINE_SAMPLES = 5
+
+
+def _flatten_structs(table: "pa.Table") -> "pa.Table":
+    """
+    Flatten struct columns into '_'-joined columns, as json_normalize(sep='_') does.
+
+    Args:
+        table: Arrow table with possibly nested struct columns
+
+    Returns:
+        Table without struct columns
+    """
+    names: List[str] = []
+    columns: List[Any] = []
+
+    def visit(name: str, column: Any) -> None:
+        if pa.types.is_struct(column.type):
+            for index, field in enumerate(column.type):
+                visit(f"{name}_{field.name}", pc.struct_field(column, [index]))
+        else:
+            names.append(name)
+            columns.append(column)
+
+    for name, column in zip(table.column_names, table.columns):
+        visit(name, column)
+
+    return pa.table(columns, names=names)
 
 
 class JSONLoader(DataLoader):
@@ -29,8 +103,53 @@ class JSONLoader(DataLoader):
         lines (bool): If True, treat as JSON Lines format (default: auto-detect)
         orient (str): Pandas json orientation ('records', 'index', etc.)
         flatten (bool): Flatten nested JSON structures (default: True)
+        engine (str): How JSON Lines are decoded. "python" (default) decodes each
+                      line with orjson when installed, else json. "pyarrow" decodes
+                      ranges of the file with pyarrow.json on multiple threads and
+                      flattens nested objects from the Arrow schema. JSON arrays
+                      are always parsed by the streaming Python reader.
+        block_size (int): Bytes per block parsed by the pyarrow engine (default: 16 MB)
+        memory_map (bool): Memory-map JSON Lines files and parse byte ranges of
+                           whole lines on parse_threads threads (default: False)
+        range_size (int): Bytes per range when memory-mapped (default: 8 MB)
+        parse_threads (int): Ranges parsed at once when memory-mapped
+                             (default: min(4, CPU count))
+
+    Files compressed with gzip, bzip2, xz or zstd are decompressed on a
+    background thread while they are parsed (see compression). memory_map does
+    not apply to them; the pyarrow engine reads them in ranges of whole lines.
     """
 
+    supports_compression = True
+
+    def __init__(self, file_path: str, chunk_size: int = 50000, **kwargs: Any) -> None:
+        """
+        Initialize JSON loader.
+
+        Args:
+            file_path: Path to the JSON file
+            chunk_size: Number of records per chunk
+            **kwargs: Loader options (lines, orient, flatten, engine, memory_map, ...)
+
+        Raises:
+            ValueError: If the engine is unknown
+        """
+        super().__init__(file_path, chunk_size, **kwargs)
+
+        self.engine: str = (kwargs.get("engine") or "python").lower()
+        if self.engine not in JSON_ENGINES:
+            raise ValueError(
+                f"Unknown JSON engine '{self.engine}'. Expected one of: {', '.join(JSON_ENGINES)}"
+            )
+
+        # Invalid JSON Lines skipped by the last load, with a few samples
+        self.invalid_lines: int = 0
+        self.invalid_line_samples: List[str] = []
+
+        self.memory_map: bool = bool(kwargs.get("memory_map", False))
+        self.range_size: int = kwargs.get("range_size") or DEFAULT_RANGE_SIZE
+        self.parse_threads: int = kwargs.get("parse_threads") or DEFAULT_PARSE_THREADS
+
     def load(self) -> Iterator[pd.DataFrame]:
         """
         Load JSON data in chunks.
@@ -49,7 +168,13 @@ class JSONLoader(DataLoader):
             if lines is None:
                 lines = self._is_jsonl_format()
 
-            if lines:
+            if lines and self.engine == "pyarrow":
+                # JSON Lines format - decode ranges with pyarrow
+                yield from self._load_jsonl_arrow(flatten)
+            elif lines and self.memory_map and not self.compression:
+                # JSON Lines format - parse ranges of the mapped file
+                yield from self._load_jsonl_mapped(flatten)
+            elif lines:
                 # JSON Lines format - process line by line in chunks
                 yield from self._load_jsonl(flatten)
             else:
@@ -76,7 +201,7 @@ class JSONLoader(DataLoader):
             True if JSON Lines, False if standard JSON array
         """
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
+            with self._open_text() as f:
                 first_line = f.readline().strip()
 
                 # Empty file
@@ -98,46 +223,277 @@ class JSONLoader(DataLoader):
         """
         Load JSON Lines format in chunks.
 
+        Lines are decoded in batches of chunk_size lines; invalid lines are
+        counted and sampled rather than reported one by one.
+
         Args:
             flatten: Whether to flatten nested structures
 
         Yields:
             DataFrames containing chunks of records
         """
+        self._reset_invalid_lines()
         records: List[Dict[str, Any]] = []
+        line_number = 1
 
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
+        with self.open_file() as f:
+            while True:
+                lines = list(islice(f, self.chunk_size))
+                if not lines:
+                    break
 
-                # Skip empty lines
-                if not line:
-                    continue
+                batch, invalid, samples = self._parse_json_lines(lines, line_number)
+                self._add_invalid_lines(invalid, samples)
+                line_number += len(lines)
 
-                try:
-                    record = json.loads(line)
-                    records.append(record)
+                records.extend(batch)
+                if len(records) >= self.chunk_size:
+                    yield self._records_to_dataframe(records[:self.chunk_size], flatten)
+                    records = records[self.chunk_size:]
 
-                    # Yield chunk when we reach chunk_size
-                    if len(records) >= self.chunk_size:
-                        df = self._records_to_dataframe(records, flatten)
-                        yield df
-                        records = []
+        # Yield remaining records
+        if records:
+            yield self._records_to_dataframe(records, flatten)
 
-                except json.JSONDecodeError as e:
-                    # Log warning but continue processing
-                    print(f"Warning: Invalid JSON on line, skipping: {str(e)}")
-                    continue
+        self._report_invalid_lines()
+
+    def _load_jsonl_mapped(self, flatten: bool) -> Iterator[pd.DataFrame]:
+        """
+        Load JSON Lines format by parsing byte ranges of the memory-mapped file.
+
+        Ranges end on line boundaries and are parsed in parallel; the records
+        are regrouped, in file order, into chunks of chunk_size records.
+
+        Args:
+            flatten: Whether to flatten nested structures
+
+        Yields:
+            DataFrames containing chunks of records
+        """
+        def parse(byte_range):
+            start, end = byte_range
+            return self._parse_json_lines(data[start:end].split(b'\n'))
+
+        self._reset_invalid_lines()
+        records: List[Dict[str, Any]] = []
+
+        with map_file(self.file_path) as data:
+            batches = ordered_map(parse, record_ranges(data, 0, self.range_size), self.parse_threads)
+            try:
+                for batch, invalid, samples in batches:
+                    self._add_invalid_lines(invalid, samples)
+                    records.extend(batch)
+
+                    position = 0
+                    while len(records) - position >= self.chunk_size:
+                        yield self._records_to_dataframe(records[position:position + self.chunk_size], flatten)
+                        position += self.chunk_size
+                    del records[:position]
+            finally:
+                batches.close()
 
         # Yield remaining records
         if records:
-            df = self._records_to_dataframe(records, flatten)
-            yield df
+            yield self._records_to_dataframe(records, flatten)
+
+        self._report_invalid_lines()
+
+    def _load_jsonl_arrow(self, flatten: bool) -> Iterator[pd.DataFrame]:
+        """
+        Load JSON Lines format with the pyarrow JSON reader.
+
+        The file is split into byte ranges of whole lines, which pyarrow
+        decodes in parallel without holding the GIL. Nested objects
+        become struct columns and are flattened from the Arrow schema. A range
+        holding an invalid line is decoded again without its invalid lines.
+
+        Args:
+            flatten: Whether to flatten nested structures
+
+        Yields:
+            DataFrames containing chunks of chunk_size rows
+        """
+        if not HAS_PYARROW:
+            raise RuntimeError(
+                "PyArrow is required for the pyarrow JSON engine but is not installed. "
+                "Install it with: pip install pyarrow"
+            )
+
+        def parse(buffer):
+            return self._read_arrow_range(buffer, flatten)
+
+        def frames():
+            for frame, invalid, samples in results:
+                self._add_invalid_lines(invalid, samples)
+                if frame is not None:
+                    yield frame
+
+        self._reset_invalid_lines()
+
+        with self._line_buffers() as buffers:
+            results = ordered_map(parse, buffers, self.parse_threads)
+            try:
+                yield from rechunk(frames(), self.chunk_size)
+            finally:
+                results.close()
+
+        self._report_invalid_lines()
+
+    @contextmanager
+    def _line_buffers(self) -> Iterator[Iterator["pa.Buffer"]]:
+        """
+        Open the file as Arrow buffers of whole lines, about range_size bytes each.
+
+        Uncompressed files are memory-mapped and sliced without copying;
+        compressed files are read from the decompressing stream.
+
+        Yields:
+            Iterator of buffers
+        """
+        if self.compression is not None:
+            with self.open_file() as f:
+                yield (pa.py_buffer(block) for block in line_blocks(f, self.range_size))
+            return
+
+        with map_file(self.file_path) as data:
+            buffer = pa.py_buffer(data)
+            yield (
+                buffer.slice(start, end - start)
+                for start, end in record_ranges(data, 0, self.range_size)
+            )
+
+    def _read_arrow_range(self, buffer: "pa.Buffer", flatten: bool) -> Tuple[Optional[pd.DataFrame], int, List[str]]:
+        """
+        Decode one range of JSON Lines with pyarrow.
+
+        Args:
+            buffer: Bytes of whole lines
+            flatten: Whether to flatten struct columns
+
+        Returns:
+            Tuple of (DataFrame or None if no line was valid, invalid line count, samples)
+        """
+        invalid, samples = 0, []
+        try:
+            table = self._read_arrow_json(buffer)
+        except pa.ArrowInvalid:
+            # Keep only lines holding a JSON object and decode those again
+            valid_lines = []
+            for line in buffer.to_pybytes().split(b'\n'):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = _loads(line)
+                except ValueError as e:
+                    invalid, samples = self._note_invalid_line(invalid, samples, str(e), line)
+                    continue
+                if not isinstance(record, dict):
+                    invalid, samples = self._note_invalid_line(invalid, samples, "Not a JSON object", line)
+                    continue
+                valid_lines.append(line)
+
+            if not valid_lines:
+                return None, invalid, samples
+
+            try:
+                table = self._read_arrow_json(pa.py_buffer(b'\n'.join(valid_lines)))
+            except pa.ArrowInvalid as e:
+                raise RuntimeError(
+                    f"{e}. The pyarrow engine infers column types per range; "
+                    f"use engine: python for fields whose type varies"
+                )
+
+        if flatten:
+            table = _flatten_structs(table)
+        if self.columns is not None:
+            table = table.select([name for name in table.column_names if name in self.columns])
+
+        return table.to_pandas(), invalid, samples
+
+    def _read_arrow_json(self, buffer: "pa.Buffer") -> "pa.Table":
+        """Decode newline-delimited JSON held in an Arrow buffer."""
+        return pa_json.read_json(
+            pa.BufferReader(buffer),
+            read_options=pa_json.ReadOptions(
+                use_threads=True,
+                block_size=self.kwargs.get("block_size") or DEFAULT_BLOCK_SIZE,
+            ),
+            parse_options=pa_json.ParseOptions(newlines_in_values=False),
+        )
+
+    @classmethod
+    def _parse_json_lines(
+        cls, lines: List[bytes], first_line_number: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], int, List[str]]:
+        """
+        Parse JSON Lines, skipping empty lines and lines that are not JSON objects.
+
+        Args:
+            lines: Lines of a JSON Lines file
+            first_line_number: Line number of the first line, used in samples
+
+        Returns:
+            Tuple of (parsed records, invalid line count, samples of invalid lines)
+        """
+        records: List[Dict[str, Any]] = []
+        invalid, samples = 0, []
+
+        for index, line in enumerate(lines):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                record = _loads(line)
+            except ValueError as e:
+                error = str(e)
+            else:
+                if isinstance(record, dict):
+                    records.append(record)
+                    continue
+                error = "Not a JSON object"
+
+            if first_line_number is not None:
+                error = f"line {first_line_number + index}: {error}"
+            invalid, samples = cls._note_invalid_line(invalid, samples, error, line)
+
+        return records, invalid, samples
+
+    @staticmethod
+    def _note_invalid_line(invalid: int, samples: List[str], error: str, line: bytes) -> Tuple[int, List[str]]:
+        """Count an invalid line, keeping a sample of the first few."""
+        if len(samples) < MAX_INVALID_LINE_SAMPLES:
+            text = line[:80].decode('utf-8', errors='replace')
+            samples.append(f"{error} ({text})")
+        return invalid + 1, samples
+
+    def _reset_invalid_lines(self) -> None:
+        """Clear the invalid line count before a load."""
+        self.invalid_lines = 0
+        self.invalid_line_samples = []
+
+    def _add_invalid_lines(self, invalid: int, samples: List[str]) -> None:
+        """Add the invalid lines found in one batch or range."""
+        self.invalid_lines += invalid
+        room = MAX_INVALID_LINE_SAMPLES - len(self.invalid_line_samples)
+        self.invalid_line_samples.extend(samples[:max(room, 0)])
+
+    def _report_invalid_lines(self) -> None:
+        """Log one warning for all invalid lines skipped by a load."""
+        if self.invalid_lines:
+            logger.warning(
+                f"Skipped {self.invalid_lines} invalid JSON line(s) in {self.file_path}. "
+                f"First: {'; '.join(self.invalid_line_samples)}"
+            )
 
     def _load_json_array(self, orient: str, flatten: bool) -> Iterator[pd.DataFrame]:
         """
         Load standard JSON array format in chunks.
 
+        Top-level arrays are parsed incrementally (see json_stream), so memory
+        use is bounded by the chunk size rather than the file size.
+
         Args:
             orient: Pandas JSON orientation
             flatten: Whether to flatten nested structures
@@ -145,30 +501,31 @@ class JSONLoader(DataLoader):
         Yields:
             DataFrames containing chunks of data
         """
-        # For standard JSON arrays, pandas can handle it efficiently
-        # but we need to chunk it for memory efficiency
-
         try:
-            # Read entire JSON (for arrays, we need to parse the whole structure)
-            with open(self.file_path, 'r', encoding='utf-8') as f:
+            if is_json_array(self.file_path):
+                # Stream records from the array; only one chunk is held at a time
+                records: List[Any] = []
+                with self._open_text() as f:
+                    for record in JSONArrayReader(f):
+                        records.append(record)
+                        if len(records) >= self.chunk_size:
+                            yield self._records_to_dataframe(records, flatten)
+                            records = []
+
+                if records:
+                    yield self._records_to_dataframe(records, flatten)
+                return
+
+            # Other top-level values (such as oriented dicts) are parsed whole
+            with self._open_text() as f:
                 data = json.load(f)
 
-            # Handle different JSON structures
-            if isinstance(data, list):
-                records = data
-            elif isinstance(data, dict):
-                # If it's a dict, might be oriented data
-                records = data
-            else:
-                raise ValueError(f"Unexpected JSON structure: {type(data)}")
-
-            # Convert to DataFrame
-            if isinstance(records, list):
-                df = self._records_to_dataframe(records, flatten)
-            else:
-                df = pd.DataFrame.from_dict(records, orient=orient)
+            if isinstance(data, dict):
+                df = pd.DataFrame.from_dict(data, orient=orient)
                 if flatten:
                     df = self._flatten_dataframe(df)
+            else:
+                raise ValueError(f"Unexpected JSON structure: {type(data)}")
 
             # Yield in chunks
             for i in range(0, len(df), self.chunk_size):
@@ -178,6 +535,10 @@ class JSONLoader(DataLoader):
         except json.JSONDecodeError as e:
             raise RuntimeError(f"Invalid JSON array format: {str(e)}")
 
+    def _open_text(self) -> TextIO:
+        """Open the file as UTF-8 text, decompressing it if it is compressed."""
+        return io.TextIOWrapper(self.open_file(), encoding='utf-8')
+
     def _records_to_dataframe(self, records: List[Dict[str, Any]], flatten: bool) -> pd.DataFrame:
         """
         Convert list of records to DataFrame, optionally flattening nested structures.
@@ -192,6 +553,9 @@ class JSONLoader(DataLoader):
         if not records:
             return pd.DataFrame()
 
+        if self.columns is not None:
+            records = self._project_records(records, flatten)
+
         if flatten:
             # Use json_normalize for flattening nested structures
             df = pd.json_normalize(records, sep='_')
@@ -200,6 +564,29 @@ class JSONLoader(DataLoader):
 
         return df
 
+    def _project_records(self, records: List[Dict[str, Any]], flatten: bool) -> List[Dict[str, Any]]:
+        """
+        Drop the top-level fields that cannot produce any of the requested columns.
+
+        Args:
+            records: List of dictionaries
+            flatten: Whether nested fields will be flattened into '_'-joined columns
+
+        Returns:
+            Records holding only the fields needed for self.columns
+        """
+        keep = set()
+        for column in self.columns:
+            parts = str(column).split('_') if flatten else [str(column)]
+            # A flattened column "a_b_c" may come from field "a", "a_b" or "a_b_c"
+            keep.update('_'.join(parts[:i]) for i in range(1, len(parts) + 1))
+
+        return [
+            {key: value for key, value in record.items() if key in keep}
+            if isinstance(record, dict) else record
+            for record in records
+        ]
+
     def _flatten_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Flatten nested structures in existing DataFrame.
@@ -214,6 +601,38 @@ class JSONLoader(DataLoader):
         records = df.to_dict('records')
         return pd.json_normalize(records, sep='_')
 
+    def count_rows(self) -> Optional[int]:
+        """
+        Count the records of the file exactly, without building DataFrames.
+
+        JSON Lines files are counted by their non-blank lines; elements of a
+        top-level array are decoded one at a time by JSONArrayReader.
+
+        Returns:
+            Number of records, or None if the file is neither JSON Lines nor a
+            valid top-level array
+        """
+        if self.is_empty():
+            return 0
+
+        lines = self.kwargs.get("lines", None)
+        if lines is None:
+            lines = self._is_jsonl_format()
+
+        if lines:
+            with self.open_file() as f:
+                return sum(1 for line in f if line.strip())
+
+        if not is_json_array(self.file_path):
+            return None
+
+        try:
+            with self._open_text() as f:
+                return sum(1 for _ in JSONArrayReader(f))
+        except json.JSONDecodeError:
+            # Left to load() to report
+            return None
+
     def get_metadata(self) -> Dict[str, Any]:
         """
         Get JSON file metadata.
@@ -246,18 +665,24 @@ class JSONLoader(DataLoader):
                 # Estimate total rows
                 if is_jsonl:
                     # Count lines for JSONL
-                    with open(self.file_path, 'r', encoding='utf-8') as f:
+                    with self._open_text() as f:
                         line_count = sum(1 for line in f if line.strip())
                     metadata["estimated_rows"] = line_count
-                else:
-                    # For JSON arrays, we'd need to parse entire file
-                    # Just count from what we have
-                    with open(self.file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if isinstance(data, list):
-                            metadata["estimated_rows"] = len(data)
+                elif is_json_array(self.file_path):
+                    # Small arrays are counted exactly; larger ones are estimated
+                    # from the size of the first records
+                    with self._open_text() as f:
+                        reader = JSONArrayReader(f)
+                        sampled = sum(1 for _ in islice(reader, ESTIMATE_SAMPLE_RECORDS + 1))
+                        if sampled <= ESTIMATE_SAMPLE_RECORDS:
+                            metadata["estimated_rows"] = sampled
                         else:
-                            metadata["estimated_rows"] = len(first_chunk)
+                            data_size = estimate_decompressed_size(f.buffer, self.get_file_size())
+                            metadata["estimated_rows"] = int(
+                                data_size * sampled / max(reader.offset, 1)
+                            )
+                else:
+                    metadata["estimated_rows"] = len(first_chunk)
 
             except Exception as e:
                 metadata["error"] = f"Could not read metadata: {str(e)}"
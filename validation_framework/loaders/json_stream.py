@@ -0,0 +1,146 @@
+"""
+Incremental parser for top-level JSON arrays.
+
+JSONArrayReader reads a text file in buffers and decodes one array element at
+a time with json.JSONDecoder.raw_decode, so memory use is bounded by the buffer
+size and the largest single element rather than by the size of the file. When
+an element runs past the end of the buffer, more text is read and the element
+is decoded again; the read size doubles each time so that large elements are
+still parsed in linear time.
+"""
+
+import io
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterator, Optional, TextIO, Union
+
+from validation_framework.loaders.compression import open_file
+
+# Characters read from the file at a time
+BUFFER_SIZE = 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Characters that may continue a number
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+class JSONArrayReader:
+    """
+    Iterate over the elements of a JSON array read from a text file.
+
+    Example:
+        >>> with open('orders.json', encoding='utf-8') as f:
+        ...     for record in JSONArrayReader(f):
+        ...         process(record)
+
+    Raises:
+        json.JSONDecodeError: While iterating, if the file is not a valid JSON array
+    """
+
+    def __init__(self, file: TextIO, buffer_size: Optional[int] = None) -> None:
+        """
+        Initialize the reader.
+
+        Args:
+            file: Text file positioned at the start of the array
+            buffer_size: Characters read from the file at a time (default: BUFFER_SIZE)
+        """
+        self._file = file
+        self._buffer_size = max(1, buffer_size or BUFFER_SIZE)
+        self._decoder = json.JSONDecoder()
+        self._text = ""
+        self._position = 0
+        self._discarded = 0
+        self._eof = False
+
+    @property
+    def offset(self) -> int:
+        """Number of characters consumed so far."""
+        return self._discarded + self._position
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._next_char() != "[":
+            self._fail("Expecting '['")
+        self._position += 1
+
+        if self._next_char() == "]":
+            self._position += 1
+        else:
+            while True:
+                self._next_char()
+                yield self._decode_value()
+
+                char = self._next_char()
+                self._position += 1
+                if char == "]":
+                    break
+                if char != ",":
+                    self._position -= 1
+                    self._fail("Expecting ',' delimiter")
+
+        if self._next_char():
+            self._fail("Extra data")
+
+    def _next_char(self) -> str:
+        """Skip whitespace and peek at the next character; '' at the end of the file."""
+        while True:
+            self._position = _WHITESPACE.match(self._text, self._position).end()
+            if self._position < len(self._text):
+                return self._text[self._position]
+            if self._eof:
+                return ""
+            self._fill(self._buffer_size)
+
+    def _decode_value(self) -> Any:
+        """Decode the value at the current position, reading more text as needed."""
+        read_size = self._buffer_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._text, self._position)
+                # A number cut off by the end of the buffer may continue in the next read
+                if self._eof or (end < len(self._text) and self._text[end] not in _NUMBER_CHARS):
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+
+            self._fill(read_size)
+            read_size *= 2
+
+    def _fill(self, size: int) -> None:
+        """Drop consumed text and append up to size characters from the file."""
+        chunk = self._file.read(size)
+        self._discarded += self._position
+        self._text = self._text[self._position:] + chunk
+        self._position = 0
+        self._eof = not chunk
+
+    def _fail(self, message: str) -> None:
+        """Raise a JSONDecodeError at the current position."""
+        raise json.JSONDecodeError(message, self._text, self._position)
+
+
+def is_json_array(file_path: Union[str, Path], encoding: str = "utf-8") -> bool:
+    """
+    Check whether a JSON file holds a top-level array, reading only its start.
+
+    Compressed files are checked after decompression.
+
+    Args:
+        file_path: Path to the JSON file
+        encoding: File encoding
+
+    Returns:
+        True if the first non-whitespace character is '['
+    """
+    with io.TextIOWrapper(open_file(file_path), encoding=encoding) as f:
+        while True:
+            text = f.read(4096)
+            if not text:
+                return False
+            text = text.lstrip()
+            if text:
+                return text[0] == "["
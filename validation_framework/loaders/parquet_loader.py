@@ -5,17 +5,25 @@ Parquet is a columnar storage format ideal for large datasets (200GB+).
 It provides excellent compression and allows for efficient column-based reading.
 """
 
-from typing import Iterator, Dict, Any, List
+import os
+import threading
+from typing import Iterator, Dict, Any, List, Optional, Callable, Union
 import pandas as pd
-from validation_framework.loaders.base import DataLoader
+from validation_framework.loaders.base import DataLoader, ColumnStatistics, RowGroupStatistics
+from validation_framework.loaders.byte_ranges import ordered_map
 
 try:
+    import pyarrow as pa
     import pyarrow.parquet as pq
     HAS_PYARROW = True
 except ImportError:
     HAS_PYARROW = False
+    pa = None
     pq = None
 
+# Default number of row groups decoded at once
+DEFAULT_READ_THREADS = min(4, os.cpu_count() or 1)
+
 
 class ParquetLoader(DataLoader):
     """
@@ -26,14 +34,35 @@ class ParquetLoader(DataLoader):
     - Built-in compression reduces I/O
     - Efficient chunked reading without loading entire file
     - Schema is stored in the file metadata
+
+    Row groups are decoded on a pool of threads and regrouped, in file order,
+    into chunks of chunk_size rows. Per row group min/max/null-count statistics
+    are available through row_group_statistics(), and load_skipping() leaves out
+    row groups that the statistics already settle.
+
+    Loader options (passed as keyword arguments):
+        read_threads: Number of row groups decoded at once (default: up to 4)
     """
 
+    def __init__(self, file_path: str, chunk_size: int = 50000, **kwargs: Any) -> None:
+        """
+        Initialize Parquet loader.
+
+        Args:
+            file_path: Path to the Parquet file
+            chunk_size: Number of rows per chunk
+            **kwargs: Loader options (read_threads, columns)
+        """
+        super().__init__(file_path, chunk_size, **kwargs)
+        self.read_threads: int = max(1, int(kwargs.get("read_threads") or DEFAULT_READ_THREADS))
+
     def load(self) -> Iterator[pd.DataFrame]:
         """
         Load Parquet data in chunks using PyArrow for optimal performance.
 
-        This method uses PyArrow's batch reading capabilities to efficiently
-        process very large files without loading them entirely into memory.
+        Row groups are decoded in parallel without loading the whole file
+        into memory; at most read_threads row groups are held ahead of the
+        chunk being yielded.
 
         Yields:
             pd.DataFrame: Chunks of data from the Parquet file
@@ -41,6 +70,39 @@ class ParquetLoader(DataLoader):
         Raises:
             RuntimeError: If there's an error reading the Parquet file or pyarrow is not installed
         """
+        return self._load_row_groups(skip=None)
+
+    def load_skipping(
+        self,
+        skip: Callable[[RowGroupStatistics], bool],
+    ) -> Iterator[Union[pd.DataFrame, RowGroupStatistics]]:
+        """
+        Load Parquet data in chunks, without decoding the row groups skip() accepts.
+
+        Args:
+            skip: Called with the statistics of each row group
+
+        Yields:
+            DataFrames containing chunks of data, and statistics of skipped row groups
+        """
+        return self._load_row_groups(skip=skip)
+
+    def _load_row_groups(
+        self,
+        skip: Optional[Callable[[RowGroupStatistics], bool]],
+    ) -> Iterator[Union[pd.DataFrame, RowGroupStatistics]]:
+        """
+        Decode row groups and regroup them into chunks of chunk_size rows.
+
+        A chunk never spans a skipped row group, so every row keeps its position
+        relative to the statistics yielded in between.
+
+        Args:
+            skip: Optional predicate selecting row groups to leave out
+
+        Yields:
+            DataFrames, and RowGroupStatistics for each skipped row group
+        """
         if not HAS_PYARROW:
             raise RuntimeError(
                 "PyArrow is required for Parquet support but is not installed. "
@@ -48,15 +110,44 @@ class ParquetLoader(DataLoader):
             )
 
         try:
-            # Use PyArrow for efficient chunked reading
             parquet_file = pq.ParquetFile(self.file_path)
+            num_row_groups = parquet_file.metadata.num_row_groups
+
+            skipped: Dict[int, RowGroupStatistics] = {}
+            if skip is not None:
+                for statistics in self._row_group_statistics(parquet_file):
+                    if skip(statistics):
+                        skipped[statistics.index] = statistics
+
+            tables = self._read_row_groups([i for i in range(num_row_groups) if i not in skipped])
+            pending: List["pa.Table"] = []
+            pending_rows = 0
+
+            try:
+                for index in range(num_row_groups):
+                    if index in skipped:
+                        if pending_rows:
+                            yield pa.concat_tables(pending).to_pandas()
+                            pending, pending_rows = [], 0
+                        yield skipped[index]
+                        continue
+
+                    table = next(tables)
+                    pending.append(table)
+                    pending_rows += table.num_rows
+
+                    while pending_rows >= self.chunk_size:
+                        combined = pa.concat_tables(pending)
+                        yield combined.slice(0, self.chunk_size).to_pandas()
 
-            # Read in batches for memory efficiency
-            # batch_size is in rows, similar to chunk_size for consistency
-            for batch in parquet_file.iter_batches(batch_size=self.chunk_size):
-                # Convert PyArrow batch to pandas DataFrame
-                df = batch.to_pandas()
-                yield df
+                        rest = combined.slice(self.chunk_size)
+                        pending, pending_rows = [rest], rest.num_rows
+
+                if pending_rows:
+                    yield pa.concat_tables(pending).to_pandas()
+
+            finally:
+                tables.close()
 
         except FileNotFoundError:
             raise FileNotFoundError(f"Parquet file not found: {self.file_path}")
@@ -68,6 +159,89 @@ class ParquetLoader(DataLoader):
                 f"Ensure the file is a valid Parquet format."
             )
 
+    def _read_row_groups(self, indices: List[int]) -> Iterator["pa.Table"]:
+        """
+        Decode row groups on a thread pool, yielding tables in the order given.
+
+        Each thread opens its own handle on the file.
+
+        Args:
+            indices: Row groups to decode
+
+        Returns:
+            Iterator of one Arrow table per row group
+        """
+        handles = threading.local()
+
+        def read(index: int) -> "pa.Table":
+            parquet_file = getattr(handles, "parquet_file", None)
+            if parquet_file is None:
+                parquet_file = handles.parquet_file = pq.ParquetFile(self.file_path)
+            return parquet_file.read_row_group(index, columns=self.columns)
+
+        return ordered_map(read, indices, min(self.read_threads, len(indices)))
+
+    def row_group_statistics(self) -> List[RowGroupStatistics]:
+        """
+        Get the min/max/null-count statistics of every row group.
+
+        Statistics come from the file footer, so no data is decoded. Columns
+        without statistics in the file are left out.
+
+        Returns:
+            List of RowGroupStatistics in file order
+
+        Raises:
+            RuntimeError: If the statistics cannot be read
+        """
+        if not HAS_PYARROW:
+            raise RuntimeError(
+                "PyArrow is required for Parquet support but is not installed. "
+                "Install it with: pip install pyarrow"
+            )
+
+        try:
+            if self.is_empty():
+                return []
+            return self._row_group_statistics(pq.ParquetFile(self.file_path))
+
+        except Exception as e:
+            raise RuntimeError(
+                f"Error reading row group statistics from {self.file_path}: {str(e)}"
+            )
+
+    @staticmethod
+    def _row_group_statistics(parquet_file: "pq.ParquetFile") -> List[RowGroupStatistics]:
+        """Build RowGroupStatistics for each row group of an open file."""
+        schema = parquet_file.schema_arrow
+        kinds = {name: _column_kind(schema.field(name).type) for name in schema.names}
+        metadata = parquet_file.metadata
+
+        row_groups = []
+        for index in range(metadata.num_row_groups):
+            row_group = metadata.row_group(index)
+            columns = {}
+
+            for j in range(row_group.num_columns):
+                column = row_group.column(j)
+                name = column.path_in_schema
+                statistics = column.statistics
+
+                # Nested fields have dotted paths and no top-level column
+                if name not in kinds or statistics is None:
+                    continue
+
+                columns[name] = ColumnStatistics(
+                    kind=kinds[name],
+                    min_value=statistics.min if statistics.has_min_max else None,
+                    max_value=statistics.max if statistics.has_min_max else None,
+                    null_count=statistics.null_count if statistics.has_null_count else None,
+                )
+
+            row_groups.append(RowGroupStatistics(index=index, num_rows=row_group.num_rows, columns=columns))
+
+        return row_groups
+
     def get_metadata(self) -> Dict[str, Any]:
         """
         Get Parquet file metadata efficiently without loading data.
@@ -169,6 +343,10 @@ class ParquetLoader(DataLoader):
                 f"Error reading column names from {self.file_path}: {str(e)}"
             )
 
+    def count_rows(self) -> Optional[int]:
+        """Get the exact row count from the Parquet footer."""
+        return self.get_row_count()
+
     def get_row_count(self) -> int:
         """
         Get exact row count efficiently from Parquet metadata.
@@ -193,3 +371,21 @@ class ParquetLoader(DataLoader):
             raise RuntimeError(
                 f"Error reading row count from {self.file_path}: {str(e)}"
             )
+
+
+def _column_kind(arrow_type: "pa.DataType") -> str:
+    """Classify an Arrow type for ColumnStatistics.kind."""
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+
+    if pa.types.is_boolean(arrow_type):
+        return "boolean"
+    if pa.types.is_integer(arrow_type):
+        return "integer"
+    if pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type):
+        return "floating"
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return "string"
+    if pa.types.is_temporal(arrow_type):
+        return "temporal"
+    return "other"
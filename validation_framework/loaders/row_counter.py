@@ -0,0 +1,138 @@
+"""
+Exact record counting for delimited text files.
+
+count_records() memory-maps a file and scans it in large windows, counting the
+line breaks that end a record with NumPy, without copying. In windows that contain
+quote characters, a newline preceded by an odd number of quotes is inside a
+quoted field (RFC 4180 quoting, with "" as an escaped quote) and is not counted.
+Blank lines, holding nothing but spaces, tabs and carriage returns (other than
+the delimiter), are skipped, as pandas does. Compressed files are scanned in the
+same way as they are decompressed (see compression).
+
+Counts are cached per file and invalidated when its size or modification time
+changes, so several rules or loaders asking for the same file only scan it once.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from validation_framework.loaders.byte_ranges import ascii_compatible, map_file
+from validation_framework.loaders.compression import compression_of, open_file
+
+# Bytes of the mapped file scanned at a time
+BUFFER_SIZE = 16 * 1024 * 1024
+
+_NEWLINE = 0x0A
+
+# Bytes pandas skips in a blank line, unless one of them is the delimiter
+_BLANK_BYTES = b" \t\r"
+
+
+def count_records(
+    file_path: Union[str, Path],
+    quotechar: Optional[str] = '"',
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+) -> Optional[int]:
+    """
+    Count the non-blank records of a delimited text file, including any header.
+
+    Args:
+        file_path: Path to the file
+        quotechar: Quote character, or None if fields are never quoted
+        encoding: File encoding
+        delimiter: Field delimiter; a line of delimiters is a record, not blank
+
+    Returns:
+        Number of records, or None if the encoding cannot be scanned byte-wise
+        (UTF-16 and UTF-32)
+    """
+    if not ascii_compatible(encoding):
+        return None
+
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    return _count_records(str(path), stat.st_size, stat.st_mtime_ns, quotechar, delimiter)
+
+
+def clear_cache() -> None:
+    """Forget all cached record counts."""
+    _count_records.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _count_records(path: str, size: int, mtime_ns: int, quotechar: Optional[str], delimiter: str) -> int:
+    """Count records of a file; size and mtime_ns are part of the cache key."""
+    counter = _RecordCounter(quotechar, delimiter)
+    if compression_of(path):
+        with open_file(path) as f:
+            while True:
+                block = f.read(BUFFER_SIZE)
+                if not block:
+                    break
+                window = np.frombuffer(block, dtype=np.uint8)
+                counter.feed(window, counter.quote is not None and block.find(counter.quote) != -1)
+        return counter.finish()
+
+    with map_file(path) as mapped:
+        for start in range(0, len(mapped), BUFFER_SIZE):
+            end = min(start + BUFFER_SIZE, len(mapped))
+            window = np.frombuffer(mapped, dtype=np.uint8, count=end - start, offset=start)
+            counter.feed(window, counter.quote is not None and mapped.find(counter.quote, start, end) != -1)
+            del window
+    return counter.finish()
+
+
+class _RecordCounter:
+    """Incremental record counter fed one window at a time."""
+
+    def __init__(self, quotechar: Optional[str], delimiter: str = ",") -> None:
+        self.records = 0
+        self.in_quotes = False
+        # True while the current line holds nothing but blank bytes
+        self.line_empty = True
+        self.quote = quotechar.encode("ascii") if quotechar else None
+
+        # Lookup table of the bytes that may not appear in a blank line. Newlines
+        # are allowed, so that each line can be checked together with its end.
+        self.content = np.ones(256, dtype=bool)
+        self.content[_NEWLINE] = False
+        for byte in _BLANK_BYTES:
+            if chr(byte) != delimiter:
+                self.content[byte] = False
+
+    def feed(self, data: np.ndarray, has_quotes: bool) -> None:
+        """Count the records ended in a window of bytes."""
+        line_ends = np.flatnonzero(data == _NEWLINE)
+
+        if self.quote is not None and (self.in_quotes or has_quotes):
+            # A newline is quoted when an odd number of quote characters precede it
+            quotes = np.flatnonzero(data == self.quote[0])
+            quoted = (np.searchsorted(quotes, line_ends) + int(self.in_quotes)) & 1
+            line_ends = line_ends[quoted == 0]
+            self.in_quotes = bool((len(quotes) + int(self.in_quotes)) & 1)
+
+        if not len(line_ends):
+            self.line_empty = self.line_empty and not self._has_content(data)
+            return
+
+        # Each line runs from the byte after the previous line end to its own end
+        line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+        has_content = np.logical_or.reduceat(self.content[data[:line_ends[-1] + 1]], line_starts)
+        if not self.line_empty:
+            # The first line started in an earlier window with content
+            has_content[0] = True
+
+        self.records += int(np.count_nonzero(has_content))
+        self.line_empty = not self._has_content(data[line_ends[-1] + 1:])
+
+    def _has_content(self, data: np.ndarray) -> bool:
+        """Check whether a run of bytes holds anything a blank line may not."""
+        return bool(np.any(self.content[data]))
+
+    def finish(self) -> int:
+        """Get the total, counting a last record with no trailing newline."""
+        return self.records + (0 if self.line_empty else 1)
@@ -919,22 +919,25 @@ HTML_TEMPLATE = """
                         <div class="validation-header" onclick="toggleValidation('validation-{{ file_report.file_name }}-{{ loop.index }}')">
                             <div class="validation-title">
                                 <span class="validation-icon">
-                                    {% if result.passed %}✅{% else %}❌{% endif %}
+                                    {% if result.passed %}✅{% elif result.skipped %}⏭️{% else %}❌{% endif %}
                                 </span>
                                 <div>
                                     <div class="validation-name">{{ result.rule_name }}</div>
-                                    <span class="severity-badge {% if result.passed %}severity-success{% else %}{% if result.severity.value == 'ERROR' %}severity-error{% else %}severity-warning{% endif %}{% endif %}">
-                                        {% if result.passed %}PASSED{% else %}{{ result.severity.value }}{% endif %}
+                                    <span class="severity-badge {% if result.passed %}severity-success{% elif result.skipped %}severity-warning{% else %}{% if result.severity.value == 'ERROR' %}severity-error{% else %}severity-warning{% endif %}{% endif %}">
+                                        {% if result.passed %}PASSED{% elif result.skipped %}SKIPPED{% else %}{{ result.severity.value }}{% endif %}
                                     </span>
                                 </div>
                             </div>
                             <div class="validation-stats">
-                                {% if not result.passed %}
-                                    <span style="color: var(--error);">{{ result.failed_count }} failures</span>
+                                {% if not result.passed and not result.skipped %}
+                                    <span style="color: var(--error);"{% if result.stopped_early %} title="Stopped early; counts are lower bounds"{% endif %}>{% if result.stopped_early %}≥{% endif %}{{ result.failed_count }} failures</span>
                                 {% endif %}
                                 {% if result.total_count > 0 %}
                                     <span style="color: var(--text-muted);">{{ "%.1f"|format((result.total_count - result.failed_count) / result.total_count * 100) }}% pass rate</span>
                                 {% endif %}
+                                {% if result.from_metadata %}
+                                    <span style="color: var(--text-muted);" title="Answered from file metadata without reading data">📋 metadata</span>
+                                {% endif %}
                                 <span class="toggle-icon" id="toggle-validation-{{ file_report.file_name }}-{{ loop.index }}">▼</span>
                             </div>
                         </div>
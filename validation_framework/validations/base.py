@@ -1,17 +1,40 @@
 """Base classes for validation rules."""
 
 from abc import ABC, abstractmethod
-from typing import Iterator, Dict, Any, Optional
+from enum import IntEnum
+from typing import Iterator, Dict, Any, Optional, Set, Tuple
+import re
 import pandas as pd
 from validation_framework.core.results import ValidationResult, Severity
+from validation_framework.loaders.base import RowGroupStatistics
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Quoted literals and identifiers in condition / rule expressions
+_STRING_LITERAL = re.compile(r"'[^']*'|\"[^\"]*\"")
+_IDENTIFIER = re.compile(r"`([^`]+)`|\b([A-Za-z_][A-Za-z0-9_]*)\b")
+
+
+class RuleCost(IntEnum):
+    """Estimated cost of running a rule on a file, cheapest first."""
+    FILE = 0            # Reads file metadata only
+    VECTORIZED = 1      # Vectorized scan of the data
+    PYTHON_LOOP = 2     # Scan with per-row Python work, or its own pass over the file
+    MATERIALIZE = 3     # Holds whole columns or other files in memory
+
 
 class ValidationRule(ABC):
     """Base class for all validation rules."""
 
+    # Estimated cost of the rule; None lets the base class decide
+    cost: Optional[RuleCost] = None
+
+    # True for cheap structural checks (empty file, schema) that are run before
+    # every other rule; with processing.fail_fast a failed ERROR-level gate
+    # skips the rules that would scan the data
+    gate: bool = False
+
     def __init__(self, name: str, severity: Severity, params: Optional[Dict[str, Any]] = None, condition: Optional[str] = None):
         """
         Initialize validation rule.
@@ -48,6 +71,45 @@ class ValidationRule(ABC):
         """Get human-readable description of the validation rule."""
         pass
 
+    def estimate_cost(self) -> RuleCost:
+        """
+        Estimate the cost of running this rule, for ordering rules on a file.
+
+        Returns:
+            RuleCost of the rule
+        """
+        return self.cost if self.cost is not None else RuleCost.PYTHON_LOOP
+
+    def required_columns(self) -> Optional[Set[str]]:
+        """
+        Get the columns this rule reads from the data.
+
+        The engine loads only the union of the columns its rules require. Names
+        that are not columns of the file (such as keywords picked up from a
+        condition) are ignored.
+
+        Returns:
+            Set of column names, or None if the rule needs every column
+        """
+        return None
+
+    @staticmethod
+    def _expression_columns(expression: Optional[str]) -> Set[str]:
+        """
+        Get the names an expression may refer to as columns.
+
+        Args:
+            expression: Condition or rule expression (SQL-like or pandas syntax)
+
+        Returns:
+            Set of identifiers and backtick-quoted names in the expression
+        """
+        if not expression:
+            return set()
+
+        expression = _STRING_LITERAL.sub(" ", expression)
+        return {quoted or name for quoted, name in _IDENTIFIER.findall(expression)}
+
     def _evaluate_condition(self, df: pd.DataFrame) -> pd.Series:
         """
         Evaluate the condition expression on a DataFrame.
@@ -129,6 +191,16 @@ class ValidationRule(ABC):
 class FileValidationRule(ValidationRule):
     """Base class for file-level validations (not data content)."""
 
+    # True when the rule reads the exact row count from context["total_rows"];
+    # the engine then counts the rows of files whose metadata only estimates them
+    needs_row_count: bool = False
+
+    cost = RuleCost.FILE
+
+    def required_columns(self) -> Optional[Set[str]]:
+        """File-level validations read no data columns."""
+        return set()
+
     def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
         """
         File-level validations don't need data iterator.
@@ -143,9 +215,303 @@ class FileValidationRule(ValidationRule):
 
 
 class DataValidationRule(ValidationRule):
-    """Base class for data content validations."""
+    """
+    Base class for data content validations.
+
+    Rules can implement validate() directly, or implement the chunk protocol
+    (init_state / accumulate / finalize) and inherit validate(). Rules that
+    implement the chunk protocol can be executed in a single shared pass over
+    the file alongside every other ported rule, instead of re-reading the file
+    once per validation.
+
+    Chunk protocol:
+        init_state(context) -> dict
+            Create the accumulator for a run. Parameter problems can be reported
+            by storing a final ValidationResult under state["result"].
+        accumulate(state, chunk, row_offset, context) -> None
+            Fold one chunk into the state. row_offset is the number of rows
+            seen before this chunk. Setting state["result"] ends the run early.
+        finalize(state, context) -> ValidationResult
+            Build the final result from the state.
+        release_state(state) -> None
+            Optional. Free resources held by the state (temp files, connections).
+            Always called once the run is over, even after an error.
+        merge_state(state, partial) -> None
+            Fold a partial state, built by accumulating a single chunk into a
+            fresh init_state(), into the running state. Only used for rules
+            with parallel_chunks = True, whose chunks may then be evaluated in
+            worker processes. Rules with extra state keys extend this.
+        failure_count(state) -> int
+            Optional. Number of failures found so far, checked against the
+            stop_after_failures limit of rules with stops_early = True.
+        covers_row_group(statistics) -> bool
+            Optional. Return True when the min/max/null-count statistics of a
+            row group (RowGroupStatistics) settle the rule for all of its rows,
+            so the row group need not be decoded. Must not depend on the state.
+            A row group is only skipped when every rule in the scan covers it.
+        accumulate_statistics(state, statistics, row_offset, context) -> None
+            Fold a covered row group into the state in place of its rows. The
+            default counts its rows as checked with no failures.
+    """
+
+    # Used to build "Error during <label>: ..." messages
+    error_label: str = "validation"
+
+    # True when accumulate() only depends on the chunk it is given, so chunks can
+    # be evaluated independently and combined with merge_state()
+    parallel_chunks: bool = False
+
+    # Params holding the names of the columns the rule reads (a name or a list of
+    # names). None means the rule may read any column.
+    column_params: Optional[Tuple[str, ...]] = None
+
+    # True when a single failure settles the rule as failed, so it may stop
+    # reading once it has found stop_after_failures failures
+    stops_early: bool = False
 
-    @abstractmethod
     def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
-        """Validate data content."""
+        """
+        Validate data content by driving the chunk protocol.
+
+        Subclasses that do not implement the chunk protocol must override this.
+
+        Args:
+            data_iterator: Iterator yielding data chunks
+            context: Validation context
+
+        Returns:
+            ValidationResult object
+        """
+        if not self.supports_chunk_protocol():
+            raise NotImplementedError(
+                f"{type(self).__name__} must implement validate() or the chunk protocol"
+            )
+
+        state = None
+        try:
+            state = self.init_state(context)
+            row_offset = 0
+            for chunk in data_iterator:
+                if state.get("result") is not None:
+                    break
+                self.accumulate(state, chunk, row_offset, context)
+                row_offset += len(chunk)
+                self.check_failure_limit(state, context)
+            return self.finalize(state, context)
+
+        except Exception as e:
+            return self._error_result(e)
+
+        finally:
+            if state is not None:
+                self.release_state(state)
+
+    def estimate_cost(self) -> RuleCost:
+        """
+        Estimate the cost of running this rule.
+
+        Rules implementing the chunk protocol default to a vectorized scan in
+        the shared pass; rules that only override validate() read the file in
+        a pass of their own. Rules whose accumulate() does per-row Python work
+        set cost = RuleCost.PYTHON_LOOP.
+
+        Returns:
+            RuleCost of the rule
+        """
+        if self.cost is not None:
+            return self.cost
+        return RuleCost.VECTORIZED if self.supports_chunk_protocol() else RuleCost.PYTHON_LOOP
+
+    def required_columns(self) -> Optional[Set[str]]:
+        """
+        Get the columns this rule reads, from its column_params and condition.
+
+        Returns:
+            Set of column names, or None if the rule needs every column
+        """
+        if self.column_params is None:
+            return None
+
+        columns = self._expression_columns(self.condition)
+        for param in self.column_params:
+            value = self.params.get(param)
+            if isinstance(value, str):
+                columns.add(value)
+            elif isinstance(value, (list, tuple)):
+                columns.update(name for name in value if isinstance(name, str))
+
+        return columns
+
+    @classmethod
+    def supports_chunk_protocol(cls) -> bool:
+        """Check whether this rule implements the chunk protocol."""
+        return cls.accumulate is not DataValidationRule.accumulate
+
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create the accumulator state for a validation run.
+
+        Args:
+            context: Validation context
+
+        Returns:
+            State dictionary with the common counters initialised
+        """
+        return {
+            "result": None,
+            "total_rows": 0,
+            "failed_count": 0,
+            "failed_rows": [],
+            "max_samples": context.get("max_sample_failures", 100),
+            "stop_after_failures": self.failure_limit(context),
+        }
+
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
+        """
+        Fold a single chunk into the state.
+
+        Args:
+            state: State created by init_state()
+            chunk: DataFrame chunk
+            row_offset: Number of rows that preceded this chunk
+            context: Validation context
+        """
+        raise NotImplementedError
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """
+        Build the final ValidationResult from the state.
+
+        Args:
+            state: State after all chunks have been accumulated
+            context: Validation context
+
+        Returns:
+            ValidationResult object
+        """
+        raise NotImplementedError
+
+    def merge_state(self, state: Dict[str, Any], partial: Dict[str, Any]) -> None:
+        """
+        Merge the partial state of one chunk into the running state.
+
+        Partial states must be merged in chunk order so that sample failures
+        and early results match a sequential run.
+
+        Args:
+            state: Running state
+            partial: State produced for a single chunk
+        """
+        if state["result"] is not None:
+            return
+
+        if partial["result"] is not None:
+            state["result"] = partial["result"]
+            return
+
+        state["total_rows"] += partial["total_rows"]
+        state["failed_count"] += partial["failed_count"]
+
+        room = state["max_samples"] - len(state["failed_rows"])
+        if room > 0:
+            state["failed_rows"].extend(partial["failed_rows"][:room])
+
+    def failure_limit(self, context: Dict[str, Any]) -> Optional[int]:
+        """
+        Get the number of failures after which this rule stops reading.
+
+        The rule's stop_after_failures param takes precedence over the job's
+        processing.stop_after_failures. Rules without stops_early never stop.
+
+        Args:
+            context: Validation context
+
+        Returns:
+            Failure limit, or None to read the whole file
+        """
+        if not self.stops_early:
+            return None
+        limit = self.params.get("stop_after_failures", context.get("stop_after_failures"))
+        return int(limit) if limit else None
+
+    def failure_count(self, state: Dict[str, Any]) -> int:
+        """
+        Count the failures found so far.
+
+        Args:
+            state: Running state
+
+        Returns:
+            Number of failures accumulated into the state
+        """
+        return state["failed_count"]
+
+    def check_failure_limit(self, state: Dict[str, Any], context: Dict[str, Any]) -> None:
+        """
+        End the run once the rule has found stop_after_failures failures.
+
+        The result is built from the rows read so far and stored under
+        state["result"], so the rule drops out of the scan.
+
+        Args:
+            state: Running state, after a chunk has been folded in
+            context: Validation context
+        """
+        limit = state.get("stop_after_failures")
+        if not limit or state["result"] is not None or self.failure_count(state) < limit:
+            return
+
+        state["result"] = self._stopped_early_result(self.finalize(state, context), state["total_rows"])
+
+    def covers_row_group(self, statistics: RowGroupStatistics) -> bool:
+        """
+        Check whether a row group's statistics settle this rule for all its rows.
+
+        Args:
+            statistics: Statistics of the row group
+
+        Returns:
+            True if the row group does not need to be decoded for this rule
+        """
+        return False
+
+    def accumulate_statistics(
+        self,
+        state: Dict[str, Any],
+        statistics: RowGroupStatistics,
+        row_offset: int,
+        context: Dict[str, Any],
+    ) -> None:
+        """
+        Fold a row group covered by covers_row_group() into the state.
+
+        Args:
+            state: State created by init_state()
+            statistics: Statistics of the skipped row group
+            row_offset: Number of rows that preceded the row group
+            context: Validation context
+        """
+        state["total_rows"] += statistics.num_rows
+
+    def release_state(self, state: Dict[str, Any]) -> None:
+        """
+        Release resources held by the state.
+
+        Args:
+            state: State created by init_state()
+        """
         pass
+
+    def _stopped_early_result(self, result: ValidationResult, rows_read: int) -> ValidationResult:
+        """Mark a result built before the end of the file; its counts are lower bounds."""
+        result.stopped_early = True
+        result.message += f" (stopped after {rows_read:,} rows; counts are lower bounds)"
+        return result
+
+    def _error_result(self, error: Exception) -> ValidationResult:
+        """Create the result reported when the rule raised an unexpected error."""
+        return self._create_result(
+            passed=False,
+            message=f"Error during {self.error_label}: {str(error)}",
+            failed_count=1,
+        )
@@ -12,7 +12,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import os
-from validation_framework.validations.base import DataValidationRule, FileValidationRule, ValidationResult
+from validation_framework.validations.base import DataValidationRule, FileValidationRule, RuleCost, ValidationResult
+from validation_framework.loaders.base import RowGroupStatistics
 
 
 class StatisticalOutlierCheck(DataValidationRule):
@@ -45,6 +46,9 @@ class StatisticalOutlierCheck(DataValidationRule):
             threshold: 1.5  # Flag values beyond 1.5*IQR from quartiles
     """
 
+    cost = RuleCost.MATERIALIZE
+    column_params = ("field",)
+
     def get_description(self) -> str:
         field = self.params.get("field", "unknown")
         method = self.params.get("method", "zscore")
@@ -204,6 +208,10 @@ class CrossFieldComparisonCheck(DataValidationRule):
             field_b: "product_price"
     """
 
+    parallel_chunks = True
+    column_params = ("field_a", "field_b")
+    stops_early = True
+
     VALID_OPERATORS = ['>', '<', '>=', '<=', '==', '!=']
 
     def get_description(self) -> str:
@@ -212,91 +220,112 @@ class CrossFieldComparisonCheck(DataValidationRule):
         field_b = self.params.get("field_b", "field_b")
         return f"Cross-field validation: {field_a} {operator} {field_b}"
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame],
-                 context: Dict[str, Any]) -> ValidationResult:
-        """Validate relationship between two fields."""
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create accumulator state, rejecting invalid parameters up front."""
+        state = super().init_state(context)
         field_a = self.params.get("field_a")
         operator = self.params.get("operator")
         field_b = self.params.get("field_b")
 
         if not all([field_a, operator, field_b]):
-            return self._create_result(
+            state["result"] = self._create_result(
                 passed=False,
                 message="Parameters 'field_a', 'operator', and 'field_b' are required",
                 failed_count=1
             )
-
-        if operator not in self.VALID_OPERATORS:
-            return self._create_result(
+        elif operator not in self.VALID_OPERATORS:
+            state["result"] = self._create_result(
                 passed=False,
                 message=f"Invalid operator '{operator}'. Use one of: {', '.join(self.VALID_OPERATORS)}",
                 failed_count=1
             )
 
-        total_rows = 0
-        failed_rows = []
-        max_samples = context.get("max_sample_failures", 100)
+        return state
 
-        for chunk in data_iterator:
-            # Check both fields exist
-            if field_a not in chunk.columns:
-                return self._create_result(
-                    passed=False,
-                    message=f"Field '{field_a}' not found",
-                    failed_count=1
-                )
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame,
+                   row_offset: int, context: Dict[str, Any]) -> None:
+        """Validate the field relationship for one chunk."""
+        field_a = self.params.get("field_a")
+        operator = self.params.get("operator")
+        field_b = self.params.get("field_b")
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
 
-            if field_b not in chunk.columns:
-                return self._create_result(
-                    passed=False,
-                    message=f"Field '{field_b}' not found",
-                    failed_count=1
-                )
+        # Check both fields exist
+        if field_a not in chunk.columns:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Field '{field_a}' not found",
+                failed_count=1
+            )
+            return
 
-            # Apply comparison
-            try:
-                if operator == '>':
-                    comparison = chunk[field_a] > chunk[field_b]
-                elif operator == '<':
-                    comparison = chunk[field_a] < chunk[field_b]
-                elif operator == '>=':
-                    comparison = chunk[field_a] >= chunk[field_b]
-                elif operator == '<=':
-                    comparison = chunk[field_a] <= chunk[field_b]
-                elif operator == '==':
-                    comparison = chunk[field_a] == chunk[field_b]
-                elif operator == '!=':
-                    comparison = chunk[field_a] != chunk[field_b]
-
-                # Find failing rows
-                failing_indices = chunk[~comparison].index.tolist()
-
-                for idx in failing_indices:
-                    if len(failed_rows) < max_samples:
-                        val_a = chunk.loc[idx, field_a]
-                        val_b = chunk.loc[idx, field_b]
-                        failed_rows.append({
-                            "row": int(total_rows + idx),
-                            "fields": f"{field_a} vs {field_b}",
-                            "value": f"{val_a} {operator} {val_b}",
-                            "message": f"Comparison failed: {val_a} not {operator} {val_b}"
-                        })
+        if field_b not in chunk.columns:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Field '{field_b}' not found",
+                failed_count=1
+            )
+            return
+
+        # Apply comparison
+        try:
+            if operator == '>':
+                comparison = chunk[field_a] > chunk[field_b]
+            elif operator == '<':
+                comparison = chunk[field_a] < chunk[field_b]
+            elif operator == '>=':
+                comparison = chunk[field_a] >= chunk[field_b]
+            elif operator == '<=':
+                comparison = chunk[field_a] <= chunk[field_b]
+            elif operator == '==':
+                comparison = chunk[field_a] == chunk[field_b]
+            elif operator == '!=':
+                comparison = chunk[field_a] != chunk[field_b]
+
+            # Find failing rows
+            failing = ~comparison
+            state["failed_count"] += int(failing.sum())
+
+            room = max(max_samples - len(failed_rows), 0)
+            for idx in chunk[failing].index[:room]:
+                val_a = chunk.loc[idx, field_a]
+                val_b = chunk.loc[idx, field_b]
+                failed_rows.append({
+                    "row": int(row_offset + idx),
+                    "fields": f"{field_a} vs {field_b}",
+                    "value": f"{val_a} {operator} {val_b}",
+                    "message": f"Comparison failed: {val_a} not {operator} {val_b}"
+                })
 
-            except Exception as e:
-                return self._create_result(
-                    passed=False,
-                    message=f"Error comparing fields: {str(e)}",
-                    failed_count=1
-                )
+        except Exception as e:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Error comparing fields: {str(e)}",
+                failed_count=1
+            )
+            return
 
-            total_rows += len(chunk)
+        state["total_rows"] += len(chunk)
 
-        # Create result
-        if failed_rows:
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Build the result for rows that failed the comparison."""
+        if state["result"] is not None:
+            return state["result"]
+
+        field_a = self.params.get("field_a")
+        operator = self.params.get("operator")
+        field_b = self.params.get("field_b")
+        total_rows = state["total_rows"]
+        failed_rows = state["failed_rows"]
+
+        failed_count = state["failed_count"]
+
+        if failed_count > 0:
             return self._create_result(
                 passed=False,
-                message=f"Found {len(failed_rows)} rows where {field_a} not {operator} {field_b}",
-                failed_count=len(failed_rows),
+                message=f"Found {failed_count} rows where {field_a} not {operator} {field_b}",
+                failed_count=failed_count,
                 total_count=total_rows,
                 sample_failures=failed_rows
             )
@@ -307,7 +336,6 @@ class CrossFieldComparisonCheck(DataValidationRule):
             total_count=total_rows
         )
 
-
 class FreshnessCheck(FileValidationRule):
     """
     Validates that file or data is fresh (recently updated).
@@ -443,48 +471,86 @@ class CompletenessCheck(DataValidationRule):
             min_completeness: 1.0  # All records must have customer_id
     """
 
+    parallel_chunks = True
+    column_params = ("field",)
+
     def get_description(self) -> str:
         field = self.params.get("field", "unknown")
         min_comp = self.params.get("min_completeness", "?")
         return f"Completeness check on '{field}': minimum {min_comp*100:.0f}%"
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame],
-                 context: Dict[str, Any]) -> ValidationResult:
-        """Validate field completeness."""
-        field = self.params.get("field")
-        min_completeness = self.params.get("min_completeness")
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create accumulator state, rejecting invalid parameters up front."""
+        state = super().init_state(context)
+        state["non_null_rows"] = 0
 
-        if not field:
-            return self._create_result(
+        if not self.params.get("field"):
+            state["result"] = self._create_result(
                 passed=False,
                 message="Parameter 'field' is required",
                 failed_count=1
             )
-
-        if min_completeness is None:
-            return self._create_result(
+        elif self.params.get("min_completeness") is None:
+            state["result"] = self._create_result(
                 passed=False,
                 message="Parameter 'min_completeness' is required",
                 failed_count=1
             )
 
+        return state
+
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame,
+                   row_offset: int, context: Dict[str, Any]) -> None:
+        """Count populated values in one chunk."""
+        field = self.params.get("field")
+
+        if field not in chunk.columns:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Field '{field}' not found",
+                failed_count=1
+            )
+            return
+
+        state["total_rows"] += len(chunk)
+        state["non_null_rows"] += int(chunk[field].notna().sum())
+
+    def covers_row_group(self, statistics: RowGroupStatistics) -> bool:
+        """
+        Check whether a row group's null count gives its completeness exactly.
+
+        Floating-point columns are never covered, as NaN values are not
+        counted as nulls in the statistics.
+        """
+        column = statistics.columns.get(self.params.get("field"))
+        return column is not None and column.null_count is not None and column.kind != "floating"
+
+    def accumulate_statistics(self, state: Dict[str, Any], statistics: RowGroupStatistics,
+                              row_offset: int, context: Dict[str, Any]) -> None:
+        """Count populated values in a row group from its null count."""
+        column = statistics.columns[self.params.get("field")]
+        state["total_rows"] += statistics.num_rows
+        state["non_null_rows"] += statistics.num_rows - column.null_count
+
+    def merge_state(self, state: Dict[str, Any], partial: Dict[str, Any]) -> None:
+        """Merge a chunk's partial state, including the populated value count."""
+        if state["result"] is None and partial["result"] is None:
+            state["non_null_rows"] += partial["non_null_rows"]
+        super().merge_state(state, partial)
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Compare overall completeness against the threshold."""
+        if state["result"] is not None:
+            return state["result"]
+
+        min_completeness = self.params.get("min_completeness")
+
         # Convert percentage to decimal if needed
         if min_completeness > 1.0:
             min_completeness = min_completeness / 100.0
 
-        total_rows = 0
-        non_null_rows = 0
-
-        for chunk in data_iterator:
-            if field not in chunk.columns:
-                return self._create_result(
-                    passed=False,
-                    message=f"Field '{field}' not found",
-                    failed_count=1
-                )
-
-            total_rows += len(chunk)
-            non_null_rows += chunk[field].notna().sum()
+        total_rows = state["total_rows"]
+        non_null_rows = state["non_null_rows"]
 
         # Calculate completeness
         if total_rows == 0:
@@ -512,7 +578,6 @@ class CompletenessCheck(DataValidationRule):
             total_count=total_rows
         )
 
-
 class StringLengthCheck(DataValidationRule):
     """
     Validates string field length is within acceptable range.
@@ -541,6 +606,11 @@ class StringLengthCheck(DataValidationRule):
             min_length: 10  # At least 10 characters
     """
 
+    cost = RuleCost.PYTHON_LOOP
+    parallel_chunks = True
+    column_params = ("field",)
+    stops_early = True
+
     def get_description(self) -> str:
         field = self.params.get("field", "unknown")
         min_len = self.params.get("min_length")
@@ -555,72 +625,88 @@ class StringLengthCheck(DataValidationRule):
         else:
             return f"String length check on '{field}'"
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame],
-                 context: Dict[str, Any]) -> ValidationResult:
-        """Validate string length."""
-        field = self.params.get("field")
-        min_length = self.params.get("min_length")
-        max_length = self.params.get("max_length")
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create accumulator state, rejecting invalid parameters up front."""
+        state = super().init_state(context)
 
-        if not field:
-            return self._create_result(
+        if not self.params.get("field"):
+            state["result"] = self._create_result(
                 passed=False,
                 message="Parameter 'field' is required",
                 failed_count=1
             )
-
-        if min_length is None and max_length is None:
-            return self._create_result(
+        elif self.params.get("min_length") is None and self.params.get("max_length") is None:
+            state["result"] = self._create_result(
                 passed=False,
                 message="At least one of 'min_length' or 'max_length' is required",
                 failed_count=1
             )
 
-        total_rows = 0
-        failed_rows = []
-        max_samples = context.get("max_sample_failures", 100)
+        return state
 
-        for chunk in data_iterator:
-            if field not in chunk.columns:
-                return self._create_result(
-                    passed=False,
-                    message=f"Field '{field}' not found",
-                    failed_count=1
-                )
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame,
+                   row_offset: int, context: Dict[str, Any]) -> None:
+        """Check string lengths in one chunk."""
+        field = self.params.get("field")
+        min_length = self.params.get("min_length")
+        max_length = self.params.get("max_length")
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
 
-            for idx, value in chunk[field].dropna().items():
-                str_value = str(value)
-                length = len(str_value)
+        if field not in chunk.columns:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Field '{field}' not found",
+                failed_count=1
+            )
+            return
 
-                failed = False
-                reason = ""
+        for idx, value in chunk[field].dropna().items():
+            str_value = str(value)
+            length = len(str_value)
 
-                if min_length is not None and length < min_length:
-                    failed = True
-                    reason = f"Length {length} < minimum {min_length}"
+            failed = False
+            reason = ""
 
-                if max_length is not None and length > max_length:
-                    failed = True
-                    reason = f"Length {length} > maximum {max_length}"
+            if min_length is not None and length < min_length:
+                failed = True
+                reason = f"Length {length} < minimum {min_length}"
 
-                if failed and len(failed_rows) < max_samples:
-                    # Truncate long values for display
-                    display_value = str_value[:50] + "..." if len(str_value) > 50 else str_value
-                    failed_rows.append({
-                        "row": int(total_rows + idx),
-                        "field": field,
-                        "value": display_value,
-                        "message": reason
-                    })
+            if max_length is not None and length > max_length:
+                failed = True
+                reason = f"Length {length} > maximum {max_length}"
 
-            total_rows += len(chunk)
+            if not failed:
+                continue
 
-        # Create result
-        if failed_rows:
+            state["failed_count"] += 1
+            if len(failed_rows) < max_samples:
+                # Truncate long values for display
+                display_value = str_value[:50] + "..." if len(str_value) > 50 else str_value
+                failed_rows.append({
+                    "row": int(row_offset + idx),
+                    "field": field,
+                    "value": display_value,
+                    "message": reason
+                })
+
+        state["total_rows"] += len(chunk)
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Build the result for values with invalid length."""
+        if state["result"] is not None:
+            return state["result"]
+
+        total_rows = state["total_rows"]
+        failed_rows = state["failed_rows"]
+
+        failed_count = state["failed_count"]
+
+        if failed_count > 0:
             return self._create_result(
                 passed=False,
-                message=f"Found {len(failed_rows)} values with invalid length",
-                failed_count=len(failed_rows),
+                message=f"Found {failed_count} values with invalid length",
+                failed_count=failed_count,
                 total_count=total_rows,
                 sample_failures=failed_rows
             )
@@ -631,7 +717,6 @@ class StringLengthCheck(DataValidationRule):
             total_count=total_rows
         )
 
-
 class NumericPrecisionCheck(DataValidationRule):
     """
     Validates numeric precision (decimal places).
@@ -659,6 +744,11 @@ class NumericPrecisionCheck(DataValidationRule):
             max_decimal_places: 4  # Up to 4 decimal places allowed
     """
 
+    cost = RuleCost.PYTHON_LOOP
+    parallel_chunks = True
+    column_params = ("field",)
+    stops_early = True
+
     def get_description(self) -> str:
         field = self.params.get("field", "unknown")
         exact = self.params.get("exact_decimal_places")
@@ -671,83 +761,100 @@ class NumericPrecisionCheck(DataValidationRule):
         else:
             return f"Precision check on '{field}'"
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame],
-                 context: Dict[str, Any]) -> ValidationResult:
-        """Validate numeric precision."""
-        field = self.params.get("field")
-        max_decimal_places = self.params.get("max_decimal_places")
-        exact_decimal_places = self.params.get("exact_decimal_places")
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create accumulator state, rejecting invalid parameters up front."""
+        state = super().init_state(context)
 
-        if not field:
-            return self._create_result(
+        if not self.params.get("field"):
+            state["result"] = self._create_result(
                 passed=False,
                 message="Parameter 'field' is required",
                 failed_count=1
             )
-
-        if max_decimal_places is None and exact_decimal_places is None:
-            return self._create_result(
+        elif (self.params.get("max_decimal_places") is None
+              and self.params.get("exact_decimal_places") is None):
+            state["result"] = self._create_result(
                 passed=False,
                 message="Either 'max_decimal_places' or 'exact_decimal_places' is required",
                 failed_count=1
             )
 
-        total_rows = 0
-        failed_rows = []
-        max_samples = context.get("max_sample_failures", 100)
+        return state
 
-        for chunk in data_iterator:
-            if field not in chunk.columns:
-                return self._create_result(
-                    passed=False,
-                    message=f"Field '{field}' not found",
-                    failed_count=1
-                )
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame,
+                   row_offset: int, context: Dict[str, Any]) -> None:
+        """Check decimal precision in one chunk."""
+        field = self.params.get("field")
+        max_decimal_places = self.params.get("max_decimal_places")
+        exact_decimal_places = self.params.get("exact_decimal_places")
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
 
-            for idx, value in chunk[field].dropna().items():
-                try:
-                    # Convert to string to count decimal places
-                    str_value = str(float(value))
-
-                    # Count decimal places
-                    if '.' in str_value:
-                        decimal_places = len(str_value.split('.')[1].rstrip('0'))
-                    else:
-                        decimal_places = 0
-
-                    failed = False
-                    reason = ""
-
-                    if exact_decimal_places is not None:
-                        if decimal_places != exact_decimal_places:
-                            failed = True
-                            reason = f"Has {decimal_places} decimals, requires exactly {exact_decimal_places}"
-
-                    elif max_decimal_places is not None:
-                        if decimal_places > max_decimal_places:
-                            failed = True
-                            reason = f"Has {decimal_places} decimals, maximum is {max_decimal_places}"
-
-                    if failed and len(failed_rows) < max_samples:
-                        failed_rows.append({
-                            "row": int(total_rows + idx),
-                            "field": field,
-                            "value": str(value),
-                            "message": reason
-                        })
+        if field not in chunk.columns:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Field '{field}' not found",
+                failed_count=1
+            )
+            return
 
-                except (ValueError, TypeError):
-                    # Not a valid number, skip
-                    pass
+        for idx, value in chunk[field].dropna().items():
+            try:
+                # Convert to string to count decimal places
+                str_value = str(float(value))
 
-            total_rows += len(chunk)
+                # Count decimal places
+                if '.' in str_value:
+                    decimal_places = len(str_value.split('.')[1].rstrip('0'))
+                else:
+                    decimal_places = 0
 
-        # Create result
-        if failed_rows:
+                failed = False
+                reason = ""
+
+                if exact_decimal_places is not None:
+                    if decimal_places != exact_decimal_places:
+                        failed = True
+                        reason = f"Has {decimal_places} decimals, requires exactly {exact_decimal_places}"
+
+                elif max_decimal_places is not None:
+                    if decimal_places > max_decimal_places:
+                        failed = True
+                        reason = f"Has {decimal_places} decimals, maximum is {max_decimal_places}"
+
+                if not failed:
+                    continue
+
+                state["failed_count"] += 1
+                if len(failed_rows) < max_samples:
+                    failed_rows.append({
+                        "row": int(row_offset + idx),
+                        "field": field,
+                        "value": str(value),
+                        "message": reason
+                    })
+
+            except (ValueError, TypeError):
+                # Not a valid number, skip
+                pass
+
+        state["total_rows"] += len(chunk)
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Build the result for values with invalid precision."""
+        if state["result"] is not None:
+            return state["result"]
+
+        total_rows = state["total_rows"]
+        failed_rows = state["failed_rows"]
+
+        failed_count = state["failed_count"]
+
+        if failed_count > 0:
             return self._create_result(
                 passed=False,
-                message=f"Found {len(failed_rows)} values with invalid precision",
-                failed_count=len(failed_rows),
+                message=f"Found {failed_count} values with invalid precision",
+                failed_count=failed_count,
                 total_count=total_rows,
                 sample_failures=failed_rows
             )
@@ -10,7 +10,7 @@ These validations check relationships and consistency across multiple data files
 from typing import Iterator, Dict, Any, List
 import pandas as pd
 from pathlib import Path
-from validation_framework.validations.base import DataValidationRule, ValidationResult
+from validation_framework.validations.base import DataValidationRule, RuleCost, ValidationResult
 import logging
 
 logger = logging.getLogger(__name__)
@@ -52,6 +52,10 @@ class ReferentialIntegrityCheck(DataValidationRule):
             allow_null: true
     """
 
+    cost = RuleCost.MATERIALIZE
+    column_params = ("foreign_key",)
+    stops_early = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         foreign_key = self.params.get("foreign_key", "?")
@@ -132,6 +136,9 @@ class ReferentialIntegrityCheck(DataValidationRule):
             total_violations = 0
             sample_violations = []
             max_samples = 10
+            stop_after = self.failure_limit(context)
+            rows_read = 0
+            stopped_early = False
 
             for chunk in data_iterator:
                 # Check if foreign key column exists
@@ -191,16 +198,22 @@ class ReferentialIntegrityCheck(DataValidationRule):
                             })
 
                 total_checked += len(chunk_to_check)
+                rows_read += len(chunk)
+
+                if stop_after and total_violations >= stop_after:
+                    stopped_early = True
+                    break
 
             # Build result
             if total_violations > 0:
-                return self._create_result(
+                result = self._create_result(
                     passed=False,
                     message=f"Found {total_violations} referential integrity violations in {foreign_key}",
                     failed_count=total_violations,
                     total_count=total_checked,
                     sample_failures=sample_violations,
                 )
+                return self._stopped_early_result(result, rows_read) if stopped_early else result
 
             return self._create_result(
                 passed=True,
@@ -332,6 +345,9 @@ class CrossFileComparisonCheck(DataValidationRule):
             reference_aggregation: "count"
     """
 
+    cost = RuleCost.MATERIALIZE
+    column_params = ("column",)
+
     def get_description(self) -> str:
         """Get human-readable description."""
         agg = self.params.get("aggregation", "?")
@@ -693,6 +709,9 @@ class CrossFileDuplicateCheck(DataValidationRule):
             reference_file_format: "parquet"
     """
 
+    cost = RuleCost.MATERIALIZE
+    column_params = ("columns",)
+
     def get_description(self) -> str:
         """Get human-readable description."""
         columns = self.params.get("columns", [])
@@ -64,6 +64,8 @@ class SQLCustomCheck(DataValidationRule):
               WHERE total_amount < 0
     """
 
+    column_params = ()
+
     def get_description(self) -> str:
         """Get human-readable description."""
         sql_query = self.params.get("sql_query", "")
@@ -191,6 +193,8 @@ class DatabaseReferentialIntegrityCheck(DataValidationRule):
             allow_null: false
     """
 
+    column_params = ()
+
     def get_description(self) -> str:
         """Get human-readable description."""
         fk_table = self.params.get("foreign_key_table", "?")
@@ -382,6 +386,8 @@ class DatabaseConstraintCheck(DataValidationRule):
               HAVING COUNT(*) > 1
     """
 
+    column_params = ()
+
     def get_description(self) -> str:
         """Get human-readable description."""
         table = self.params.get("table", "?")
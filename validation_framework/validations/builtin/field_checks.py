@@ -11,12 +11,30 @@ These validations check individual field (column) values:
 - Date format validation
 """
 
-from typing import Iterator, Dict, Any, List, Set
+from typing import Dict, Any, List, Set
+import numpy as np
 import pandas as pd
 import re
 from datetime import datetime
 from dateutil import parser as date_parser
 from validation_framework.validations.base import DataValidationRule, ValidationResult
+from validation_framework.loaders.base import RowGroupStatistics
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Values made only of printable ASCII are matched identically by Python's re and
+# by RE2 (used by pyarrow), so only those chunks are handed to pyarrow
+_PRINTABLE_ASCII = r"^[\x20-\x7e]*$"
+
+# Syntax both engines compile but read differently: re takes "{,n}" as a
+# repeat and "[[:alpha:]]" as a set of characters, RE2 takes "{,n}" literally
+# and "[:alpha:]" as a POSIX class. Patterns containing either use re.
+_RE2_DIVERGENT_SYNTAX = ("{,", "[:")
 
 
 class MandatoryFieldCheck(DataValidationRule):
@@ -41,111 +59,151 @@ class MandatoryFieldCheck(DataValidationRule):
             allow_whitespace: false
     """
 
+    error_label = "mandatory field check"
+    parallel_chunks = True
+    column_params = ("fields",)
+    stops_early = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         fields = self.params.get("fields", [])
         return f"Checks that required fields are not empty: {', '.join(fields)}"
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create accumulator state, rejecting a missing field list up front."""
+        state = super().init_state(context)
+
+        if not self.params.get("fields", []):
+            state["result"] = self._create_result(
+                passed=False,
+                message="No fields specified for mandatory check",
+                failed_count=1,
+            )
+
+        return state
+
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
         """
-        Check for missing values in mandatory fields across all chunks.
+        Check one chunk for missing values in mandatory fields.
 
         Args:
-            data_iterator: Iterator yielding data chunks
+            state: Accumulator state
+            chunk: DataFrame chunk
+            row_offset: Number of rows preceding this chunk
+            context: Validation context
+        """
+        fields = self.params.get("fields", [])
+        allow_whitespace = self.params.get("allow_whitespace", False)
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
+
+        # Verify fields exist
+        missing_fields = [f for f in fields if f not in chunk.columns]
+        if missing_fields:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Fields not found in data: {', '.join(missing_fields)}",
+                failed_count=1,
+            )
+            return
+
+        state["total_rows"] += len(chunk)
+
+        # Apply conditional filter if condition is specified
+        if self.condition:
+            condition_mask = self._evaluate_condition(chunk)
+            # Only validate rows that match the condition
+            rows_to_check = chunk[condition_mask]
+
+            # If no rows match condition in this chunk, skip validation
+            if len(rows_to_check) == 0:
+                return
+        else:
+            rows_to_check = chunk
+
+        # Check each required field
+        for field in fields:
+            # Find rows with missing values (check only rows that meet condition)
+            mask = rows_to_check[field].isna()
+
+            # Also check for empty strings if not allowing whitespace
+            if not allow_whitespace and rows_to_check[field].dtype == 'object':
+                # Convert to string and check for empty/whitespace
+                mask = mask | (rows_to_check[field].astype(str).str.strip() == '')
+
+            state["failed_count"] += int(mask.sum())
+
+            # Collect samples
+            room = max_samples - len(failed_rows)
+            if room <= 0:
+                continue
+            for idx in rows_to_check[mask].index[:room]:
+                failed_rows.append({
+                    "row": int(row_offset + idx),
+                    "field": field,
+                    "value": str(chunk.loc[idx, field]),
+                    "message": f"Missing or empty value in mandatory field '{field}'"
+                })
+
+    def covers_row_group(self, statistics: RowGroupStatistics) -> bool:
+        """
+        Check whether a row group's null counts show every mandatory field is populated.
+
+        Floating-point columns are never covered, as NaN values are not counted
+        as nulls in the statistics. String columns are only covered when
+        allow_whitespace is set, as blank strings are not counted either.
+
+        Args:
+            statistics: Statistics of the row group
+
+        Returns:
+            True if no mandatory value in the row group can be missing
+        """
+        fields = self.params.get("fields", [])
+        covered_kinds = {"integer", "boolean", "temporal"}
+        if self.params.get("allow_whitespace", False):
+            covered_kinds.add("string")
+
+        for field in fields:
+            column = statistics.columns.get(field)
+            if column is None or column.null_count != 0 or column.kind not in covered_kinds:
+                return False
+
+        return bool(fields)
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """
+        Build the result for missing values found across all chunks.
+
+        Args:
+            state: Accumulator state
             context: Validation context
 
         Returns:
             ValidationResult with details of any missing values found
         """
-        try:
-            fields = self.params.get("fields", [])
-            if not fields:
-                return self._create_result(
-                    passed=False,
-                    message="No fields specified for mandatory check",
-                    failed_count=1,
-                )
-
-            allow_whitespace = self.params.get("allow_whitespace", False)
-
-            total_rows = 0
-            failed_rows = []
-            max_samples = context.get("max_sample_failures", 100)
-
-            # Process each chunk
-            for chunk_idx, chunk in enumerate(data_iterator):
-                # Verify fields exist
-                missing_fields = [f for f in fields if f not in chunk.columns]
-                if missing_fields:
-                    return self._create_result(
-                        passed=False,
-                        message=f"Fields not found in data: {', '.join(missing_fields)}",
-                        failed_count=1,
-                    )
-
-                # Apply conditional filter if condition is specified
-                if self.condition:
-                    condition_mask = self._evaluate_condition(chunk)
-                    # Only validate rows that match the condition
-                    rows_to_check = chunk[condition_mask]
-
-                    # If no rows match condition in this chunk, skip validation
-                    if len(rows_to_check) == 0:
-                        total_rows += len(chunk)
-                        continue
-                else:
-                    rows_to_check = chunk
-
-                # Check each required field
-                for field in fields:
-                    # Find rows with missing values (check only rows that meet condition)
-                    mask = rows_to_check[field].isna()
-
-                    # Also check for empty strings if not allowing whitespace
-                    if not allow_whitespace and rows_to_check[field].dtype == 'object':
-                        # Convert to string and check for empty/whitespace
-                        mask = mask | (rows_to_check[field].astype(str).str.strip() == '')
-
-                    # Find failed row indices
-                    failed_indices = rows_to_check[mask].index.tolist()
-
-                    # Collect samples
-                    for idx in failed_indices:
-                        if len(failed_rows) < max_samples:
-                            failed_rows.append({
-                                "row": int(total_rows + idx),
-                                "field": field,
-                                "value": str(chunk.loc[idx, field]),
-                                "message": f"Missing or empty value in mandatory field '{field}'"
-                            })
-
-                total_rows += len(chunk)
-
-            # Create result
-            failed_count = len(failed_rows)
-
-            if failed_count > 0:
-                return self._create_result(
-                    passed=False,
-                    message=f"Found {failed_count} rows with missing mandatory field values",
-                    failed_count=failed_count,
-                    total_count=total_rows * len(fields),  # Total checks performed
-                    sample_failures=failed_rows,
-                )
+        if state["result"] is not None:
+            return state["result"]
 
-            return self._create_result(
-                passed=True,
-                message=f"All mandatory fields contain values across {total_rows} rows",
-                total_count=total_rows * len(fields),
-            )
+        fields = self.params.get("fields", [])
+        total_rows = state["total_rows"]
+        failed_rows = state["failed_rows"]
+        failed_count = state["failed_count"]
 
-        except Exception as e:
+        if failed_count > 0:
             return self._create_result(
                 passed=False,
-                message=f"Error during mandatory field check: {str(e)}",
-                failed_count=1,
+                message=f"Found {failed_count} rows with missing mandatory field values",
+                failed_count=failed_count,
+                total_count=total_rows * len(fields),  # Total checks performed
+                sample_failures=failed_rows,
             )
 
+        return self._create_result(
+            passed=True,
+            message=f"All mandatory fields contain values across {total_rows} rows",
+            total_count=total_rows * len(fields),
+        )
 
 class RegexCheck(DataValidationRule):
     """
@@ -164,6 +222,9 @@ class RegexCheck(DataValidationRule):
             pattern (str): Regular expression pattern
             message (str, optional): Custom error message
             invert (bool): If True, values should NOT match pattern (default: False)
+            engine (str, optional): "auto" (default) matches with pyarrow when the
+                pattern means the same to RE2 as to re and the chunk's values
+                allow it, "python" always uses re
 
     Example YAML:
         # Email validation
@@ -183,6 +244,11 @@ class RegexCheck(DataValidationRule):
             message: "Account number must be exactly 8 digits"
     """
 
+    error_label = "regex check"
+    parallel_chunks = True
+    column_params = ("field",)
+    stops_early = True
+
     def __init__(self, name: str, severity, params: Dict[str, Any] = None, condition: str = None):
         """
         Initialize RegexCheck with pre-compiled regex pattern for performance.
@@ -208,124 +274,160 @@ class RegexCheck(DataValidationRule):
             self.compiled_regex = None
             self.regex_error = "No pattern specified"
 
+        # Pattern in RE2 form for pyarrow, or None when it must be matched with re
+        self.arrow_pattern = None
+        if (
+            HAS_PYARROW
+            and self.compiled_regex is not None
+            and self.params.get("engine", "auto") == "auto"
+            and pattern.isascii()
+            and not any(syntax in pattern for syntax in _RE2_DIVERGENT_SYNTAX)
+        ):
+            # re.match only anchors at the start of the value
+            arrow_pattern = f"^(?:{pattern})"
+            try:
+                pc.match_substring_regex(pa.array([""]), arrow_pattern)
+                self.arrow_pattern = arrow_pattern
+            except pa.ArrowInvalid:
+                # Not supported by RE2 (lookarounds, backreferences, ...)
+                pass
+
     def get_description(self) -> str:
         """Get human-readable description."""
         field = self.params.get("field", "unknown")
         pattern = self.params.get("pattern", "")
         return f"Validates '{field}' against pattern: {pattern}"
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
+    def _match_mask(self, values: pd.Series) -> pd.Series:
+        """
+        Match string values against the pattern in bulk.
+
+        Args:
+            values: Non-null string values
+
+        Returns:
+            Boolean Series aligned with values, True where the value matches
+        """
+        if self.arrow_pattern is not None:
+            array = pa.array(values, type=pa.string())
+            if pc.all(pc.match_substring_regex(array, _PRINTABLE_ASCII)).as_py():
+                matches = pc.match_substring_regex(array, self.arrow_pattern)
+                return pd.Series(matches.to_numpy(zero_copy_only=False), index=values.index, dtype=bool)
+
+        # Object values: the pyarrow-backed str dtype would hand the pattern to RE2
+        return values.astype(object).str.match(self.compiled_regex.pattern).astype(bool)
+
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create accumulator state, rejecting invalid parameters up front."""
+        state = super().init_state(context)
+
+        if not self.params.get("field"):
+            message = "No field specified for regex check"
+        elif not self.params.get("pattern"):
+            message = "No pattern specified for regex check"
+        elif self.regex_error:
+            # Pattern was compiled in __init__; report the compile error here
+            message = f"Invalid regex pattern: {self.regex_error}"
+        else:
+            return state
+
+        state["result"] = self._create_result(
+            passed=False,
+            message=message,
+            failed_count=1,
+        )
+        return state
+
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
         """
-        Validate field values against regex pattern across all chunks.
+        Match one chunk of field values against the regex pattern.
 
         Args:
-            data_iterator: Iterator yielding data chunks
+            state: Accumulator state
+            chunk: DataFrame chunk
+            row_offset: Number of rows preceding this chunk
+            context: Validation context
+        """
+        field = self.params.get("field")
+        pattern = self.params.get("pattern")
+        custom_message = self.params.get("message", f"Value does not match pattern: {pattern}")
+        invert = self.params.get("invert", False)
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
+
+        # Verify field exists
+        if field not in chunk.columns:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Field not found in data: {field}",
+                failed_count=1,
+            )
+            return
+
+        state["total_rows"] += len(chunk)
+
+        # Apply conditional filter if condition is specified
+        if self.condition:
+            condition_mask = self._evaluate_condition(chunk)
+            rows_to_check = chunk[condition_mask]
+
+            # If no rows match condition in this chunk, skip validation
+            if len(rows_to_check) == 0:
+                return
+        else:
+            rows_to_check = chunk
+
+        # Convert to string for regex matching (skip nulls)
+        field_values = rows_to_check[field].dropna().astype(str)
+        if field_values.empty:
+            return
+
+        # Match the whole chunk at once; failures are counted from the mask
+        matches = self._match_mask(field_values)
+        failed_values = field_values[matches] if invert else field_values[~matches]
+        state["failed_count"] += len(failed_values)
+
+        room = max_samples - len(failed_rows)
+        for idx, value in failed_values.iloc[:max(room, 0)].items():
+            failed_rows.append({
+                "row": int(row_offset + idx),
+                "field": field,
+                "value": value,
+                "message": custom_message
+            })
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """
+        Build the result for pattern mismatches found across all chunks.
+
+        Args:
+            state: Accumulator state
             context: Validation context
 
         Returns:
             ValidationResult with details of non-matching values
         """
-        try:
-            field = self.params.get("field")
-            if not field:
-                return self._create_result(
-                    passed=False,
-                    message="No field specified for regex check",
-                    failed_count=1,
-                )
-
-            pattern = self.params.get("pattern")
-            if not pattern:
-                return self._create_result(
-                    passed=False,
-                    message="No pattern specified for regex check",
-                    failed_count=1,
-                )
-
-            custom_message = self.params.get("message", f"Value does not match pattern: {pattern}")
-            invert = self.params.get("invert", False)
-
-            # Use pre-compiled regex pattern (compiled in __init__ for performance)
-            if self.regex_error:
-                return self._create_result(
-                    passed=False,
-                    message=f"Invalid regex pattern: {self.regex_error}",
-                    failed_count=1,
-                )
-
-            regex = self.compiled_regex
-
-            total_rows = 0
-            failed_rows = []
-            max_samples = context.get("max_sample_failures", 100)
-
-            # Process each chunk
-            for chunk_idx, chunk in enumerate(data_iterator):
-                # Verify field exists
-                if field not in chunk.columns:
-                    return self._create_result(
-                        passed=False,
-                        message=f"Field not found in data: {field}",
-                        failed_count=1,
-                    )
-
-                # Apply conditional filter if condition is specified
-                if self.condition:
-                    condition_mask = self._evaluate_condition(chunk)
-                    rows_to_check = chunk[condition_mask]
-
-                    # If no rows match condition in this chunk, skip validation
-                    if len(rows_to_check) == 0:
-                        total_rows += len(chunk)
-                        continue
-                else:
-                    rows_to_check = chunk
-
-                # Convert to string for regex matching (skip nulls)
-                field_values = rows_to_check[field].dropna().astype(str)
-
-                # Test each value against pattern
-                for idx, value in field_values.items():
-                    matches = bool(regex.match(value))
-
-                    # Check if validation fails (considering invert flag)
-                    failed = (matches and invert) or (not matches and not invert)
-
-                    if failed and len(failed_rows) < max_samples:
-                        failed_rows.append({
-                            "row": int(total_rows + idx),
-                            "field": field,
-                            "value": value,
-                            "message": custom_message
-                        })
-
-                total_rows += len(chunk)
-
-            # Create result
-            failed_count = len(failed_rows)
-
-            if failed_count > 0:
-                return self._create_result(
-                    passed=False,
-                    message=f"Found {failed_count} values that do not match pattern",
-                    failed_count=failed_count,
-                    total_count=total_rows,
-                    sample_failures=failed_rows,
-                )
+        if state["result"] is not None:
+            return state["result"]
 
-            return self._create_result(
-                passed=True,
-                message=f"All {total_rows} values match the expected pattern",
-                total_count=total_rows,
-            )
+        total_rows = state["total_rows"]
+        failed_rows = state["failed_rows"]
+        failed_count = state["failed_count"]
 
-        except Exception as e:
+        if failed_count > 0:
             return self._create_result(
                 passed=False,
-                message=f"Error during regex check: {str(e)}",
-                failed_count=1,
+                message=f"Found {failed_count} values that do not match pattern",
+                failed_count=failed_count,
+                total_count=total_rows,
+                sample_failures=failed_rows,
             )
 
+        return self._create_result(
+            passed=True,
+            message=f"All {total_rows} values match the expected pattern",
+            total_count=total_rows,
+        )
 
 class ValidValuesCheck(DataValidationRule):
     """
@@ -348,6 +450,11 @@ class ValidValuesCheck(DataValidationRule):
             case_sensitive: true
     """
 
+    error_label = "valid values check"
+    parallel_chunks = True
+    column_params = ("field",)
+    stops_early = True
+
     def __init__(self, name: str, severity, params: Dict[str, Any] = None, condition: str = None):
         """
         Initialize ValidValuesCheck with pre-computed valid set for performance.
@@ -377,109 +484,137 @@ class ValidValuesCheck(DataValidationRule):
         valid_values = self.params.get("valid_values", [])
         return f"Checks '{field}' contains only valid values: {', '.join(map(str, valid_values))}"
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create accumulator state, rejecting invalid parameters up front."""
+        state = super().init_state(context)
+        state["invalid_values"] = set()
+
+        if not self.params.get("field"):
+            message = "No field specified for valid values check"
+        elif not self.params.get("valid_values", []):
+            message = "No valid values specified"
+        else:
+            return state
+
+        state["result"] = self._create_result(
+            passed=False,
+            message=message,
+            failed_count=1,
+        )
+        return state
+
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
+        """
+        Check one chunk of field values against the allowed set.
+
+        Args:
+            state: Accumulator state
+            chunk: DataFrame chunk
+            row_offset: Number of rows preceding this chunk
+            context: Validation context
+        """
+        field = self.params.get("field")
+        valid_values = self.params.get("valid_values", [])
+
+        # Use pre-computed valid set (computed in __init__ for performance)
+        valid_set = self.valid_set
+        case_sensitive = self.case_sensitive
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
+        invalid_values_found: Set[str] = state["invalid_values"]
+
+        # Verify field exists
+        if field not in chunk.columns:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Field not found in data: {field}",
+                failed_count=1,
+            )
+            return
+
+        state["total_rows"] += len(chunk)
+
+        # Apply conditional filter if condition is specified
+        if self.condition:
+            condition_mask = self._evaluate_condition(chunk)
+            rows_to_check = chunk[condition_mask]
+
+            # If no rows match condition in this chunk, skip validation
+            if len(rows_to_check) == 0:
+                return
+        else:
+            rows_to_check = chunk
+
+        # Check each distinct value once (skip nulls), then map the verdict back to
+        # every row through the dictionary codes
+        field_values = rows_to_check[field].dropna()
+        if field_values.empty:
+            return
+
+        codes, uniques = pd.factorize(field_values)
+        unique_valid = np.fromiter(
+            (
+                (str(value) if case_sensitive else str(value).lower()) in valid_set
+                for value in uniques
+            ),
+            dtype=bool,
+            count=len(uniques),
+        )
+        if unique_valid.all():
+            return
+
+        invalid_mask = ~unique_valid[codes]
+        state["failed_count"] += int(invalid_mask.sum())
+        invalid_values_found.update(str(value) for value, valid in zip(uniques, unique_valid) if not valid)
+
+        room = max_samples - len(failed_rows)
+        for idx, value in field_values[invalid_mask].iloc[:max(room, 0)].items():
+            failed_rows.append({
+                "row": int(row_offset + idx),
+                "field": field,
+                "value": str(value),
+                "message": f"Invalid value '{value}'. Expected one of: {', '.join(map(str, valid_values))}"
+            })
+
+    def merge_state(self, state: Dict[str, Any], partial: Dict[str, Any]) -> None:
+        """Merge a chunk's partial state, including the distinct invalid values."""
+        if state["result"] is None and partial["result"] is None:
+            state["invalid_values"].update(partial["invalid_values"])
+        super().merge_state(state, partial)
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
         """
-        Validate field values are in the allowed set.
+        Build the result for invalid values found across all chunks.
 
         Args:
-            data_iterator: Iterator yielding data chunks
+            state: Accumulator state
             context: Validation context
 
         Returns:
             ValidationResult with details of invalid values
         """
-        try:
-            field = self.params.get("field")
-            if not field:
-                return self._create_result(
-                    passed=False,
-                    message="No field specified for valid values check",
-                    failed_count=1,
-                )
-
-            valid_values = self.params.get("valid_values", [])
-            if not valid_values:
-                return self._create_result(
-                    passed=False,
-                    message="No valid values specified",
-                    failed_count=1,
-                )
-
-            # Use pre-computed valid set (computed in __init__ for performance)
-            valid_set = self.valid_set
-            case_sensitive = self.case_sensitive
-
-            total_rows = 0
-            failed_rows = []
-            max_samples = context.get("max_sample_failures", 100)
-            invalid_values_found: Set[str] = set()
-
-            # Process each chunk
-            for chunk_idx, chunk in enumerate(data_iterator):
-                # Verify field exists
-                if field not in chunk.columns:
-                    return self._create_result(
-                        passed=False,
-                        message=f"Field not found in data: {field}",
-                        failed_count=1,
-                    )
-
-                # Apply conditional filter if condition is specified
-                if self.condition:
-                    condition_mask = self._evaluate_condition(chunk)
-                    rows_to_check = chunk[condition_mask]
-
-                    # If no rows match condition in this chunk, skip validation
-                    if len(rows_to_check) == 0:
-                        total_rows += len(chunk)
-                        continue
-                else:
-                    rows_to_check = chunk
-
-                # Check each value (skip nulls)
-                field_values = rows_to_check[field].dropna()
-
-                for idx, value in field_values.items():
-                    check_value = str(value) if case_sensitive else str(value).lower()
-
-                    if check_value not in valid_set:
-                        invalid_values_found.add(str(value))
-
-                        if len(failed_rows) < max_samples:
-                            failed_rows.append({
-                                "row": int(total_rows + idx),
-                                "field": field,
-                                "value": str(value),
-                                "message": f"Invalid value '{value}'. Expected one of: {', '.join(map(str, valid_values))}"
-                            })
-
-                total_rows += len(chunk)
-
-            # Create result
-            failed_count = len(failed_rows)
-
-            if failed_count > 0:
-                return self._create_result(
-                    passed=False,
-                    message=f"Found {failed_count} invalid values. Unique invalid values: {', '.join(sorted(invalid_values_found)[:10])}",
-                    failed_count=failed_count,
-                    total_count=total_rows,
-                    sample_failures=failed_rows,
-                )
+        if state["result"] is not None:
+            return state["result"]
 
-            return self._create_result(
-                passed=True,
-                message=f"All {total_rows} values are valid",
-                total_count=total_rows,
-            )
+        total_rows = state["total_rows"]
+        failed_rows = state["failed_rows"]
+        invalid_values_found = state["invalid_values"]
+        failed_count = state["failed_count"]
 
-        except Exception as e:
+        if failed_count > 0:
             return self._create_result(
                 passed=False,
-                message=f"Error during valid values check: {str(e)}",
-                failed_count=1,
+                message=f"Found {failed_count} invalid values. Unique invalid values: {', '.join(sorted(invalid_values_found)[:10])}",
+                failed_count=failed_count,
+                total_count=total_rows,
+                sample_failures=failed_rows,
             )
 
+        return self._create_result(
+            passed=True,
+            message=f"All {total_rows} values are valid",
+            total_count=total_rows,
+        )
 
 class RangeCheck(DataValidationRule):
     """
@@ -500,6 +635,11 @@ class RangeCheck(DataValidationRule):
             max_value: 1000000
     """
 
+    error_label = "range check"
+    parallel_chunks = True
+    column_params = ("field",)
+    stops_early = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         field = self.params.get("field", "unknown")
@@ -515,119 +655,163 @@ class RangeCheck(DataValidationRule):
         else:
             return f"Checks '{field}' range (no limits specified)"
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create accumulator state, rejecting invalid parameters up front."""
+        state = super().init_state(context)
+
+        if not self.params.get("field"):
+            message = "No field specified for range check"
+        elif self.params.get("min_value") is None and self.params.get("max_value") is None:
+            message = "No range limits specified (need min_value or max_value)"
+        else:
+            return state
+
+        state["result"] = self._create_result(
+            passed=False,
+            message=message,
+            failed_count=1,
+        )
+        return state
+
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
         """
-        Validate numeric values are within range.
+        Check one chunk of numeric values against the range limits.
 
         Args:
-            data_iterator: Iterator yielding data chunks
+            state: Accumulator state
+            chunk: DataFrame chunk
+            row_offset: Number of rows preceding this chunk
             context: Validation context
+        """
+        field = self.params.get("field")
+        min_value = self.params.get("min_value")
+        max_value = self.params.get("max_value")
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
+
+        # Verify field exists
+        if field not in chunk.columns:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Field not found in data: {field}",
+                failed_count=1,
+            )
+            return
+
+        state["total_rows"] += len(chunk)
+
+        # Apply conditional filter if condition is specified
+        if self.condition:
+            condition_mask = self._evaluate_condition(chunk)
+            rows_to_check = chunk[condition_mask]
+
+            # If no rows match condition in this chunk, skip validation
+            if len(rows_to_check) == 0:
+                return
+        else:
+            rows_to_check = chunk
+
+        # Convert to numeric if needed
+        try:
+            field_values = pd.to_numeric(rows_to_check[field], errors='coerce')
+        except Exception:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Field '{field}' cannot be converted to numeric",
+                failed_count=1,
+            )
+            return
+
+        # Check range violations (skip nulls)
+        field_values = field_values.dropna()
+        out_of_range = pd.Series(False, index=field_values.index)
+        if min_value is not None:
+            out_of_range |= field_values < min_value
+        if max_value is not None:
+            out_of_range |= field_values > max_value
+
+        state["failed_count"] += int(out_of_range.sum())
+
+        room = max_samples - len(failed_rows)
+        if room <= 0:
+            return
+
+        for idx, value in field_values[out_of_range].iloc[:room].items():
+            if min_value is not None and value < min_value:
+                message = f"Value {value} is below minimum {min_value}"
+            else:
+                message = f"Value {value} exceeds maximum {max_value}"
+
+            failed_rows.append({
+                "row": int(row_offset + idx),
+                "field": field,
+                "value": float(value),
+                "message": message
+            })
+
+    def covers_row_group(self, statistics: RowGroupStatistics) -> bool:
+        """
+        Check whether a row group's min/max already lie within the range limits.
+
+        Args:
+            statistics: Statistics of the row group
 
         Returns:
-            ValidationResult with details of out-of-range values
+            True if no value in the row group can be out of range
         """
-        try:
-            field = self.params.get("field")
-            if not field:
-                return self._create_result(
-                    passed=False,
-                    message="No field specified for range check",
-                    failed_count=1,
-                )
-
-            min_value = self.params.get("min_value")
-            max_value = self.params.get("max_value")
-
-            if min_value is None and max_value is None:
-                return self._create_result(
-                    passed=False,
-                    message="No range limits specified (need min_value or max_value)",
-                    failed_count=1,
-                )
-
-            total_rows = 0
-            failed_rows = []
-            max_samples = context.get("max_sample_failures", 100)
-
-            # Process each chunk
-            for chunk_idx, chunk in enumerate(data_iterator):
-                # Verify field exists
-                if field not in chunk.columns:
-                    return self._create_result(
-                        passed=False,
-                        message=f"Field not found in data: {field}",
-                        failed_count=1,
-                    )
-
-                # Apply conditional filter if condition is specified
-                if self.condition:
-                    condition_mask = self._evaluate_condition(chunk)
-                    rows_to_check = chunk[condition_mask]
-
-                    # If no rows match condition in this chunk, skip validation
-                    if len(rows_to_check) == 0:
-                        total_rows += len(chunk)
-                        continue
-                else:
-                    rows_to_check = chunk
-
-                # Convert to numeric if needed
-                try:
-                    field_values = pd.to_numeric(rows_to_check[field], errors='coerce')
-                except Exception:
-                    return self._create_result(
-                        passed=False,
-                        message=f"Field '{field}' cannot be converted to numeric",
-                        failed_count=1,
-                    )
-
-                # Check range violations (skip nulls)
-                for idx, value in field_values.dropna().items():
-                    out_of_range = False
-                    message = ""
-
-                    if min_value is not None and value < min_value:
-                        out_of_range = True
-                        message = f"Value {value} is below minimum {min_value}"
-                    elif max_value is not None and value > max_value:
-                        out_of_range = True
-                        message = f"Value {value} exceeds maximum {max_value}"
-
-                    if out_of_range and len(failed_rows) < max_samples:
-                        failed_rows.append({
-                            "row": int(total_rows + idx),
-                            "field": field,
-                            "value": float(value),
-                            "message": message
-                        })
-
-                total_rows += len(chunk)
-
-            # Create result
-            failed_count = len(failed_rows)
-
-            if failed_count > 0:
-                return self._create_result(
-                    passed=False,
-                    message=f"Found {failed_count} values outside acceptable range",
-                    failed_count=failed_count,
-                    total_count=total_rows,
-                    sample_failures=failed_rows,
-                )
+        column = statistics.columns.get(self.params.get("field"))
+        if column is None:
+            return False
 
-            return self._create_result(
-                passed=True,
-                message=f"All {total_rows} values are within acceptable range",
-                total_count=total_rows,
+        # Nulls are never out of range
+        if column.null_count == statistics.num_rows:
+            return True
+
+        if column.kind not in ("integer", "floating") or not column.has_min_max:
+            return False
+
+        min_value = self.params.get("min_value")
+        max_value = self.params.get("max_value")
+        try:
+            return (
+                (min_value is None or column.min_value >= min_value)
+                and (max_value is None or column.max_value <= max_value)
             )
+        except TypeError:
+            return False
 
-        except Exception as e:
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """
+        Build the result for out-of-range values found across all chunks.
+
+        Args:
+            state: Accumulator state
+            context: Validation context
+
+        Returns:
+            ValidationResult with details of out-of-range values
+        """
+        if state["result"] is not None:
+            return state["result"]
+
+        total_rows = state["total_rows"]
+        failed_rows = state["failed_rows"]
+        failed_count = state["failed_count"]
+
+        if failed_count > 0:
             return self._create_result(
                 passed=False,
-                message=f"Error during range check: {str(e)}",
-                failed_count=1,
+                message=f"Found {failed_count} values outside acceptable range",
+                failed_count=failed_count,
+                total_count=total_rows,
+                sample_failures=failed_rows,
             )
 
+        return self._create_result(
+            passed=True,
+            message=f"All {total_rows} values are within acceptable range",
+            total_count=total_rows,
+        )
 
 class DateFormatCheck(DataValidationRule):
     """
@@ -649,116 +833,162 @@ class DateFormatCheck(DataValidationRule):
             allow_null: false
     """
 
+    error_label = "date format check"
+    parallel_chunks = True
+    column_params = ("field",)
+    stops_early = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         field = self.params.get("field", "unknown")
         format_str = self.params.get("format", "unknown")
         return f"Checks '{field}' matches date format: {format_str}"
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create accumulator state, rejecting invalid parameters up front."""
+        state = super().init_state(context)
+
+        if not self.params.get("field"):
+            message = "No field specified for date format check"
+        elif not self.params.get("format"):
+            message = "No date format specified"
+        else:
+            return state
+
+        state["result"] = self._create_result(
+            passed=False,
+            message=message,
+            failed_count=1,
+        )
+        return state
+
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
+        """
+        Parse one chunk of date values with the expected format.
+
+        Args:
+            state: Accumulator state
+            chunk: DataFrame chunk
+            row_offset: Number of rows preceding this chunk
+            context: Validation context
+        """
+        field = self.params.get("field")
+        date_format = self.params.get("format")
+        allow_null = self.params.get("allow_null", True)
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
+
+        # Verify field exists
+        if field not in chunk.columns:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Field not found in data: {field}",
+                failed_count=1,
+            )
+            return
+
+        state["total_rows"] += len(chunk)
+
+        # Apply conditional filter if condition is specified
+        if self.condition:
+            condition_mask = self._evaluate_condition(chunk)
+            rows_to_check = chunk[condition_mask]
+
+            # If no rows match condition in this chunk, skip validation
+            if len(rows_to_check) == 0:
+                return
+        else:
+            rows_to_check = chunk
+
+        values = rows_to_check[field]
+        null_mask = values.isna().to_numpy()
+
+        # Parse the non-null values in bulk
+        invalid_mask = np.zeros(len(values), dtype=bool)
+        if not null_mask.all():
+            invalid_mask[~null_mask] = self._invalid_dates(values[~null_mask], date_format)
+
+        failed_mask = invalid_mask if allow_null else invalid_mask | null_mask
+        state["failed_count"] += int(failed_mask.sum())
+
+        room = max_samples - len(failed_rows)
+        if room <= 0:
+            return
+
+        failed_values = values[failed_mask].iloc[:room]
+        for (idx, value), is_null in zip(failed_values.items(), null_mask[failed_mask]):
+            failed_rows.append({
+                "row": int(row_offset + idx),
+                "field": field,
+                "value": str(value),
+                "message": "Null value not allowed" if is_null else f"Invalid date format. Expected: {date_format}"
+            })
+
+    def _invalid_dates(self, values: pd.Series, date_format: str) -> np.ndarray:
+        """
+        Find values that do not parse with the expected format.
+
+        Each distinct string is parsed once, so columns with heavily repeated
+        dates only cost a parse per distinct date. Parsing uses
+        pd.to_datetime; values it rejects are re-checked with strptime, which
+        also accepts dates outside the pandas Timestamp range.
+
+        Args:
+            values: Non-null field values
+            date_format: Expected strftime format
+
+        Returns:
+            Boolean array aligned with values, True where the value is invalid
+        """
+        codes, uniques = pd.factorize(values)
+        uniques = [str(value) for value in uniques]
+
+        try:
+            parsed = pd.to_datetime(pd.Series(uniques, dtype=object), format=date_format, errors="coerce")
+            unique_invalid = parsed.isna().to_numpy()
+        except (ValueError, TypeError):
+            # Formats pandas cannot apply in bulk (e.g. mixed time zones)
+            unique_invalid = np.ones(len(uniques), dtype=bool)
+
+        for position in np.flatnonzero(unique_invalid):
+            try:
+                datetime.strptime(uniques[position], date_format)
+                unique_invalid[position] = False
+            except (ValueError, TypeError):
+                pass
+
+        return unique_invalid[codes]
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
         """
-        Validate date field format.
+        Build the result for invalid dates found across all chunks.
 
         Args:
-            data_iterator: Iterator yielding data chunks
+            state: Accumulator state
             context: Validation context
 
         Returns:
             ValidationResult with details of invalid dates
         """
-        try:
-            field = self.params.get("field")
-            if not field:
-                return self._create_result(
-                    passed=False,
-                    message="No field specified for date format check",
-                    failed_count=1,
-                )
-
-            date_format = self.params.get("format")
-            if not date_format:
-                return self._create_result(
-                    passed=False,
-                    message="No date format specified",
-                    failed_count=1,
-                )
-
-            allow_null = self.params.get("allow_null", True)
-
-            total_rows = 0
-            failed_rows = []
-            max_samples = context.get("max_sample_failures", 100)
-
-            # Process each chunk
-            for chunk_idx, chunk in enumerate(data_iterator):
-                # Verify field exists
-                if field not in chunk.columns:
-                    return self._create_result(
-                        passed=False,
-                        message=f"Field not found in data: {field}",
-                        failed_count=1,
-                    )
-
-                # Apply conditional filter if condition is specified
-                if self.condition:
-                    condition_mask = self._evaluate_condition(chunk)
-                    rows_to_check = chunk[condition_mask]
-
-                    # If no rows match condition in this chunk, skip validation
-                    if len(rows_to_check) == 0:
-                        total_rows += len(chunk)
-                        continue
-                else:
-                    rows_to_check = chunk
-
-                # Check each value
-                for idx, value in rows_to_check[field].items():
-                    # Handle nulls
-                    if pd.isna(value):
-                        if not allow_null and len(failed_rows) < max_samples:
-                            failed_rows.append({
-                                "row": int(total_rows + idx),
-                                "field": field,
-                                "value": str(value),
-                                "message": "Null value not allowed"
-                            })
-                        continue
-
-                    # Try to parse date with specified format
-                    try:
-                        datetime.strptime(str(value), date_format)
-                    except (ValueError, TypeError) as e:
-                        if len(failed_rows) < max_samples:
-                            failed_rows.append({
-                                "row": int(total_rows + idx),
-                                "field": field,
-                                "value": str(value),
-                                "message": f"Invalid date format. Expected: {date_format}"
-                            })
-
-                total_rows += len(chunk)
-
-            # Create result
-            failed_count = len(failed_rows)
-
-            if failed_count > 0:
-                return self._create_result(
-                    passed=False,
-                    message=f"Found {failed_count} dates with invalid format",
-                    failed_count=failed_count,
-                    total_count=total_rows,
-                    sample_failures=failed_rows,
-                )
+        if state["result"] is not None:
+            return state["result"]
 
-            return self._create_result(
-                passed=True,
-                message=f"All {total_rows} dates match expected format {date_format}",
-                total_count=total_rows,
-            )
+        date_format = self.params.get("format")
+        total_rows = state["total_rows"]
+        failed_rows = state["failed_rows"]
+        failed_count = state["failed_count"]
 
-        except Exception as e:
+        if failed_count > 0:
             return self._create_result(
                 passed=False,
-                message=f"Error during date format check: {str(e)}",
-                failed_count=1,
+                message=f"Found {failed_count} dates with invalid format",
+                failed_count=failed_count,
+                total_count=total_rows,
+                sample_failures=failed_rows,
             )
+
+        return self._create_result(
+            passed=True,
+            message=f"All {total_rows} dates match expected format {date_format}",
+            total_count=total_rows,
+        )
@@ -9,7 +9,6 @@ These validations check file properties before data processing:
 """
 
 from typing import Iterator, Dict, Any
-import pandas as pd
 from pathlib import Path
 from validation_framework.validations.base import FileValidationRule, ValidationResult
 
@@ -43,6 +42,8 @@ class EmptyFileCheck(FileValidationRule):
             check_data_rows: true
     """
 
+    gate = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         check_data_rows = self.params.get("check_data_rows", False)
@@ -92,7 +93,9 @@ class EmptyFileCheck(FileValidationRule):
                     if file_format.lower() == "csv":
                         # Read first 2 lines to check if there's data beyond header
                         import csv
-                        with open(file_path, 'r', encoding='utf-8') as f:
+                        import io
+                        from validation_framework.loaders.compression import open_file
+                        with io.TextIOWrapper(open_file(file_path), encoding='utf-8') as f:
                             reader = csv.reader(f)
                             lines = []
                             for i, line in enumerate(reader):
@@ -109,9 +112,10 @@ class EmptyFileCheck(FileValidationRule):
                                 )
 
                     elif file_format.lower() in ["excel", "xlsx", "xls"]:
-                        # Check Excel file for data rows
-                        df = pd.read_excel(file_path, nrows=1)
-                        if len(df) == 0:
+                        # Check Excel file for data rows, streaming only the first one
+                        from validation_framework.loaders.excel_loader import ExcelLoader
+                        first_chunk = next(ExcelLoader(file_path, chunk_size=1).load())
+                        if len(first_chunk) == 0:
                             return self._create_result(
                                 passed=False,
                                 message=f"File contains only headers with no data rows: {file_path}",
@@ -119,11 +123,14 @@ class EmptyFileCheck(FileValidationRule):
                             )
 
                     elif file_format.lower() == "json":
-                        # Check JSON file for data
-                        import json
-                        with open(file_path, 'r') as f:
-                            data = json.load(f)
-                            if isinstance(data, list) and len(data) == 0:
+                        # Check JSON arrays for a first record, without parsing the rest
+                        import io
+                        from validation_framework.loaders.json_stream import JSONArrayReader, is_json_array
+                        from validation_framework.loaders.compression import open_file
+                        if is_json_array(file_path):
+                            with io.TextIOWrapper(open_file(file_path), encoding='utf-8') as f:
+                                has_records = next((True for _ in JSONArrayReader(f)), False)
+                            if not has_records:
                                 return self._create_result(
                                     passed=False,
                                     message=f"File contains no data records: {file_path}",
@@ -131,9 +138,9 @@ class EmptyFileCheck(FileValidationRule):
                                 )
 
                     elif file_format.lower() == "parquet":
-                        # Check Parquet file for data rows
-                        df = pd.read_parquet(file_path)
-                        if len(df) == 0:
+                        # Row count is in the Parquet footer, no data needs reading
+                        import pyarrow.parquet as pq
+                        if pq.ParquetFile(file_path).metadata.num_rows == 0:
                             return self._create_result(
                                 passed=False,
                                 message=f"File contains only headers with no data rows: {file_path}",
@@ -195,6 +202,8 @@ class RowCountRangeCheck(FileValidationRule):
             max_rows: 1000000
     """
 
+    needs_row_count = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         min_rows = self.params.get("min_rows")
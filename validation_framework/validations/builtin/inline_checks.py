@@ -7,10 +7,10 @@ writing Python code. All configuration is done in the YAML file.
 Author: daniel edge
 """
 
-from typing import Iterator, Dict, Any, List
+from typing import Dict, Any, List, Optional, Set
 import pandas as pd
 import re
-from validation_framework.validations.base import DataValidationRule, ValidationResult
+from validation_framework.validations.base import DataValidationRule, RuleCost, ValidationResult
 
 
 class InlineRegexCheck(DataValidationRule):
@@ -52,6 +52,11 @@ class InlineRegexCheck(DataValidationRule):
             should_match: false
     """
 
+    cost = RuleCost.PYTHON_LOOP
+    parallel_chunks = True
+    column_params = ("field",)
+    stops_early = True
+
     def __init__(self, name: str, severity, params: Dict[str, Any] = None, condition: str = None):
         """
         Initialize InlineRegexCheck with pre-compiled regex pattern for performance.
@@ -87,87 +92,91 @@ class InlineRegexCheck(DataValidationRule):
         pattern = self.params.get("pattern", "")
         return f"Custom regex check on '{field}': {pattern}"
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
-        """Validate field values against custom regex pattern."""
-        try:
-            field = self.params.get("field")
-            pattern = self.params.get("pattern")
-            should_match = self.params.get("should_match", True)
-            description = self.params.get("description", "Custom validation")
-
-            if not field or not pattern:
-                return self._create_result(
-                    passed=False,
-                    message="Missing required parameters: field and pattern",
-                    failed_count=1,
-                )
-
-            # Use pre-compiled regex pattern (compiled in __init__ for performance)
-            if self.regex_error:
-                return self._create_result(
-                    passed=False,
-                    message=f"Invalid regex pattern: {self.regex_error}",
-                    failed_count=1,
-                )
-
-            regex = self.compiled_regex
-
-            total_rows = 0
-            failed_rows = []
-            max_samples = context.get("max_sample_failures", 100)
-
-            # Process chunks
-            for chunk in data_iterator:
-                if field not in chunk.columns:
-                    return self._create_result(
-                        passed=False,
-                        message=f"Field '{field}' not found",
-                        failed_count=1,
-                    )
-
-                # Check each value
-                for idx, value in chunk[field].dropna().items():
-                    matches = bool(regex.search(str(value)))
-                    failed = (matches and not should_match) or (not matches and should_match)
-
-                    if failed and len(failed_rows) < max_samples:
-                        if should_match:
-                            msg = f"{description} - Value does not match expected pattern"
-                        else:
-                            msg = f"{description} - Value should NOT contain this pattern"
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create accumulator state, rejecting invalid parameters up front."""
+        state = super().init_state(context)
 
-                        failed_rows.append({
-                            "row": int(total_rows + idx),
-                            "field": field,
-                            "value": str(value),
-                            "message": msg
-                        })
+        if not self.params.get("field") or not self.params.get("pattern"):
+            message = "Missing required parameters: field and pattern"
+        elif self.regex_error:
+            # Pattern was compiled in __init__; report the compile error here
+            message = f"Invalid regex pattern: {self.regex_error}"
+        else:
+            return state
+
+        state["result"] = self._create_result(
+            passed=False,
+            message=message,
+            failed_count=1,
+        )
+        return state
+
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
+        """Validate one chunk of field values against the custom regex pattern."""
+        field = self.params.get("field")
+        should_match = self.params.get("should_match", True)
+        description = self.params.get("description", "Custom validation")
+        regex = self.compiled_regex
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
+
+        if field not in chunk.columns:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Field '{field}' not found",
+                failed_count=1,
+            )
+            return
 
-                total_rows += len(chunk)
+        # Check each value
+        for idx, value in chunk[field].dropna().items():
+            matches = bool(regex.search(str(value)))
+            failed = (matches and not should_match) or (not matches and should_match)
 
-            # Create result
-            if failed_rows:
-                return self._create_result(
-                    passed=False,
-                    message=f"{description} - Found {len(failed_rows)} values that failed validation",
-                    failed_count=len(failed_rows),
-                    total_count=total_rows,
-                    sample_failures=failed_rows,
-                )
+            if not failed:
+                continue
 
-            return self._create_result(
-                passed=True,
-                message=f"{description} - All {total_rows} values passed validation",
-                total_count=total_rows,
-            )
+            state["failed_count"] += 1
+            if len(failed_rows) < max_samples:
+                if should_match:
+                    msg = f"{description} - Value does not match expected pattern"
+                else:
+                    msg = f"{description} - Value should NOT contain this pattern"
 
-        except Exception as e:
+                failed_rows.append({
+                    "row": int(row_offset + idx),
+                    "field": field,
+                    "value": str(value),
+                    "message": msg
+                })
+
+        state["total_rows"] += len(chunk)
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Build the result for values that failed the custom regex pattern."""
+        if state["result"] is not None:
+            return state["result"]
+
+        description = self.params.get("description", "Custom validation")
+        total_rows = state["total_rows"]
+        failed_rows = state["failed_rows"]
+
+        failed_count = state["failed_count"]
+
+        if failed_count > 0:
             return self._create_result(
                 passed=False,
-                message=f"Error during validation: {str(e)}",
-                failed_count=1,
+                message=f"{description} - Found {failed_count} values that failed validation",
+                failed_count=failed_count,
+                total_count=total_rows,
+                sample_failures=failed_rows,
             )
 
+        return self._create_result(
+            passed=True,
+            message=f"{description} - All {total_rows} values passed validation",
+            total_count=total_rows,
+        )
 
 class InlineBusinessRuleCheck(DataValidationRule):
     """
@@ -214,88 +223,101 @@ class InlineBusinessRuleCheck(DataValidationRule):
             error_message: "Savings account has zero interest rate"
     """
 
+    error_label = "business rule check"
+    parallel_chunks = True
+    stops_early = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         return self.params.get("description", "Custom business rule")
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
-        """Validate data against business rule."""
-        try:
-            rule = self.params.get("rule")
-            description = self.params.get("description", "Custom business rule")
-            error_message = self.params.get("error_message", "Business rule violation")
-
-            if not rule:
-                return self._create_result(
-                    passed=False,
-                    message="No rule specified",
-                    failed_count=1,
-                )
-
-            total_rows = 0
-            failed_rows = []
-            max_samples = context.get("max_sample_failures", 100)
-
-            # Process chunks
-            for chunk in data_iterator:
-                try:
-                    # Prepare evaluation context
-                    eval_context = self._prepare_eval_context(chunk)
-
-                    # Convert SQL-like syntax to pandas query
-                    pandas_query = self._convert_to_pandas_query(rule)
-
-                    # Execute query - rows that PASS the rule
-                    try:
-                        passing_mask = chunk.eval(pandas_query)
-                    except Exception:
-                        # Fallback: try as direct eval
-                        passing_mask = eval(pandas_query, {"__builtins__": {}}, eval_context)
-
-                    # Find failing rows (NOT passing)
-                    failing_indices = chunk[~passing_mask].index.tolist()
-
-                    # Collect samples
-                    for idx in failing_indices:
-                        if len(failed_rows) < max_samples:
-                            row_data = chunk.loc[idx].to_dict()
-                            failed_rows.append({
-                                "row": int(total_rows + idx),
-                                "values": {k: str(v)[:50] for k, v in list(row_data.items())[:5]},  # First 5 columns
-                                "message": error_message
-                            })
-
-                except Exception as e:
-                    return self._create_result(
-                        passed=False,
-                        message=f"Error evaluating rule: {str(e)}",
-                        failed_count=1,
-                    )
-
-                total_rows += len(chunk)
-
-            # Create result
-            if failed_rows:
-                return self._create_result(
-                    passed=False,
-                    message=f"{description} - {len(failed_rows)} rows failed business rule",
-                    failed_count=len(failed_rows),
-                    total_count=total_rows,
-                    sample_failures=failed_rows,
-                )
+    def required_columns(self) -> Optional[Set[str]]:
+        """The rule expression may refer to any of the names it contains."""
+        return self._expression_columns(self.params.get("rule")) | self._expression_columns(self.condition)
 
-            return self._create_result(
-                passed=True,
-                message=f"{description} - All {total_rows} rows passed business rule",
-                total_count=total_rows,
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create accumulator state, rejecting a missing rule up front."""
+        state = super().init_state(context)
+
+        if not self.params.get("rule"):
+            state["result"] = self._create_result(
+                passed=False,
+                message="No rule specified",
+                failed_count=1,
             )
 
+        return state
+
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
+        """Evaluate the business rule against one chunk."""
+        rule = self.params.get("rule")
+        error_message = self.params.get("error_message", "Business rule violation")
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
+
+        try:
+            # Prepare evaluation context
+            eval_context = self._prepare_eval_context(chunk)
+
+            # Convert SQL-like syntax to pandas query
+            pandas_query = self._convert_to_pandas_query(rule)
+
+            # Execute query - rows that PASS the rule
+            try:
+                passing_mask = chunk.eval(pandas_query)
+            except Exception:
+                # Fallback: try as direct eval
+                passing_mask = eval(pandas_query, {"__builtins__": {}}, eval_context)
+
+            # Find failing rows (NOT passing)
+            failing = ~passing_mask
+            state["failed_count"] += int(failing.sum())
+
+            # Collect samples
+            room = max(max_samples - len(failed_rows), 0)
+            for idx in chunk[failing].index[:room]:
+                row_data = chunk.loc[idx].to_dict()
+                failed_rows.append({
+                    "row": int(row_offset + idx),
+                    "values": {k: str(v)[:50] for k, v in list(row_data.items())[:5]},  # First 5 columns
+                    "message": error_message
+                })
+
         except Exception as e:
-            return self._create_result(
+            state["result"] = self._create_result(
                 passed=False,
-                message=f"Error during business rule check: {str(e)}",
+                message=f"Error evaluating rule: {str(e)}",
                 failed_count=1,
             )
+            return
+
+        state["total_rows"] += len(chunk)
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Build the result for rows that failed the business rule."""
+        if state["result"] is not None:
+            return state["result"]
+
+        description = self.params.get("description", "Custom business rule")
+        total_rows = state["total_rows"]
+        failed_rows = state["failed_rows"]
+
+        failed_count = state["failed_count"]
+
+        if failed_count > 0:
+            return self._create_result(
+                passed=False,
+                message=f"{description} - {failed_count} rows failed business rule",
+                failed_count=failed_count,
+                total_count=total_rows,
+                sample_failures=failed_rows,
+            )
+
+        return self._create_result(
+            passed=True,
+            message=f"{description} - All {total_rows} rows passed business rule",
+            total_count=total_rows,
+        )
 
     def _prepare_eval_context(self, df: pd.DataFrame) -> dict:
         """Prepare evaluation context with today's date etc."""
@@ -358,91 +380,110 @@ class InlineLookupCheck(DataValidationRule):
             description: "Product code must be in approved list"
     """
 
+    error_label = "lookup check"
+    cost = RuleCost.PYTHON_LOOP
+    parallel_chunks = True
+    column_params = ("field",)
+    stops_early = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         return self.params.get("description", "Reference data lookup")
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
-        """Validate against reference list."""
-        try:
-            field = self.params.get("field")
-            reference_values = self.params.get("reference_values", [])
-            check_type = self.params.get("check_type", "allow").lower()
-            description = self.params.get("description", "Reference data check")
-
-            if not field or not reference_values:
-                return self._create_result(
-                    passed=False,
-                    message="Missing required parameters: field and reference_values",
-                    failed_count=1,
-                )
-
-            # Convert to set for efficient lookup
-            reference_set = set(reference_values)
-
-            total_rows = 0
-            failed_rows = []
-            max_samples = context.get("max_sample_failures", 100)
-            invalid_values = set()
-
-            # Process chunks
-            for chunk in data_iterator:
-                if field not in chunk.columns:
-                    return self._create_result(
-                        passed=False,
-                        message=f"Field '{field}' not found",
-                        failed_count=1,
-                    )
-
-                # Check each value
-                for idx, value in chunk[field].dropna().items():
-                    value_str = str(value)
-
-                    if check_type == "allow":
-                        # Value must be IN the reference list
-                        if value_str not in reference_set:
-                            invalid_values.add(value_str)
-                            if len(failed_rows) < max_samples:
-                                failed_rows.append({
-                                    "row": int(total_rows + idx),
-                                    "field": field,
-                                    "value": value_str,
-                                    "message": f"Value not in approved list. Allowed: {', '.join(list(reference_values)[:5])}"
-                                })
-                    else:  # deny
-                        # Value must NOT be IN the reference list
-                        if value_str in reference_set:
-                            invalid_values.add(value_str)
-                            if len(failed_rows) < max_samples:
-                                failed_rows.append({
-                                    "row": int(total_rows + idx),
-                                    "field": field,
-                                    "value": value_str,
-                                    "message": f"Value is in blocked list"
-                                })
-
-                total_rows += len(chunk)
-
-            # Create result
-            if failed_rows:
-                invalid_list = ', '.join(sorted(invalid_values)[:10])
-                return self._create_result(
-                    passed=False,
-                    message=f"{description} - {len(failed_rows)} values failed. Invalid values: {invalid_list}",
-                    failed_count=len(failed_rows),
-                    total_count=total_rows,
-                    sample_failures=failed_rows,
-                )
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create accumulator state, rejecting invalid parameters up front."""
+        state = super().init_state(context)
+        state["invalid_values"] = set()
 
-            return self._create_result(
-                passed=True,
-                message=f"{description} - All {total_rows} values passed lookup check",
-                total_count=total_rows,
+        if not self.params.get("field") or not self.params.get("reference_values", []):
+            state["result"] = self._create_result(
+                passed=False,
+                message="Missing required parameters: field and reference_values",
+                failed_count=1,
             )
 
-        except Exception as e:
-            return self._create_result(
+        return state
+
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
+        """Check one chunk of field values against the reference list."""
+        field = self.params.get("field")
+        reference_values = self.params.get("reference_values", [])
+        check_type = self.params.get("check_type", "allow").lower()
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
+        invalid_values = state["invalid_values"]
+
+        # Convert to set for efficient lookup
+        reference_set = set(reference_values)
+
+        if field not in chunk.columns:
+            state["result"] = self._create_result(
                 passed=False,
-                message=f"Error during lookup check: {str(e)}",
+                message=f"Field '{field}' not found",
                 failed_count=1,
             )
+            return
+
+        # Check each value
+        for idx, value in chunk[field].dropna().items():
+            value_str = str(value)
+
+            if check_type == "allow":
+                # Value must be IN the reference list
+                if value_str not in reference_set:
+                    invalid_values.add(value_str)
+                    state["failed_count"] += 1
+                    if len(failed_rows) < max_samples:
+                        failed_rows.append({
+                            "row": int(row_offset + idx),
+                            "field": field,
+                            "value": value_str,
+                            "message": f"Value not in approved list. Allowed: {', '.join(list(reference_values)[:5])}"
+                        })
+            else:  # deny
+                # Value must NOT be IN the reference list
+                if value_str in reference_set:
+                    invalid_values.add(value_str)
+                    state["failed_count"] += 1
+                    if len(failed_rows) < max_samples:
+                        failed_rows.append({
+                            "row": int(row_offset + idx),
+                            "field": field,
+                            "value": value_str,
+                            "message": f"Value is in blocked list"
+                        })
+
+        state["total_rows"] += len(chunk)
+
+    def merge_state(self, state: Dict[str, Any], partial: Dict[str, Any]) -> None:
+        """Merge a chunk's partial state, including the distinct invalid values."""
+        if state["result"] is None and partial["result"] is None:
+            state["invalid_values"].update(partial["invalid_values"])
+        super().merge_state(state, partial)
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Build the result for values that failed the reference lookup."""
+        if state["result"] is not None:
+            return state["result"]
+
+        description = self.params.get("description", "Reference data check")
+        total_rows = state["total_rows"]
+        failed_rows = state["failed_rows"]
+
+        failed_count = state["failed_count"]
+
+        if failed_count > 0:
+            invalid_list = ', '.join(sorted(state["invalid_values"])[:10])
+            return self._create_result(
+                passed=False,
+                message=f"{description} - {failed_count} values failed. Invalid values: {invalid_list}",
+                failed_count=failed_count,
+                total_count=total_rows,
+                sample_failures=failed_rows,
+            )
+
+        return self._create_result(
+            passed=True,
+            message=f"{description} - All {total_rows} values passed lookup check",
+            total_count=total_rows,
+        )
@@ -7,10 +7,40 @@ These validations check entire rows/records:
 - Uniqueness constraints
 """
 
-from typing import Iterator, Dict, Any, List
+from typing import Dict, Any, List, Optional, Set
+import numpy as np
 import pandas as pd
-from validation_framework.validations.base import DataValidationRule, ValidationResult
+from validation_framework.validations.base import DataValidationRule, RuleCost, ValidationResult
 from validation_framework.core.memory_bounded_tracker import MemoryBoundedTracker
+from validation_framework.core.row_hashing import hash_rows, mark_duplicates
+
+# Hashed keys kept in memory before spilling to disk. The NumPy store uses about
+# the same memory for this many keys as the previous 1M-key Python set.
+HASHED_KEY_MEMORY_LIMIT = 6_000_000
+
+# Memory budget of the Bloom filter over spilled keys: about what the NumPy store
+# uses at HASHED_KEY_MEMORY_LIMIT keys (2**23 slots of 16 bytes).
+BLOOM_FILTER_MAX_BYTES = 128 * 1024 * 1024
+
+
+def _create_key_tracker(context: Dict[str, Any]) -> MemoryBoundedTracker:
+    """
+    Create the tracker used to find repeated keys.
+
+    Spilled keys are kept in hash partitions behind a Bloom filter. When the
+    loader reports a row count, the filter is sized for the keys that can reach
+    disk, as the last HASHED_KEY_MEMORY_LIMIT keys are never spilled, and its
+    memory is capped at BLOOM_FILTER_MAX_BYTES.
+    """
+    row_count = context.get("total_rows") or context.get("estimated_rows")
+    return MemoryBoundedTracker(
+        max_memory_keys=HASHED_KEY_MEMORY_LIMIT,
+        memory_store="hash_array",
+        spill_backend="partitioned",
+        bloom_filter=True,
+        expected_keys=max(row_count - HASHED_KEY_MEMORY_LIMIT, HASHED_KEY_MEMORY_LIMIT) if row_count else None,
+        bloom_max_bytes=BLOOM_FILTER_MAX_BYTES,
+    )
 
 
 class DuplicateRowCheck(DataValidationRule):
@@ -39,6 +69,10 @@ class DuplicateRowCheck(DataValidationRule):
             key_fields: ["transaction_id", "date"]
     """
 
+    error_label = "duplicate check"
+    column_params = ("key_fields",)
+    stops_early = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         if self.params.get("consider_all_fields", False):
@@ -47,107 +81,136 @@ class DuplicateRowCheck(DataValidationRule):
             key_fields = self.params.get("key_fields", [])
             return f"Checks for duplicates based on: {', '.join(key_fields)}"
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
+    def required_columns(self) -> Optional[Set[str]]:
+        """Duplicate checks across all fields read every column."""
+        if self.params.get("consider_all_fields", False):
+            return None
+        return super().required_columns()
+
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Check for duplicate rows across all chunks.
+        Create accumulator state with a memory-bounded key tracker.
 
         Uses memory-bounded tracking with automatic disk spillover to handle
         files of any size (including 200GB+) while keeping memory usage under control.
 
-        Default memory limit: 1 million keys (~40-80 MB)
-        After limit: Keys spill to temporary SQLite database on disk
+        Keys are held as 64-bit hash pairs in a NumPy table (~16-32 bytes each).
+        Default memory limit: 6 million keys (~130 MB)
+        After limit: Keys spill to hash-partitioned files on disk, with a
+        Bloom filter in front so new keys rarely need a disk lookup
+        """
+        state = super().init_state(context)
+        state["duplicate_count"] = 0
+
+        consider_all = self.params.get("consider_all_fields", False)
+        key_fields = self.params.get("key_fields", [])
+
+        if not consider_all and not key_fields:
+            state["result"] = self._create_result(
+                passed=False,
+                message="No key fields specified for duplicate check",
+                failed_count=1,
+            )
+            return state
+
+        state["tracker"] = _create_key_tracker(context)
+        return state
+
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
+        """
+        Check one chunk for keys already seen earlier in the file.
 
         Args:
-            data_iterator: Iterator yielding data chunks
+            state: Accumulator state
+            chunk: DataFrame chunk
+            row_offset: Number of rows preceding this chunk
+            context: Validation context
+        """
+        consider_all = self.params.get("consider_all_fields", False)
+        key_fields = self.params.get("key_fields", [])
+        tracker = state["tracker"]
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
+
+        # Determine which columns to check
+        if consider_all:
+            check_cols = list(chunk.columns)
+        else:
+            # Verify key fields exist
+            missing_fields = [f for f in key_fields if f not in chunk.columns]
+            if missing_fields:
+                state["result"] = self._create_result(
+                    passed=False,
+                    message=f"Key fields not found in data: {', '.join(missing_fields)}",
+                    failed_count=1,
+                )
+                return
+            check_cols = key_fields
+
+        # Hash the composite key of every row and flag repeats in bulk
+        duplicate_mask = mark_duplicates(tracker, *hash_rows(chunk[check_cols]))
+        duplicate_positions = np.flatnonzero(duplicate_mask)
+        state["duplicate_count"] += len(duplicate_positions)
+
+        # Collect samples
+        room = max_samples - len(failed_rows)
+        for idx in duplicate_positions[:max(room, 0)]:
+            row_data = chunk.iloc[idx].to_dict()
+            failed_rows.append({
+                "row": int(row_offset + idx),
+                "key_values": {k: row_data[k] for k in check_cols},
+                "message": f"Duplicate row detected"
+            })
+
+        state["total_rows"] += len(chunk)
+
+    def failure_count(self, state: Dict[str, Any]) -> int:
+        """Count the duplicates found so far."""
+        return state["duplicate_count"]
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """
+        Build the result for duplicates found across all chunks.
+
+        Args:
+            state: Accumulator state
             context: Validation context
 
         Returns:
             ValidationResult with details of duplicate rows
         """
-        # Create memory-bounded tracker with context manager for automatic cleanup
-        with MemoryBoundedTracker(max_memory_keys=1_000_000) as tracker:
-            try:
-                consider_all = self.params.get("consider_all_fields", False)
-                key_fields = self.params.get("key_fields", [])
-
-                if not consider_all and not key_fields:
-                    return self._create_result(
-                        passed=False,
-                        message="No key fields specified for duplicate check",
-                        failed_count=1,
-                    )
-
-                total_rows = 0
-                failed_rows = []
-                max_samples = context.get("max_sample_failures", 100)
-                duplicate_count = 0
-
-                # Process each chunk
-                for chunk_idx, chunk in enumerate(data_iterator):
-                    # Determine which columns to check
-                    if consider_all:
-                        check_cols = list(chunk.columns)
-                    else:
-                        # Verify key fields exist
-                        missing_fields = [f for f in key_fields if f not in chunk.columns]
-                        if missing_fields:
-                            return self._create_result(
-                                passed=False,
-                                message=f"Key fields not found in data: {', '.join(missing_fields)}",
-                                failed_count=1,
-                            )
-                        check_cols = key_fields
-
-                    # Create composite key for each row
-                    for idx in range(len(chunk)):
-                        # Build tuple of key values
-                        row_key = tuple(chunk.iloc[idx][check_cols])
-
-                        # Check if we've seen this key before (atomically check and add)
-                        is_duplicate, was_added = tracker.add_and_check(row_key)
-
-                        if is_duplicate:
-                            duplicate_count += 1
-
-                            # Collect sample
-                            if len(failed_rows) < max_samples:
-                                row_data = chunk.iloc[idx].to_dict()
-                                failed_rows.append({
-                                    "row": int(total_rows + idx),
-                                    "key_values": {k: row_data[k] for k in check_cols},
-                                    "message": f"Duplicate row detected"
-                                })
-
-                    total_rows += len(chunk)
-
-                # Get statistics from tracker
-                stats = tracker.get_statistics()
-
-                # Create result
-                if duplicate_count > 0:
-                    unique_keys = stats["total_keys"]
-                    spill_info = " (disk spillover used)" if stats["is_spilled"] else ""
-                    return self._create_result(
-                        passed=False,
-                        message=f"Found {duplicate_count} duplicate rows ({unique_keys:,} unique records{spill_info})",
-                        failed_count=duplicate_count,
-                        total_count=total_rows,
-                        sample_failures=failed_rows,
-                    )
-
-                return self._create_result(
-                    passed=True,
-                    message=f"No duplicates found among {total_rows:,} rows",
-                    total_count=total_rows,
-                )
+        if state["result"] is not None:
+            return state["result"]
 
-            except Exception as e:
-                return self._create_result(
-                    passed=False,
-                    message=f"Error during duplicate check: {str(e)}",
-                    failed_count=1,
-                )
+        total_rows = state["total_rows"]
+        duplicate_count = state["duplicate_count"]
 
+        # Get statistics from tracker
+        stats = state["tracker"].get_statistics()
+
+        # Create result
+        if duplicate_count > 0:
+            unique_keys = stats["total_keys"]
+            spill_info = " (disk spillover used)" if stats["is_spilled"] else ""
+            return self._create_result(
+                passed=False,
+                message=f"Found {duplicate_count} duplicate rows ({unique_keys:,} unique records{spill_info})",
+                failed_count=duplicate_count,
+                total_count=total_rows,
+                sample_failures=state["failed_rows"],
+            )
+
+        return self._create_result(
+            passed=True,
+            message=f"No duplicates found among {total_rows:,} rows",
+            total_count=total_rows,
+        )
+
+    def release_state(self, state: Dict[str, Any]) -> None:
+        """Close the key tracker and remove any spillover database."""
+        tracker = state.get("tracker")
+        if tracker is not None:
+            tracker.close()
 
 class BlankRecordCheck(DataValidationRule):
     """
@@ -166,6 +229,11 @@ class BlankRecordCheck(DataValidationRule):
             exclude_fields: ["optional_notes"]
     """
 
+    error_label = "blank record check"
+    cost = RuleCost.PYTHON_LOOP
+    parallel_chunks = True
+    stops_early = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         exclude = self.params.get("exclude_fields", [])
@@ -173,80 +241,86 @@ class BlankRecordCheck(DataValidationRule):
             return f"Checks for blank rows (excluding fields: {', '.join(exclude)})"
         return "Checks for completely blank rows"
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
         """
-        Check for blank rows across all chunks.
+        Check one chunk for blank rows.
 
         Args:
-            data_iterator: Iterator yielding data chunks
+            state: Accumulator state
+            chunk: DataFrame chunk
+            row_offset: Number of rows preceding this chunk
+            context: Validation context
+        """
+        exclude_fields = self.params.get("exclude_fields", [])
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
+
+        # Determine which columns to check
+        check_cols = [col for col in chunk.columns if col not in exclude_fields]
+
+        if not check_cols:
+            state["result"] = self._create_result(
+                passed=False,
+                message="No columns to check after exclusions",
+                failed_count=1,
+            )
+            return
+
+        # Find rows where all checked columns are null or empty
+        for idx in range(len(chunk)):
+            row = chunk.iloc[idx][check_cols]
+
+            # Check if all values are null or empty strings
+            is_blank = True
+            for value in row:
+                if pd.notna(value) and str(value).strip() != '':
+                    is_blank = False
+                    break
+
+            if not is_blank:
+                continue
+
+            state["failed_count"] += 1
+            if len(failed_rows) < max_samples:
+                failed_rows.append({
+                    "row": int(row_offset + idx),
+                    "message": "Completely blank row detected"
+                })
+
+        state["total_rows"] += len(chunk)
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """
+        Build the result for blank rows found across all chunks.
+
+        Args:
+            state: Accumulator state
             context: Validation context
 
         Returns:
             ValidationResult with details of blank rows found
         """
-        try:
-            exclude_fields = self.params.get("exclude_fields", [])
-
-            total_rows = 0
-            failed_rows = []
-            max_samples = context.get("max_sample_failures", 100)
-
-            # Process each chunk
-            for chunk_idx, chunk in enumerate(data_iterator):
-                # Determine which columns to check
-                check_cols = [col for col in chunk.columns if col not in exclude_fields]
-
-                if not check_cols:
-                    return self._create_result(
-                        passed=False,
-                        message="No columns to check after exclusions",
-                        failed_count=1,
-                    )
-
-                # Find rows where all checked columns are null or empty
-                for idx in range(len(chunk)):
-                    row = chunk.iloc[idx][check_cols]
-
-                    # Check if all values are null or empty strings
-                    is_blank = True
-                    for value in row:
-                        if pd.notna(value) and str(value).strip() != '':
-                            is_blank = False
-                            break
-
-                    if is_blank and len(failed_rows) < max_samples:
-                        failed_rows.append({
-                            "row": int(total_rows + idx),
-                            "message": "Completely blank row detected"
-                        })
-
-                total_rows += len(chunk)
-
-            # Create result
-            blank_count = len(failed_rows)
-
-            if blank_count > 0:
-                return self._create_result(
-                    passed=False,
-                    message=f"Found {blank_count} completely blank rows",
-                    failed_count=blank_count,
-                    total_count=total_rows,
-                    sample_failures=failed_rows,
-                )
+        if state["result"] is not None:
+            return state["result"]
 
-            return self._create_result(
-                passed=True,
-                message=f"No blank rows found among {total_rows} rows",
-                total_count=total_rows,
-            )
+        total_rows = state["total_rows"]
+        failed_rows = state["failed_rows"]
+        blank_count = state["failed_count"]
 
-        except Exception as e:
+        if blank_count > 0:
             return self._create_result(
                 passed=False,
-                message=f"Error during blank record check: {str(e)}",
-                failed_count=1,
+                message=f"Found {blank_count} completely blank rows",
+                failed_count=blank_count,
+                total_count=total_rows,
+                sample_failures=failed_rows,
             )
 
+        return self._create_result(
+            passed=True,
+            message=f"No blank rows found among {total_rows} rows",
+            total_count=total_rows,
+        )
 
 class UniqueKeyCheck(DataValidationRule):
     """
@@ -265,115 +339,142 @@ class UniqueKeyCheck(DataValidationRule):
             fields: ["customer_id"]
     """
 
+    error_label = "unique key check"
+    column_params = ("fields",)
+    stops_early = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         fields = self.params.get("fields", [])
         return f"Checks uniqueness of: {', '.join(fields)}"
 
-    def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Check uniqueness of specified fields.
+        Create accumulator state with a memory-bounded key tracker.
 
         Uses memory-bounded tracking with automatic disk spillover to handle
         files of any size while keeping memory usage under control.
+        """
+        state = super().init_state(context)
+        state["duplicate_count"] = 0
+
+        # Track first occurrence of keys for better error messages
+        # Note: This is memory-bounded separately - we only store first 100k
+        state["first_occurrence"] = {}
+
+        if not self.params.get("fields", []):
+            state["result"] = self._create_result(
+                passed=False,
+                message="No fields specified for uniqueness check",
+                failed_count=1,
+            )
+            return state
+
+        state["tracker"] = _create_key_tracker(context)
+        return state
+
+    def accumulate(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
+        """
+        Check one chunk for keys already seen earlier in the file.
+
+        Args:
+            state: Accumulator state
+            chunk: DataFrame chunk
+            row_offset: Number of rows preceding this chunk
+            context: Validation context
+        """
+        fields = self.params.get("fields", [])
+        tracker = state["tracker"]
+        first_occurrence = state["first_occurrence"]
+        max_first_occurrence = 100_000
+        failed_rows = state["failed_rows"]
+        max_samples = state["max_samples"]
+
+        # Verify fields exist
+        missing_fields = [f for f in fields if f not in chunk.columns]
+        if missing_fields:
+            state["result"] = self._create_result(
+                passed=False,
+                message=f"Fields not found in data: {', '.join(missing_fields)}",
+                failed_count=1,
+            )
+            return
+
+        # Skip rows with a null in any key field
+        positions = np.flatnonzero(chunk[fields].notna().all(axis=1).to_numpy())
+        keys = chunk[fields].iloc[positions]
+
+        # Hash the composite key of every row and flag repeats in bulk
+        hashes, check_hashes = hash_rows(keys)
+        duplicate_mask = mark_duplicates(tracker, hashes, check_hashes)
+
+        # Track first occurrence if we have space
+        for i in np.flatnonzero(~duplicate_mask):
+            if len(first_occurrence) >= max_first_occurrence:
+                break
+            first_occurrence[(hashes[i], check_hashes[i])] = int(row_offset + positions[i])
+
+        duplicates = np.flatnonzero(duplicate_mask)
+        state["duplicate_count"] += len(duplicates)
+
+        room = max_samples - len(failed_rows)
+        for i in duplicates[:max(room, 0)]:
+            idx = positions[i]
+            key_dict = {k: chunk.iloc[idx][k] for k in fields}
+            first_row = first_occurrence.get((hashes[i], check_hashes[i]), "unknown")
+            failed_rows.append({
+                "row": int(row_offset + idx),
+                "key_values": key_dict,
+                "first_seen_row": first_row,
+                "message": f"Duplicate key found (first occurrence at row {first_row})"
+            })
+
+        state["total_rows"] += len(chunk)
+
+    def failure_count(self, state: Dict[str, Any]) -> int:
+        """Count the duplicates found so far."""
+        return state["duplicate_count"]
+
+    def finalize(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """
+        Build the result for duplicate keys found across all chunks.
 
         Args:
-            data_iterator: Iterator yielding data chunks
+            state: Accumulator state
             context: Validation context
 
         Returns:
             ValidationResult with details of duplicate keys
         """
-        # Create memory-bounded tracker with context manager for automatic cleanup
-        with MemoryBoundedTracker(max_memory_keys=1_000_000) as tracker:
-            try:
-                fields = self.params.get("fields", [])
-                if not fields:
-                    return self._create_result(
-                        passed=False,
-                        message="No fields specified for uniqueness check",
-                        failed_count=1,
-                    )
-
-                total_rows = 0
-                failed_rows = []
-                max_samples = context.get("max_sample_failures", 100)
-                duplicate_count = 0
-
-                # Track first occurrence of keys for better error messages
-                # Note: This is memory-bounded separately - we only store first 100k
-                first_occurrence = {}
-                max_first_occurrence = 100_000
-
-                # Process each chunk
-                for chunk_idx, chunk in enumerate(data_iterator):
-                    # Verify fields exist
-                    missing_fields = [f for f in fields if f not in chunk.columns]
-                    if missing_fields:
-                        return self._create_result(
-                            passed=False,
-                            message=f"Fields not found in data: {', '.join(missing_fields)}",
-                            failed_count=1,
-                        )
-
-                    # Check each row
-                    for idx in range(len(chunk)):
-                        # Build composite key
-                        if len(fields) == 1:
-                            row_key = chunk.iloc[idx][fields[0]]
-                        else:
-                            row_key = tuple(chunk.iloc[idx][fields])
-
-                        # Skip null keys
-                        if pd.isna(row_key) or (isinstance(row_key, tuple) and any(pd.isna(v) for v in row_key)):
-                            continue
-
-                        # Check if seen before (atomically check and add)
-                        is_duplicate, was_added = tracker.add_and_check(row_key)
-
-                        if is_duplicate:
-                            duplicate_count += 1
-
-                            if len(failed_rows) < max_samples:
-                                key_dict = {k: chunk.iloc[idx][k] for k in fields}
-                                first_row = first_occurrence.get(row_key, "unknown")
-                                failed_rows.append({
-                                    "row": int(total_rows + idx),
-                                    "key_values": key_dict,
-                                    "first_seen_row": first_row,
-                                    "message": f"Duplicate key found (first occurrence at row {first_row})"
-                                })
-                        else:
-                            # Track first occurrence if we have space
-                            if len(first_occurrence) < max_first_occurrence:
-                                first_occurrence[row_key] = total_rows + idx
-
-                    total_rows += len(chunk)
-
-                # Get statistics from tracker
-                stats = tracker.get_statistics()
-
-                # Create result
-                if duplicate_count > 0:
-                    spill_info = " (disk spillover used)" if stats["is_spilled"] else ""
-                    return self._create_result(
-                        passed=False,
-                        message=f"Found {duplicate_count} duplicate keys (should be unique{spill_info})",
-                        failed_count=duplicate_count,
-                        total_count=total_rows,
-                        sample_failures=failed_rows,
-                    )
-
-                unique_count = stats["total_keys"]
-                return self._create_result(
-                    passed=True,
-                    message=f"All {unique_count:,} keys are unique across {total_rows:,} rows",
-                    total_count=total_rows,
-                )
+        if state["result"] is not None:
+            return state["result"]
 
-            except Exception as e:
-                return self._create_result(
-                    passed=False,
-                    message=f"Error during unique key check: {str(e)}",
-                    failed_count=1,
-                )
+        total_rows = state["total_rows"]
+        duplicate_count = state["duplicate_count"]
+
+        # Get statistics from tracker
+        stats = state["tracker"].get_statistics()
+
+        # Create result
+        if duplicate_count > 0:
+            spill_info = " (disk spillover used)" if stats["is_spilled"] else ""
+            return self._create_result(
+                passed=False,
+                message=f"Found {duplicate_count} duplicate keys (should be unique{spill_info})",
+                failed_count=duplicate_count,
+                total_count=total_rows,
+                sample_failures=state["failed_rows"],
+            )
+
+        unique_count = stats["total_keys"]
+        return self._create_result(
+            passed=True,
+            message=f"All {unique_count:,} keys are unique across {total_rows:,} rows",
+            total_count=total_rows,
+        )
+
+    def release_state(self, state: Dict[str, Any]) -> None:
+        """Close the key tracker and remove any spillover database."""
+        tracker = state.get("tracker")
+        if tracker is not None:
+            tracker.close()
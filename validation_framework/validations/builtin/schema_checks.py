@@ -40,6 +40,8 @@ class SchemaMatchCheck(FileValidationRule):
             check_order: false
     """
 
+    gate = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         schema = self.params.get("expected_schema", {})
@@ -190,6 +192,8 @@ class ColumnPresenceCheck(FileValidationRule):
             case_sensitive: true
     """
 
+    gate = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         cols = self.params.get("required_columns", [])
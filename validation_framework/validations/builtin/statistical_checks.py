@@ -11,7 +11,7 @@ These validations use statistical methods to detect data quality issues:
 from typing import Iterator, Dict, Any
 import pandas as pd
 import numpy as np
-from validation_framework.validations.base import DataValidationRule, ValidationResult
+from validation_framework.validations.base import DataValidationRule, RuleCost, ValidationResult
 import logging
 
 logger = logging.getLogger(__name__)
@@ -47,6 +47,9 @@ class DistributionCheck(DataValidationRule):
             expected_distribution: "uniform"
     """
 
+    cost = RuleCost.MATERIALIZE
+    column_params = ("column",)
+
     def get_description(self) -> str:
         """Get human-readable description."""
         column = self.params.get("column", "?")
@@ -215,6 +218,9 @@ class CorrelationCheck(DataValidationRule):
             correlation_type: "spearman"
     """
 
+    cost = RuleCost.MATERIALIZE
+    column_params = ("column1", "column2")
+
     def get_description(self) -> str:
         """Get human-readable description."""
         col1 = self.params.get("column1", "?")
@@ -391,6 +397,9 @@ class AdvancedAnomalyDetectionCheck(DataValidationRule):
             max_anomaly_pct: 5
     """
 
+    cost = RuleCost.MATERIALIZE
+    column_params = ("column",)
+
     def get_description(self) -> str:
         """Get human-readable description."""
         column = self.params.get("column", "?")
@@ -12,7 +12,7 @@ from typing import Iterator, Dict, Any, List
 import pandas as pd
 from pathlib import Path
 from datetime import datetime, timedelta
-from validation_framework.validations.base import DataValidationRule, FileValidationRule, ValidationResult
+from validation_framework.validations.base import DataValidationRule, FileValidationRule, RuleCost, ValidationResult
 import logging
 
 logger = logging.getLogger(__name__)
@@ -58,6 +58,9 @@ class BaselineComparisonCheck(DataValidationRule):
             tolerance_pct: 15
     """
 
+    cost = RuleCost.MATERIALIZE
+    column_params = ("column",)
+
     def get_description(self) -> str:
         """Get human-readable description."""
         metric = self.params.get("metric", "?")
@@ -340,6 +343,9 @@ class TrendDetectionCheck(DataValidationRule):
             comparison_period: 7  # Compare to 7 days ago
     """
 
+    cost = RuleCost.MATERIALIZE
+    column_params = ("column",)
+
     def get_description(self) -> str:
         """Get human-readable description."""
         metric = self.params.get("metric", "?")